@@ -0,0 +1,9 @@
+-- Migration: Add state_version column to chat_session table
+-- Date: 2026-10-17
+-- Description: 세션 상태 캐시의 워커 간 충돌 확인을 위한 저장 버전 컬럼 추가
+--              (세션 상태 저장마다 1씩 증가, 캐시된 버전과 다르면 DB에서 다시 로드)
+
+ALTER TABLE chat_session
+ADD COLUMN state_version INTEGER NOT NULL DEFAULT 0 COMMENT '세션 상태 저장 버전';
+
+-- 기존 세션은 0에서 시작 (첫 저장 시 1로 증가)
@@ -0,0 +1,9 @@
+-- Migration: Add state_snapshot column to chat_session table
+-- Date: 2026-10-17
+-- Description: 세션 재개 시 기본 키 조회 한 번으로 StateContext 전체를 복원하기 위한 스냅샷 컬럼 추가
+--              (형식 버전 1바이트 + zlib 압축 JSON, src/services/state_snapshot.py 참고)
+
+ALTER TABLE chat_session
+ADD COLUMN state_snapshot MEDIUMBLOB NULL COMMENT 'StateContext 스냅샷 (압축 JSON)';
+
+-- 기존 세션은 NULL로 유지 (다음 저장 시 채워지며, 그 전까지는 정규화된 사건 테이블에서 복원)
@@ -0,0 +1,21 @@
+-- Migration: Add chat_turn table
+-- Date: 2026-10-17
+-- Description: conversation_history JSON 전체를 매 메시지마다 다시 쓰지 않도록 Q-A 쌍을 한 행씩 추가하는 테이블
+--              chat_session.conversation_history는 마이그레이션 기간 동안 호환용으로 유지
+--              (CONVERSATION_HISTORY_JSON_WRITE=false로 기록 중단)
+
+CREATE TABLE IF NOT EXISTS chat_turn (
+    session_id VARCHAR(50) NOT NULL,
+    seq INTEGER NOT NULL COMMENT '세션 내 순번 (0부터)',
+    field VARCHAR(50),
+    question TEXT,
+    answer TEXT,
+    source VARCHAR(30) COMMENT '답변 출처 (예: initial_description)',
+    timestamp VARCHAR(40) COMMENT 'Q-A 쌍의 timestamp (ISO 8601)',
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (session_id, seq),
+    FOREIGN KEY (session_id) REFERENCES chat_session(session_id) ON DELETE CASCADE,
+    INDEX idx_chat_turn_created (created_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- 기존 세션의 conversation_history는 세션을 처음 로드할 때 chat_turn으로 옮겨집니다
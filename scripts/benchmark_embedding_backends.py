@@ -0,0 +1,152 @@
+"""
+Embedding 추론 백엔드 벤치마크 스크립트
+
+백엔드(torch, torch_int8, onnx)마다 새 프로세스에서 모델을 로드하여
+로드 시간, 단건 쿼리 지연 시간(p50/p95), 배치 처리량, 메모리(RSS), torch 대비 코사인 유사도를 측정합니다.
+
+사용 예:
+    python scripts/benchmark_embedding_backends.py
+    python scripts/benchmark_embedding_backends.py --backends torch torch_int8 --queries 200
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# 노드가 실제로 사용하는 형태의 쿼리
+SAMPLE_QUERIES = [
+    "필수 필드",
+    "요약 포맷",
+    "incident_date 질문",
+    "친구에게 빌려준 돈을 돌려받지 못했어요",
+    "전세 보증금을 집주인이 돌려주지 않습니다",
+    "회사에서 월급을 3개월째 못 받고 있어요",
+    "이혼하면서 양육권을 가져오고 싶어요",
+    "과징금 부과 처분이 부당한 것 같아요",
+]
+
+
+def _rss_mb() -> float:
+    """현재 프로세스 RSS (MB)"""
+    try:
+        with open("/proc/self/status", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    # /proc이 없는 환경에서는 최대 RSS로 대체 (macOS는 바이트, Linux는 KB 단위)
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024
+
+
+def _load_corpus(limit: int):
+    """배치 처리량 측정용 RAG Chunk 텍스트"""
+    from src.rag.ingestion import iter_prepared_documents
+    from src.rag.pipeline import RAGIndexingPipeline
+    rag_dir = Path(__file__).parent.parent / "data" / "rag"
+    files = RAGIndexingPipeline._list_files(rag_dir, recursive=True)
+    texts = [chunk.content for prepared in iter_prepared_documents(files, 1) for chunk in prepared.chunks]
+    return texts[:limit]
+
+
+def _benchmark(backend: str, queries: int, corpus_size: int, batch_size: int) -> dict:
+    """
+    새 프로세스에서 한 백엔드 측정
+
+    Returns:
+        측정 결과 딕셔너리 (parity 계산용 샘플 쿼리 벡터 포함)
+    """
+    os.environ["EMBEDDING_BACKEND"] = backend
+    import numpy as np
+    # 라이브러리 임포트 비용은 백엔드와 무관하므로 모델 로드 측정 전에 미리 임포트
+    import sentence_transformers  # noqa: F401
+    import src.rag.vector_db  # noqa: F401
+
+    rss_before = _rss_mb()
+    started = time.perf_counter()
+    from src.rag.embeddings import embedding_model
+    load_seconds = time.perf_counter() - started
+    rss_loaded = _rss_mb()
+
+    # 첫 호출의 그래프 최적화/메모리 할당은 측정에서 제외
+    embedding_model.encode(SAMPLE_QUERIES)
+
+    latencies = []
+    for i in range(queries):
+        query = SAMPLE_QUERIES[i % len(SAMPLE_QUERIES)]
+        started = time.perf_counter()
+        embedding_model.encode(query)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+    corpus = _load_corpus(corpus_size)
+    started = time.perf_counter()
+    embedding_model.encode(corpus, batch_size=batch_size)
+    batch_seconds = time.perf_counter() - started
+
+    return {
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "rss_model_mb": rss_loaded - rss_before,
+        "rss_peak_mb": _rss_mb(),
+        "p50_ms": float(np.percentile(latencies, 50)),
+        "p95_ms": float(np.percentile(latencies, 95)),
+        "throughput": len(corpus) / batch_seconds if batch_seconds else 0.0,
+        "corpus_size": len(corpus),
+        "sample_vectors": np.asarray(embedding_model.encode(SAMPLE_QUERIES), dtype=np.float32)
+    }
+
+
+def main():
+    """벤치마크 메인 함수"""
+    parser = argparse.ArgumentParser(description="Embedding 추론 백엔드 벤치마크")
+    parser.add_argument("--backends", nargs="+", default=["torch", "torch_int8", "onnx"], help="측정할 백엔드")
+    parser.add_argument("--queries", type=int, default=100, help="단건 쿼리 지연 시간 측정 횟수")
+    parser.add_argument("--corpus-size", type=int, default=512, help="배치 처리량 측정에 사용할 Chunk 수")
+    parser.add_argument("--batch-size", type=int, default=64, help="배치 처리량 측정 배치 크기")
+    args = parser.parse_args()
+
+    import numpy as np
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for backend in args.backends:
+        # 백엔드마다 새 프로세스를 사용해야 로드 시간과 메모리를 서로 간섭 없이 측정할 수 있음
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            try:
+                results.append(
+                    executor.submit(_benchmark, backend, args.queries, args.corpus_size, args.batch_size).result()
+                )
+            except Exception as e:
+                print(f"[{backend}] 측정 실패: {type(e).__name__}: {str(e)}")
+
+    if not results:
+        return
+
+    baseline = next((result for result in results if result["backend"] == "torch"), None)
+    header = f"{'backend':<12}{'load(s)':>9}{'load RSS(MB)':>15}{'peak RSS(MB)':>14}{'p50(ms)':>9}{'p95(ms)':>9}{'texts/s':>10}{'min cos':>9}"
+    print(header)
+    print("-" * len(header))
+    for result in results:
+        min_cosine = "-"
+        if baseline is not None:
+            a, b = baseline["sample_vectors"], result["sample_vectors"]
+            cosine = np.sum(a * b, axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+            min_cosine = f"{cosine.min():.4f}"
+        print(
+            f"{result['backend']:<12}{result['load_seconds']:>9.2f}{result['rss_model_mb']:>15.1f}"
+            f"{result['rss_peak_mb']:>14.1f}{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}"
+            f"{result['throughput']:>10.1f}{min_cosine:>9}"
+        )
+    print(f"\n(배치 처리량: Chunk {results[0]['corpus_size']}개, 배치 크기 {args.batch_size})")
+
+
+if __name__ == "__main__":
+    main()
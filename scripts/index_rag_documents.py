@@ -35,18 +35,42 @@ def main():
     parser.add_argument(
         "--clear",
         action="store_true",
-        help="기존 인덱스를 초기화하고 재인덱싱"
+        help="전체 재인덱싱 (새 세대 컬렉션에 구축·검증 후 별칭 전환, 검색 중단 없음)"
+    )
+    parser.add_argument(
+        "--rollback",
+        action="store_true",
+        help="별칭을 직전 세대로 되돌림"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="변경 여부와 관계없이 모든 파일을 다시 Embedding (기본: 변경된 파일만 증분 인덱싱)"
     )
     args = parser.parse_args()
     
-    if args.clear:
-        logger.info("기존 인덱스 초기화 중...")
-        pipeline.clear_collection()
+    if args.rollback:
+        result = pipeline.rollback()
+        logger.info(f"RAG 인덱스 롤백 완료: {result['from']} → {result['to']}")
+        return
     
     # 인덱싱 수행
     try:
-        total_chunks = pipeline.index_directory(rag_dir, recursive=True)
-        logger.info(f"RAG 문서 인덱싱 완료! 총 {total_chunks}개 Chunk 인덱싱됨")
+        if args.clear:
+            result = pipeline.rebuild(rag_dir, recursive=True)
+            logger.info(
+                f"블루/그린 재인덱싱 완료! 새 세대 {result['generation']} "
+                f"(이전 {result['previous']}), 총 {result['chunks']}개 Chunk"
+            )
+        elif args.full:
+            total_chunks = pipeline.index_directory(rag_dir, recursive=True)
+            logger.info(f"RAG 문서 인덱싱 완료! 총 {total_chunks}개 Chunk 인덱싱됨")
+        else:
+            result = pipeline.index_directory_incremental(rag_dir, recursive=True)
+            logger.info(
+                f"RAG 문서 증분 인덱싱 완료! 추가 {result['added']}, 변경 {result['updated']}, "
+                f"삭제 {result['removed']}, 건너뜀 {result['skipped']}, 실패 {result['failed']}"
+            )
     except Exception as e:
         logger.error(f"인덱싱 실패: {str(e)}")
         raise
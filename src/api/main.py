@@ -105,9 +105,11 @@ def register_routers_lazy():
         return
     
     try:
-        from src.api.routers import chat, rag
+        from src.api.routers import chat, rag, cache, stats
         app.include_router(chat.router)
         app.include_router(rag.router)
+        app.include_router(cache.router)
+        app.include_router(stats.router)
         _routers_registered = True
         logger.info("라우터 등록 완료 (lazy loading)")
     except Exception as e:
@@ -124,6 +126,26 @@ async def startup_event():
     async def _register_routers():
         await asyncio.sleep(0.1)  # 서버 시작 완료 대기
         register_routers_lazy()
+        # K2 조회 테이블 구축 (매 턴 벡터 검색 대신 메모리 조회)
+        try:
+            from src.rag.k2_table import k2_lookup_table
+            await asyncio.to_thread(k2_lookup_table.build)
+        except Exception as e:
+            logger.error(f"K2 조회 테이블 구축 실패 (벡터 검색으로 폴백): {str(e)}")
+        # 노드 고정 쿼리 Embedding 사전 적재 (선택)
+        from config.settings import settings
+        if settings.query_embedding_prewarm:
+            try:
+                from pathlib import Path
+                from src.rag.embeddings import embedding_model
+                from src.utils.rag_helpers import get_known_node_queries
+                await asyncio.to_thread(
+                    embedding_model.prewarm_query_cache,
+                    get_known_node_queries(),
+                    Path(settings.query_embedding_cache_path)
+                )
+            except Exception as e:
+                logger.error(f"쿼리 Embedding 캐시 사전 적재 실패: {str(e)}")
         # 준비 완료 로그 출력
         logger.info("="*70)
         logger.info("✅ 서버 준비 완료!")
@@ -152,6 +174,13 @@ async def shutdown_event():
     logger.info("애플리케이션 종료")
     
     # 리소스 정리
+    from src.langgraph.executor import graph_executor
+    graph_executor.shutdown(wait=False)
+    
+    # 대기 중인 사건 테이블 기록은 DB 연결을 닫기 전에 모두 수행
+    from src.services.case_table_writer import case_table_writer
+    case_table_writer.shutdown(wait=True)
+    
     from src.db.connection import db_manager
     db_manager.close()
 
@@ -173,6 +202,7 @@ async def health_check():
     """헬스 체크 엔드포인트"""
     from src.db.connection import db_manager
     from src.rag.vector_db import vector_db_manager
+    from src.langgraph.executor import graph_executor
     
     db_healthy = db_manager.health_check()
     vector_db_healthy = vector_db_manager.health_check()
@@ -182,7 +212,9 @@ async def health_check():
     return {
         "status": status,
         "database": "healthy" if db_healthy else "unhealthy",
-        "vector_db": "healthy" if vector_db_healthy else "unhealthy"
+        "vector_db": "healthy" if vector_db_healthy else "unhealthy",
+        "graph_executor": graph_executor.get_stats(),
+        "db_unit_of_work": db_manager.get_unit_of_work_stats()
     }
 
 
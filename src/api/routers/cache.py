@@ -0,0 +1,88 @@
+"""
+캐시 관리 API 라우터 (GPT 응답 캐시, 의미 캐시, 세션 상태 캐시)
+"""
+from fastapi import APIRouter, Depends
+from src.services.gpt_cache import gpt_cache
+from src.services.semantic_cache import semantic_cache
+from src.services.session_state_cache import session_state_cache
+from src.api.auth import verify_api_key
+from src.utils.response import success_response
+
+router = APIRouter(prefix="/cache", tags=["cache"])
+
+
+@router.get("/gpt/stats")
+async def get_gpt_cache_stats(_: str = Depends(verify_api_key)):
+    """
+    GPT 응답 캐시 통계 조회
+    
+    항목 수, 사용 바이트, 히트/미스/제거/만료 횟수를 반환합니다.
+    """
+    return success_response(gpt_cache.get_stats())
+
+
+@router.delete("/gpt")
+async def clear_gpt_cache(_: str = Depends(verify_api_key)):
+    """GPT 응답 캐시 전체 삭제"""
+    cleared = gpt_cache.clear()
+    return success_response({"cleared_entries": cleared})
+
+
+@router.get("/semantic/stats")
+async def get_semantic_cache_stats(_: str = Depends(verify_api_key)):
+    """
+    의미 캐시 통계 조회
+    
+    노드별 항목 수, 히트율, 감사 횟수, 오탐률과 최근 오탐 사례를 반환합니다.
+    """
+    return success_response(semantic_cache.get_stats())
+
+
+@router.delete("/semantic")
+async def clear_semantic_cache(_: str = Depends(verify_api_key)):
+    """의미 캐시 전체 삭제"""
+    cleared = semantic_cache.clear()
+    return success_response({"cleared_entries": cleared})
+
+
+@router.get("/embedding/stats")
+async def get_query_embedding_cache_stats(_: str = Depends(verify_api_key)):
+    """
+    쿼리 Embedding 캐시 통계 조회
+    
+    항목 수, 히트/미스 횟수, 히트율, LRU 제거 횟수와
+    사이드카 연결 실패/로컬 전환 사용량을 반환합니다.
+    """
+    from src.rag.embeddings import embedding_model
+    return success_response({
+        "model_name": embedding_model.model_name,
+        "backend": embedding_model.backend,
+        "service": embedding_model.service,
+        "sidecar": embedding_model.get_sidecar_stats(),
+        **embedding_model.query_cache.get_stats()
+    })
+
+
+@router.delete("/embedding")
+async def clear_query_embedding_cache(_: str = Depends(verify_api_key)):
+    """쿼리 Embedding 캐시 전체 삭제"""
+    from src.rag.embeddings import embedding_model
+    cleared = embedding_model.query_cache.clear()
+    return success_response({"cleared_entries": cleared})
+
+
+@router.get("/session/stats")
+async def get_session_state_cache_stats(_: str = Depends(verify_api_key)):
+    """
+    세션 상태 캐시 통계 조회
+    
+    캐시된 세션 수, 히트/미스/제거 횟수, 다른 워커 저장으로 인한 충돌 횟수를 반환합니다.
+    """
+    return success_response(session_state_cache.get_stats())
+
+
+@router.delete("/session")
+async def clear_session_state_cache(_: str = Depends(verify_api_key)):
+    """세션 상태 캐시 전체 삭제 (다음 메시지부터 DB에서 다시 로드)"""
+    cleared = session_state_cache.clear()
+    return success_response({"cleared_entries": cleared})
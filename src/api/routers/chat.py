@@ -2,15 +2,18 @@
 채팅 관련 API 라우터
 """
 from fastapi import APIRouter, HTTPException, Depends, UploadFile, File, Form
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, model_validator
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 import os
+import json
 import uuid
+import asyncio
 import mimetypes
 from src.utils.response import success_response, error_response
-from src.utils.exceptions import SessionNotFoundError, InvalidInputError
+from src.utils.exceptions import SessionNotFoundError, InvalidInputError, SessionStateConflictError
 from src.utils.constants import SessionStatus
 from src.db.connection import db_manager
 from src.db.models.chat_session import ChatSession
@@ -21,9 +24,10 @@ from src.services.session_manager import (
     SessionManager,
     validate_session_id,
     load_session_state,
-    save_session_state
+    save_session_state,
+    get_conversation_turns
 )
-from src.langgraph.graph import run_graph_step
+from src.langgraph.executor import graph_executor
 from src.langgraph.state import create_initial_context, StateContext
 from src.api.auth import verify_api_key
 from config.settings import settings
@@ -98,7 +102,8 @@ async def start_chat(request: ChatStartRequest, _: str = Depends(verify_api_key)
     """상담 세션 시작"""
     try:
         # 세션 생성
-        session_id = SessionManager.create_session(
+        session_id = await run_in_threadpool(
+            SessionManager.create_session,
             channel=request.channel,
             user_identifier=request.user_meta.get("user_id") if request.user_meta else None
         )
@@ -107,11 +112,12 @@ async def start_chat(request: ChatStartRequest, _: str = Depends(verify_api_key)
         context = create_initial_context(session_id)
         context["channel"] = request.channel
         
-        # INIT Node 실행
-        result = run_graph_step(context)
-        
-        # 상태 저장 (다음 메시지에서 올바른 State로 시작하기 위해)
-        save_session_state(session_id, result)
+        # INIT Node 실행 (그래프 워커 풀에서 실행, 턴의 쓰기는 트랜잭션 하나로 기록)
+        async with db_manager.unit_of_work():
+            result = await graph_executor.run_graph_step(context)
+            
+            # 상태 저장 (다음 메시지에서 올바른 State로 시작하기 위해)
+            await run_in_threadpool(save_session_state, session_id, result)
         
         return success_response({
             "session_id": session_id,
@@ -141,57 +147,59 @@ async def process_message(request: ChatMessageRequest, _: str = Depends(verify_a
         if not validate_session_id(request.session_id):
             raise InvalidInputError("유효하지 않은 세션 ID 형식입니다.", "session_id")
         
-        # 세션 상태 로드
-        state = load_session_state(request.session_id)
-        if not state:
-            raise SessionNotFoundError(request.session_id)
-        
-        # 사용자 입력 업데이트
-        state["last_user_input"] = request.user_message
-        
-        # 디버깅 로그 (강제 출력)
-        import sys
-        sys.stderr.write("\n" + "="*70 + "\n")
-        sys.stderr.write(f"📨 [API] 메시지 수신\n")
-        sys.stderr.write(f"📌 세션 ID: {request.session_id}\n")
-        sys.stderr.write(f"📝 사용자 메시지: {request.user_message[:100]}...\n")
-        sys.stderr.write(f"🔄 현재 State: {state.get('current_state')}\n")
-        sys.stderr.write("="*70 + "\n")
-        sys.stderr.flush()
-        logger.info("="*70)
-        logger.info(f"📨 [API] 메시지 수신")
-        logger.info(f"📌 세션 ID: {request.session_id}")
-        logger.info(f"📝 사용자 메시지: {request.user_message[:100]}...")
-        logger.info(f"🔄 현재 State: {state.get('current_state')}")
-        logger.info("="*70)
-        logger.info(f"메시지 처리 시작: session_id={request.session_id}, current_state={state.get('current_state')}, user_message={request.user_message[:50]}...")
-        
-        # LangGraph 1 step 실행
-        sys.stderr.write(f"▶️  LangGraph 실행 시작...\n")
-        sys.stderr.flush()
-        logger.info(f"▶️  LangGraph 실행 시작...")
-        result = run_graph_step(state)
-        sys.stderr.write(f"✅ LangGraph 실행 완료\n")
-        sys.stderr.flush()
-        logger.info(f"✅ LangGraph 실행 완료")
-        
-        bot_message = result.get('bot_message') or ''
-        bot_message_preview = bot_message[:50] if bot_message else '(메시지 없음)'
-        
-        # Q-A 매칭 방식 디버깅 정보 로깅
-        conversation_history = result.get("conversation_history", [])
-        skipped_fields = result.get("skipped_fields", [])
-        initial_analysis = result.get("initial_analysis")
-        
-        logger.info(
-            f"메시지 처리 완료: new_state={result.get('current_state')}, "
-            f"bot_message={bot_message_preview}..., "
-            f"conversation_history={len(conversation_history)}개, "
-            f"skipped_fields={skipped_fields}"
-        )
-        
-        # 상태 저장
-        save_session_state(request.session_id, result)
+        # 세션 로드부터 상태 저장까지 한 턴의 쓰기는 트랜잭션 하나로 기록
+        async with db_manager.unit_of_work():
+            # 세션 상태 로드
+            state = await run_in_threadpool(load_session_state, request.session_id)
+            if not state:
+                raise SessionNotFoundError(request.session_id)
+            
+            # 사용자 입력 업데이트
+            state["last_user_input"] = request.user_message
+            
+            # 디버깅 로그 (강제 출력)
+            import sys
+            sys.stderr.write("\n" + "="*70 + "\n")
+            sys.stderr.write(f"📨 [API] 메시지 수신\n")
+            sys.stderr.write(f"📌 세션 ID: {request.session_id}\n")
+            sys.stderr.write(f"📝 사용자 메시지: {request.user_message[:100]}...\n")
+            sys.stderr.write(f"🔄 현재 State: {state.get('current_state')}\n")
+            sys.stderr.write("="*70 + "\n")
+            sys.stderr.flush()
+            logger.info("="*70)
+            logger.info(f"📨 [API] 메시지 수신")
+            logger.info(f"📌 세션 ID: {request.session_id}")
+            logger.info(f"📝 사용자 메시지: {request.user_message[:100]}...")
+            logger.info(f"🔄 현재 State: {state.get('current_state')}")
+            logger.info("="*70)
+            logger.info(f"메시지 처리 시작: session_id={request.session_id}, current_state={state.get('current_state')}, user_message={request.user_message[:50]}...")
+            
+            # LangGraph 1 step 실행 (이벤트 루프를 블로킹하지 않도록 그래프 워커 풀에서 실행)
+            sys.stderr.write(f"▶️  LangGraph 실행 시작...\n")
+            sys.stderr.flush()
+            logger.info(f"▶️  LangGraph 실행 시작...")
+            result = await graph_executor.run_graph_step(state)
+            sys.stderr.write(f"✅ LangGraph 실행 완료\n")
+            sys.stderr.flush()
+            logger.info(f"✅ LangGraph 실행 완료")
+            
+            bot_message = result.get('bot_message') or ''
+            bot_message_preview = bot_message[:50] if bot_message else '(메시지 없음)'
+            
+            # Q-A 매칭 방식 디버깅 정보 로깅
+            conversation_history = result.get("conversation_history", [])
+            skipped_fields = result.get("skipped_fields", [])
+            initial_analysis = result.get("initial_analysis")
+            
+            logger.info(
+                f"메시지 처리 완료: new_state={result.get('current_state')}, "
+                f"bot_message={bot_message_preview}..., "
+                f"conversation_history={len(conversation_history)}개, "
+                f"skipped_fields={skipped_fields}"
+            )
+            
+            # 상태 저장
+            await run_in_threadpool(save_session_state, request.session_id, result)
         
         # 응답 데이터 구성 (Q-A 매칭 방식 디버깅 정보 포함)
         response_data = {
@@ -217,66 +225,203 @@ async def process_message(request: ChatMessageRequest, _: str = Depends(verify_a
     except InvalidInputError as e:
         logger.error(f"메시지 처리 실패 (잘못된 입력): {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
+    except SessionStateConflictError as e:
+        # 같은 세션의 다른 요청이 먼저 저장됨 (이 턴의 결과는 저장하지 않음, 클라이언트가 다시 시도)
+        logger.warning(f"메시지 처리 실패 (세션 상태 충돌): {str(e)}")
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         logger.error(f"메시지 처리 실패: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """
+    Server-Sent Events 형식 메시지 생성
+    
+    Args:
+        event: 이벤트 이름
+        data: 이벤트 데이터 (JSON 직렬화)
+    
+    Returns:
+        SSE 메시지 문자열
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def _load_case_summary(db_session, session_id: str) -> Dict[str, Any]:
+    """
+    세션의 사건 요약 조회
+    
+    Args:
+        db_session: DB 세션
+        session_id: 세션 ID
+    
+    Returns:
+        {"summary_text", "structured_data"} (요약이 없으면 빈 딕셔너리)
+    """
+    case = db_session.query(CaseMaster).filter(
+        CaseMaster.session_id == session_id
+    ).first()
+    if not case:
+        return {}
+    
+    summary = db_session.query(CaseSummary).filter(
+        CaseSummary.case_id == case.case_id
+    ).first()
+    if not summary:
+        return {}
+    return {
+        "summary_text": summary.summary_text,
+        "structured_data": summary.structured_json
+    }
+
+
+def _get_case_summary(session_id: str) -> Dict[str, Any]:
+    """새 DB 세션으로 사건 요약 조회 (상담 완료 응답용)"""
+    with db_manager.get_db_session() as db_session:
+        return _load_case_summary(db_session, session_id)
+
+
+@router.post("/message/stream")
+async def process_message_stream(request: ChatMessageRequest, _: str = Depends(verify_api_key)):
+    """
+    사용자 메시지 처리 (SSE 스트리밍)
+    
+    자유 텍스트를 생성하는 노드(SUMMARY)의 LLM 토큰을 도착 즉시 `token` 이벤트로
+    전송하고("키: 값" 텍스트), 그래프 실행이 끝나면 `done` 이벤트로 최종 상태를 전송합니다.
+    이번 단계에서 상담이 완료되었으면 `done`의 summary에 저장된 사건 요약을 담습니다.
+    실행 중 오류는 `error` 이벤트로 전송합니다.
+    """
+    # 세션 검증/로드는 스트림 시작 전에 완료 (HTTP 상태 코드로 오류 반환)
+    if not validate_session_id(request.session_id):
+        raise HTTPException(status_code=400, detail="유효하지 않은 세션 ID 형식입니다.")
+    
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    # 턴 작업에서 로드한 세션 상태 (로드가 끝나면 응답을 시작)
+    loaded: asyncio.Future = loop.create_future()
+    
+    def on_token(token: str):
+        # 노드가 워커 스레드에서 호출해도 안전하도록 이벤트 루프에 위임
+        loop.call_soon_threadsafe(queue.put_nowait, ("token", {"content": token}))
+    
+    async def run_step():
+        try:
+            # 세션 로드부터 상태 저장까지 한 턴의 쓰기는 트랜잭션 하나로 기록
+            async with db_manager.unit_of_work():
+                try:
+                    state = await run_in_threadpool(load_session_state, request.session_id)
+                except Exception as e:
+                    loaded.set_exception(e)
+                    return
+                loaded.set_result(state)
+                if not state:
+                    return
+                
+                state["last_user_input"] = request.user_message
+                logger.info(f"스트리밍 메시지 처리 시작: session_id={request.session_id}, current_state={state.get('current_state')}")
+                result = await graph_executor.run_graph_step_stream(state, on_token)
+                await run_in_threadpool(save_session_state, request.session_id, result)
+            summary = None
+            if result.get("current_state") == "COMPLETED":
+                summary = await run_in_threadpool(_get_case_summary, request.session_id)
+            queue.put_nowait(("done", {
+                "session_id": request.session_id,
+                "current_state": result.get("current_state", ""),
+                "completion_rate": result.get("completion_rate", 0),
+                "bot_message": result.get("bot_message", ""),
+                "expected_input": result.get("expected_input"),
+                "summary": summary
+            }))
+        except SessionStateConflictError as e:
+            logger.warning(f"스트리밍 메시지 처리 실패 (세션 상태 충돌): {str(e)}")
+            queue.put_nowait(("error", {"detail": str(e), "error_code": e.error_code}))
+        except Exception as e:
+            if not loaded.done():
+                loaded.set_exception(e)
+            logger.error(f"스트리밍 메시지 처리 실패: {str(e)}", exc_info=True)
+            queue.put_nowait(("error", {"detail": f"서버 내부 오류: {str(e)}"}))
+        finally:
+            queue.put_nowait(None)
+    
+    task = asyncio.create_task(run_step())
+    try:
+        state = await loaded
+    except Exception as e:
+        logger.error(f"메시지 처리 실패 (세션 로드): {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"서버 내부 오류: {str(e)}")
+    if not state:
+        raise HTTPException(status_code=404, detail=str(SessionNotFoundError(request.session_id)))
+    
+    async def event_stream():
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                event, data = item
+                yield _sse_event(event, data)
+        finally:
+            # 클라이언트 연결이 끊겨도 그래프 실행과 상태 저장은 끝까지 수행
+            await asyncio.shield(task)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @router.post("/end")
 async def end_chat(request: ChatEndRequest, _: str = Depends(verify_api_key)):
     """상담 종료"""
     try:
-        # 세션 검증
-        session = SessionManager.get_session(request.session_id)
-        if not session:
-            raise SessionNotFoundError(request.session_id)
-        
-        # 세션 상태 로드
-        state = load_session_state(request.session_id)
-        if not state:
-            raise SessionNotFoundError(request.session_id)
-        
-        # SUMMARY → COMPLETED 실행 (아직 SUMMARY가 아닌 경우)
-        # 하나의 DB 세션으로 통합하여 트랜잭션 일관성 확보
-        with db_manager.get_db_session() as db_session:
+        # 세션 로드부터 상태 저장까지 종료 턴의 쓰기는 트랜잭션 하나로 기록
+        async with db_manager.unit_of_work():
+            # 세션 검증
+            session = await run_in_threadpool(SessionManager.get_session, request.session_id)
+            if not session:
+                raise SessionNotFoundError(request.session_id)
+            
+            # 세션 상태 로드
+            state = await run_in_threadpool(load_session_state, request.session_id)
+            if not state:
+                raise SessionNotFoundError(request.session_id)
+            
+            # SUMMARY → COMPLETED 실행 (아직 SUMMARY가 아닌 경우, GPT 호출이 이벤트 루프를 블로킹하지 않도록 스레드에서 실행)
             if state.get("current_state") != "COMPLETED":
                 # SUMMARY Node 실행
                 from src.langgraph.nodes.summary_node import summary_node
-                state = summary_node(state)
+                state = await run_in_threadpool(summary_node, state)
                 
                 # COMPLETED Node 실행
                 from src.langgraph.nodes.completed_node import completed_node
-                state = completed_node(state)
+                state = await run_in_threadpool(completed_node, state)
                 
-                # 상태 저장 (같은 세션 사용)
-                save_session_state(request.session_id, state, db_session=db_session)
-            
-            # 최종 결과 조회 (같은 세션 사용)
-            case = db_session.query(CaseMaster).filter(
-                CaseMaster.session_id == request.session_id
-            ).first()
-            
-            summary_data = {}
-            if case:
-                summary = db_session.query(CaseSummary).filter(
-                    CaseSummary.case_id == case.case_id
-                ).first()
-                
-                if summary:
-                    summary_data = {
-                        "summary_text": summary.summary_text,
-                        "structured_data": summary.structured_json
-                    }
-            
-            return success_response({
-                "session_id": request.session_id,
-                "final_state": "COMPLETED",
-                "completion_rate": session.completion_rate,
-                "summary": summary_data
-            })
+                # 상태 저장 (작업 단위에 등록하여 턴 마지막에 기록)
+                await run_in_threadpool(save_session_state, request.session_id, state)
+        
+        # 종료된 세션은 더 이상 메시지를 받지 않으므로 저장이 커밋된 뒤 캐시에서 제거
+        SessionManager.invalidate_session_state(request.session_id)
+        
+        # 최종 결과 조회 (커밋된 사건 요약)
+        summary_data = await run_in_threadpool(_get_case_summary, request.session_id)
+        
+        return success_response({
+            "session_id": request.session_id,
+            "final_state": "COMPLETED",
+            # 조회한 세션 행은 이미 분리(detached)되어 있으므로 방금 저장한 상태의 값을 사용
+            "completion_rate": state.get("completion_rate", 0),
+            "summary": summary_data
+        })
     
     except SessionNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    except SessionStateConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -452,11 +597,11 @@ async def get_session_detail(session_id: str, _: str = Depends(verify_api_key)):
                 logger.warning(f"파일 목록 조회 중 오류 (테이블이 없을 수 있음): {str(e)}")
                 file_list = []
             
-            # conversation_history 가져오기 (DB에서 직접)
+            # conversation_history 가져오기 (chat_turn, 이전 세션은 JSON 컬럼)
             conversation_history = []
             try:
-                if session.conversation_history:
-                    conversation_history = session.conversation_history
+                conversation_history = get_conversation_turns(session_id) or session.conversation_history or []
+                if conversation_history:
                     logger.info(f"conversation_history 로드 완료: {session_id}, {len(conversation_history)}개 Q-A 쌍")
                 else:
                     logger.debug(f"conversation_history 없음: {session_id}")
@@ -2,8 +2,9 @@
 RAG 문서 인덱싱 관련 API 라우터
 """
 from fastapi import APIRouter, HTTPException, BackgroundTasks, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 import os
 from src.rag.pipeline import RAGIndexingPipeline
@@ -86,9 +87,11 @@ def _validate_directory_path(directory_path: str) -> Path:
 class IndexRequest(BaseModel):
     """인덱싱 요청 모델"""
     clear_existing: bool = False
-    """기존 인덱스를 초기화하고 재인덱싱할지 여부"""
+    """전체 재인덱싱 여부 (새 세대 컬렉션에 구축·검증 후 별칭을 전환하므로 검색 중단 없음)"""
     directory: Optional[str] = None
     """인덱싱할 디렉토리 경로 (기본값: data/rag)"""
+    incremental: bool = True
+    """변경된 파일만 다시 인덱싱할지 여부 (False면 모든 파일을 다시 Embedding)"""
 
 
 class IndexResponse(BaseModel):
@@ -109,6 +112,10 @@ class IndexStatusResponse(BaseModel):
     """마지막 인덱싱 시간"""
     total_chunks: Optional[int] = None
     """현재 인덱스에 저장된 총 Chunk 개수"""
+    last_result: Optional[Dict[str, Any]] = None
+    """마지막 인덱싱 결과 (added/updated/removed/skipped/failed 파일 수와 이번 실행에서 기록한 chunks 개수, 전체 재인덱싱 시 세대 정보 포함)"""
+    active_collection: Optional[str] = None
+    """현재 검색에 사용 중인 세대 컬렉션 이름"""
 
 
 # 전역 인덱싱 상태 관리
@@ -118,7 +125,8 @@ class IndexStatusResponse(BaseModel):
 _indexing_status = {
     "is_indexing": False,
     "last_indexed": None,
-    "total_chunks": None
+    "total_chunks": None,
+    "last_result": None
 }
 
 
@@ -142,13 +150,14 @@ class IndexingStatusManager:
         _indexing_status["is_indexing"] = is_indexing
     
     @staticmethod
-    def update_last_indexed(total_chunks: int):
+    def update_last_indexed(total_chunks: int, last_result: Optional[Dict[str, Any]] = None):
         """마지막 인덱싱 정보 업데이트"""
         global _indexing_status
         from src.utils.helpers import get_kst_now
         _indexing_status["is_indexing"] = False
         _indexing_status["last_indexed"] = get_kst_now().isoformat()
         _indexing_status["total_chunks"] = total_chunks
+        _indexing_status["last_result"] = last_result
     
     @staticmethod
     def reset():
@@ -156,9 +165,24 @@ class IndexingStatusManager:
         global _indexing_status
         _indexing_status["last_indexed"] = None
         _indexing_status["total_chunks"] = None
+        _indexing_status["last_result"] = None
 
 
-def _index_documents(clear_existing: bool, directory: Optional[str] = None):
+def _count_active_chunks() -> Tuple[str, int]:
+    """
+    현재 인덱스(별칭이 가리키는 세대)의 Chunk 개수 조회
+    
+    Returns:
+        (세대 컬렉션 이름, Chunk 개수)
+    """
+    from src.rag.vector_db import vector_db_manager
+    from src.rag.index_alias import index_alias_registry
+    active_collection = index_alias_registry.resolve("rag_documents")
+    collection = vector_db_manager.get_or_create_collection(name=active_collection)
+    return active_collection, collection.count()
+
+
+def _index_documents(clear_existing: bool, directory: Optional[str] = None, incremental: bool = True):
     """백그라운드에서 문서 인덱싱 수행"""
     try:
         IndexingStatusManager.set_indexing(True)
@@ -175,69 +199,36 @@ def _index_documents(clear_existing: bool, directory: Optional[str] = None):
         # 파이프라인 초기화
         pipeline = RAGIndexingPipeline()
         
-        # 기존 인덱스 초기화
-        if clear_existing:
-            logger.info("기존 인덱스 초기화 중...")
-            pipeline.clear_collection()
-        
         # 인덱싱 수행
-        total_chunks = pipeline.index_directory(rag_dir, recursive=True)
+        # - 전체 재인덱싱: 새 세대 컬렉션에 구축·검증 후 별칭 전환 (구축 중에도 기존 세대로 검색)
+        # - 증분 모드: 변경된 파일만 다시 Embedding
+        if clear_existing:
+            logger.info("블루/그린 전체 재인덱싱 중...")
+            result = pipeline.rebuild(rag_dir, recursive=True)
+            chunks_written = result["chunks"]
+        elif incremental:
+            result = pipeline.index_directory_incremental(rag_dir, recursive=True)
+            chunks_written = result["chunks"]
+        else:
+            result = None
+            chunks_written = pipeline.index_directory(rag_dir, recursive=True)
         
-        # 상태 업데이트
-        IndexingStatusManager.update_last_indexed(total_chunks)
+        # K2 조회 테이블도 변경된 문서로 다시 구축
+        from src.rag.k2_table import k2_lookup_table
+        k2_lookup_table.build()
         
-        logger.info(f"RAG 문서 인덱싱 완료! 총 {total_chunks}개 Chunk 인덱싱됨")
+        # 상태 업데이트 (증분 인덱싱은 변경된 파일의 Chunk만 기록하므로 총 개수는 인덱스에서 조회)
+        _, total_chunks = _count_active_chunks()
+        IndexingStatusManager.update_last_indexed(total_chunks, result)
         
+        logger.info(f"RAG 문서 인덱싱 완료! 이번 실행에서 {chunks_written}개 Chunk 기록, 인덱스 총 {total_chunks}개")
+    
     except Exception as e:
         IndexingStatusManager.set_indexing(False)
         logger.error(f"인덱싱 실패: {str(e)}", exc_info=True)
         raise
 
 
-@router.post("/index", response_model=IndexResponse)
-async def index_documents(
-    request: IndexRequest,
-    background_tasks: BackgroundTasks,
-    _: str = Depends(verify_api_key)
-):
-    """
-    RAG 문서 인덱싱 시작
-    
-    - **clear_existing**: 기존 인덱스를 초기화하고 재인덱싱할지 여부
-    - **directory**: 인덱싱할 디렉토리 경로 (기본값: data/rag)
-    
-    백그라운드에서 인덱싱이 수행되므로 즉시 응답이 반환됩니다.
-    인덱싱 상태는 `/rag/status` 엔드포인트로 확인할 수 있습니다.
-    """
-    status = IndexingStatusManager.get_status()
-    
-    # 이미 인덱싱 중이면 에러 반환
-    if status["is_indexing"]:
-        raise HTTPException(
-            status_code=409,
-            detail="이미 인덱싱이 진행 중입니다. 잠시 후 다시 시도해주세요."
-        )
-    
-    # 디렉토리 경로 설정 및 검증
-    if request.directory:
-        rag_dir = _validate_directory_path(request.directory)
-    else:
-        rag_dir = ALLOWED_RAG_BASE_DIR
-    
-    # 백그라운드 작업으로 인덱싱 시작
-    background_tasks.add_task(
-        _index_documents,
-        clear_existing=request.clear_existing,
-        directory=str(rag_dir) if request.directory else None
-    )
-    
-    return IndexResponse(
-        success=True,
-        message="인덱싱이 시작되었습니다. 상태는 /rag/status 엔드포인트로 확인할 수 있습니다.",
-        directory=str(rag_dir)
-    )
-
-
 @router.get("/status", response_model=IndexStatusResponse)
 async def get_index_status(_: str = Depends(verify_api_key)):
     """
@@ -247,28 +238,72 @@ async def get_index_status(_: str = Depends(verify_api_key)):
     """
     status = IndexingStatusManager.get_status()
     
-    # 현재 인덱스의 Chunk 개수 확인
+    # 현재 인덱스(별칭이 가리키는 세대)의 Chunk 개수 확인
+    active_collection = None
     try:
-        from src.rag.vector_db import vector_db_manager
-        collection = vector_db_manager.get_or_create_collection(name="rag_documents")
-        count = collection.count()
-        status["total_chunks"] = count
+        active_collection, status["total_chunks"] = _count_active_chunks()
     except Exception as e:
         logger.warning(f"인덱스 Chunk 개수 확인 실패: {str(e)}")
     
     return IndexStatusResponse(
         is_indexing=status["is_indexing"],
         last_indexed=status["last_indexed"],
-        total_chunks=status["total_chunks"]
+        total_chunks=status["total_chunks"],
+        last_result=status["last_result"],
+        active_collection=active_collection
     )
 
 
+@router.get("/generations")
+async def get_index_generations(_: str = Depends(verify_api_key)):
+    """
+    RAG 인덱스 세대 조회
+    
+    현재 검색에 사용 중인 세대와 롤백 가능한 이전 세대 목록을 반환합니다.
+    """
+    pipeline = RAGIndexingPipeline()
+    return {
+        "success": True,
+        **pipeline.list_generations()
+    }
+
+
+@router.post("/rollback")
+async def rollback_index(_: str = Depends(verify_api_key)):
+    """
+    RAG 인덱스 롤백
+    
+    별칭을 직전 세대로 되돌리고, 되돌리기 전 세대는 삭제합니다.
+    """
+    status = IndexingStatusManager.get_status()
+    
+    if status["is_indexing"]:
+        raise HTTPException(
+            status_code=409,
+            detail="인덱싱이 진행 중일 때는 롤백할 수 없습니다."
+        )
+    
+    try:
+        # 별칭 전환과 ChromaDB 컬렉션 삭제가 이벤트 루프를 블로킹하지 않도록 스레드에서 실행
+        result = await run_in_threadpool(lambda: RAGIndexingPipeline().rollback())
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    logger.info(f"RAG 인덱스 롤백 완료: {result['from']} → {result['to']}")
+    return {
+        "success": True,
+        "message": "이전 세대로 롤백되었습니다.",
+        **result
+    }
+
+
 @router.delete("/index")
 async def clear_index(_: str = Depends(verify_api_key)):
     """
     RAG 문서 인덱스 초기화
     
-    기존 인덱스를 완전히 삭제합니다. 주의: 이 작업은 되돌릴 수 없습니다.
+    현재 세대와 롤백용 이전 세대를 포함한 인덱스를 완전히 삭제합니다. 주의: 이 작업은 되돌릴 수 없습니다.
+    서비스 중단 없이 다시 만들려면 `clear_existing=true`로 `/rag/index`를 호출합니다.
     """
     status = IndexingStatusManager.get_status()
     
@@ -280,8 +315,7 @@ async def clear_index(_: str = Depends(verify_api_key)):
         )
     
     try:
-        from src.rag.vector_db import vector_db_manager
-        vector_db_manager.delete_collection("rag_documents")
+        await run_in_threadpool(lambda: RAGIndexingPipeline().clear_collection())
         
         # 상태 초기화
         IndexingStatusManager.reset()
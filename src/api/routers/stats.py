@@ -0,0 +1,49 @@
+"""
+운영 통계 API 라우터 (엔티티 추출 GPT 폴백, A/B 테스트)
+"""
+from fastapi import APIRouter, Depends
+from src.services.ab_test_manager import ab_test_manager
+from src.services.entity_extractor import entity_extractor
+from src.api.auth import verify_api_key
+from src.utils.response import success_response
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("/entity-extraction")
+async def get_entity_extraction_stats(_: str = Depends(verify_api_key)):
+    """
+    엔티티 추출 GPT 폴백 통계 조회
+    
+    필드(date, amount, party)별 호출 수, 패턴 추출 성공 수, GPT 폴백 수와 비율,
+    폴백 사유별 횟수를 반환합니다.
+    """
+    return success_response(entity_extractor.get_fallback_stats())
+
+
+@router.delete("/entity-extraction")
+async def reset_entity_extraction_stats(_: str = Depends(verify_api_key)):
+    """엔티티 추출 GPT 폴백 통계 초기화"""
+    entity_extractor.reset_fallback_stats()
+    return success_response({"reset": True})
+
+
+@router.get("/ab-test")
+async def get_ab_test_stats(_: str = Depends(verify_api_key)):
+    """
+    A/B 테스트 통계 조회
+    
+    사실 추출 방식별 세션/성공/오류 수와 사건 분류 방식(multi_call/fused)별
+    세션 수, 성공/폴백 수, 폴백 비율, 평균 소요 시간을 반환합니다.
+    """
+    return success_response({
+        "fact_extraction": ab_test_manager.get_stats(),
+        "classification": ab_test_manager.get_classification_stats()
+    })
+
+
+@router.delete("/ab-test")
+async def reset_ab_test_stats(_: str = Depends(verify_api_key)):
+    """A/B 테스트 통계 초기화"""
+    ab_test_manager.reset_stats()
+    return success_response({"reset": True})
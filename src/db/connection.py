@@ -1,30 +1,144 @@
 """
 데이터베이스 연결 관리 모듈
+
+대화 턴 단위 작업 (Unit of Work):
+    한 턴에서 노드/로거/세션 저장이 각자 연결을 얻어 커밋하면 턴마다 연결 획득과 커밋이 여러 번 일어납니다.
+    엔드포인트가 unit_of_work()로 턴을 감싸면 그 안에서 enlist()로 등록한 쓰기 작업은 바로 실행되지 않고
+    턴 마지막에 세션/트랜잭션 하나로 함께 기록됩니다. 조회는 기존처럼 get_db_session()으로 바로 수행합니다.
+    턴 동안 실행된 SQL 문/커밋/연결 획득 수는 DB_UNIT_OF_WORK_ENABLED와 관계없이 집계합니다.
 """
-from sqlalchemy import create_engine, Engine, text
+import asyncio
+import threading
+from sqlalchemy import create_engine, Engine, event, text
 from sqlalchemy.orm import sessionmaker, Session, scoped_session
 from sqlalchemy.pool import QueuePool
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, List, Optional, Tuple
 from config.settings import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 커밋 후 실행할 콜백 목록을 보관하는 Session.info 키
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+class UnitOfWork:
+    """대화 턴 단위 작업 (등록된 쓰기 작업과 턴의 DB 사용량)"""
+    
+    def __init__(self, deferred: bool):
+        """
+        Args:
+            deferred: True면 등록된 쓰기 작업을 flush 시점까지 미룸, False면 등록 즉시 실행
+        """
+        self.deferred = deferred
+        # (작업 함수, 인자, 실패 허용 여부)
+        self._operations: List[Tuple[Callable[..., Any], Tuple[Any, ...], bool]] = []
+        self._lock = threading.Lock()
+        self.statements = 0
+        self.transactions = 0
+        self.connections = 0
+    
+    @property
+    def pending(self) -> int:
+        """대기 중인 쓰기 작업 수"""
+        with self._lock:
+            return len(self._operations)
+    
+    def add(self, func: Callable[..., Any], args: Tuple[Any, ...], best_effort: bool):
+        """쓰기 작업 등록"""
+        with self._lock:
+            self._operations.append((func, args, best_effort))
+    
+    def take(self) -> List[Tuple[Callable[..., Any], Tuple[Any, ...], bool]]:
+        """대기 중인 쓰기 작업을 꺼냄 (등록 순서)"""
+        with self._lock:
+            operations, self._operations = self._operations, []
+            return operations
+    
+    def count(self, statements: int = 0, transactions: int = 0, connections: int = 0):
+        """DB 사용량 집계 (엔진 이벤트에서 호출, 여러 스레드에서 호출될 수 있음)"""
+        with self._lock:
+            self.statements += statements
+            self.transactions += transactions
+            self.connections += connections
+
+
+# 현재 턴의 작업 단위 (이벤트 루프 태스크/워커 스레드로 컨텍스트와 함께 전달)
+_current_unit_of_work: ContextVar[Optional[UnitOfWork]] = ContextVar("db_unit_of_work", default=None)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is not None:
+        unit_of_work.count(statements=1)
+
+
+def _count_commit(conn):
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is not None:
+        unit_of_work.count(transactions=1)
+
+
+def _count_checkout(dbapi_connection, connection_record, connection_proxy):
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is not None:
+        unit_of_work.count(connections=1)
+
+
+def run_after_commit(session: Session, callback: Callable[[], None]):
+    """
+    세션 트랜잭션이 커밋된 뒤 콜백 실행 (롤백되면 실행하지 않음)
+    
+    쓰기 작업이 작업 단위에 등록되어 턴 마지막에 커밋되는 경우에도 캐시 갱신 등이
+    실제 커밋 이후에만 일어나도록 합니다.
+    
+    Args:
+        session: DB 세션
+        callback: 커밋 후 실행할 함수
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit_callbacks(session: Session):
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, []):
+        try:
+            callback()
+        except Exception as e:
+            logger.error(f"커밋 후 콜백 실행 실패: {str(e)}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit_callbacks(session: Session):
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
 
 class DatabaseManager:
     """데이터베이스 연결 관리 클래스"""
     
-    def __init__(self):
+    def __init__(self, database_url: Optional[str] = None):
+        """
+        Args:
+            database_url: 데이터베이스 URL (None이면 settings.database_url)
+        """
+        self.database_url = database_url or settings.database_url
         self.engine: Engine = None
         self.SessionLocal: sessionmaker = None
+        self._stats_lock = threading.Lock()
+        self._turns = 0
+        self._turn_statements = 0
+        self._turn_transactions = 0
+        self._turn_connections = 0
+        self._max_turn_statements = 0
         self._initialize()
     
     def _initialize(self):
         """데이터베이스 연결 초기화"""
         try:
             self.engine = create_engine(
-                settings.database_url,
+                self.database_url,
                 poolclass=QueuePool,
                 pool_size=5,
                 max_overflow=10,
@@ -33,6 +147,11 @@ class DatabaseManager:
                 echo=False,  # SQL 쿼리 로깅 (개발 시 True)
             )
             
+            # 턴당 SQL 문/커밋/연결 획득 수 집계
+            event.listen(self.engine, "before_cursor_execute", _count_statement)
+            event.listen(self.engine, "commit", _count_commit)
+            event.listen(self.engine, "checkout", _count_checkout)
+            
             self.SessionLocal = scoped_session(
                 sessionmaker(
                     autocommit=False,
@@ -80,8 +199,132 @@ class DatabaseManager:
             logger.error(f"데이터베이스 세션 오류: {str(e)}", exc_info=True)
             raise
         finally:
+            # 커밋되지 않은 트랜잭션의 콜백이 스레드 로컬 세션에 남지 않도록 정리
+            session.info.pop(_AFTER_COMMIT_KEY, None)
             session.close()
     
+    def enlist(self, func: Callable[..., Any], *args: Any, best_effort: bool = False):
+        """
+        현재 턴의 작업 단위에 쓰기 작업 등록 (작업 단위가 없거나 비활성화면 바로 실행)
+        
+        작업 함수는 func(db_session, *args) 형태로 호출되며 커밋하지 않아야 합니다.
+        미뤄진 작업은 턴 마지막(또는 flush_unit_of_work 호출 시)에 실행되므로,
+        인자는 등록 이후 변경되지 않는 값이어야 합니다.
+        
+        Args:
+            func: 쓰기 작업 함수
+            *args: 작업 함수 인자
+            best_effort: 미뤄진 작업이 실패해도 턴을 실패시키지 않음 (로그 기록 등)
+        
+        Raises:
+            Exception: 바로 실행한 작업이 실패한 경우
+        """
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is None or not unit_of_work.deferred:
+            with self.get_db_session() as session:
+                func(session, *args)
+            return
+        unit_of_work.add(func, args, best_effort)
+    
+    def flush_unit_of_work(self):
+        """
+        현재 턴의 작업 단위에 등록된 쓰기 작업을 트랜잭션 하나로 실행
+        
+        일괄 기록이 실패하면 롤백한 뒤 작업별로 각자의 트랜잭션에서 다시 실행하여,
+        로그 한 건의 실패로 세션 상태 저장까지 사라지지 않도록 합니다.
+        
+        Raises:
+            Exception: best_effort가 아닌 작업이 실패한 경우 (첫 번째 오류)
+        """
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is None:
+            return
+        operations = unit_of_work.take()
+        if not operations:
+            return
+        
+        try:
+            with self.get_db_session() as session:
+                for func, args, _ in operations:
+                    func(session, *args)
+            return
+        except Exception as e:
+            logger.warning(f"작업 단위 일괄 기록 실패, 작업별로 다시 기록: {str(e)}")
+        
+        error: Optional[Exception] = None
+        for func, args, best_effort in operations:
+            try:
+                with self.get_db_session() as session:
+                    func(session, *args)
+            except Exception as e:
+                if best_effort:
+                    logger.error(f"작업 단위 기록 실패 (무시): {getattr(func, '__name__', func)} - {str(e)}")
+                elif error is None:
+                    error = e
+        if error is not None:
+            raise error
+    
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncGenerator[UnitOfWork, None]:
+        """
+        대화 턴 단위 작업 범위 (이미 범위 안이면 바깥 작업 단위를 그대로 사용)
+        
+        범위 안에서 enlist()로 등록한 쓰기 작업은 범위를 벗어날 때 워커 스레드에서 트랜잭션 하나로
+        기록됩니다. 범위 안에서 오류가 발생해도 이미 등록된 작업은 기록합니다 (기존처럼 오류 이전의
+        로그 등이 남도록). 범위 안의 동기 코드는 run_in_threadpool/asyncio.to_thread 등 컨텍스트를
+        전달하는 방식으로 실행해야 작업 단위에 참여합니다.
+        
+        Yields:
+            UnitOfWork 인스턴스
+        """
+        current = _current_unit_of_work.get()
+        if current is not None:
+            yield current
+            return
+        
+        unit_of_work = UnitOfWork(deferred=settings.db_unit_of_work_enabled)
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield unit_of_work
+        finally:
+            try:
+                if unit_of_work.pending:
+                    await asyncio.to_thread(self.flush_unit_of_work)
+            finally:
+                _current_unit_of_work.reset(token)
+                self._record_turn(unit_of_work)
+    
+    def _record_turn(self, unit_of_work: UnitOfWork):
+        """턴의 DB 사용량을 누적 통계에 반영"""
+        logger.debug(
+            f"턴 DB 사용량: SQL {unit_of_work.statements}회, 커밋 {unit_of_work.transactions}회, "
+            f"연결 획득 {unit_of_work.connections}회"
+        )
+        with self._stats_lock:
+            self._turns += 1
+            self._turn_statements += unit_of_work.statements
+            self._turn_transactions += unit_of_work.transactions
+            self._turn_connections += unit_of_work.connections
+            self._max_turn_statements = max(self._max_turn_statements, unit_of_work.statements)
+    
+    def get_unit_of_work_stats(self) -> Dict[str, Any]:
+        """
+        턴당 DB 사용량 통계 조회
+        
+        Returns:
+            턴 수, 턴당 평균 SQL 문/커밋/연결 획득 수, 턴당 최대 SQL 문 수
+        """
+        with self._stats_lock:
+            turns = self._turns
+            return {
+                "enabled": settings.db_unit_of_work_enabled,
+                "turns": turns,
+                "avg_statements": round(self._turn_statements / turns, 2) if turns else 0.0,
+                "avg_transactions": round(self._turn_transactions / turns, 2) if turns else 0.0,
+                "avg_connections": round(self._turn_connections / turns, 2) if turns else 0.0,
+                "max_statements": self._max_turn_statements
+            }
+    
     def health_check(self) -> bool:
         """
         데이터베이스 연결 상태 확인
@@ -126,4 +369,3 @@ def get_db() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
-
@@ -3,6 +3,7 @@
 from src.db.models.chat_session import ChatSession
 from src.db.models.chat_session_state_log import ChatSessionStateLog
 from src.db.models.chat_file import ChatFile
+from src.db.models.chat_turn import ChatTurn
 from src.db.models.case_master import CaseMaster
 from src.db.models.case_party import CaseParty
 from src.db.models.case_fact import CaseFact
@@ -16,6 +17,7 @@ __all__ = [
     "ChatSession",
     "ChatSessionStateLog",
     "ChatFile",
+    "ChatTurn",
     "CaseMaster",
     "CaseParty",
     "CaseFact",
@@ -1,7 +1,7 @@
 """
 ChatSession 모델
 """
-from sqlalchemy import Column, String, Integer, DateTime, CheckConstraint, Index, JSON
+from sqlalchemy import Column, String, Integer, DateTime, CheckConstraint, Index, JSON, LargeBinary
 from sqlalchemy.orm import relationship
 from src.db.base import BaseModel
 from src.utils.helpers import get_kst_now
@@ -31,11 +31,14 @@ class ChatSession(BaseModel):
     ended_at = Column(DateTime)
     created_at = Column(DateTime, nullable=False, default=get_kst_now)
     updated_at = Column(DateTime, nullable=False, default=get_kst_now, onupdate=get_kst_now)
-    conversation_history = Column(JSON, nullable=True)  # Q-A 쌍 리스트 저장
+    conversation_history = Column(JSON, nullable=True)  # Q-A 쌍 리스트 (chat_turn 이전 호환용, CONVERSATION_HISTORY_JSON_WRITE)
+    state_version = Column(Integer, nullable=False, default=0)  # 세션 상태 저장 횟수 (워커 간 캐시 충돌 확인용)
+    state_snapshot = Column(LargeBinary(length=16 * 1024 * 1024 - 1), nullable=True)  # StateContext 전체 스냅샷 (압축 JSON, MySQL MEDIUMBLOB)
     
     # Relationships
     state_logs = relationship("ChatSessionStateLog", back_populates="session", cascade="all, delete-orphan")
     case = relationship("CaseMaster", back_populates="session", uselist=False, cascade="all, delete-orphan")
     ai_logs = relationship("AIProcessLog", back_populates="session", cascade="all, delete-orphan")
     files = relationship("ChatFile", back_populates="session", cascade="all, delete-orphan")
+    turns = relationship("ChatTurn", back_populates="session", cascade="all, delete-orphan", passive_deletes=True, order_by="ChatTurn.seq")
 
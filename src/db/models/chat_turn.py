@@ -0,0 +1,27 @@
+"""
+ChatTurn 모델
+"""
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from src.db.base import BaseModel
+from src.utils.helpers import get_kst_now
+
+
+class ChatTurn(BaseModel):
+    """대화 Q-A 턴 테이블 (세션별 추가 전용, conversation_history 항목 하나가 한 행)"""
+    __tablename__ = "chat_turn"
+    __table_args__ = (
+        Index('idx_chat_turn_created', 'created_at'),
+    )
+    
+    session_id = Column(String(50), ForeignKey("chat_session.session_id", ondelete="CASCADE"), primary_key=True)
+    seq = Column(Integer, primary_key=True)  # 세션 내 순번 (0부터)
+    field = Column(String(50))
+    question = Column(Text)
+    answer = Column(Text)
+    source = Column(String(30))  # 답변 출처 (예: initial_description, 없으면 질문에 대한 답변)
+    timestamp = Column(String(40))  # Q-A 쌍의 timestamp (ISO 8601 문자열 그대로 저장)
+    created_at = Column(DateTime, nullable=False, default=get_kst_now)
+    
+    # Relationships
+    session = relationship("ChatSession", back_populates="turns")
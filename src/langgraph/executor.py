@@ -0,0 +1,235 @@
+"""
+LangGraph 실행 워커 풀 모듈
+
+run_graph_step은 GPT API 호출, 벡터 DB 검색, DB I/O를 동기적으로 수행하므로
+이벤트 루프에서 직접 호출하면 같은 워커의 다른 요청(헬스 체크, 상태 조회,
+정적 파일 등)이 모두 블로킹됩니다. 이 모듈은 그래프 실행을 전용 스레드 풀로
+옮기고, 워커(프로세스)당 동시 실행 수를 세마포어로 제한합니다.
+
+GRAPH_ASYNC_EXECUTION이 활성화되면 AsyncOpenAI 기반 비동기 노드 경로를 사용하므로
+LLM 응답 대기 중에는 스레드를 점유하지 않습니다.
+"""
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class GraphExecutor:
+    """그래프 실행 전용 워커 풀"""
+    
+    def __init__(self, max_workers: int = 8, max_concurrency: int = 8, async_mode: bool = False):
+        """
+        Args:
+            max_workers: 스레드 풀 크기
+            max_concurrency: 동시에 실행 가능한 작업 수 (초과 시 대기열에서 대기)
+            async_mode: True면 비동기 노드 경로(run_graph_step_async) 사용
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_concurrency = max(1, max_concurrency)
+        self.async_mode = async_mode
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+        
+        # 메트릭
+        self._queued = 0
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait_time = 0.0
+        self._total_run_time = 0.0
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """스레드 풀 반환 (최초 사용 시 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="graph-worker"
+                )
+                logger.info(
+                    f"그래프 워커 풀 생성: max_workers={self.max_workers}, "
+                    f"max_concurrency={self.max_concurrency}"
+                )
+            return self._executor
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프용 세마포어 반환"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+    
+    @asynccontextmanager
+    async def _slot(self):
+        """
+        동시 실행 슬롯 획득 (대기열/실행 중 메트릭 기록)
+        
+        동시 실행 수가 max_concurrency에 도달하면 슬롯이 빌 때까지 대기합니다.
+        """
+        semaphore = self._get_semaphore()
+        enqueued_at = time.monotonic()
+        
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+        
+        try:
+            await semaphore.acquire()
+        finally:
+            with self._lock:
+                self._queued -= 1
+        
+        started_at = time.monotonic()
+        with self._lock:
+            self._in_flight += 1
+            self._total_wait_time += started_at - enqueued_at
+        
+        success = False
+        try:
+            yield
+            success = True
+        finally:
+            semaphore.release()
+            with self._lock:
+                self._in_flight -= 1
+                self._total_run_time += time.monotonic() - started_at
+                if success:
+                    self._completed += 1
+                else:
+                    self._failed += 1
+    
+    async def submit(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        동기 함수를 워커 풀에서 실행 (호출한 쪽의 컨텍스트 변수를 그대로 전달)
+        
+        Args:
+            func: 실행할 동기 함수
+            *args: 함수 인자
+        
+        Returns:
+            함수 반환값
+        """
+        async with self._slot():
+            loop = asyncio.get_running_loop()
+            # 턴 단위 DB 작업(db_manager.unit_of_work) 등이 워커 스레드에서도 보이도록 컨텍스트 복사
+            context = contextvars.copy_context()
+            return await loop.run_in_executor(self._get_executor(), context.run, func, *args)
+    
+    async def submit_async(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        코루틴 함수를 동시 실행 상한 내에서 실행 (스레드를 점유하지 않음)
+        
+        Args:
+            func: 실행할 코루틴 함수
+            *args: 함수 인자
+        
+        Returns:
+            함수 반환값
+        """
+        async with self._slot():
+            return await func(*args)
+    
+    async def run_graph_step(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        LangGraph 1 step 실행
+        
+        async_mode이면 이벤트 루프에서 비동기 노드를 await하고,
+        아니면 동기 run_graph_step을 워커 풀에서 실행합니다.
+        
+        Args:
+            state: 현재 State Context
+        
+        Returns:
+            업데이트된 State
+        """
+        if self.async_mode:
+            from src.langgraph.graph import run_graph_step_async
+            return await self.submit_async(run_graph_step_async, state)
+        
+        from src.langgraph.graph import run_graph_step
+        return await self.submit(run_graph_step, state)
+    
+    async def run_graph_step_stream(
+        self,
+        state: Dict[str, Any],
+        on_token: Callable[[str], None]
+    ) -> Dict[str, Any]:
+        """
+        LangGraph 1 step 실행 (토큰 스트리밍)
+        
+        토큰 콜백을 현재 컨텍스트에 등록한 뒤 비동기 노드 경로로 실행합니다.
+        async_mode 설정과 관계없이 비동기 경로를 사용합니다.
+        
+        Args:
+            state: 현재 State Context
+            on_token: LLM 토큰 수신 콜백
+        
+        Returns:
+            업데이트된 State
+        """
+        from src.langgraph.graph import run_graph_step_async
+        from src.langgraph.streaming import set_token_callback, reset_token_callback
+        
+        token = set_token_callback(on_token)
+        try:
+            return await self.submit_async(run_graph_step_async, state)
+        finally:
+            reset_token_callback(token)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        워커 풀 통계 조회
+        
+        Returns:
+            대기열 깊이, 실행 중 작업 수, 평균 대기/실행 시간 등
+        """
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "mode": "async" if self.async_mode else "thread",
+                "max_workers": self.max_workers,
+                "max_concurrency": self.max_concurrency,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_wait_ms": round(self._total_wait_time / finished * 1000, 2) if finished else 0.0,
+                "avg_run_ms": round(self._total_run_time / finished * 1000, 2) if finished else 0.0,
+            }
+    
+    def shutdown(self, wait: bool = True):
+        """
+        워커 풀 종료
+        
+        Args:
+            wait: 실행 중인 작업 완료까지 대기 여부
+        """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
+                logger.info("그래프 워커 풀 종료")
+
+
+# 전역 그래프 실행기 인스턴스
+graph_executor = GraphExecutor(
+    max_workers=settings.graph_worker_threads,
+    max_concurrency=settings.graph_max_concurrency,
+    async_mode=settings.graph_async_execution
+)
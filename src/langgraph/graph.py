@@ -2,8 +2,9 @@
 LangGraph 그래프 구성
 """
 import sys
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Callable, Awaitable
 from langgraph.graph import StateGraph, END
 from src.langgraph.state import StateContext
 from src.langgraph.nodes import (
@@ -315,77 +316,16 @@ def run_graph_step(state: StateContext) -> StateContext:
                         logger.info(f"💬 반환 bot_message: {next_bot_msg[:100] if isinstance(next_bot_msg, str) else next_bot_msg}")
                         logger.info(f"➡️  반환 next_state: {next_next_state}")
                         
-                        # next_result의 모든 필드를 result에 병합 (덮어쓰기)
-                        # bot_message는 반드시 병합 (더 엄격한 검증)
-                        if "bot_message" in next_result and next_result["bot_message"]:
-                            result["bot_message"] = next_result["bot_message"]
-                            merged_msg = next_result['bot_message'][:100] if next_result['bot_message'] else '(빈 문자열)'
-                            msg = f"✅ bot_message 병합 완료: {merged_msg}...\n"
-                            os.write(2, msg.encode('utf-8'))
-                            sys.stderr.write(msg)
-                            sys.stderr.flush()
-                            logger.info(f"✅ bot_message 병합 완료: {merged_msg}...")
-                        else:
-                            msg = f"⚠️  {next_state} 노드에서 bot_message가 없거나 비어있습니다!\n"
-                            os.write(2, msg.encode('utf-8'))
-                            sys.stderr.write(msg)
-                            sys.stderr.flush()
-                            logger.warning(f"⚠️  {next_state} 노드에서 bot_message가 없거나 비어있음!")
-                            # bot_message가 없으면 기본 메시지 설정
-                            result["bot_message"] = "추가 정보가 필요합니다." if next_state == "RE_QUESTION" else "처리 중입니다."
-                            logger.warning(f"[{session_id}] ⚠️  기본 bot_message 설정: {result['bot_message']}")
-                        
-                        # expected_input 병합
-                        if "expected_input" in next_result:
-                            result["expected_input"] = next_result["expected_input"]
-                        
-                        # next_result의 다른 필드들도 병합 (conversation_history, current_question 등)
-                        for key in ["conversation_history", "current_question", "skipped_fields", "asked_fields", "missing_fields", "facts"]:
-                            if key in next_result:
-                                result[key] = next_result[key]
-                        
-                        # next_result의 next_state가 있으면 업데이트
-                        # 예: RE_QUESTION → FACT_COLLECTION 또는 RE_QUESTION → SUMMARY
-                        if next_result.get("next_state"):
-                            new_next_state = next_result["next_state"]
-                            
-                            # RE_QUESTION → SUMMARY 전이는 비정상적임 (missing_fields가 있어야 함)
-                            # 이 경우 RE_QUESTION 노드의 bot_message를 보존해야 함
-                            if next_state == "RE_QUESTION" and new_next_state == "SUMMARY":
-                                logger.warning(f"[{session_id}] ⚠️  RE_QUESTION → SUMMARY 전이 감지 (비정상적). RE_QUESTION bot_message 보존: {result.get('bot_message', '(없음)')[:100]}")
-                                # RE_QUESTION 노드의 bot_message를 보존
-                                re_question_bot_message = result.get("bot_message", "")
-                            
-                            result["current_state"] = new_next_state
-                            result["next_state"] = new_next_state
-                            logger.info(f"[{session_id}] {next_state} → {new_next_state} 전이 (연쇄 전이)")
-                            
-                            # RE_QUESTION → SUMMARY 전이인 경우 SUMMARY 노드도 즉시 실행
-                            if next_state == "RE_QUESTION" and new_next_state == "SUMMARY":
-                                logger.info(f"[{session_id}] RE_QUESTION → SUMMARY 연쇄 전이 감지, SUMMARY 노드 즉시 실행")
-                                summary_node_func = node_map.get("SUMMARY")
-                                if summary_node_func:
-                                    summary_result = summary_node_func(result)
-                                    logger.info(f"[{session_id}] SUMMARY 노드 실행 완료")
-                                    
-                                    # SUMMARY 노드 결과 병합
-                                    # 단, RE_QUESTION 노드의 bot_message가 있으면 우선 보존
-                                    if re_question_bot_message and re_question_bot_message.strip():
-                                        result["bot_message"] = re_question_bot_message
-                                        logger.info(f"[{session_id}] RE_QUESTION bot_message 보존: {re_question_bot_message[:100]}...")
-                                    elif "bot_message" in summary_result:
-                                        result["bot_message"] = summary_result["bot_message"]
-                                    
-                                    for key in ["summary", "risk_tags", "completion_rate"]:
-                                        if key in summary_result:
-                                            result[key] = summary_result[key]
-                                    
-                                    if summary_result.get("next_state"):
-                                        result["current_state"] = summary_result["next_state"]
-                                        result["next_state"] = summary_result["next_state"]
-                        else:
-                            # next_state가 없으면 현재 next_state 유지 (RE_QUESTION → FACT_COLLECTION)
-                            logger.info(f"[{session_id}] {next_state} 노드가 next_state를 반환하지 않음, 현재 next_state 유지: {next_state}")
+                        # next_result의 필드를 result에 병합
+                        # RE_QUESTION → SUMMARY 연쇄 전이인 경우 SUMMARY 노드도 즉시 실행
+                        if _merge_chained_result(result, next_result, next_state, session_id):
+                            # RE_QUESTION 노드의 bot_message를 보존
+                            re_question_bot_message = result.get("bot_message", "")
+                            logger.info(f"[{session_id}] RE_QUESTION → SUMMARY 연쇄 전이 감지, SUMMARY 노드 즉시 실행")
+                            summary_node_func = node_map.get("SUMMARY")
+                            if summary_node_func:
+                                summary_result = summary_node_func(result)
+                                _merge_summary_result(result, summary_result, re_question_bot_message, session_id)
                     except Exception as e:
                         import sys
                         import os
@@ -434,6 +374,204 @@ def run_graph_step(state: StateContext) -> StateContext:
         raise
 
 
+def _merge_chained_result(
+    result: Dict[str, Any],
+    next_result: Dict[str, Any],
+    next_state: str,
+    session_id: str
+) -> bool:
+    """
+    VALIDATION 직후 연쇄 실행한 노드(RE_QUESTION/SUMMARY)의 결과를 병합
+    
+    Args:
+        result: VALIDATION 노드 결과 (제자리에서 업데이트됨)
+        next_result: 연쇄 실행한 노드의 결과
+        next_state: 연쇄 실행한 노드 이름
+        session_id: 세션 ID
+    
+    Returns:
+        RE_QUESTION → SUMMARY 연쇄 전이 여부 (True면 SUMMARY 노드도 즉시 실행해야 함)
+    """
+    # bot_message는 반드시 병합 (비어있으면 기본 메시지)
+    if "bot_message" in next_result and next_result["bot_message"]:
+        result["bot_message"] = next_result["bot_message"]
+        logger.info(f"✅ bot_message 병합 완료: {next_result['bot_message'][:100]}...")
+    else:
+        logger.warning(f"⚠️  {next_state} 노드에서 bot_message가 없거나 비어있음!")
+        result["bot_message"] = "추가 정보가 필요합니다." if next_state == "RE_QUESTION" else "처리 중입니다."
+        logger.warning(f"[{session_id}] ⚠️  기본 bot_message 설정: {result['bot_message']}")
+    
+    # expected_input 병합
+    if "expected_input" in next_result:
+        result["expected_input"] = next_result["expected_input"]
+    
+    # next_result의 다른 필드들도 병합 (conversation_history, current_question 등)
+    for key in ["conversation_history", "current_question", "skipped_fields", "asked_fields", "missing_fields", "facts"]:
+        if key in next_result:
+            result[key] = next_result[key]
+    
+    # next_result의 next_state가 있으면 업데이트
+    # 예: RE_QUESTION → FACT_COLLECTION 또는 RE_QUESTION → SUMMARY
+    new_next_state = next_result.get("next_state")
+    if not new_next_state:
+        # next_state가 없으면 현재 next_state 유지 (RE_QUESTION → FACT_COLLECTION)
+        logger.info(f"[{session_id}] {next_state} 노드가 next_state를 반환하지 않음, 현재 next_state 유지: {next_state}")
+        return False
+    
+    # RE_QUESTION → SUMMARY 전이는 비정상적임 (missing_fields가 있어야 함)
+    is_summary_chain = next_state == "RE_QUESTION" and new_next_state == "SUMMARY"
+    if is_summary_chain:
+        logger.warning(f"[{session_id}] ⚠️  RE_QUESTION → SUMMARY 전이 감지 (비정상적). RE_QUESTION bot_message 보존: {result.get('bot_message', '(없음)')[:100]}")
+    
+    result["current_state"] = new_next_state
+    result["next_state"] = new_next_state
+    logger.info(f"[{session_id}] {next_state} → {new_next_state} 전이 (연쇄 전이)")
+    return is_summary_chain
+
+
+def _merge_summary_result(
+    result: Dict[str, Any],
+    summary_result: Dict[str, Any],
+    re_question_bot_message: str,
+    session_id: str
+):
+    """
+    RE_QUESTION → SUMMARY 연쇄 실행한 SUMMARY 노드 결과 병합
+    
+    Args:
+        result: 현재까지 병합된 결과 (제자리에서 업데이트됨)
+        summary_result: SUMMARY 노드 결과
+        re_question_bot_message: 보존할 RE_QUESTION 노드의 bot_message
+        session_id: 세션 ID
+    """
+    logger.info(f"[{session_id}] SUMMARY 노드 실행 완료")
+    
+    # 단, RE_QUESTION 노드의 bot_message가 있으면 우선 보존
+    if re_question_bot_message and re_question_bot_message.strip():
+        result["bot_message"] = re_question_bot_message
+        logger.info(f"[{session_id}] RE_QUESTION bot_message 보존: {re_question_bot_message[:100]}...")
+    elif "bot_message" in summary_result:
+        result["bot_message"] = summary_result["bot_message"]
+    
+    for key in ["summary", "risk_tags", "completion_rate"]:
+        if key in summary_result:
+            result[key] = summary_result[key]
+    
+    if summary_result.get("next_state"):
+        result["current_state"] = summary_result["next_state"]
+        result["next_state"] = summary_result["next_state"]
+
+
+def _get_async_node_map() -> Dict[str, Callable[[StateContext], Awaitable[Dict[str, Any]]]]:
+    """
+    비동기 노드 맵 생성
+    
+    GPT 호출이 있는 노드는 AsyncOpenAI 기반 비동기 변형을 사용하고,
+    벡터 검색/DB I/O만 수행하는 노드는 스레드에서 실행합니다.
+    
+    Returns:
+        State 이름 → 비동기 노드 함수 딕셔너리
+    """
+    from src.langgraph.nodes import (
+        init_node,
+        case_classification_node_async,
+        fact_collection_node,
+        validation_node_async,
+        re_question_node,
+        summary_node_async,
+        completed_node
+    )
+    
+    def _in_thread(node_func):
+        async def _run(state: StateContext) -> Dict[str, Any]:
+            return await asyncio.to_thread(node_func, state)
+        return _run
+    
+    return {
+        "INIT": _in_thread(init_node),
+        "CASE_CLASSIFICATION": case_classification_node_async,
+        "FACT_COLLECTION": _in_thread(fact_collection_node),
+        "VALIDATION": validation_node_async,
+        "RE_QUESTION": _in_thread(re_question_node),
+        "SUMMARY": summary_node_async,
+        "COMPLETED": _in_thread(completed_node)
+    }
+
+
+async def run_graph_step_async(state: StateContext) -> StateContext:
+    """
+    LangGraph 1 step 실행 (비동기)
+    
+    run_graph_step과 동일한 State 전이/연쇄 실행 규칙을 따르지만, 노드를 await하므로
+    LLM 응답 대기 중 스레드를 점유하지 않습니다.
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        업데이트된 State Context
+    
+    Raises:
+        RuntimeError: 재귀 제한 초과 시
+    """
+    try:
+        session_id = state.get("session_id", "unknown")
+        current_state = state.get("current_state", "INIT")
+        logger.info(f"🔄 [GRAPH] 노드 실행 시작 (async): {current_state}")
+        logger.info(f"📌 세션 ID: {session_id}")
+        
+        # 재귀 제한 확인
+        if _check_recursion_limit(session_id):
+            logger.error(f"[{session_id}] 무한 루프 감지, 그래프 실행 중단")
+            state["current_state"] = "COMPLETED"
+            state["bot_message"] = "죄송합니다. 시스템 오류가 발생했습니다. 세션을 다시 시작해주세요."
+            _reset_session_step_count(session_id)
+            return state
+        
+        node_map = _get_async_node_map()
+        node_func = node_map.get(current_state)
+        if not node_func:
+            logger.error(f"[{session_id}] 알 수 없는 State: {current_state}")
+            return state
+        
+        result = await node_func(state)
+        
+        # last_user_input 보존 (Node가 반환하지 않았을 수 있음)
+        if "last_user_input" not in result and "last_user_input" in state:
+            result["last_user_input"] = state["last_user_input"]
+        
+        next_state = result.get("next_state")
+        if next_state:
+            result["current_state"] = next_state
+            logger.info(f"✅ State 전이: {current_state} → {next_state}")
+            
+            # VALIDATION → RE_QUESTION/SUMMARY: 다음 노드를 즉시 실행하여 bot_message 생성
+            if current_state == "VALIDATION" and next_state in ["RE_QUESTION", "SUMMARY"]:
+                try:
+                    next_result = await node_map[next_state](result)
+                    if _merge_chained_result(result, next_result, next_state, session_id):
+                        re_question_bot_message = result.get("bot_message", "")
+                        logger.info(f"[{session_id}] RE_QUESTION → SUMMARY 연쇄 전이 감지, SUMMARY 노드 즉시 실행")
+                        summary_result = await node_map["SUMMARY"](result)
+                        _merge_summary_result(result, summary_result, re_question_bot_message, session_id)
+                except Exception as e:
+                    logger.error(f"[{session_id}] ❌ {next_state} 노드 실행 중 오류 발생: {str(e)}", exc_info=True)
+                    if not result.get("bot_message"):
+                        result["bot_message"] = "죄송합니다. 오류가 발생했습니다. 다시 시도해주세요."
+        elif "current_state" not in result:
+            # current_state가 없으면 현재 상태 유지
+            result["current_state"] = current_state
+            logger.info(f"⏸️  State 유지: {current_state}")
+        
+        return result
+    
+    except Exception as e:
+        session_id = state.get("session_id", "unknown")
+        logger.error(f"[{session_id}] Graph step 실행 실패 (async): {str(e)}", exc_info=True)
+        _reset_session_step_count(session_id)
+        raise
+
+
 # 전역 그래프 인스턴스 (캐싱)
 _graph_instance = None
 
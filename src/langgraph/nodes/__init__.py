@@ -1,11 +1,14 @@
 """LangGraph Nodes 모듈"""
 
 from src.langgraph.nodes.init_node import init_node
-from src.langgraph.nodes.case_classification_node import case_classification_node
+from src.langgraph.nodes.case_classification_node import (
+    case_classification_node,
+    case_classification_node_async
+)
 from src.langgraph.nodes.fact_collection_node import fact_collection_node
-from src.langgraph.nodes.validation_node import validation_node
+from src.langgraph.nodes.validation_node import validation_node, validation_node_async
 from src.langgraph.nodes.re_question_node import re_question_node
-from src.langgraph.nodes.summary_node import summary_node
+from src.langgraph.nodes.summary_node import summary_node, summary_node_async
 from src.langgraph.nodes.completed_node import completed_node
 
 __all__ = [
@@ -16,5 +19,8 @@ __all__ = [
     "re_question_node",
     "summary_node",
     "completed_node",
+    "case_classification_node_async",
+    "validation_node_async",
+    "summary_node_async",
 ]
 
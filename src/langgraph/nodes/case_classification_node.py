@@ -1,11 +1,19 @@
 """
 CASE_CLASSIFICATION Node 구현
 """
+import re
 import sys
-from typing import Dict, Any
+import json
+import time
+import asyncio
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from src.langgraph.state import StateContext
 from src.services.keyword_extractor import keyword_extractor
 from src.services.gpt_client import gpt_client
+from src.services.semantic_cache import semantic_cache
 from src.rag.searcher import rag_searcher
 from src.utils.logger import get_logger, log_execution_time
 from src.utils.constants import (
@@ -17,235 +25,273 @@ from src.utils.constants import (
     REQUIRED_FIELDS_BY_CASE_TYPE,
     REQUIRED_FIELDS
 )
-from src.utils.rag_helpers import extract_required_fields_from_rag
+from src.utils.rag_helpers import get_k2_required_fields
 from src.utils.question_loader import get_question_message
 from src.utils.helpers import get_kst_now
-from src.langgraph.nodes.qa_helpers import _analyze_initial_description
+from src.langgraph.nodes.qa_helpers import (
+    _analyze_initial_description,
+    _analyze_initial_description_async,
+    _reconcile_analysis_fields
+)
+from src.langgraph.nodes.fused_classification import _classify_fused, _classify_fused_async
+from src.services.ab_test_manager import ab_test_manager, ClassificationMethod
 from config.fallback_keywords import get_fallback_case_type
 from src.db.connection import db_manager
 from src.db.models.case_master import CaseMaster
 from src.db.models.chat_session import ChatSession
+from config.settings import settings
 
 logger = get_logger(__name__)
 
+# 동기 경로에서 독립적인 GPT/RAG 호출을 병렬 실행하기 위한 스레드 풀 (최초 사용 시 생성)
+_fanout_executor: Optional[ThreadPoolExecutor] = None
+_fanout_lock = threading.Lock()
+
+
+def _get_fanout_executor() -> ThreadPoolExecutor:
+    """CASE_CLASSIFICATION 병렬 호출용 스레드 풀 반환"""
+    global _fanout_executor
+    with _fanout_lock:
+        if _fanout_executor is None:
+            _fanout_executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.classification_fanout_workers),
+                thread_name_prefix="classification-fanout"
+            )
+        return _fanout_executor
 
-def post_classification_analysis(state: StateContext) -> StateContext:
+
+def _submit_fanout(func: Callable[..., Any], *args: Any) -> Future:
     """
-    CASE_CLASSIFICATION 이후 1차 서술 분석
+    병렬 호출용 스레드 풀에 작업 제출 (호출한 쪽의 컨텍스트 변수를 그대로 전달)
+    
+    GraphExecutor.submit과 같이 컨텍스트를 복사하므로 턴 단위 DB 작업(db_manager.unit_of_work)과
+    스트리밍 콜백이 병렬 작업에서도 보입니다. 컨텍스트는 동시에 두 스레드에서 실행할 수 없어
+    작업마다 따로 복사합니다.
+    
+    Args:
+        func: 실행할 동기 함수
+        *args: 함수 인자
+    
+    Returns:
+        작업 Future
+    """
+    context = contextvars.copy_context()
+    return _get_fanout_executor().submit(context.run, func, *args)
+
+
+def _default_required_fields(case_type: Optional[str]) -> List[str]:
+    """
+    사건 유형별 기본 필수 필드 목록
+    
+    Args:
+        case_type: 사건 유형 (None이면 기본 사건 유형 사용)
+    
+    Returns:
+        필수 필드 리스트
+    """
+    default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type or DEFAULT_CASE_TYPE, [])
+    if not default_required_fields:
+        default_required_fields = REQUIRED_FIELDS
+    return default_required_fields
+
+
+def _apply_default_initial_analysis(state: StateContext, required_fields: List[str]) -> StateContext:
+    """
+    1차 서술 분석 없이 모든 필수 필드를 질문 대상으로 설정
     
     Args:
         state: 현재 State Context
+        required_fields: 질문 대상 필드 목록
     
     Returns:
-        분석 결과를 포함한 state 업데이트
+        업데이트된 State Context
     """
-    try:
-        session_id = state.get("session_id", "unknown")
-        initial_description = state.get("last_user_input", "")  # CASE_CLASSIFICATION에서 받은 입력
-        case_type = state.get("case_type")
-        
-        logger.info(f"🔍 [1차 서술 분석] 시작: session_id={session_id}")
-        logger.info(f"📝 initial_description: {initial_description[:100] if initial_description else '(없음)'}...")
-        logger.info(f"🏷️  case_type: {case_type}")
-        
-        if not initial_description or not case_type:
-            logger.warning(f"[{session_id}] 1차 서술 분석 스킵: initial_description 또는 case_type 없음")
-            logger.info(f"⚠️  1차 서술 분석 스킵: initial_description={bool(initial_description)}, case_type={bool(case_type)}")
-            # case_type이 없어도 기본 필수 필드로 missing_fields 설정
-            if not case_type:
-                logger.warning(f"[{session_id}] case_type이 없어 기본 필수 필드 사용")
-                default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(DEFAULT_CASE_TYPE, REQUIRED_FIELDS)
-            else:
-                default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
-            
-            state["initial_description"] = initial_description
-            state["initial_analysis"] = {
-                "extracted_facts": {},
-                "answered_fields": [],
-                "missing_fields": default_required_fields
-            }
-            state["conversation_history"] = []
-            state["skipped_fields"] = []
-            state["missing_fields"] = default_required_fields  # 모든 필드를 질문 대상으로 설정
-            logger.info(f"[{session_id}] 기본 missing_fields 설정: {default_required_fields}")
-            return state
-        
-        # RAG에서 필수 필드 목록 가져오기
-        try:
-            rag_results = rag_searcher.search(
-                query="필수 필드",
-                knowledge_type="K2",
-                main_case_type=case_type,
-                top_k=1
-            )
-            required_fields = extract_required_fields_from_rag(rag_results)
-        except Exception as e:
-            logger.warning(f"[{session_id}] RAG 필수 필드 조회 실패: {str(e)}")
-            required_fields = []
-        
-        if not required_fields:
-            required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
-            logger.debug(f"[{session_id}] RAG 결과 없음, 기본 필수 필드 사용: {required_fields}")
-        
-        # 1차 서술 분석 (GPT)
-        logger.info(f"🤖 GPT API 호출 시작: 1차 서술 분석...")
-        analysis_result = _analyze_initial_description(
-            initial_description,
-            case_type,
-            required_fields
-        )
-        logger.info(f"✅ GPT API 호출 완료")
-        
-        # State 업데이트
-        state["initial_description"] = initial_description
-        state["initial_analysis"] = analysis_result
-        
-        # 1차 서술에서 추출된 정보를 conversation_history에 추가
-        extracted_facts = analysis_result.get("extracted_facts", {})
-        answered_fields = analysis_result.get("answered_fields", [])
-        
-        conversation_history = []
-        for field in answered_fields:
-            if extracted_facts.get(field) is not None:
-                # RAG에서 해당 필드의 질문 템플릿 가져오기 (로깅용)
-                question = get_question_message(field, case_type)
-                conversation_history.append({
-                    "question": question,
-                    "field": field,
-                    "answer": str(extracted_facts[field]),
-                    "source": "initial_description",
-                    "timestamp": get_kst_now().isoformat()
-                })
-        
-        state["conversation_history"] = conversation_history
-        state["skipped_fields"] = answered_fields
-        state["missing_fields"] = analysis_result.get("missing_fields", [])
-        
-        # 상세 로깅
-        logger.info(f"[{session_id}] 1차 서술 분석 완료: answered_fields={answered_fields} ({len(answered_fields)}개), missing_fields={state['missing_fields']} ({len(state['missing_fields'])}개)")
-        logger.debug(f"[{session_id}] conversation_history 추가: {len(conversation_history)}개 Q-A 쌍")
-        logger.debug(f"[{session_id}] extracted_facts: {[(k, v) for k, v in extracted_facts.items() if v is not None]}")
-        
-        logger.info(f"✅ 1차 서술 분석 완료: answered_fields={len(answered_fields)}개, missing_fields={len(state['missing_fields'])}개")
-        logger.info(f"📊 conversation_history: {len(conversation_history)}개 Q-A 쌍")
-        
-        return state
+    state["initial_description"] = state.get("last_user_input", "")
+    state["initial_analysis"] = {
+        "extracted_facts": {},
+        "answered_fields": [],
+        "missing_fields": required_fields
+    }
+    state["conversation_history"] = []
+    state["skipped_fields"] = []
+    state["missing_fields"] = required_fields  # 모든 필드를 질문 대상으로 설정
+    return state
+
+
+def _get_required_fields(session_id: str, case_type: str, sub_case_type: Optional[str] = None) -> List[str]:
+    """
+    K2에서 필수 필드 목록 조회 (없으면 기본 필수 필드)
+    
+    Args:
+        session_id: 세션 ID (로깅용)
+        case_type: 사건 유형
+        sub_case_type: 세부 사건 유형 (분류 전이면 None)
     
+    Returns:
+        필수 필드 리스트
+    """
+    try:
+        required_fields = get_k2_required_fields(case_type, sub_case_type)
     except Exception as e:
-        logger.error(f"1차 서술 분석 실패: {str(e)}", exc_info=True)
-        # 폴백: 모든 필드를 질문 대상으로 설정
-        case_type = state.get("case_type", DEFAULT_CASE_TYPE)
-        default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
-        if not default_required_fields:
-            default_required_fields = REQUIRED_FIELDS
-        
-        state["initial_description"] = state.get("last_user_input", "")
-        state["initial_analysis"] = {
-            "extracted_facts": {},
-            "answered_fields": [],
-            "missing_fields": default_required_fields
-        }
-        state["conversation_history"] = []
-        state["skipped_fields"] = []
-        state["missing_fields"] = default_required_fields  # 모든 필드를 질문 대상으로 설정
-        logger.warning(f"[{state.get('session_id', 'unknown')}] 1차 서술 분석 실패, 모든 필드를 질문 대상으로 설정: {default_required_fields}")
-        return state
+        logger.warning(f"[{session_id}] RAG 필수 필드 조회 실패: {str(e)}")
+        required_fields = []
+    
+    if not required_fields:
+        required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
+        logger.debug(f"[{session_id}] RAG 결과 없음, 기본 필수 필드 사용: {required_fields}")
+    
+    return required_fields
 
 
-@log_execution_time(logger)
-def case_classification_node(state: StateContext) -> Dict[str, Any]:
+def _run_initial_analysis(session_id: str, initial_description: str, case_type: str) -> Dict[str, Any]:
     """
-    CASE_CLASSIFICATION Node 실행
+    RAG K2 필수 필드 조회 후 1차 서술 분석 (GPT)
+    
+    Args:
+        session_id: 세션 ID
+        initial_description: 1차 서술
+        case_type: 사건 유형 (영문)
+    
+    Returns:
+        _analyze_initial_description 결과
+    """
+    required_fields = _get_required_fields(session_id, case_type)
+    
+    logger.info(f"🤖 GPT API 호출 시작: 1차 서술 분석... (case_type={case_type})")
+    analysis_result = _analyze_initial_description(
+        initial_description,
+        case_type,
+        required_fields
+    )
+    logger.info(f"✅ GPT API 호출 완료")
+    return analysis_result
+
+
+async def _run_initial_analysis_async(session_id: str, initial_description: str, case_type: str) -> Dict[str, Any]:
+    """
+    RAG K2 필수 필드 조회 후 1차 서술 분석 (비동기)
+    
+    Args:
+        session_id: 세션 ID
+        initial_description: 1차 서술
+        case_type: 사건 유형 (영문)
+    
+    Returns:
+        _analyze_initial_description_async 결과
+    """
+    required_fields = await asyncio.to_thread(_get_required_fields, session_id, case_type)
+    
+    logger.info(f"🤖 GPT API 호출 시작: 1차 서술 분석 (async)... (case_type={case_type})")
+    analysis_result = await _analyze_initial_description_async(
+        initial_description,
+        case_type,
+        required_fields
+    )
+    logger.info(f"✅ GPT API 호출 완료")
+    return analysis_result
+
+
+def _apply_initial_analysis(
+    state: StateContext,
+    initial_description: str,
+    case_type: str,
+    analysis_result: Dict[str, Any]
+) -> StateContext:
+    """
+    1차 서술 분석 결과를 State에 반영 (conversation_history, skipped/missing 필드)
     
     Args:
         state: 현재 State Context
+        initial_description: 1차 서술
+        case_type: 사건 유형
+        analysis_result: _analyze_initial_description 결과
     
     Returns:
-        업데이트된 State 및 다음 State 정보
+        업데이트된 State Context
     """
-    import os
-    try:
-        session_id = state["session_id"]
-        user_input = state.get("last_user_input", "")
-        
-        # 단계 표시 (강제 출력 - os.write 사용)
-        os.write(2, b"\n" + b"="*70 + b"\n")
-        os.write(2, "[STEP 2] CASE_CLASSIFICATION 노드 실행!!!\n".encode('utf-8'))
-        os.write(2, b"="*70 + b"\n")
-        os.write(2, f"세션 ID: {session_id}\n".encode('utf-8'))
-        os.write(2, f"사용자 입력: {user_input[:50] if user_input else '(없음)'}...\n".encode('utf-8'))
-        os.write(2, b"="*70 + b"\n")
-        logger.info("="*70)
-        logger.info("📍 [STEP 2] CASE_CLASSIFICATION 노드 실행")
-        logger.info("="*70)
-        logger.info(f"📌 세션 ID: {session_id}")
-        logger.info(f"📝 사용자 입력: {user_input[:50] if user_input else '(없음)'}...")
-        logger.info("="*70)
-        logger.info("="*70)
-        logger.info("📍 [STEP 2] CASE_CLASSIFICATION 노드 실행")
-        logger.info("="*70)
-        logger.info(f"📌 세션 ID: {session_id}")
-        logger.info(f"📝 사용자 입력: {user_input[:Limits.LOG_PREVIEW_LENGTH] if user_input else 'None'}...")
-        logger.info("="*70)
-        
-        if not user_input:
-            logger.warning("사용자 입력이 없습니다.")
-            return {
-                **state,
-                "bot_message": "사건과 관련된 내용을 알려주세요.",
-                "next_state": "CASE_CLASSIFICATION"
-            }
-        
-        # 1. 키워드 및 의미 추출
-        semantic_features = keyword_extractor.extract_semantic_features(user_input)
-        keywords = semantic_features.get("keywords", [])
-        
-        # 2. RAG K1 조회 (사건 유형 분류 기준)
-        query = " ".join(keywords) if keywords else user_input
-        rag_results = rag_searcher.search_by_knowledge_type(
-            query=query,
-            knowledge_type="K1",
-            top_k=3
-        )
-        
-        # 3. 사건 유형 결정
-        main_case_type = None
-        sub_case_type = None
-        
-        if rag_results:
-            # 가장 유사도 높은 결과 사용
-            best_match = rag_results[0]
-            metadata = best_match.get("metadata", {})
-            main_case_type = metadata.get("main_case_type")
-            sub_case_type = metadata.get("sub_case_type")
-        
-        # GPT API로 최종 분류 (RAG 결과를 참고)
-        if not main_case_type:
-            try:
-                # 프롬프트 파일에서 로드 시도
-                from src.services.prompt_loader import prompt_loader
-                prompt_template = prompt_loader.load_prompt("case_classification", sub_dir="classification")
-                if prompt_template:
-                    classification_prompt = prompt_template.format(user_input=user_input)
-                else:
-                    # 기본 프롬프트 사용
-                    classification_prompt = f"""다음 텍스트를 분석하여 법률 사건 유형을 분류하세요.
-가능한 분류:
-- 민사: 계약, 불법행위, 대여금, 손해배상
-- 형사: 사기, 성범죄, 폭행
-- 가사: 이혼, 상속
-- 행정: 행정처분, 세무
+    session_id = state.get("session_id", "unknown")
+    
+    # State 업데이트
+    state["initial_description"] = initial_description
+    state["initial_analysis"] = analysis_result
+    
+    # 1차 서술에서 추출된 정보를 conversation_history에 추가
+    extracted_facts = analysis_result.get("extracted_facts", {})
+    answered_fields = analysis_result.get("answered_fields", [])
+    
+    conversation_history = []
+    for field in answered_fields:
+        if extracted_facts.get(field) is not None:
+            # RAG에서 해당 필드의 질문 템플릿 가져오기 (로깅용)
+            question = get_question_message(field, case_type)
+            conversation_history.append({
+                "question": question,
+                "field": field,
+                "answer": str(extracted_facts[field]),
+                "source": "initial_description",
+                "timestamp": get_kst_now().isoformat()
+            })
+    
+    state["conversation_history"] = conversation_history
+    state["skipped_fields"] = answered_fields
+    state["missing_fields"] = analysis_result.get("missing_fields", [])
+    
+    # 상세 로깅
+    logger.info(f"[{session_id}] 1차 서술 분석 완료: answered_fields={answered_fields} ({len(answered_fields)}개), missing_fields={state['missing_fields']} ({len(state['missing_fields'])}개)")
+    logger.debug(f"[{session_id}] conversation_history 추가: {len(conversation_history)}개 Q-A 쌍")
+    logger.debug(f"[{session_id}] extracted_facts: {[(k, v) for k, v in extracted_facts.items() if v is not None]}")
+    
+    logger.info(f"✅ 1차 서술 분석 완료: answered_fields={len(answered_fields)}개, missing_fields={len(state['missing_fields'])}개")
+    logger.info(f"📊 conversation_history: {len(conversation_history)}개 Q-A 쌍")
+    
+    return state
 
-텍스트: {user_input}
 
-JSON 형식으로 반환:
-{{
-    "main_case_type": "민사/형사/가사/행정",
-    "sub_case_type": "세부 유형"
-}}"""
-            except Exception as prompt_error:
-                logger.debug(f"프롬프트 로드 실패, 기본 프롬프트 사용: {str(prompt_error)}")
-                classification_prompt = f"""다음 텍스트를 분석하여 법률 사건 유형을 분류하세요.
+def _should_skip_initial_analysis(state: StateContext) -> bool:
+    """
+    1차 서술 분석 생략 여부 확인 (생략 시 기본 필수 필드로 State 설정)
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        생략 여부
+    """
+    session_id = state.get("session_id", "unknown")
+    initial_description = state.get("last_user_input", "")  # CASE_CLASSIFICATION에서 받은 입력
+    case_type = state.get("case_type")
+    
+    logger.info(f"🔍 [1차 서술 분석] 시작: session_id={session_id}")
+    logger.info(f"📝 initial_description: {initial_description[:100] if initial_description else '(없음)'}...")
+    logger.info(f"🏷️  case_type: {case_type}")
+    
+    if initial_description and case_type:
+        return False
+    
+    logger.warning(f"[{session_id}] 1차 서술 분석 스킵: initial_description 또는 case_type 없음")
+    logger.info(f"⚠️  1차 서술 분석 스킵: initial_description={bool(initial_description)}, case_type={bool(case_type)}")
+    # case_type이 없어도 기본 필수 필드로 missing_fields 설정
+    if not case_type:
+        logger.warning(f"[{session_id}] case_type이 없어 기본 필수 필드 사용")
+        default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(DEFAULT_CASE_TYPE, REQUIRED_FIELDS)
+    else:
+        default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
+    
+    _apply_default_initial_analysis(state, default_required_fields)
+    logger.info(f"[{session_id}] 기본 missing_fields 설정: {default_required_fields}")
+    return True
+
+
+def _initial_analysis_failed(state: StateContext, error: Exception) -> StateContext:
+    """1차 서술 분석 실패 시 폴백: 모든 필드를 질문 대상으로 설정"""
+    logger.error(f"1차 서술 분석 실패: {str(error)}", exc_info=True)
+    default_required_fields = _default_required_fields(state.get("case_type", DEFAULT_CASE_TYPE))
+    _apply_default_initial_analysis(state, default_required_fields)
+    logger.warning(f"[{state.get('session_id', 'unknown')}] 1차 서술 분석 실패, 모든 필드를 질문 대상으로 설정: {default_required_fields}")
+    return state
+
+
+CLASSIFICATION_PROMPT_FALLBACK = """다음 텍스트를 분석하여 법률 사건 유형을 분류하세요.
 가능한 분류:
 - 민사: 계약, 불법행위, 대여금, 손해배상
 - 형사: 사기, 성범죄, 폭행
@@ -259,222 +305,682 @@ JSON 형식으로 반환:
     "main_case_type": "민사/형사/가사/행정",
     "sub_case_type": "세부 유형"
 }}"""
+
+
+def _log_classification_start(session_id: str, user_input: str):
+    """CASE_CLASSIFICATION 노드 시작 단계 표시"""
+    logger.info("="*70)
+    logger.info("📍 [STEP 2] CASE_CLASSIFICATION 노드 실행")
+    logger.info("="*70)
+    logger.info(f"📌 세션 ID: {session_id}")
+    logger.info(f"📝 사용자 입력: {user_input[:Limits.LOG_PREVIEW_LENGTH] if user_input else 'None'}...")
+    logger.info("="*70)
+
+
+def _search_case_type_candidates(keywords: List[str], user_input: str) -> List[Dict[str, Any]]:
+    """
+    RAG K1 조회 (사건 유형 분류 기준)
+    
+    대여금/과징금 같은 법률 용어가 정확히 일치하는 문서가 상위에 오도록 기본적으로
+    BM25 + 벡터 결합 검색(RAG_K1_SEARCH_MODE=hybrid)을 사용합니다.
+    
+    Args:
+        keywords: 의미 추출 단계에서 얻은 키워드
+        user_input: 사용자 입력 (키워드가 없을 때 쿼리로 사용)
+    
+    Returns:
+        K1 검색 결과 리스트
+    """
+    query = " ".join(keywords) if keywords else user_input
+    return rag_searcher.search_by_knowledge_type(
+        query=query,
+        knowledge_type="K1",
+        top_k=3,
+        mode=settings.rag_k1_search_mode
+    )
+
+
+def _case_type_from_rag(rag_results: List[Dict[str, Any]]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    K1 검색 결과에서 사건 유형 결정 (가장 유사도 높은 결과 사용)
+    
+    Args:
+        rag_results: K1 검색 결과
+    
+    Returns:
+        (main_case_type, sub_case_type)
+    """
+    if not rag_results:
+        return None, None
+    metadata = rag_results[0].get("metadata", {})
+    return metadata.get("main_case_type"), metadata.get("sub_case_type")
+
+
+def _speculative_case_type(session_id: str, user_input: str) -> Optional[str]:
+    """
+    1차 서술 분석 선실행용 후보 사건 유형 조회
+    
+    의미 추출(GPT)을 기다리지 않고 사용자 입력 원문으로 K1을 조회해
+    1순위 후보의 사건 유형을 반환합니다.
+    
+    동기 경로에서는 이미 실행 중인 선실행을 취소할 수 없어, 후보가 빗나가면 1차 서술 분석
+    GPT 호출 비용을 한 번 더 씁니다. 그래서 상위 후보
+    (CLASSIFICATION_SPECULATIVE_MIN_AGREEMENT개)가 모두 같은 사건 유형일 때만 선실행합니다.
+    
+    Args:
+        session_id: 세션 ID
+        user_input: 사용자 입력
+    
+    Returns:
+        후보 사건 유형 (영문) 또는 None (비활성화/후보 없음)
+    """
+    if not settings.classification_speculative_analysis:
+        return None
+    
+    try:
+        rag_results = _search_case_type_candidates([], user_input)
+    except Exception as e:
+        logger.debug(f"[{session_id}] 선실행용 K1 조회 실패: {str(e)}")
+        return None
+    
+    main_case_type, _ = _case_type_from_rag(rag_results)
+    if not main_case_type:
+        return None
+    
+    top_candidates = rag_results[:max(1, settings.classification_speculative_min_agreement)]
+    if any(result.get("metadata", {}).get("main_case_type") != main_case_type for result in top_candidates):
+        logger.debug(f"[{session_id}] K1 상위 후보가 엇갈려 1차 서술 분석 선실행 생략")
+        return None
+    return CASE_TYPE_MAPPING.get(main_case_type, main_case_type)
+
+
+def _is_speculation_hit(session_id: str, speculative_case_type: Optional[str], case_type: Optional[str]) -> bool:
+    """
+    선실행한 1차 서술 분석을 재사용할 수 있는지 확인
+    
+    Args:
+        session_id: 세션 ID
+        speculative_case_type: 선실행 시 사용한 후보 사건 유형
+        case_type: 최종 확정된 사건 유형
+    
+    Returns:
+        재사용 가능 여부 (후보와 확정 사건 유형이 같으면 True)
+    """
+    if not speculative_case_type:
+        return False
+    
+    hit = speculative_case_type == case_type
+    logger.info(
+        f"[{session_id}] 1차 서술 분석 선실행 {'적중' if hit else '불일치 (재실행)'}: "
+        f"후보={speculative_case_type}, 확정={case_type}"
+    )
+    return hit
+
+
+def _build_classification_prompt(user_input: str) -> str:
+    """
+    GPT 분류 프롬프트 생성 (프롬프트 파일이 없으면 기본 프롬프트 사용)
+    
+    Args:
+        user_input: 사용자 입력
+    
+    Returns:
+        프롬프트 문자열
+    """
+    try:
+        # 프롬프트 파일에서 로드 시도
+        from src.services.prompt_loader import prompt_loader
+        prompt_template = prompt_loader.load_prompt("case_classification", sub_dir="classification")
+        if prompt_template:
+            return prompt_template.format(user_input=user_input)
+    except Exception as prompt_error:
+        logger.debug(f"프롬프트 로드 실패, 기본 프롬프트 사용: {str(prompt_error)}")
+    # 기본 프롬프트 사용
+    return CLASSIFICATION_PROMPT_FALLBACK.format(user_input=user_input)
+
+
+def _parse_classification_content(content: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    GPT 분류 응답에서 사건 유형 추출
+    
+    Args:
+        content: GPT 응답 본문
+    
+    Returns:
+        (main_case_type, sub_case_type)
+    
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시
+    """
+    # 응답에서 JSON 추출 (마크다운 코드 블록 제거)
+    content = content.strip()
+    
+    # ```json ... ``` 또는 ``` ... ``` 제거
+    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+    if json_match:
+        content = json_match.group(1)
+    else:
+        # JSON 객체만 추출
+        json_match = re.search(r'\{.*\}', content, re.DOTALL)
+        if json_match:
+            content = json_match.group(0)
+    
+    classification = json.loads(content)
+    return classification.get("main_case_type"), classification.get("sub_case_type")
+
+
+def _classify_with_gpt(session_id: str, user_input: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    GPT API로 최종 분류 (실패 시 키워드 기반 폴백)
+    
+    Args:
+        session_id: 세션 ID
+        user_input: 사용자 입력
+    
+    Returns:
+        (main_case_type, sub_case_type)
+    """
+    classification_prompt = _build_classification_prompt(user_input)
+    
+    def _request() -> Tuple[Optional[str], Optional[str]]:
+        response = gpt_client.chat_completion(
+            messages=[{"role": "user", "content": classification_prompt}],
+            temperature=0.3,
+            max_tokens=Limits.MAX_TOKENS_CLASSIFICATION,
+            session_id=session_id,
+            node_name="case_classification"
+        )
+        return _parse_classification_content(response["content"])
+    
+    try:
+        return semantic_cache.get_or_compute("case_classification", user_input, _request)
+    except Exception as e:
+        logger.error(f"GPT 분류 실패: {str(e)}")
+        # 폴백: 키워드 기반 간단한 분류
+        return get_fallback_case_type(user_input)
+
+
+async def _classify_with_gpt_async(session_id: str, user_input: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    GPT API로 최종 분류 (비동기, 실패 시 키워드 기반 폴백)
+    
+    Args:
+        session_id: 세션 ID
+        user_input: 사용자 입력
+    
+    Returns:
+        (main_case_type, sub_case_type)
+    """
+    classification_prompt = _build_classification_prompt(user_input)
+    
+    async def _request() -> Tuple[Optional[str], Optional[str]]:
+        response = await gpt_client.chat_completion_async(
+            messages=[{"role": "user", "content": classification_prompt}],
+            temperature=0.3,
+            max_tokens=Limits.MAX_TOKENS_CLASSIFICATION,
+            session_id=session_id,
+            node_name="case_classification"
+        )
+        return _parse_classification_content(response["content"])
+    
+    try:
+        return await semantic_cache.get_or_compute_async("case_classification", user_input, _request)
+    except Exception as e:
+        logger.error(f"GPT 분류 실패: {str(e)}")
+        return get_fallback_case_type(user_input)
+
+
+def _save_case_master(session_id: str, main_case_type_en: Optional[str], sub_case_type: Optional[str]):
+    """
+    case_master 생성/업데이트 및 State 전이 로깅
+    
+    Args:
+        session_id: 세션 ID
+        main_case_type_en: 주 사건 유형 (영문)
+        sub_case_type: 세부 사건 유형
+    """
+    with db_manager.get_db_session() as db_session:
+        chat_session = db_session.query(ChatSession).filter(
+            ChatSession.session_id == session_id
+        ).first()
+        
+        if chat_session:
+            # case_master 생성 또는 업데이트
+            case = db_session.query(CaseMaster).filter(
+                CaseMaster.session_id == session_id
+            ).first()
             
-            try:
-                response = gpt_client.chat_completion(
-                    messages=[{"role": "user", "content": classification_prompt}],
-                    temperature=0.3,
-                    max_tokens=Limits.MAX_TOKENS_CLASSIFICATION,
+            if not case:
+                case = CaseMaster(
                     session_id=session_id,
-                    node_name="case_classification"
+                    main_case_type=main_case_type_en,
+                    sub_case_type=sub_case_type,
+                    case_stage=CaseStage.BEFORE_CONSULTATION.value
                 )
-                
-                import json
-                import re
-                
-                # 응답에서 JSON 추출 (마크다운 코드 블록 제거)
-                content = response["content"].strip()
-                
-                # ```json ... ``` 또는 ``` ... ``` 제거
-                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-                if json_match:
-                    content = json_match.group(1)
-                else:
-                    # JSON 객체만 추출
-                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                    if json_match:
-                        content = json_match.group(0)
-                
-                classification = json.loads(content)
-                main_case_type = classification.get("main_case_type")
-                sub_case_type = classification.get("sub_case_type")
-            except Exception as e:
-                logger.error(f"GPT 분류 실패: {str(e)}")
-                # 폴백: 키워드 기반 간단한 분류
-                main_case_type, sub_case_type = get_fallback_case_type(user_input)
-        
-        # 4. case_type 변환 (한글 → 영문)
-        main_case_type_en = CASE_TYPE_MAPPING.get(main_case_type, main_case_type) if main_case_type else None
-        
-        # 5. State 업데이트
-        state["case_type"] = main_case_type_en
-        state["sub_case_type"] = sub_case_type
-        
-        # 5. DB에 case_master 생성/업데이트
-        with db_manager.get_db_session() as db_session:
-            chat_session = db_session.query(ChatSession).filter(
-                ChatSession.session_id == session_id
-            ).first()
+                db_session.add(case)
+            else:
+                case.main_case_type = main_case_type_en
+                case.sub_case_type = sub_case_type
             
-            if chat_session:
-                # case_master 생성 또는 업데이트
-                from src.db.models.case_master import CaseMaster
-                case = db_session.query(CaseMaster).filter(
-                    CaseMaster.session_id == session_id
-                ).first()
-                
-                if not case:
-                    case = CaseMaster(
-                        session_id=session_id,
-                        main_case_type=main_case_type_en,
-                        sub_case_type=sub_case_type,
-                        case_stage=CaseStage.BEFORE_CONSULTATION.value
-                    )
-                    db_session.add(case)
-                else:
-                    case.main_case_type = main_case_type_en
-                    case.sub_case_type = sub_case_type
-                
-                # 세션 상태 업데이트
-                chat_session.current_state = "CASE_CLASSIFICATION"
-                db_session.commit()
-        
-        # 6. State 전이 로깅
-        from src.langgraph.state_logger import log_state_transition
-        log_state_transition(
-            session_id=session_id,
-            from_state="INIT",
-            to_state="CASE_CLASSIFICATION",
-            condition_key="user_input_received"
-        )
-        
-        # 7. 1차 서술 분석 수행 (Q-A 매칭 방식)
-        import os
-        os.write(2, "[1차 서술 분석] 시작!!!\n".encode('utf-8'))
-        logger.info(f"🔍 1차 서술 분석 시작...")
+            # 세션 상태 업데이트
+            chat_session.current_state = "CASE_CLASSIFICATION"
+            db_session.commit()
+    
+    # State 전이 로깅
+    from src.langgraph.state_logger import log_state_transition
+    log_state_transition(
+        session_id=session_id,
+        from_state="INIT",
+        to_state="CASE_CLASSIFICATION",
+        condition_key="user_input_received"
+    )
+
+
+def _log_initial_analysis_result(state: StateContext, session_id: str):
+    """1차 서술 분석 결과 단계 표시"""
+    skipped_fields = state.get("skipped_fields", [])
+    missing_fields = state.get("missing_fields", [])
+    if skipped_fields:
+        logger.debug(f"[1차 서술 분석] 성공: skipped_fields={skipped_fields}, missing_fields={missing_fields}")
+        logger.info(f"[{session_id}] 1차 서술 분석 성공: skipped_fields={skipped_fields}")
+        logger.info(f"✅ 1차 서술 분석 성공: skipped_fields={skipped_fields}")
+    else:
+        logger.debug(f"[1차 서술 분석] 결과: skipped_fields 없음, missing_fields={missing_fields}")
+        logger.info(f"⚠️  1차 서술 분석 결과: skipped_fields 없음")
+
+
+def _set_next_question(
+    state: StateContext,
+    session_id: str,
+    main_case_type_en: Optional[str],
+    sub_case_type: Optional[str]
+) -> Dict[str, Any]:
+    """
+    1차 서술 분석 결과를 반영하여 다음 질문 생성 및 FACT_COLLECTION 전이 정보 반환
+    
+    Args:
+        state: 현재 State Context
+        session_id: 세션 ID
+        main_case_type_en: 주 사건 유형 (영문, 로깅용)
+        sub_case_type: 세부 사건 유형 (로깅용)
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    # 8. 1차 서술 분석 결과 반영하여 다음 질문 생성
+    skipped_fields = state.get("skipped_fields", [])
+    missing_fields = state.get("missing_fields", [])
+    conversation_history = state.get("conversation_history", [])
+    
+    logger.info(f"[{session_id}] 1차 서술 분석 결과 확인: skipped_fields={skipped_fields} ({len(skipped_fields) if skipped_fields else 0}개), missing_fields={missing_fields} ({len(missing_fields) if missing_fields else 0}개), conversation_history={len(conversation_history)}개")
+    logger.info(f"✅ 1차 서술 분석 결과: skipped_fields={len(skipped_fields) if skipped_fields else 0}개, missing_fields={len(missing_fields) if missing_fields else 0}개")
+    
+    if skipped_fields:
+        logger.info(f"[{session_id}] 1차 서술에서 이미 답변된 필드: {skipped_fields} ({len(skipped_fields)}개)")
+        logger.info(f"✅ 1차 서술 분석 결과: {len(skipped_fields)}개 필드 이미 답변됨")
+    
+    if missing_fields:
+        logger.info(f"[{session_id}] 1차 서술에서 누락된 필드: {missing_fields} ({len(missing_fields)}개)")
+        logger.info(f"❓ 질문 필요한 필드: {len(missing_fields)}개")
+    
+    # missing_fields가 있으면 다음 질문 생성 (질문해야 할 필드가 있음)
+    if missing_fields and len(missing_fields) > 0:
+        # FACT_COLLECTION의 _generate_next_question을 사용하여 다음 질문 생성
+        from src.langgraph.nodes.fact_collection_node import _generate_next_question
         try:
-            state = post_classification_analysis(state)
-            skipped_fields = state.get("skipped_fields", [])
-            missing_fields = state.get("missing_fields", [])
-            if skipped_fields:
-                os.write(2, f"[1차 서술 분석] 성공!!! skipped_fields={skipped_fields}, missing_fields={missing_fields}\n".encode('utf-8'))
-                logger.info(f"[{session_id}] 1차 서술 분석 성공: skipped_fields={skipped_fields}")
-                logger.info(f"✅ 1차 서술 분석 성공: skipped_fields={skipped_fields}")
-            else:
-                os.write(2, f"[1차 서술 분석] 결과: skipped_fields 없음, missing_fields={missing_fields}\n".encode('utf-8'))
-                logger.info(f"⚠️  1차 서술 분석 결과: skipped_fields 없음")
-        except Exception as e:
-            os.write(2, f"[1차 서술 분석] 실패!!! {str(e)}\n".encode('utf-8'))
-            logger.error(f"[{session_id}] 1차 서술 분석 실패: {str(e)}", exc_info=True)
-            logger.error(f"❌ 1차 서술 분석 실패: {str(e)}")
-            # 폴백: 1차 서술 분석 실패해도 계속 진행
-            # 모든 필드를 질문 대상으로 설정
-            case_type = state.get("case_type", DEFAULT_CASE_TYPE)
-            default_required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, [])
-            if not default_required_fields:
-                default_required_fields = REQUIRED_FIELDS
+            logger.info(f"[{session_id}] _generate_next_question 호출 시작... (missing_fields={missing_fields})")
+            next_question = _generate_next_question(state)
+            logger.info(f"[{session_id}] _generate_next_question 결과: field={next_question.get('field')}, question={next_question.get('question', '')[:100]}...")
+            logger.info(f"📝 다음 질문 생성 성공: field={next_question.get('field')}, question={next_question.get('question', '')[:50]}...")
             
-            state["initial_description"] = state.get("last_user_input", "")
-            state["initial_analysis"] = {
-                "extracted_facts": {},
-                "answered_fields": [],
-                "missing_fields": default_required_fields
-            }
-            state["conversation_history"] = []
-            state["skipped_fields"] = []
-            state["missing_fields"] = default_required_fields  # 모든 필드를 질문 대상으로 설정
-            os.write(2, f"[에러] 1차 서술 분석 실패!!! 모든 필드를 질문 대상으로 설정: {default_required_fields}\n".encode('utf-8'))
-            logger.warning(f"[{session_id}] 1차 서술 분석 실패, 모든 필드를 질문 대상으로 설정: {default_required_fields}")
-        
-        # 8. 1차 서술 분석 결과 반영하여 다음 질문 생성
-        skipped_fields = state.get("skipped_fields", [])
-        missing_fields = state.get("missing_fields", [])
-        conversation_history = state.get("conversation_history", [])
-        
-        logger.info(f"[{session_id}] 1차 서술 분석 결과 확인: skipped_fields={skipped_fields} ({len(skipped_fields) if skipped_fields else 0}개), missing_fields={missing_fields} ({len(missing_fields) if missing_fields else 0}개), conversation_history={len(conversation_history)}개")
-        logger.info(f"✅ 1차 서술 분석 결과: skipped_fields={len(skipped_fields) if skipped_fields else 0}개, missing_fields={len(missing_fields) if missing_fields else 0}개")
-        
-        if skipped_fields:
-            logger.info(f"[{session_id}] 1차 서술에서 이미 답변된 필드: {skipped_fields} ({len(skipped_fields)}개)")
-            logger.info(f"✅ 1차 서술 분석 결과: {len(skipped_fields)}개 필드 이미 답변됨")
-        
-        if missing_fields:
-            logger.info(f"[{session_id}] 1차 서술에서 누락된 필드: {missing_fields} ({len(missing_fields)}개)")
-            logger.info(f"❓ 질문 필요한 필드: {len(missing_fields)}개")
-        
-        # 1차 서술 분석 결과 반영하여 다음 질문 생성
-        import os
-        os.write(2, f"[확인] missing_fields: {missing_fields} (개수: {len(missing_fields) if missing_fields else 0})\n".encode('utf-8'))
-        os.write(2, f"[확인] skipped_fields: {skipped_fields} (개수: {len(skipped_fields) if skipped_fields else 0})\n".encode('utf-8'))
-        
-        # missing_fields가 있으면 다음 질문 생성 (질문해야 할 필드가 있음)
-        if missing_fields and len(missing_fields) > 0:
-            # FACT_COLLECTION의 _generate_next_question을 사용하여 다음 질문 생성
-            from src.langgraph.nodes.fact_collection_node import _generate_next_question
-            try:
-                os.write(2, f"[다음 질문 생성] 호출 시작!!! missing_fields={missing_fields}\n".encode('utf-8'))
-                logger.info(f"[{session_id}] _generate_next_question 호출 시작... (missing_fields={missing_fields})")
-                next_question = _generate_next_question(state)
-                os.write(2, f"[다음 질문 생성] 성공!!! field={next_question.get('field')}, question={next_question.get('question', '')[:50]}...\n".encode('utf-8'))
-                logger.info(f"[{session_id}] _generate_next_question 결과: field={next_question.get('field')}, question={next_question.get('question', '')[:100]}...")
-                logger.info(f"📝 다음 질문 생성 성공: field={next_question.get('field')}, question={next_question.get('question', '')[:50]}...")
-                
-                state["bot_message"] = next_question["question"]
-                state["current_question"] = next_question
-                state["expected_input"] = {
-                    "type": "text",
-                    "field": next_question.get("field", "fact_description")
-                }
-                logger.info(f"[{session_id}] 1차 서술 분석 기반 다음 질문 설정 완료: {next_question.get('field')}")
-            except Exception as e:
-                os.write(2, f"[다음 질문 생성] 실패!!! {str(e)}\n".encode('utf-8'))
-                logger.error(f"[{session_id}] _generate_next_question 실패: {str(e)}", exc_info=True)
-                logger.warning(f"[{session_id}] 다음 질문 생성 실패, 기본 메시지 사용: {str(e)}")
-                logger.error(f"❌ 다음 질문 생성 실패: {str(e)}")
-                state["bot_message"] = "추가 정보를 알려주세요."
-                state["expected_input"] = {
-                    "type": "text",
-                    "field": "fact_description"
-                }
-        elif skipped_fields and len(skipped_fields) > 0:
-            # skipped_fields만 있고 missing_fields가 없으면 모든 필드가 이미 답변됨
-            # 하지만 아직 추가 정보가 필요할 수 있으므로 기본 메시지
-            os.write(2, f"[경고] 모든 필수 필드가 이미 답변됨!!! skipped_fields={skipped_fields}\n".encode('utf-8'))
-            logger.info(f"[{session_id}] 모든 필수 필드가 이미 답변됨 (skipped_fields={skipped_fields}), 추가 정보 요청")
-            state["bot_message"] = "추가로 알려주실 정보가 있으신가요?"
+            state["bot_message"] = next_question["question"]
+            state["current_question"] = next_question
             state["expected_input"] = {
                 "type": "text",
-                "field": "additional_info"
+                "field": next_question.get("field", "fact_description")
             }
-        else:
-            # 1차 서술 분석 결과가 없거나 모든 필드가 비어있으면 기본 메시지
-            os.write(2, f"[에러] 1차 서술 분석 결과 없음!!! 기본 메시지 사용!!! skipped_fields={skipped_fields}, missing_fields={missing_fields}\n".encode('utf-8'))
-            logger.warning(f"[{session_id}] 1차 서술 분석 결과가 없음 (skipped_fields={skipped_fields}, missing_fields={missing_fields}), 기본 메시지 사용")
-            logger.warning(f"⚠️ 1차 서술 분석 결과 없음, 기본 메시지 사용")
-            state["bot_message"] = "사건과 관련된 구체적인 내용을 알려주세요."
+            logger.info(f"[{session_id}] 1차 서술 분석 기반 다음 질문 설정 완료: {next_question.get('field')}")
+        except Exception as e:
+            logger.error(f"[{session_id}] _generate_next_question 실패: {str(e)}", exc_info=True)
+            logger.warning(f"[{session_id}] 다음 질문 생성 실패, 기본 메시지 사용: {str(e)}")
+            logger.error(f"❌ 다음 질문 생성 실패: {str(e)}")
+            state["bot_message"] = "추가 정보를 알려주세요."
             state["expected_input"] = {
                 "type": "text",
                 "field": "fact_description"
             }
-        
-        final_bot_message = state.get("bot_message", "")
-        os.write(2, f"[완료] CASE_CLASSIFICATION!!! bot_message='{final_bot_message[:50]}...'\n".encode('utf-8'))
-        logger.info(f"[{session_id}] CASE_CLASSIFICATION 완료: {main_case_type_en} / {sub_case_type}, bot_message='{final_bot_message[:100]}...', skipped_fields={skipped_fields}, missing_fields={missing_fields}")
-        logger.info(f"✅ CASE_CLASSIFICATION 완료: bot_message='{final_bot_message[:50]}...'")
-        
-        # bot_message가 없으면 기본 메시지 설정
-        if not final_bot_message:
-            state["bot_message"] = "사건 유형을 확인했습니다. 추가 정보를 수집하겠습니다."
-            logger.warning(f"[{session_id}] ⚠️  bot_message가 없어 기본 메시지 설정")
-        
-        return {
-            **state,
-            "bot_message": state.get("bot_message", "사건 유형을 확인했습니다. 추가 정보를 수집하겠습니다."),  # 명시적으로 포함
-            "next_state": "FACT_COLLECTION"
+    elif skipped_fields and len(skipped_fields) > 0:
+        # skipped_fields만 있고 missing_fields가 없으면 모든 필드가 이미 답변됨
+        # 하지만 아직 추가 정보가 필요할 수 있으므로 기본 메시지
+        logger.info(f"[{session_id}] 모든 필수 필드가 이미 답변됨 (skipped_fields={skipped_fields}), 추가 정보 요청")
+        state["bot_message"] = "추가로 알려주실 정보가 있으신가요?"
+        state["expected_input"] = {
+            "type": "text",
+            "field": "additional_info"
         }
-    
-    except Exception as e:
-        logger.error(f"CASE_CLASSIFICATION Node 실행 실패: {str(e)}", exc_info=True)
-        # 폴백 처리: 기본 사건 유형으로 설정하고 계속 진행
-        state["case_type"] = DEFAULT_CASE_TYPE
-        state["sub_case_type"] = DEFAULT_SUB_CASE_TYPE
+    else:
+        # 1차 서술 분석 결과가 없거나 모든 필드가 비어있으면 기본 메시지
+        logger.warning(f"[{session_id}] 1차 서술 분석 결과가 없음 (skipped_fields={skipped_fields}, missing_fields={missing_fields}), 기본 메시지 사용")
+        logger.warning(f"⚠️ 1차 서술 분석 결과 없음, 기본 메시지 사용")
         state["bot_message"] = "사건과 관련된 구체적인 내용을 알려주세요."
         state["expected_input"] = {
             "type": "text",
             "field": "fact_description"
         }
-        return {
-            **state,
-            "next_state": "FACT_COLLECTION"
-        }
+    
+    final_bot_message = state.get("bot_message", "")
+    logger.info(f"[{session_id}] CASE_CLASSIFICATION 완료: {main_case_type_en} / {sub_case_type}, bot_message='{final_bot_message[:100]}...', skipped_fields={skipped_fields}, missing_fields={missing_fields}")
+    logger.info(f"✅ CASE_CLASSIFICATION 완료: bot_message='{final_bot_message[:50]}...'")
+    
+    # bot_message가 없으면 기본 메시지 설정
+    if not final_bot_message:
+        state["bot_message"] = "사건 유형을 확인했습니다. 추가 정보를 수집하겠습니다."
+        logger.warning(f"[{session_id}] ⚠️  bot_message가 없어 기본 메시지 설정")
+    
+    return {
+        **state,
+        "bot_message": state.get("bot_message", "사건 유형을 확인했습니다. 추가 정보를 수집하겠습니다."),  # 명시적으로 포함
+        "next_state": "FACT_COLLECTION"
+    }
+
+
+def _classification_failed(state: StateContext, error: Exception) -> Dict[str, Any]:
+    """CASE_CLASSIFICATION 실패 시 폴백: 기본 사건 유형으로 설정하고 계속 진행"""
+    logger.error(f"CASE_CLASSIFICATION Node 실행 실패: {str(error)}", exc_info=True)
+    state["case_type"] = DEFAULT_CASE_TYPE
+    state["sub_case_type"] = DEFAULT_SUB_CASE_TYPE
+    state["bot_message"] = "사건과 관련된 구체적인 내용을 알려주세요."
+    state["expected_input"] = {
+        "type": "text",
+        "field": "fact_description"
+    }
+    return {
+        **state,
+        "next_state": "FACT_COLLECTION"
+    }
+
+
+def _no_input_result(state: StateContext) -> Dict[str, Any]:
+    """사용자 입력이 없을 때 재입력 요청"""
+    logger.warning("사용자 입력이 없습니다.")
+    return {
+        **state,
+        "bot_message": "사건과 관련된 내용을 알려주세요.",
+        "next_state": "CASE_CLASSIFICATION"
+    }
+
+
+def _complete_fused_classification(
+    state: StateContext,
+    session_id: str,
+    user_input: str,
+    fused_result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    fused 분류 결과를 State에 반영하고 다음 질문 생성 (DB/벡터 DB I/O)
+    
+    Args:
+        state: 현재 State Context
+        session_id: 세션 ID
+        user_input: 사용자 입력 (1차 서술)
+        fused_result: _classify_fused 결과
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    main_case_type = fused_result["main_case_type"]
+    sub_case_type = fused_result["sub_case_type"]
+    main_case_type_en = CASE_TYPE_MAPPING.get(main_case_type, main_case_type)
+    
+    state["case_type"] = main_case_type_en
+    state["sub_case_type"] = sub_case_type
+    logger.info(f"[{session_id}] fused 분류 완료: {main_case_type_en} / {sub_case_type}")
+    
+    _save_case_master(session_id, main_case_type_en, sub_case_type)
+    
+    # 사건 유형별 필수 필드(K2) 기준으로 answered/missing 필드 보정
+    required_fields = _get_required_fields(session_id, main_case_type_en, sub_case_type)
+    analysis_result = _reconcile_analysis_fields(
+        {"extracted_facts": fused_result["extracted_facts"]},
+        required_fields
+    )
+    state = _apply_initial_analysis(state, user_input, main_case_type_en, analysis_result)
+    _log_initial_analysis_result(state, session_id)
+    
+    return _set_next_question(state, session_id, main_case_type_en, sub_case_type)
+
+
+def _classify_multi_call(state: StateContext, session_id: str, user_input: str) -> Dict[str, Any]:
+    """
+    다중 호출 방식 사건 분류 (의미 추출 → K1 → 분류 → 1차 서술 분석)
+    
+    서로 의존하지 않는 호출은 병렬로 실행합니다.
+    - 의미 추출(GPT) ∥ K1 후보 조회 → 1차 서술 분석 선실행(K2 + GPT)
+    - case_master 저장(DB) ∥ 1차 서술 분석
+    
+    Args:
+        state: 현재 State Context
+        session_id: 세션 ID
+        user_input: 사용자 입력
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    # 1. 키워드 및 의미 추출 (GPT)을 시작하고, 그동안 K1 1순위 후보로 1차 서술 분석 선실행
+    semantic_future = _submit_fanout(keyword_extractor.extract_semantic_features, user_input)
+    speculative_case_type = _speculative_case_type(session_id, user_input)
+    speculative_future: Optional[Future] = None
+    if speculative_case_type:
+        speculative_future = _submit_fanout(
+            _run_initial_analysis, session_id, user_input, speculative_case_type
+        )
+    
+    semantic_features = semantic_future.result()
+    keywords = semantic_features.get("keywords", [])
+    
+    # 2. RAG K1 조회 (사건 유형 분류 기준)
+    rag_results = _search_case_type_candidates(keywords, user_input)
+    
+    # 3. 사건 유형 결정
+    main_case_type, sub_case_type = _case_type_from_rag(rag_results)
+    
+    # GPT API로 최종 분류 (RAG 결과를 참고)
+    if not main_case_type:
+        main_case_type, sub_case_type = _classify_with_gpt(session_id, user_input)
+    
+    # 4. case_type 변환 (한글 → 영문)
+    main_case_type_en = CASE_TYPE_MAPPING.get(main_case_type, main_case_type) if main_case_type else None
+    
+    # 5. State 업데이트
+    state["case_type"] = main_case_type_en
+    state["sub_case_type"] = sub_case_type
+    
+    # 6. 1차 서술 분석 시작 (선실행 결과가 확정 사건 유형과 같으면 재사용)
+    logger.info(f"🔍 1차 서술 분석 시작...")
+    analysis_future: Optional[Future] = None
+    if not _should_skip_initial_analysis(state):
+        if _is_speculation_hit(session_id, speculative_case_type, main_case_type_en):
+            analysis_future = speculative_future
+        else:
+            analysis_future = _submit_fanout(
+                _run_initial_analysis, session_id, user_input, main_case_type_en
+            )
+    if speculative_future is not None and analysis_future is not speculative_future:
+        # 대기 중일 때만 취소됨 (이미 실행 중이면 GPT 호출이 끝날 때까지 실행되고 결과만 버림)
+        speculative_future.cancel()
+    
+    # 7. 1차 서술 분석과 동시에 case_master 생성/업데이트 및 State 전이 로깅
+    _save_case_master(session_id, main_case_type_en, sub_case_type)
+    
+    try:
+        if analysis_future is not None:
+            state = _apply_initial_analysis(
+                state, user_input, main_case_type_en, analysis_future.result()
+            )
+        _log_initial_analysis_result(state, session_id)
+    except Exception as e:
+        # 폴백: 1차 서술 분석 실패해도 계속 진행 (모든 필드를 질문 대상으로 설정)
+        state = _initial_analysis_failed(state, e)
+    
+    # 8. 1차 서술 분석 결과 반영하여 다음 질문 생성
+    return _set_next_question(state, session_id, main_case_type_en, sub_case_type)
+
 
+@log_execution_time(logger)
+def case_classification_node(state: StateContext) -> Dict[str, Any]:
+    """
+    CASE_CLASSIFICATION Node 실행
+    
+    fused 분류 방식이 할당된 세션은 단일 GPT 호출로 분류와 1차 서술 분석을 수행하고,
+    응답 검증에 실패하면 다중 호출 방식으로 폴백합니다.
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    try:
+        session_id = state["session_id"]
+        user_input = state.get("last_user_input", "")
+        _log_classification_start(session_id, user_input)
+        
+        if not user_input:
+            return _no_input_result(state)
+        
+        started_at = time.monotonic()
+        fallback = False
+        method = ab_test_manager.get_classification_method(state)
+        if method == ClassificationMethod.FUSED.value:
+            rag_results = _search_case_type_candidates([], user_input)
+            fused_result = _classify_fused(session_id, user_input, rag_results)
+            if fused_result is not None:
+                result = _complete_fused_classification(state, session_id, user_input, fused_result)
+                ab_test_manager.record_classification(session_id, method, (time.monotonic() - started_at) * 1000)
+                return result
+            fallback = True
+        
+        result = _classify_multi_call(state, session_id, user_input)
+        ab_test_manager.record_classification(
+            session_id, method, (time.monotonic() - started_at) * 1000, fallback=fallback
+        )
+        return result
+    
+    except Exception as e:
+        return _classification_failed(state, e)
+
+
+async def _classify_multi_call_async(state: StateContext, session_id: str, user_input: str) -> Dict[str, Any]:
+    """
+    다중 호출 방식 사건 분류 (비동기, 병렬화 방식은 동기 버전과 같음)
+    
+    Args:
+        state: 현재 State Context
+        session_id: 세션 ID
+        user_input: 사용자 입력
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    pending: List[asyncio.Task] = []
+    try:
+        semantic_task = asyncio.create_task(keyword_extractor.extract_semantic_features_async(user_input))
+        pending.append(semantic_task)
+        speculative_case_type = await asyncio.to_thread(_speculative_case_type, session_id, user_input)
+        speculative_task: Optional[asyncio.Task] = None
+        if speculative_case_type:
+            speculative_task = asyncio.create_task(
+                _run_initial_analysis_async(session_id, user_input, speculative_case_type)
+            )
+            pending.append(speculative_task)
+        
+        semantic_features = await semantic_task
+        keywords = semantic_features.get("keywords", [])
+        
+        rag_results = await asyncio.to_thread(_search_case_type_candidates, keywords, user_input)
+        main_case_type, sub_case_type = _case_type_from_rag(rag_results)
+        
+        if not main_case_type:
+            main_case_type, sub_case_type = await _classify_with_gpt_async(session_id, user_input)
+        
+        main_case_type_en = CASE_TYPE_MAPPING.get(main_case_type, main_case_type) if main_case_type else None
+        state["case_type"] = main_case_type_en
+        state["sub_case_type"] = sub_case_type
+        
+        logger.info(f"🔍 1차 서술 분석 시작...")
+        analysis_task: Optional[asyncio.Task] = None
+        if not _should_skip_initial_analysis(state):
+            if _is_speculation_hit(session_id, speculative_case_type, main_case_type_en):
+                analysis_task = speculative_task
+            else:
+                analysis_task = asyncio.create_task(
+                    _run_initial_analysis_async(session_id, user_input, main_case_type_en)
+                )
+                pending.append(analysis_task)
+        if speculative_task is not None and analysis_task is not speculative_task:
+            speculative_task.cancel()
+        
+        await asyncio.to_thread(_save_case_master, session_id, main_case_type_en, sub_case_type)
+        
+        try:
+            if analysis_task is not None:
+                state = _apply_initial_analysis(
+                    state, user_input, main_case_type_en, await analysis_task
+                )
+            _log_initial_analysis_result(state, session_id)
+        except Exception as e:
+            state = _initial_analysis_failed(state, e)
+        
+        return await asyncio.to_thread(_set_next_question, state, session_id, main_case_type_en, sub_case_type)
+    
+    finally:
+        # 실패/조기 반환 시 남은 병렬 작업 정리
+        for task in pending:
+            if not task.done():
+                task.cancel()
+
+
+@log_execution_time(logger)
+async def case_classification_node_async(state: StateContext) -> Dict[str, Any]:
+    """
+    CASE_CLASSIFICATION Node 실행 (비동기)
+    
+    GPT 호출(의미 추출, 분류, 1차 서술 분석)은 AsyncOpenAI로 대기하고,
+    벡터 검색과 DB I/O는 스레드에서 실행합니다.
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    try:
+        session_id = state["session_id"]
+        user_input = state.get("last_user_input", "")
+        _log_classification_start(session_id, user_input)
+        
+        if not user_input:
+            return _no_input_result(state)
+        
+        started_at = time.monotonic()
+        fallback = False
+        method = ab_test_manager.get_classification_method(state)
+        if method == ClassificationMethod.FUSED.value:
+            rag_results = await asyncio.to_thread(_search_case_type_candidates, [], user_input)
+            fused_result = await _classify_fused_async(session_id, user_input, rag_results)
+            if fused_result is not None:
+                result = await asyncio.to_thread(
+                    _complete_fused_classification, state, session_id, user_input, fused_result
+                )
+                ab_test_manager.record_classification(session_id, method, (time.monotonic() - started_at) * 1000)
+                return result
+            fallback = True
+        
+        result = await _classify_multi_call_async(state, session_id, user_input)
+        ab_test_manager.record_classification(
+            session_id, method, (time.monotonic() - started_at) * 1000, fallback=fallback
+        )
+        return result
+    
+    except Exception as e:
+        return _classification_failed(state, e)
@@ -3,7 +3,6 @@ FACT_COLLECTION Node 구현 (Q-A 매칭 방식)
 """
 from typing import Dict, Any, List, Optional
 from src.langgraph.state import StateContext
-from src.rag.searcher import rag_searcher
 from src.utils.logger import get_logger, log_execution_time
 from src.utils.constants import (
     REQUIRED_FIELDS,
@@ -11,36 +10,72 @@ from src.utils.constants import (
     Limits,
     REQUIRED_FIELDS_BY_CASE_TYPE
 )
-from src.utils.rag_helpers import (
-    extract_required_fields_from_rag,
-    extract_question_template_from_rag
-)
+from src.utils.rag_helpers import get_k2_field_guide, get_k2_question_template
 from src.utils.question_loader import get_question_message
 from src.utils.helpers import get_kst_now
 
 logger = get_logger(__name__)
 
 
-def _generate_next_question(state: StateContext) -> Dict[str, Any]:
+def _get_excluded_fields(state: StateContext) -> set:
+    """이미 질문한 필드(asked_fields)와 1차 서술에서 이미 답변된 필드(skipped_fields)"""
+    conversation_history = state.get("conversation_history", [])
+    asked_fields = [qa.get("field") for qa in conversation_history if qa.get("field")]
+    skipped_fields = state.get("skipped_fields", [])
+    return set(asked_fields) | set(skipped_fields)
+
+
+def _get_k2_guide(state: StateContext) -> Dict[str, Any]:
+    """
+    이번 턴에 필요한 K2 필수 필드와 다음 질문 후보 필드의 질문 템플릿을 한 번에 조회
+    
+    조회 테이블에 없는 사건 유형은 벡터 검색을 search_many 한 번으로 묶어 수행합니다.
+    
+    Args:
+        state: State Context
+    
+    Returns:
+        {"required_fields": [...], "question_templates": {...}, "fields": [템플릿 조회한 필드]}
+    """
+    case_type = state.get("case_type")
+    excluded_fields = _get_excluded_fields(state)
+    candidates = [
+        field
+        for field in list(state.get("missing_fields", [])) + list(REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, REQUIRED_FIELDS))
+        if field not in excluded_fields
+    ]
+    candidates = list(dict.fromkeys(candidates))
+    
+    try:
+        guide = get_k2_field_guide(case_type, state.get("sub_case_type"), candidates)
+    except Exception as e:
+        logger.warning(f"RAG K2 조회 실패: {str(e)}")
+        guide = {"required_fields": [], "question_templates": {}}
+    guide["fields"] = candidates
+    return guide
+
+
+def _generate_next_question(state: StateContext, k2_guide: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     다음 질문 생성 (Q-A 매칭 방식, 1차 서술 분석 반영)
     
     Args:
         state: State Context
+        k2_guide: _get_k2_guide 결과 (None이면 새로 조회)
     
     Returns:
         질문 딕셔너리 (question, field)
     """
-    conversation_history = state.get("conversation_history", [])
-    asked_fields = [qa.get("field") for qa in conversation_history if qa.get("field")]
-    skipped_fields = state.get("skipped_fields", [])  # 1차 서술에서 이미 답변된 필드
     missing_fields = state.get("missing_fields", [])  # 1차 서술 분석 결과
     case_type = state.get("case_type")
+    sub_case_type = state.get("sub_case_type")
+    if k2_guide is None:
+        k2_guide = _get_k2_guide(state)
     
     # 아직 질문하지 않은 필수 필드 찾기
     # 1차 서술에서 이미 답변된 필드(skipped_fields)와 이미 질문한 필드(asked_fields)는 제외
     next_field = None
-    excluded_fields = set(asked_fields) | set(skipped_fields)
+    excluded_fields = _get_excluded_fields(state)
     
     # missing_fields에서 찾기
     for field in missing_fields:
@@ -50,17 +85,7 @@ def _generate_next_question(state: StateContext) -> Dict[str, Any]:
     
     # missing_fields가 없거나 모두 제외된 경우, 전체 필수 필드에서 다시 확인
     if not next_field:
-        try:
-            rag_results = rag_searcher.search(
-                query="필수 필드",
-                knowledge_type="K2",
-                main_case_type=case_type,
-                top_k=1
-            )
-            required_fields = extract_required_fields_from_rag(rag_results)
-        except Exception as e:
-            logger.warning(f"RAG 필수 필드 조회 실패: {str(e)}")
-            required_fields = []
+        required_fields = k2_guide["required_fields"]
         
         if not required_fields:
             required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, REQUIRED_FIELDS)
@@ -77,18 +102,15 @@ def _generate_next_question(state: StateContext) -> Dict[str, Any]:
             "field": "additional_info"
         }
     
-    # RAG에서 질문 템플릿 조회
-    try:
-        rag_results = rag_searcher.search(
-            query=f"{next_field} 질문",
-            knowledge_type="K2",
-            main_case_type=case_type,
-            top_k=1
-        )
-        question = extract_question_template_from_rag(rag_results, next_field)
-    except Exception as e:
-        logger.debug(f"RAG 질문 템플릿 조회 실패: {str(e)}")
-        question = None
+    # K2에서 질문 템플릿 조회 (후보 필드는 이미 일괄 조회됨)
+    if next_field in k2_guide["fields"]:
+        question = k2_guide["question_templates"].get(next_field)
+    else:
+        try:
+            question = get_k2_question_template(next_field, case_type, sub_case_type)
+        except Exception as e:
+            logger.debug(f"RAG 질문 템플릿 조회 실패: {str(e)}")
+            question = None
     
     if not question:
         question = get_question_message(next_field, case_type)
@@ -230,8 +252,9 @@ def fact_collection_node(state: StateContext) -> Dict[str, Any]:
                 logger.warning(f"[{session_id}] current_question 없음, bot_message도 없음, missing_fields도 없음: {user_input[:50]}")
             # 이 입력은 다음 VALIDATION 노드에서 _extract_facts_from_conversation으로 처리됨
         
-        # 다음 질문 생성
-        next_question = _generate_next_question(state)
+        # 다음 질문 생성 (K2 필수 필드/질문 템플릿은 한 번에 조회하여 completion_rate 계산에도 재사용)
+        k2_guide = _get_k2_guide(state)
+        next_question = _generate_next_question(state, k2_guide)
         state["bot_message"] = next_question["question"]
         state["current_question"] = next_question
         
@@ -239,16 +262,7 @@ def fact_collection_node(state: StateContext) -> Dict[str, Any]:
         conversation_history = state.get("conversation_history", [])
         asked_fields = [qa.get("field") for qa in conversation_history if qa.get("field")]
         
-        try:
-            rag_results = rag_searcher.search(
-                query="필수 필드",
-                knowledge_type="K2",
-                main_case_type=state.get("case_type"),
-                top_k=1
-            )
-            required_fields = extract_required_fields_from_rag(rag_results)
-        except:
-            required_fields = []
+        required_fields = list(k2_guide["required_fields"])
         
         if not required_fields:
             required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(state.get("case_type"), REQUIRED_FIELDS)
@@ -0,0 +1,217 @@
+"""
+단일 호출(fused) 사건 분류 모듈
+
+의미 추출, 사건 유형 분류, 1차 서술 분석을 하나의 구조화 JSON 호출로 수행합니다.
+응답 검증에 실패하면 None을 반환하며, 호출 측은 기존 다중 호출 경로로 폴백합니다.
+"""
+import json
+from typing import Dict, Any, List, Optional
+from src.services.gpt_client import gpt_client
+from src.services.prompt_loader import prompt_loader
+from src.utils.constants import CASE_TYPE_MAPPING
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# fused 프롬프트에서 추출하는 사실 필드 (사건 유형별 필수 필드는 분류 후 K2로 보정)
+FUSED_FACT_FIELDS: List[str] = [
+    "incident_date",
+    "amount",
+    "counterparty",
+    "counterparty_type",
+    "evidence",
+    "evidence_type"
+]
+
+# fused 응답은 분류 + 사실 추출을 함께 담으므로 분류 단독 호출보다 토큰이 더 필요함
+FUSED_MAX_TOKENS = 600
+
+
+def _format_candidates(rag_results: List[Dict[str, Any]]) -> str:
+    """
+    K1 검색 결과를 프롬프트용 후보 목록으로 변환
+    
+    Args:
+        rag_results: K1 검색 결과
+    
+    Returns:
+        후보 목록 문자열 (결과가 없으면 "없음")
+    """
+    lines = []
+    for result in rag_results or []:
+        metadata = result.get("metadata", {})
+        main_case_type = metadata.get("main_case_type")
+        if not main_case_type:
+            continue
+        sub_case_type = metadata.get("sub_case_type") or "-"
+        lines.append(f"- {main_case_type} / {sub_case_type}")
+    return "\n".join(lines) if lines else "없음"
+
+
+def _build_fused_prompt(user_input: str, rag_results: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    fused 분류 프롬프트 생성
+    
+    Args:
+        user_input: 사용자 입력
+        rag_results: K1 검색 결과 (분류 후보 힌트)
+    
+    Returns:
+        프롬프트 문자열 (템플릿이 없으면 None)
+    """
+    prompt_template = prompt_loader.load_prompt("fused_classification", sub_dir="classification")
+    if not prompt_template:
+        return None
+    return prompt_template.format(
+        user_input=user_input,
+        candidates=_format_candidates(rag_results)
+    )
+
+
+def _validate_fused_result(result: Any) -> Optional[str]:
+    """
+    fused 응답 구조 검증
+    
+    Args:
+        result: 파싱된 JSON
+    
+    Returns:
+        검증 실패 사유 (유효하면 None)
+    """
+    if not isinstance(result, dict):
+        return "JSON 객체가 아님"
+    
+    main_case_type = result.get("main_case_type")
+    if main_case_type not in CASE_TYPE_MAPPING and main_case_type not in CASE_TYPE_MAPPING.values():
+        return f"알 수 없는 main_case_type: {main_case_type}"
+    
+    sub_case_type = result.get("sub_case_type")
+    if sub_case_type is not None and not isinstance(sub_case_type, str):
+        return "sub_case_type이 문자열이 아님"
+    
+    keywords = result.get("keywords")
+    if not isinstance(keywords, list) or not all(isinstance(k, str) for k in keywords):
+        return "keywords가 문자열 리스트가 아님"
+    
+    extracted_facts = result.get("extracted_facts")
+    if not isinstance(extracted_facts, dict):
+        return "extracted_facts가 객체가 아님"
+    
+    for key in ("answered_fields", "missing_fields"):
+        if key in result and not isinstance(result[key], list):
+            return f"{key}가 리스트가 아님"
+    
+    return None
+
+
+def _parse_fused_content(content: str) -> Optional[Dict[str, Any]]:
+    """
+    fused 응답 파싱 및 정규화
+    
+    Args:
+        content: GPT 응답 본문 (JSON)
+    
+    Returns:
+        정규화된 분류 결과 (검증 실패 시 None)
+    """
+    try:
+        result = json.loads(content)
+    except (json.JSONDecodeError, TypeError) as e:
+        logger.warning(f"[fused 분류] JSON 파싱 실패: {str(e)}")
+        return None
+    
+    reason = _validate_fused_result(result)
+    if reason:
+        logger.warning(f"[fused 분류] 응답 검증 실패: {reason}")
+        return None
+    
+    extracted_facts = {
+        field: result["extracted_facts"].get(field)
+        for field in FUSED_FACT_FIELDS
+    }
+    
+    return {
+        "semantic_features": {
+            "domain": result.get("domain"),
+            "keywords": result["keywords"],
+            "main_issue": result.get("main_issue"),
+            "related_concepts": []
+        },
+        "main_case_type": result["main_case_type"],
+        "sub_case_type": result.get("sub_case_type"),
+        "extracted_facts": extracted_facts
+    }
+
+
+def _classify_fused(
+    session_id: str,
+    user_input: str,
+    rag_results: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    단일 GPT 호출로 의미 추출 + 사건 유형 분류 + 1차 서술 분석
+    
+    Args:
+        session_id: 세션 ID
+        user_input: 사용자 입력
+        rag_results: K1 검색 결과 (분류 후보 힌트)
+    
+    Returns:
+        정규화된 분류 결과 (실패 시 None → 다중 호출 경로로 폴백)
+    """
+    prompt = _build_fused_prompt(user_input, rag_results)
+    if prompt is None:
+        logger.warning(f"[{session_id}] fused 분류 프롬프트가 없어 다중 호출 방식으로 폴백")
+        return None
+    
+    try:
+        response = gpt_client.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=FUSED_MAX_TOKENS,
+            response_format={"type": "json_object"},
+            session_id=session_id,
+            node_name="case_classification_fused"
+        )
+    except Exception as e:
+        logger.error(f"[{session_id}] fused 분류 GPT 호출 실패: {str(e)}")
+        return None
+    
+    return _parse_fused_content(response["content"])
+
+
+async def _classify_fused_async(
+    session_id: str,
+    user_input: str,
+    rag_results: List[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """
+    단일 GPT 호출로 의미 추출 + 사건 유형 분류 + 1차 서술 분석 (비동기)
+    
+    Args:
+        session_id: 세션 ID
+        user_input: 사용자 입력
+        rag_results: K1 검색 결과 (분류 후보 힌트)
+    
+    Returns:
+        정규화된 분류 결과 (실패 시 None → 다중 호출 경로로 폴백)
+    """
+    prompt = _build_fused_prompt(user_input, rag_results)
+    if prompt is None:
+        logger.warning(f"[{session_id}] fused 분류 프롬프트가 없어 다중 호출 방식으로 폴백")
+        return None
+    
+    try:
+        response = await gpt_client.chat_completion_async(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            max_tokens=FUSED_MAX_TOKENS,
+            response_format={"type": "json_object"},
+            session_id=session_id,
+            node_name="case_classification_fused"
+        )
+    except Exception as e:
+        logger.error(f"[{session_id}] fused 분류 GPT 호출 실패: {str(e)}")
+        return None
+    
+    return _parse_fused_content(response["content"])
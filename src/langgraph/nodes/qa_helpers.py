@@ -11,28 +11,23 @@ from src.utils.exceptions import GPTAPIError
 logger = get_logger(__name__)
 
 
-def _analyze_initial_description(
+def _build_initial_description_prompt(
     initial_description: str,
     case_type: str,
     required_fields: List[str]
-) -> Dict[str, Any]:
+) -> str:
     """
-    1차 서술(초기 사용자 입력)을 GPT로 분석하여 포함된 정보 추출
+    1차 서술 분석 프롬프트 생성
     
     Args:
-        initial_description: 초기 사용자 입력 ("친구가 2024년 1월 2일에 300만원을 빌려갔는데...")
-        case_type: 사건 유형 (CIVIL, CRIMINAL, etc.)
-        required_fields: 필수 필드 목록 (RAG K2에서 가져온 것)
+        initial_description: 초기 사용자 입력
+        case_type: 사건 유형
+        required_fields: 필수 필드 목록
     
     Returns:
-        {
-            "extracted_facts": {...},  # 추출된 정보
-            "answered_fields": ["incident_date", "amount", "counterparty"],  # 이미 답변된 필드
-            "missing_fields": ["evidence", "evidence_type"]  # 질문해야 할 필드
-        }
+        프롬프트 문자열
     """
-    try:
-        prompt = f"""다음은 법률 상담 챗봇에 처음 입력한 사용자의 사건 서술입니다.
+    return f"""다음은 법률 상담 챗봇에 처음 입력한 사용자의 사건 서술입니다.
 사건 유형: {case_type}
 
 사용자 서술:
@@ -76,6 +71,118 @@ def _analyze_initial_description(
 
 JSON만 반환하세요 (설명 없이):
 """
+
+
+def _parse_initial_description_analysis(
+    content: str,
+    required_fields: List[str]
+) -> Dict[str, Any]:
+    """
+    1차 서술 분석 GPT 응답 파싱 및 answered/missing 필드 보정
+    
+    Args:
+        content: GPT 응답 본문 (JSON)
+        required_fields: 필수 필드 목록
+    
+    Returns:
+        보정된 분석 결과 딕셔너리
+    
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시
+    """
+    result = json.loads(content)
+    return _reconcile_analysis_fields(result, required_fields)
+
+
+def _reconcile_analysis_fields(
+    result: Dict[str, Any],
+    required_fields: List[str]
+) -> Dict[str, Any]:
+    """
+    extracted_facts 기준으로 answered/missing 필드 보정
+    
+    Args:
+        result: 분석 결과 딕셔너리 (extracted_facts 포함)
+        required_fields: 필수 필드 목록
+    
+    Returns:
+        보정된 분석 결과 딕셔너리
+    """
+    # 검증: answered_fields와 missing_fields가 올바르게 설정되었는지 확인
+    extracted_facts = result.get("extracted_facts") or {}
+    
+    # extracted_facts에서 null이 아닌 필드만 answered_fields에 포함되도록 보정
+    actual_answered = [
+        field for field in required_fields
+        if extracted_facts.get(field) is not None
+    ]
+    
+    # missing_fields는 required_fields 중 answered_fields에 없는 필드
+    actual_missing = [
+        field for field in required_fields
+        if field not in actual_answered
+    ]
+    
+    result["answered_fields"] = actual_answered
+    result["missing_fields"] = actual_missing
+    
+    # 상세 로깅
+    logger.info(f"[1차 서술 분석] 완료: answered_fields={actual_answered} ({len(actual_answered)}개), missing_fields={actual_missing} ({len(actual_missing)}개)")
+    logger.debug(f"[1차 서술 분석] extracted_facts: {[(k, v) for k, v in extracted_facts.items() if v is not None]}")
+    
+    return result
+
+
+def _initial_description_fallback(error: Exception, required_fields: List[str]) -> Dict[str, Any]:
+    """
+    1차 서술 분석 실패 시 폴백 결과 생성 (모든 필드를 질문 대상으로 설정)
+    
+    Args:
+        error: 발생한 예외
+        required_fields: 필수 필드 목록
+    
+    Returns:
+        빈 분석 결과 딕셔너리
+    """
+    if isinstance(error, json.JSONDecodeError):
+        logger.error(f"1차 서술 분석 JSON 파싱 실패: {str(error)}")
+        logger.warning("1차 서술 분석 실패, 모든 필드를 질문 대상으로 설정")
+    elif isinstance(error, GPTAPIError):
+        logger.error(f"1차 서술 분석 GPT API 실패: {str(error)}", exc_info=True)
+        logger.warning("GPT API 실패, 모든 필드를 질문 대상으로 설정")
+    else:
+        logger.error(f"1차 서술 분석 실패: {str(error)}", exc_info=True)
+        logger.warning("예상치 못한 오류 발생, 모든 필드를 질문 대상으로 설정")
+    
+    return {
+        "extracted_facts": {},
+        "answered_fields": [],
+        "missing_fields": required_fields
+    }
+
+
+def _analyze_initial_description(
+    initial_description: str,
+    case_type: str,
+    required_fields: List[str]
+) -> Dict[str, Any]:
+    """
+    1차 서술(초기 사용자 입력)을 GPT로 분석하여 포함된 정보 추출
+    
+    Args:
+        initial_description: 초기 사용자 입력 ("친구가 2024년 1월 2일에 300만원을 빌려갔는데...")
+        case_type: 사건 유형 (CIVIL, CRIMINAL, etc.)
+        required_fields: 필수 필드 목록 (RAG K2에서 가져온 것)
+    
+    Returns:
+        {
+            "extracted_facts": {...},  # 추출된 정보
+            "answered_fields": ["incident_date", "amount", "counterparty"],  # 이미 답변된 필드
+            "missing_fields": ["evidence", "evidence_type"]  # 질문해야 할 필드
+        }
+    """
+    try:
+        prompt = _build_initial_description_prompt(initial_description, case_type, required_fields)
         
         # session_id는 함수 인자에 없으므로 None으로 전달 (비용 추적은 선택적)
         response = gpt_client.chat_completion(
@@ -86,89 +193,67 @@ JSON만 반환하세요 (설명 없이):
             node_name="analyze_initial_description"
         )
         
-        result = json.loads(response["content"])
-        
-        # 검증: answered_fields와 missing_fields가 올바르게 설정되었는지 확인
-        extracted_facts = result.get("extracted_facts", {})
-        answered_fields = result.get("answered_fields", [])
-        missing_fields = result.get("missing_fields", [])
-        
-        # extracted_facts에서 null이 아닌 필드만 answered_fields에 포함되도록 보정
-        actual_answered = [
-            field for field in required_fields
-            if extracted_facts.get(field) is not None
-        ]
-        
-        # missing_fields는 required_fields 중 answered_fields에 없는 필드
-        actual_missing = [
-            field for field in required_fields
-            if field not in actual_answered
-        ]
-        
-        result["answered_fields"] = actual_answered
-        result["missing_fields"] = actual_missing
+        return _parse_initial_description_analysis(response["content"], required_fields)
+    
+    except Exception as e:
+        return _initial_description_fallback(e, required_fields)
+
+
+async def _analyze_initial_description_async(
+    initial_description: str,
+    case_type: str,
+    required_fields: List[str]
+) -> Dict[str, Any]:
+    """
+    1차 서술 분석 (비동기, _analyze_initial_description과 동일한 결과 반환)
+    
+    Args:
+        initial_description: 초기 사용자 입력
+        case_type: 사건 유형
+        required_fields: 필수 필드 목록
+    
+    Returns:
+        분석 결과 딕셔너리
+    """
+    try:
+        prompt = _build_initial_description_prompt(initial_description, case_type, required_fields)
         
-        # 상세 로깅
-        logger.info(f"[1차 서술 분석] 완료: answered_fields={actual_answered} ({len(actual_answered)}개), missing_fields={actual_missing} ({len(actual_missing)}개)")
-        logger.debug(f"[1차 서술 분석] extracted_facts: {[(k, v) for k, v in extracted_facts.items() if v is not None]}")
+        response = await gpt_client.chat_completion_async(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            response_format={"type": "json_object"},
+            session_id=None,
+            node_name="analyze_initial_description"
+        )
         
-        return result
+        return _parse_initial_description_analysis(response["content"], required_fields)
     
-    except json.JSONDecodeError as e:
-        logger.error(f"1차 서술 분석 JSON 파싱 실패: {str(e)}")
-        logger.warning("1차 서술 분석 실패, 모든 필드를 질문 대상으로 설정")
-        # 폴백: 빈 결과 반환 (모든 필드를 질문해야 함)
-        return {
-            "extracted_facts": {},
-            "answered_fields": [],
-            "missing_fields": required_fields
-        }
-    except GPTAPIError as e:
-        logger.error(f"1차 서술 분석 GPT API 실패: {str(e)}", exc_info=True)
-        logger.warning("GPT API 실패, 모든 필드를 질문 대상으로 설정")
-        # GPT API 실패 시 폴백: 빈 결과 반환
-        return {
-            "extracted_facts": {},
-            "answered_fields": [],
-            "missing_fields": required_fields
-        }
     except Exception as e:
-        logger.error(f"1차 서술 분석 실패: {str(e)}", exc_info=True)
-        logger.warning("예상치 못한 오류 발생, 모든 필드를 질문 대상으로 설정")
-        # 폴백: 빈 결과 반환
-        return {
-            "extracted_facts": {},
-            "answered_fields": [],
-            "missing_fields": required_fields
-        }
+        return _initial_description_fallback(e, required_fields)
 
 
-def _extract_facts_from_conversation(
+def _build_conversation_facts_prompt(
     conversation_history: List[Dict[str, str]],
     case_type: str
-) -> Dict[str, Any]:
+) -> str:
     """
-    Q-A 대화 기록에서 구조화된 facts 추출
+    Q-A 대화 기록 facts 추출 프롬프트 생성
     
     Args:
         conversation_history: 질문-답변 쌍 리스트
         case_type: 사건 유형
     
     Returns:
-        구조화된 facts 딕셔너리
+        프롬프트 문자열
     """
-    try:
-        if not conversation_history:
-            return {}
-        
-        # Q-A 쌍을 텍스트로 변환
-        qa_text = "\n\n".join([
-            f"Q: {qa.get('question', '')}\nA: {qa.get('answer', '')}"
-            for qa in conversation_history
-        ])
-        
-        # GPT 프롬프트 구성
-        prompt = f"""다음은 법률 상담 챗봇과 사용자의 질문-답변 대화입니다.
+    # Q-A 쌍을 텍스트로 변환
+    qa_text = "\n\n".join([
+        f"Q: {qa.get('question', '')}\nA: {qa.get('answer', '')}"
+        for qa in conversation_history
+    ])
+    
+    # GPT 프롬프트 구성
+    return f"""다음은 법률 상담 챗봇과 사용자의 질문-답변 대화입니다.
 사건 유형: {case_type}
 
 대화 내용:
@@ -201,6 +286,105 @@ def _extract_facts_from_conversation(
 
 JSON만 반환하세요 (설명 없이):
 """
+
+
+def _parse_conversation_facts(
+    content: str,
+    conversation_history: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """
+    Q-A 대화 facts 추출 GPT 응답 파싱 및 타입 정리
+    
+    Args:
+        content: GPT 응답 본문 (JSON)
+        conversation_history: 질문-답변 쌍 리스트 (로깅용)
+    
+    Returns:
+        구조화된 facts 딕셔너리
+    
+    Raises:
+        json.JSONDecodeError: JSON 파싱 실패 시
+    """
+    facts = json.loads(content)
+    
+    # null 문자열을 None으로 변환 및 타입 정리
+    for key, value in facts.items():
+        if value == "null" or value == "" or value is None:
+            facts[key] = None
+        # 날짜 필드는 문자열이어야 함
+        elif key == "incident_date" and isinstance(value, str):
+            # 빈 문자열이나 "null" 문자열 체크
+            if value.strip() == "" or value.strip().lower() == "null":
+                facts[key] = None
+            else:
+                # 날짜 형식 검증 (YYYY-MM-DD)
+                facts[key] = value.strip()
+    
+    # 상세 로깅 (GPT 추출 결과 상세 확인)
+    extracted_count = sum(1 for v in facts.values() if v is not None)
+    logger.info(f"[Q-A 대화 분석] 완료: {extracted_count}개 필드 추출 성공")
+    logger.info(f"[Q-A 대화 분석] 추출된 facts 전체: {facts}")
+    logger.info(f"[Q-A 대화 분석] 추출된 facts (값 있음): {[(k, v) for k, v in facts.items() if v is not None]}")
+    logger.info(f"[Q-A 대화 분석] Q-A 쌍 수: {len(conversation_history)}개")
+    logger.info(f"[Q-A 대화 분석] Q-A 쌍 상세: {[(qa.get('field'), qa.get('answer', '')[:50]) for qa in conversation_history]}")
+    
+    # incident_date가 추출되었는지 특별히 확인
+    if facts.get("incident_date"):
+        logger.info(f"[Q-A 대화 분석] ✅ incident_date 추출 성공: {facts.get('incident_date')}")
+    else:
+        logger.warning(f"[Q-A 대화 분석] ⚠️ incident_date 추출 실패 또는 null")
+    
+    return facts
+
+
+def _conversation_facts_fallback(
+    error: Exception,
+    conversation_history: List[Dict[str, str]]
+) -> Dict[str, Any]:
+    """
+    Q-A 대화 facts 추출 실패 시 폴백 처리
+    
+    Args:
+        error: 발생한 예외
+        conversation_history: 질문-답변 쌍 리스트
+    
+    Returns:
+        폴백 facts 딕셔너리 (GPT API 실패 시 엔티티 추출 결과, 그 외 빈 딕셔너리)
+    """
+    if isinstance(error, json.JSONDecodeError):
+        logger.error(f"Q-A 대화 분석 JSON 파싱 실패: {str(error)}")
+        logger.warning("Q-A 대화 분석 실패, 빈 facts 반환")
+        # 폴백: 빈 facts 반환 (기존 방식으로 폴백하지 않음 - Q-A 매칭 방식 유지)
+        return {}
+    if isinstance(error, GPTAPIError):
+        logger.error(f"Q-A 대화 분석 GPT API 실패: {str(error)}", exc_info=True)
+        logger.warning("GPT API 실패, 빈 facts 반환 (기존 엔티티 추출 방식으로 폴백 가능)")
+        # GPT API 실패 시 기존 엔티티 추출 방식으로 폴백 시도
+        return _fallback_extract_facts_from_conversation(conversation_history)
+    logger.error(f"Q-A 대화 분석 실패: {str(error)}", exc_info=True)
+    logger.warning("예상치 못한 오류 발생, 빈 facts 반환")
+    return {}
+
+
+def _extract_facts_from_conversation(
+    conversation_history: List[Dict[str, str]],
+    case_type: str
+) -> Dict[str, Any]:
+    """
+    Q-A 대화 기록에서 구조화된 facts 추출
+    
+    Args:
+        conversation_history: 질문-답변 쌍 리스트
+        case_type: 사건 유형
+    
+    Returns:
+        구조화된 facts 딕셔너리
+    """
+    try:
+        if not conversation_history:
+            return {}
+        
+        prompt = _build_conversation_facts_prompt(conversation_history, case_type)
         
         # GPT API 호출
         # session_id는 함수 인자에 없으므로 None으로 전달 (비용 추적은 선택적)
@@ -212,52 +396,44 @@ JSON만 반환하세요 (설명 없이):
             node_name="extract_facts_from_conversation"
         )
         
-        # JSON 파싱
-        facts = json.loads(response["content"])
-        
-        # null 문자열을 None으로 변환 및 타입 정리
-        for key, value in facts.items():
-            if value == "null" or value == "" or value is None:
-                facts[key] = None
-            # 날짜 필드는 문자열이어야 함
-            elif key == "incident_date" and isinstance(value, str):
-                # 빈 문자열이나 "null" 문자열 체크
-                if value.strip() == "" or value.strip().lower() == "null":
-                    facts[key] = None
-                else:
-                    # 날짜 형식 검증 (YYYY-MM-DD)
-                    facts[key] = value.strip()
+        return _parse_conversation_facts(response["content"], conversation_history)
+    
+    except Exception as e:
+        return _conversation_facts_fallback(e, conversation_history)
+
+
+async def _extract_facts_from_conversation_async(
+    conversation_history: List[Dict[str, str]],
+    case_type: str
+) -> Dict[str, Any]:
+    """
+    Q-A 대화 기록에서 구조화된 facts 추출 (비동기)
+    
+    Args:
+        conversation_history: 질문-답변 쌍 리스트
+        case_type: 사건 유형
+    
+    Returns:
+        구조화된 facts 딕셔너리
+    """
+    try:
+        if not conversation_history:
+            return {}
         
-        # 상세 로깅 (GPT 추출 결과 상세 확인)
-        extracted_count = sum(1 for v in facts.values() if v is not None)
-        logger.info(f"[Q-A 대화 분석] 완료: {extracted_count}개 필드 추출 성공")
-        logger.info(f"[Q-A 대화 분석] 추출된 facts 전체: {facts}")
-        logger.info(f"[Q-A 대화 분석] 추출된 facts (값 있음): {[(k, v) for k, v in facts.items() if v is not None]}")
-        logger.info(f"[Q-A 대화 분석] Q-A 쌍 수: {len(conversation_history)}개")
-        logger.info(f"[Q-A 대화 분석] Q-A 쌍 상세: {[(qa.get('field'), qa.get('answer', '')[:50]) for qa in conversation_history]}")
+        prompt = _build_conversation_facts_prompt(conversation_history, case_type)
         
-        # incident_date가 추출되었는지 특별히 확인
-        if facts.get("incident_date"):
-            logger.info(f"[Q-A 대화 분석] ✅ incident_date 추출 성공: {facts.get('incident_date')}")
-        else:
-            logger.warning(f"[Q-A 대화 분석] ⚠️ incident_date 추출 실패 또는 null")
+        response = await gpt_client.chat_completion_async(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.1,
+            response_format={"type": "json_object"},
+            session_id=None,
+            node_name="extract_facts_from_conversation"
+        )
         
-        return facts
+        return _parse_conversation_facts(response["content"], conversation_history)
     
-    except json.JSONDecodeError as e:
-        logger.error(f"Q-A 대화 분석 JSON 파싱 실패: {str(e)}")
-        logger.warning("Q-A 대화 분석 실패, 빈 facts 반환")
-        # 폴백: 빈 facts 반환 (기존 방식으로 폴백하지 않음 - Q-A 매칭 방식 유지)
-        return {}
-    except GPTAPIError as e:
-        logger.error(f"Q-A 대화 분석 GPT API 실패: {str(e)}", exc_info=True)
-        logger.warning("GPT API 실패, 빈 facts 반환 (기존 엔티티 추출 방식으로 폴백 가능)")
-        # GPT API 실패 시 기존 엔티티 추출 방식으로 폴백 시도
-        return _fallback_extract_facts_from_conversation(conversation_history)
     except Exception as e:
-        logger.error(f"Q-A 대화 분석 실패: {str(e)}", exc_info=True)
-        logger.warning("예상치 못한 오류 발생, 빈 facts 반환")
-        return {}
+        return _conversation_facts_fallback(e, conversation_history)
 
 
 def _fallback_extract_facts_from_conversation(
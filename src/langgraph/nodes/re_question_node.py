@@ -5,12 +5,11 @@ import sys
 import logging
 from typing import Dict, Any
 from src.langgraph.state import StateContext
-from src.rag.searcher import rag_searcher
 from src.utils.logger import get_logger, log_execution_time
 from src.utils.constants import FIELD_INPUT_TYPE_MAPPING
 from src.utils.question_loader import get_question_message
 from src.services.missing_field_manager import get_next_missing_field
-from src.utils.rag_helpers import extract_question_template_from_rag
+from src.utils.rag_helpers import get_k2_question_template
 
 logger = get_logger(__name__)
 
@@ -157,26 +156,15 @@ def re_question_node(state: StateContext) -> Dict[str, Any]:
         sys.stderr.flush()
         logger.info(f"[{session_id}] ✅ 다음 질문 필드: {next_field} (missing_fields={missing_fields}, asked_fields={asked_fields})")
         
-        # 2. RAG K2에서 질문 템플릿 조회
+        # 2. K2에서 질문 템플릿 조회 (조회 테이블 우선, 없는 사건 유형만 벡터 검색)
         # case_type이 이미 영문이어야 함 (CIVIL, CRIMINAL, etc.)
         try:
-            rag_results = rag_searcher.search(
-                query=f"{next_field} 질문",
-                knowledge_type="K2",
-                main_case_type=case_type,
-                sub_case_type=sub_case_type,
-                # node_scope는 일단 제외 (ChromaDB 필터 제약)
-                top_k=1
-            )
-            logger.debug(f"[{session_id}] RAG 검색 완료: {len(rag_results)}개 결과")
+            question = get_k2_question_template(next_field, case_type, sub_case_type)
         except Exception as e:
-            logger.warning(f"[{session_id}] RAG 검색 실패 (계속 진행): {str(e)}")
-            rag_results = []
+            logger.warning(f"[{session_id}] K2 질문 템플릿 조회 실패 (계속 진행): {str(e)}")
+            question = None
         
-        # 3. 질문 생성 (RAG 결과 우선 사용)
-        question = extract_question_template_from_rag(rag_results, next_field)
-        
-        # RAG 결과에서 추출 실패 시 YAML 파일에서 로드
+        # 3. K2 템플릿이 없으면 YAML 파일에서 로드
         if not question or not question.strip():
             question = get_question_message(next_field, case_type)
             logger.debug(f"[{session_id}] RAG 결과에서 질문 추출 실패, YAML 파일 사용")
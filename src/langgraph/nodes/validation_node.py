@@ -2,10 +2,11 @@
 VALIDATION Node 구현 (Q-A 매칭 방식)
 """
 import sys
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
+from sqlalchemy.orm import Session
 from src.langgraph.state import StateContext
-from src.rag.searcher import rag_searcher
 from src.utils.logger import get_logger, log_execution_time
 from src.utils.constants import (
     REQUIRED_FIELDS_BY_CASE_TYPE,
@@ -15,10 +16,14 @@ from src.utils.constants import (
     PARTY_ROLES,
     EVIDENCE_TYPE_KEYWORDS
 )
-from src.utils.rag_helpers import extract_required_fields_from_rag
+from src.utils.rag_helpers import get_k2_required_fields
 from src.utils.helpers import parse_date
-from src.langgraph.nodes.qa_helpers import _extract_facts_from_conversation
+from src.langgraph.nodes.qa_helpers import (
+    _extract_facts_from_conversation,
+    _extract_facts_from_conversation_async
+)
 from src.db.connection import db_manager
+from src.services.case_table_writer import case_table_writer
 from src.db.models.case_missing_field import CaseMissingField
 from src.db.models.case_master import CaseMaster
 from src.db.models.case_fact import CaseFact
@@ -36,13 +41,167 @@ if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
     logger.setLevel(logging.INFO)
 
 
-@log_execution_time(logger)
-def validation_node(state: StateContext) -> Dict[str, Any]:
+def _log_validation_start(state: StateContext):
+    """VALIDATION 노드 시작 단계 표시"""
+    session_id = state["session_id"]
+    conversation_history = state.get("conversation_history", [])
+    case_type = state.get("case_type")
+    sub_case_type = state.get("sub_case_type")
+    
+    # 단계 표시
+    print("\n" + "="*70)
+    print("📍 [STEP 4] VALIDATION 노드 실행")
+    print("="*70)
+    print(f"📌 세션 ID: {session_id}")
+    print(f"🏷️  사건 유형: {case_type} ({sub_case_type})")
+    print(f"💬 대화 기록: {len(conversation_history)}개 Q-A 쌍")
+    print("="*70 + "\n")
+    logger.info("="*70)
+    logger.info("📍 [STEP 4] VALIDATION 노드 실행")
+    logger.info("="*70)
+    logger.info(f"📌 세션 ID: {session_id}")
+    logger.info(f"🏷️  사건 유형: {case_type} ({sub_case_type})")
+    logger.info(f"💬 대화 기록: {len(conversation_history)}개 Q-A 쌍")
+    logger.info("="*70)
+
+
+def _validation_failed(state: StateContext, error: Exception) -> Dict[str, Any]:
     """
-    VALIDATION Node 실행 (Q-A 매칭 방식)
+    VALIDATION 실패 시 폴백 처리
+    
+    Args:
+        state: 현재 State Context
+        error: 발생한 예외
+    
+    Returns:
+        기존 missing_fields 기반의 다음 State 정보
+    """
+    logger.error(f"VALIDATION Node 실행 실패: {str(error)}", exc_info=True)
+    # 폴백: 기존 conversation_history 기반으로 처리
+    missing_fields = state.get("missing_fields", [])
+    
+    if missing_fields:
+        return {
+            **state,
+            "bot_message": "추가 정보가 필요합니다. 질문에 답변해주세요.",
+            "next_state": "RE_QUESTION"
+        }
+    else:
+        return {
+            **state,
+            "bot_message": "모든 필수 정보가 수집되었습니다. 요약을 생성하겠습니다.",
+            "next_state": "SUMMARY"
+        }
+
+
+def _save_case_tables(session_id: str, facts: Dict[str, Any], missing_fields: List[str]):
+    """
+    facts/누락 필드를 정규화된 사건 테이블에 기록 (리포팅용, case_table_writer에서 실행)
+    
+    동기 모드(CASE_TABLES_ASYNC_WRITE=false)에서는 현재 턴의 작업 단위에 등록되어 턴 마지막에 기록됩니다.
+    
+    Args:
+        session_id: 세션 ID
+        facts: 추출된 facts
+        missing_fields: 누락 필드 리스트
+    """
+    try:
+        db_manager.enlist(_write_case_tables, session_id, facts, missing_fields, best_effort=True)
+    except Exception as db_error:
+        logger.error(f"[{session_id}] DB 저장 실패: {str(db_error)}", exc_info=True)
+        # DB 오류가 있어도 계속 진행
+
+
+def _write_case_tables(db_session: Session, session_id: str, facts: Dict[str, Any], missing_fields: List[str]):
+    """사건 테이블 기록 (내부 함수, 커밋은 호출자가 수행)"""
+    case = db_session.query(CaseMaster).filter(
+        CaseMaster.session_id == session_id
+    ).first()
+    
+    if case:
+        # CaseFact 저장 (날짜나 금액이 있는 경우)
+        if facts.get("incident_date") or facts.get("amount"):
+            incident_date = None
+            if facts.get("incident_date"):
+                try:
+                    parsed_date = parse_date(facts["incident_date"])
+                    if parsed_date:
+                        incident_date = parsed_date.date()
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"[{session_id}] 날짜 파싱 실패: {facts['incident_date']}, 오류: {str(e)}")
+            
+            fact = CaseFact(
+                case_id=case.case_id,
+                fact_type="사실",
+                incident_date=incident_date,
+                amount=facts.get("amount"),
+                description=None,  # conversation_history에서 추출된 정보는 description에 저장하지 않음
+                source_text=None
+            )
+            db_session.add(fact)
+        
+        # CaseParty 저장 (counterparty가 있는 경우)
+        if facts.get("counterparty"):
+            # 기존 상대방 파티 삭제 후 새로 추가
+            db_session.query(CaseParty).filter(
+                CaseParty.case_id == case.case_id,
+                CaseParty.party_role == PARTY_ROLES["COUNTERPARTY"]
+            ).delete()
+            
+            party_type = facts.get("counterparty_type", DEFAULT_PARTY_TYPE)
+            if party_type not in VALID_PARTY_TYPES:
+                party_type = DEFAULT_PARTY_TYPE
+            
+            party = CaseParty(
+                case_id=case.case_id,
+                party_role=PARTY_ROLES["COUNTERPARTY"],
+                party_type=party_type,
+                party_description=facts["counterparty"]
+            )
+            db_session.add(party)
+        
+        # CaseEvidence 저장 (evidence가 있는 경우)
+        if facts.get("evidence") is not None:
+            # 기존 증거 삭제 후 새로 추가
+            db_session.query(CaseEvidence).filter(
+                CaseEvidence.case_id == case.case_id
+            ).delete()
+            
+            evidence_type = facts.get("evidence_type")
+            if not evidence_type and facts.get("evidence"):
+                evidence_type = "기타"
+            
+            evidence = CaseEvidence(
+                case_id=case.case_id,
+                available=bool(facts["evidence"]),
+                evidence_type=evidence_type
+            )
+            db_session.add(evidence)
+        
+        # CaseMissingField 저장
+        db_session.query(CaseMissingField).filter(
+            CaseMissingField.case_id == case.case_id
+        ).delete()
+        
+        for field_key in missing_fields:
+            missing_field = CaseMissingField(
+                case_id=case.case_id,
+                field_key=field_key,
+                required=True,
+                resolved=False
+            )
+            db_session.add(missing_field)
+        
+        logger.info(f"[{session_id}] VALIDATION: DB 저장 완료")
+
+
+def _complete_validation(state: StateContext, facts: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    추출된 facts를 기준으로 누락 필드 계산, DB 저장, 다음 State 결정
     
     Args:
         state: 현재 State Context
+        facts: Q-A 대화에서 추출된 facts
     
     Returns:
         업데이트된 State 및 다음 State 정보
@@ -53,33 +212,6 @@ def validation_node(state: StateContext) -> Dict[str, Any]:
         case_type = state.get("case_type")
         sub_case_type = state.get("sub_case_type")
         
-        # 단계 표시
-        print("\n" + "="*70)
-        print("📍 [STEP 4] VALIDATION 노드 실행")
-        print("="*70)
-        print(f"📌 세션 ID: {session_id}")
-        print(f"🏷️  사건 유형: {case_type} ({sub_case_type})")
-        print(f"💬 대화 기록: {len(conversation_history)}개 Q-A 쌍")
-        print("="*70 + "\n")
-        logger.info("="*70)
-        logger.info("📍 [STEP 4] VALIDATION 노드 실행")
-        logger.info("="*70)
-        logger.info(f"📌 세션 ID: {session_id}")
-        logger.info(f"🏷️  사건 유형: {case_type} ({sub_case_type})")
-        logger.info(f"💬 대화 기록: {len(conversation_history)}개 Q-A 쌍")
-        logger.info("="*70)
-        
-        # GPT로 Q-A 쌍에서 facts 추출 (1차 서술 포함)
-        # conversation_history에는 이미 1차 서술에서 추출된 정보가 포함됨
-        try:
-            facts = _extract_facts_from_conversation(conversation_history, case_type)
-            logger.info(f"[{session_id}] GPT로 facts 추출 성공: {list(facts.keys())}")
-        except Exception as e:
-            logger.error(f"[{session_id}] GPT facts 추출 실패: {str(e)}", exc_info=True)
-            # 폴백: 빈 facts로 시작 (기존 엔티티 추출 방식은 _extract_facts_from_conversation 내부에서 처리)
-            facts = {}
-            logger.warning(f"[{session_id}] GPT 추출 실패, 빈 facts로 계속 진행")
-        
         # 1차 서술 분석 결과도 병합 (더 정확한 정보 우선)
         initial_analysis = state.get("initial_analysis", {})
         if initial_analysis:
@@ -99,16 +231,9 @@ def validation_node(state: StateContext) -> Dict[str, Any]:
         logger.info(f"[{session_id}] conversation_history: {len(conversation_history)}개 Q-A 쌍")
         logger.info(f"[{session_id}] conversation_history 상세: {[(qa.get('field'), qa.get('answer', '')[:30]) for qa in conversation_history]}")
         
-        # RAG에서 필수 필드 조회
+        # K2에서 필수 필드 조회
         try:
-            rag_results = rag_searcher.search(
-                query="필수 필드",
-                knowledge_type="K2",
-                main_case_type=case_type,
-                sub_case_type=sub_case_type,
-                top_k=1
-            )
-            required_fields = extract_required_fields_from_rag(rag_results)
+            required_fields = get_k2_required_fields(case_type, sub_case_type)
         except Exception as e:
             logger.warning(f"[{session_id}] RAG 필수 필드 조회 실패: {str(e)}")
             required_fields = []
@@ -168,92 +293,8 @@ def validation_node(state: StateContext) -> Dict[str, Any]:
         os.write(2, f"   asked_fields: {asked_fields}\n".encode('utf-8'))
         os.write(2, f"   missing_fields: {missing_fields}\n".encode('utf-8'))
         
-        # DB 저장 (facts를 DB 테이블에 저장)
-        try:
-            with db_manager.get_db_session() as db_session:
-                case = db_session.query(CaseMaster).filter(
-                    CaseMaster.session_id == session_id
-                ).first()
-                
-                if case:
-                    # CaseFact 저장 (날짜나 금액이 있는 경우)
-                    if facts.get("incident_date") or facts.get("amount"):
-                        incident_date = None
-                        if facts.get("incident_date"):
-                            try:
-                                parsed_date = parse_date(facts["incident_date"])
-                                if parsed_date:
-                                    incident_date = parsed_date.date()
-                            except (ValueError, TypeError) as e:
-                                logger.warning(f"[{session_id}] 날짜 파싱 실패: {facts['incident_date']}, 오류: {str(e)}")
-                        
-                        fact = CaseFact(
-                            case_id=case.case_id,
-                            fact_type="사실",
-                            incident_date=incident_date,
-                            amount=facts.get("amount"),
-                            description=None,  # conversation_history에서 추출된 정보는 description에 저장하지 않음
-                            source_text=None
-                        )
-                        db_session.add(fact)
-                    
-                    # CaseParty 저장 (counterparty가 있는 경우)
-                    if facts.get("counterparty"):
-                        # 기존 상대방 파티 삭제 후 새로 추가
-                        db_session.query(CaseParty).filter(
-                            CaseParty.case_id == case.case_id,
-                            CaseParty.party_role == PARTY_ROLES["COUNTERPARTY"]
-                        ).delete()
-                        
-                        party_type = facts.get("counterparty_type", DEFAULT_PARTY_TYPE)
-                        if party_type not in VALID_PARTY_TYPES:
-                            party_type = DEFAULT_PARTY_TYPE
-                        
-                        party = CaseParty(
-                            case_id=case.case_id,
-                            party_role=PARTY_ROLES["COUNTERPARTY"],
-                            party_type=party_type,
-                            party_description=facts["counterparty"]
-                        )
-                        db_session.add(party)
-                    
-                    # CaseEvidence 저장 (evidence가 있는 경우)
-                    if facts.get("evidence") is not None:
-                        # 기존 증거 삭제 후 새로 추가
-                        db_session.query(CaseEvidence).filter(
-                            CaseEvidence.case_id == case.case_id
-                        ).delete()
-                        
-                        evidence_type = facts.get("evidence_type")
-                        if not evidence_type and facts.get("evidence"):
-                            evidence_type = "기타"
-                        
-                        evidence = CaseEvidence(
-                            case_id=case.case_id,
-                            available=bool(facts["evidence"]),
-                            evidence_type=evidence_type
-                        )
-                        db_session.add(evidence)
-                    
-                    # CaseMissingField 저장
-                    db_session.query(CaseMissingField).filter(
-                        CaseMissingField.case_id == case.case_id
-                    ).delete()
-                    
-                    for field_key in missing_fields:
-                        missing_field = CaseMissingField(
-                            case_id=case.case_id,
-                            field_key=field_key,
-                            required=True,
-                            resolved=False
-                        )
-                        db_session.add(missing_field)
-                    
-                    db_session.commit()
-                    logger.info(f"[{session_id}] VALIDATION: DB 저장 완료")
-        except Exception as db_error:
-            logger.error(f"[{session_id}] DB 저장 실패: {str(db_error)}", exc_info=True)
-            # DB 오류가 있어도 계속 진행
+        # 사건 테이블 기록 (세션 재개는 상태 스냅샷을 사용하므로 응답 경로에서 분리하여 기록)
+        case_table_writer.submit(session_id, _save_case_tables, session_id, dict(facts), list(missing_fields))
         
         # 조건부 분기
         import sys
@@ -288,20 +329,68 @@ def validation_node(state: StateContext) -> Dict[str, Any]:
             }
     
     except Exception as e:
-        logger.error(f"VALIDATION Node 실행 실패: {str(e)}", exc_info=True)
-        # 폴백: 기존 conversation_history 기반으로 처리
-        missing_fields = state.get("missing_fields", [])
+        return _validation_failed(state, e)
+
+
+@log_execution_time(logger)
+def validation_node(state: StateContext) -> Dict[str, Any]:
+    """
+    VALIDATION Node 실행 (Q-A 매칭 방식)
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    try:
+        session_id = state["session_id"]
+        conversation_history = state.get("conversation_history", [])
+        case_type = state.get("case_type")
+        _log_validation_start(state)
         
-        if missing_fields:
-            return {
-                **state,
-                "bot_message": "추가 정보가 필요합니다. 질문에 답변해주세요.",
-                "next_state": "RE_QUESTION"
-            }
-        else:
-            return {
-                **state,
-                "bot_message": "모든 필수 정보가 수집되었습니다. 요약을 생성하겠습니다.",
-                "next_state": "SUMMARY"
-            }
+        # GPT로 Q-A 쌍에서 facts 추출 (1차 서술 포함)
+        # conversation_history에는 이미 1차 서술에서 추출된 정보가 포함됨
+        try:
+            facts = _extract_facts_from_conversation(conversation_history, case_type)
+            logger.info(f"[{session_id}] GPT로 facts 추출 성공: {list(facts.keys())}")
+        except Exception as e:
+            logger.error(f"[{session_id}] GPT facts 추출 실패: {str(e)}", exc_info=True)
+            # 폴백: 빈 facts로 시작 (기존 엔티티 추출 방식은 _extract_facts_from_conversation 내부에서 처리)
+            facts = {}
+            logger.warning(f"[{session_id}] GPT 추출 실패, 빈 facts로 계속 진행")
+    except Exception as e:
+        return _validation_failed(state, e)
+    
+    return _complete_validation(state, facts)
 
+
+@log_execution_time(logger)
+async def validation_node_async(state: StateContext) -> Dict[str, Any]:
+    """
+    VALIDATION Node 실행 (비동기)
+    
+    GPT facts 추출은 AsyncOpenAI로 대기하고, RAG 조회 및 DB 저장은 스레드에서 실행합니다.
+    
+    Args:
+        state: 현재 State Context
+    
+    Returns:
+        업데이트된 State 및 다음 State 정보
+    """
+    try:
+        session_id = state["session_id"]
+        conversation_history = state.get("conversation_history", [])
+        case_type = state.get("case_type")
+        _log_validation_start(state)
+        
+        try:
+            facts = await _extract_facts_from_conversation_async(conversation_history, case_type)
+            logger.info(f"[{session_id}] GPT로 facts 추출 성공: {list(facts.keys())}")
+        except Exception as e:
+            logger.error(f"[{session_id}] GPT facts 추출 실패: {str(e)}", exc_info=True)
+            facts = {}
+    except Exception as e:
+        return _validation_failed(state, e)
+    
+    return await asyncio.to_thread(_complete_validation, state, facts)
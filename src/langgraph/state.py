@@ -25,6 +25,8 @@ class StateContext(TypedDict, total=False):
     conversation_history: List[Dict[str, Any]]  # Q-A 쌍 리스트
     skipped_fields: List[str]  # 1차 서술에서 이미 답변된 필드
     current_question: Optional[Dict[str, Any]]  # 현재 질문 정보
+    classification_method: Optional[str]  # A/B 테스트로 할당된 사건 분류 방식 (multi_call/fused)
+    state_version: int  # 로드 시점의 chat_session.state_version (저장 시 버전 충돌 확인용)
 
 
 class StateContextModel(BaseModel):
@@ -47,6 +49,8 @@ class StateContextModel(BaseModel):
     conversation_history: List[Dict[str, Any]] = Field(default_factory=list)
     skipped_fields: List[str] = Field(default_factory=list)
     current_question: Optional[Dict[str, Any]] = None
+    classification_method: Optional[str] = None
+    state_version: int = Field(default=0, ge=0)
     
     @field_validator('current_state')
     @classmethod
@@ -97,7 +101,8 @@ def create_initial_context(session_id: str) -> StateContext:
         "missing_fields": [],
         "asked_fields": [],  # 이미 질문한 필드 추적
         "bot_message": None,
-        "expected_input": None
+        "expected_input": None,
+        "state_version": 0  # 새 세션은 버전 0에서 시작
     }
 
 
@@ -26,14 +26,14 @@ def log_state_transition(
         from_state: 이전 State
         to_state: 다음 State
         condition_key: 분기 조건 키
-        db_session: DB 세션 (None이면 새로 생성)
+        db_session: DB 세션 (None이면 현재 턴의 작업 단위에 등록하여 턴 마지막에 기록)
     """
     try:
         if db_session is None:
-            with db_manager.get_db_session() as session:
-                _save_state_log(
-                    session, session_id, from_state, to_state, condition_key
-                )
+            db_manager.enlist(
+                _save_state_log, session_id, from_state, to_state, condition_key,
+                best_effort=True
+            )
         else:
             _save_state_log(
                 db_session, session_id, from_state, to_state, condition_key
@@ -52,7 +52,7 @@ def _save_state_log(
     to_state: str,
     condition_key: Optional[str]
 ):
-    """State 로그 저장 (내부 함수)"""
+    """State 로그 저장 (내부 함수, 커밋은 호출자가 수행)"""
     log_entry = ChatSessionStateLog(
         session_id=session_id,
         from_state=from_state,
@@ -61,5 +61,4 @@ def _save_state_log(
     )
     
     session.add(log_entry)
-    session.commit()
 
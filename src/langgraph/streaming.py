@@ -0,0 +1,154 @@
+"""
+LLM 토큰 스트리밍 컨텍스트 모듈
+
+/chat/message/stream 요청 처리 중에만 토큰 수신 콜백을 ContextVar에 등록합니다.
+자유 텍스트를 생성하는 노드(SUMMARY 등)는 콜백이 등록되어 있으면 OpenAI 스트리밍
+API를 사용하고, 도착하는 토큰을 즉시 콜백으로 전달합니다. JSON으로 답하는 호출은
+JSONTextStreamer로 "키: 값" 텍스트로 바꿔 전달합니다.
+"""
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+TokenCallback = Callable[[str], None]
+
+# 현재 요청의 토큰 수신 콜백 (스트리밍 요청이 아니면 None)
+_token_callback: ContextVar[Optional[TokenCallback]] = ContextVar("token_callback", default=None)
+
+
+def get_token_callback() -> Optional[TokenCallback]:
+    """
+    현재 컨텍스트의 토큰 수신 콜백 반환
+    
+    Returns:
+        토큰 콜백 또는 None (스트리밍 요청이 아닌 경우)
+    """
+    return _token_callback.get()
+
+
+def set_token_callback(callback: Optional[TokenCallback]):
+    """
+    현재 컨텍스트에 토큰 수신 콜백 등록
+    
+    Args:
+        callback: 토큰 문자열을 받는 콜백
+    
+    Returns:
+        reset_token_callback에 전달할 토큰
+    """
+    return _token_callback.set(callback)
+
+
+def reset_token_callback(token):
+    """
+    set_token_callback 이전 상태로 복원
+    
+    Args:
+        token: set_token_callback이 반환한 토큰
+    """
+    _token_callback.reset(token)
+
+
+class JSONTextStreamer:
+    """
+    JSON 객체로 생성되는 LLM 응답을 "키: 값" 줄 단위 텍스트로 바꿔 전달하는 토큰 필터
+    
+    최종 요약처럼 JSON으로 답하는 호출의 원시 토큰({, ", 이스케이프 등)을 그대로 보내지 않고,
+    최상위 필드마다 "키: 값" 한 줄(Summarizer의 summary_text와 같은 형식)로 전달합니다.
+    토큰 경계가 문자열/이스케이프 중간에 걸려도 되도록 문자 단위 상태를 유지합니다.
+    중첩 배열/객체 값은 항목을 ", "로 이어 한 줄에 씁니다.
+    """
+    
+    _ESCAPES = {"n": "\n", "t": "\t", "r": "", "b": "", "f": "", "/": "/", "\\": "\\", "\"": "\""}
+    
+    def __init__(self, callback: TokenCallback):
+        """
+        Args:
+            callback: 변환된 텍스트를 받는 토큰 콜백
+        """
+        self._callback = callback
+        self._depth = 0
+        self._in_string = False
+        self._is_key = False
+        self._escape: Optional[str] = None  # 역슬래시 뒤에 읽은 문자 ("" 또는 "uXXXX" 일부)
+        self._key: list = []
+        self._line_open = False  # "키: " 이후 줄바꿈 전
+    
+    def feed(self, token: str):
+        """
+        LLM 토큰 한 개를 처리하고 변환된 텍스트가 있으면 콜백으로 전달
+        
+        Args:
+            token: 원시 토큰
+        """
+        out: list = []
+        for char in token:
+            if self._in_string:
+                self._consume_string(char, out)
+            else:
+                self._consume_structure(char, out)
+        if out:
+            self._callback("".join(out))
+    
+    def _emit(self, text: str, out: list):
+        """키 문자열이면 키 버퍼에, 아니면 출력에 추가"""
+        if self._is_key:
+            self._key.append(text)
+        elif self._depth >= 1:
+            out.append(text)
+    
+    def _consume_string(self, char: str, out: list):
+        """문자열 내부 문자 처리 (이스케이프 해석)"""
+        if self._escape is not None:
+            if self._escape == "" and char != "u":
+                self._emit(self._ESCAPES.get(char, char), out)
+                self._escape = None
+                return
+            self._escape += char
+            if len(self._escape) == 5:
+                try:
+                    self._emit(chr(int(self._escape[1:], 16)), out)
+                except ValueError:
+                    pass
+                self._escape = None
+        elif char == "\\":
+            self._escape = ""
+        elif char == "\"":
+            self._in_string = False
+            self._is_key = False
+        else:
+            self._emit(char, out)
+    
+    def _consume_structure(self, char: str, out: list):
+        """문자열 밖의 구조 문자 처리"""
+        if char == "\"":
+            self._in_string = True
+            # 최상위 객체에서 ":" 이전의 문자열은 키
+            self._is_key = self._depth == 1 and not self._line_open
+            if self._is_key:
+                self._key = []
+        elif char in "{[":
+            self._depth += 1
+        elif char in "}]":
+            self._depth -= 1
+            if self._depth <= 1:
+                self._end_line(out)
+        elif char == ":":
+            if self._depth == 1:
+                out.append(f"{''.join(self._key)}: ")
+                self._line_open = True
+            elif self._depth > 1:
+                out.append(": ")
+        elif char == ",":
+            if self._depth == 1:
+                self._end_line(out)
+            elif self._depth > 1:
+                out.append(", ")
+        elif self._depth >= 1 and self._line_open and not char.isspace():
+            # 숫자/true/false/null 값
+            out.append(char)
+    
+    def _end_line(self, out: list):
+        """현재 필드 줄 종료"""
+        if self._line_open and self._depth <= 1:
+            out.append("\n")
+            self._line_open = False
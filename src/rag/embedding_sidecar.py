@@ -0,0 +1,326 @@
+"""
+Embedding 사이드카 모듈
+
+uvicorn/gunicorn 워커마다 Embedding 모델을 따로 로드하면 워커 수만큼 메모리와 시작 시간이 늘어나므로,
+모델을 한 번만 로드한 사이드카 프로세스가 Unix 소켓으로 encode 요청을 처리합니다.
+동시에 들어온 요청은 짧은 시간(EMBEDDING_SIDECAR_MAX_WAIT_MS) 동안 모아 한 번의 배치로 계산합니다(micro-batching).
+
+EMBEDDING_SERVICE=sidecar이면 EmbeddingModel이 이 모듈의 클라이언트로 encode를 위임하며,
+쿼리 Embedding 캐시는 워커별로 그대로 동작합니다.
+
+실행:
+    python -m src.rag.embedding_sidecar
+
+프로토콜 (요청/응답 공통 프레임):
+    [헤더 길이 4바이트][본문 길이 4바이트][JSON 헤더][본문]
+    - 요청: {"op": "encode", "texts": [...]} 또는 {"op": "info"}
+    - 응답: {"shape": [n, d], "model_id": ...} + float32 벡터 바이트, 실패 시 {"error": ...}
+"""
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import numpy as np
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_FRAME_HEADER = struct.Struct("!II")
+
+
+def send_frame(sock: socket.socket, header: Dict[str, Any], payload: bytes = b""):
+    """프레임 전송"""
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_FRAME_HEADER.pack(len(header_bytes), len(payload)) + header_bytes + payload)
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    """정확히 size 바이트 수신 (연결이 끊기면 ConnectionError)"""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(size - len(buffer))
+        if not chunk:
+            raise ConnectionError("Embedding 사이드카 연결이 끊어졌습니다")
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+def recv_frame(sock: socket.socket) -> Tuple[Dict[str, Any], bytes]:
+    """프레임 수신"""
+    header_size, payload_size = _FRAME_HEADER.unpack(_recv_exact(sock, _FRAME_HEADER.size))
+    header = json.loads(_recv_exact(sock, header_size).decode("utf-8"))
+    payload = _recv_exact(sock, payload_size) if payload_size else b""
+    return header, payload
+
+
+class MicroBatcher:
+    """동시 encode 요청을 모아 한 번에 계산하는 클래스"""
+    
+    def __init__(self, encode: Callable[[List[str]], np.ndarray], max_batch: int, max_wait_ms: float):
+        """
+        배처 초기화 (start 호출 시 배치 스레드 시작)
+        
+        Args:
+            encode: 텍스트 리스트 → Embedding 배열 함수
+            max_batch: 한 번에 계산할 최대 텍스트 수
+            max_wait_ms: 첫 요청 이후 다른 요청을 기다리는 최대 시간
+        """
+        self.encode = encode
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: "queue.Queue[Optional[Tuple[List[str], Future]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self.batches = 0
+        self.requests = 0
+    
+    def start(self):
+        """배치 스레드 시작"""
+        self._thread = threading.Thread(target=self._run, name="embedding-micro-batcher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """배치 스레드 종료"""
+        self._queue.put(None)
+        if self._thread is not None:
+            self._thread.join()
+    
+    def submit(self, texts: List[str]) -> Future:
+        """
+        encode 요청 등록
+        
+        Args:
+            texts: 텍스트 리스트
+        
+        Returns:
+            Embedding 배열을 결과로 갖는 Future
+        """
+        future: Future = Future()
+        self._queue.put((texts, future))
+        return future
+    
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            pending = [item]
+            size = len(item[0])
+            deadline = time.perf_counter() + self.max_wait
+            # 배치가 찰 때까지 또는 대기 시간이 끝날 때까지 다른 요청을 모음
+            while size < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                pending.append(item)
+                size += len(item[0])
+            self._process(pending)
+    
+    def _process(self, pending: List[Tuple[List[str], Future]]):
+        """모은 요청을 한 번에 계산하여 요청별로 나눠 전달"""
+        texts = [text for request_texts, _ in pending for text in request_texts]
+        try:
+            vectors = np.asarray(self.encode(texts), dtype=np.float32) if texts else np.zeros((0, 0), dtype=np.float32)
+        except Exception as e:
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        
+        self.batches += 1
+        self.requests += len(pending)
+        offset = 0
+        for request_texts, future in pending:
+            future.set_result(vectors[offset:offset + len(request_texts)])
+            offset += len(request_texts)
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    """연결별 요청 처리 (연결 하나로 여러 요청을 순서대로 처리)"""
+    
+    def handle(self):
+        server: "EmbeddingSidecarServer" = self.server
+        while True:
+            try:
+                header, _ = recv_frame(self.request)
+            except (ConnectionError, OSError):
+                return
+            
+            try:
+                if header.get("op") == "info":
+                    send_frame(self.request, {"model_id": server.model_id})
+                elif header.get("op") == "encode":
+                    vectors = server.batcher.submit(list(header.get("texts", []))).result()
+                    send_frame(
+                        self.request,
+                        {"shape": list(vectors.shape), "model_id": server.model_id},
+                        np.ascontiguousarray(vectors, dtype=np.float32).tobytes()
+                    )
+                else:
+                    send_frame(self.request, {"error": f"지원하지 않는 요청: {header.get('op')}"})
+            except (ConnectionError, OSError):
+                return
+            except Exception as e:
+                logger.error(f"Embedding 사이드카 요청 처리 실패: {str(e)}")
+                send_frame(self.request, {"error": f"{type(e).__name__}: {str(e)}"})
+
+
+class EmbeddingSidecarServer(socketserver.ThreadingUnixStreamServer):
+    """Embedding 사이드카 서버 클래스"""
+    
+    daemon_threads = True
+    
+    def __init__(self, socket_path: Path, batcher: MicroBatcher, model_id: str):
+        """
+        서버 초기화 (남아 있는 소켓 파일은 삭제 후 생성)
+        
+        Args:
+            socket_path: Unix 소켓 경로
+            batcher: 요청을 계산할 MicroBatcher
+            model_id: 응답에 포함할 모델 식별자
+        """
+        self.socket_path = socket_path
+        self.batcher = batcher
+        self.model_id = model_id
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if socket_path.exists():
+            socket_path.unlink()
+        super().__init__(str(socket_path), _RequestHandler)
+        # 같은 사용자/그룹의 워커만 접근
+        os.chmod(socket_path, 0o660)
+    
+    def server_close(self):
+        super().server_close()
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+
+class EmbeddingSidecarClient:
+    """Embedding 사이드카 클라이언트 클래스 (스레드별 연결 사용)"""
+    
+    def __init__(self, socket_path: Path, timeout: float):
+        """
+        클라이언트 초기화 (첫 요청 시 연결)
+        
+        Args:
+            socket_path: 사이드카 Unix 소켓 경로
+            timeout: 요청당 타임아웃 (초)
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+        self._model_id: Optional[str] = None
+    
+    def _connection(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(str(self.socket_path))
+            except OSError:
+                sock.close()
+                raise
+            self._local.sock = sock
+        return sock
+    
+    def _close(self):
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+    
+    def _request(self, header: Dict[str, Any]) -> Tuple[Dict[str, Any], bytes]:
+        """
+        요청 전송 (끊어진 연결은 한 번 다시 연결하여 재시도)
+        
+        Raises:
+            ConnectionError: 사이드카에 연결할 수 없는 경우
+            RuntimeError: 사이드카가 오류를 반환한 경우
+        """
+        for attempt in range(2):
+            try:
+                sock = self._connection()
+                send_frame(sock, header)
+                response, payload = recv_frame(sock)
+                break
+            except OSError as e:
+                # ConnectionError/socket.timeout 포함
+                self._close()
+                if attempt == 1:
+                    raise ConnectionError(f"Embedding 사이드카 요청 실패: {self.socket_path} - {str(e)}") from e
+        
+        if "error" in response:
+            raise RuntimeError(f"Embedding 사이드카 오류: {response['error']}")
+        return response, payload
+    
+    @property
+    def model_id(self) -> str:
+        """사이드카가 로드한 모델 식별자"""
+        if self._model_id is None:
+            self._model_id = self._request({"op": "info"})[0]["model_id"]
+        return self._model_id
+    
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """
+        텍스트를 벡터로 변환
+        
+        Args:
+            texts: 텍스트 리스트
+        
+        Returns:
+            Embedding 벡터 배열 (float32)
+        """
+        response, payload = self._request({"op": "encode", "texts": texts})
+        self._model_id = response.get("model_id", self._model_id)
+        return np.frombuffer(payload, dtype=np.float32).reshape(response["shape"])
+
+
+def main():
+    """Embedding 사이드카 실행"""
+    import argparse
+    from src.rag import embeddings
+    from src.utils.logger import setup_logging
+    
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Embedding 사이드카")
+    parser.add_argument("--socket", default=settings.embedding_sidecar_socket, help="Unix 소켓 경로")
+    args = parser.parse_args()
+    
+    # 워커와 같은 설정(EMBEDDING_SERVICE=sidecar)으로 실행해도 사이드카 자신은 모델을 직접 로드
+    model = embeddings.embedding_model
+    if model.service != "local":
+        model = embeddings.EmbeddingModel(service="local")
+    
+    batcher = MicroBatcher(
+        lambda texts: model.encode(texts, batch_size=settings.embedding_sidecar_max_batch),
+        settings.embedding_sidecar_max_batch,
+        settings.embedding_sidecar_max_wait_ms
+    )
+    batcher.start()
+    server = EmbeddingSidecarServer(Path(args.socket), batcher, model.model_id)
+    logger.info(f"Embedding 사이드카 시작: {args.socket} (모델: {model.model_id})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Embedding 사이드카 종료")
+    finally:
+        server.server_close()
+        batcher.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,22 @@
 """
 Embedding 모델 관리 모듈
+
+노드가 반복 사용하는 고정 쿼리("필수 필드", "{field} 질문" 등)는 쿼리 Embedding LRU 캐시로
+모델 호출 없이 재사용합니다. 캐시는 모델 이름별로 유효하며 settings.embedding_model이 바뀌면
+모델을 다시 로드하고 캐시를 비웁니다.
+
+EMBEDDING_SERVICE=sidecar이면 모델을 워커마다 로드하지 않고 Embedding 사이드카 프로세스로
+encode를 위임합니다 (src/rag/embedding_sidecar.py).
 """
-from typing import List, Union
+import importlib.util
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Union, Dict, Any, Optional
+import threading
+import time
 import numpy as np
 from config.settings import settings
+from src.rag.embedding_sidecar import EmbeddingSidecarClient
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -23,24 +36,161 @@ try:
 except ImportError:
     OPENAI_AVAILABLE = False
 
+# ONNX Runtime 백엔드를 사용하는 경우 (sentence-transformers의 backend="onnx"는 optimum도 필요)
+ONNX_AVAILABLE = importlib.util.find_spec("onnxruntime") is not None and importlib.util.find_spec("optimum") is not None
+
+# Sentence Transformers 추론 백엔드
+# - torch: PyTorch float32 (기본)
+# - torch_int8: PyTorch 동적 양자화 (Linear 가중치 int8, 추가 의존성 없음)
+# - onnx: ONNX Runtime (EMBEDDING_ONNX_FILE로 양자화된 ONNX 파일 지정 가능)
+EMBEDDING_BACKENDS = ("torch", "torch_int8", "onnx")
+
+# Embedding 계산 위치
+# - local: 프로세스(워커)마다 모델 로드
+# - sidecar: 모델을 한 번만 로드한 사이드카 프로세스에 Unix 소켓으로 요청
+EMBEDDING_SERVICES = ("local", "sidecar")
+
+
+class QueryEmbeddingCache:
+    """쿼리 Embedding LRU 캐시 클래스 (스레드 안전)"""
+    
+    def __init__(self, max_entries: int):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 항목 수 (0 이하이면 캐시 비활성화)
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.max_entries > 0
+    
+    def get(self, query: str) -> Optional[np.ndarray]:
+        """
+        캐시 조회 (히트 시 가장 최근 사용으로 갱신)
+        
+        Args:
+            query: 쿼리 텍스트
+        
+        Returns:
+            Embedding 벡터 (읽기 전용) 또는 None
+        """
+        with self._lock:
+            vector = self._entries.get(query)
+            if vector is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(query)
+            self._hits += 1
+            return vector
+    
+    def set(self, query: str, vector: np.ndarray) -> np.ndarray:
+        """
+        캐시 저장 (상한 초과 시 가장 오래 사용되지 않은 항목 제거)
+        
+        Args:
+            query: 쿼리 텍스트
+            vector: Embedding 벡터
+        
+        Returns:
+            저장된 벡터 (호출자가 공유 배열을 수정하지 못하도록 읽기 전용)
+        """
+        vector = np.array(vector, copy=True)
+        vector.flags.writeable = False
+        if not self.enabled:
+            return vector
+        with self._lock:
+            self._entries[query] = vector
+            self._entries.move_to_end(query)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return vector
+    
+    def items(self) -> Dict[str, np.ndarray]:
+        """현재 항목 사본 (디스크 저장용)"""
+        with self._lock:
+            return dict(self._entries)
+    
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            return cleared
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0.0
+            }
+
 
 class EmbeddingModel:
     """Embedding 모델 래퍼 클래스"""
     
-    def __init__(self):
+    def __init__(self, service: Optional[str] = None):
+        """
+        Embedding 모델 초기화
+        
+        Args:
+            service: Embedding 계산 위치 (None이면 settings.embedding_service)
+        """
         self.model = None
         self.model_name = settings.embedding_model
+        self.backend = settings.embedding_backend
+        self.service = service or settings.embedding_service
+        self.query_cache = QueryEmbeddingCache(settings.query_embedding_cache_size)
+        self._reload_lock = threading.Lock()
+        # 사이드카 연결 실패 시 임시로 사용하는 로컬 모델과 사용량
+        self._sidecar_fallback: Optional["EmbeddingModel"] = None
+        self._sidecar_retry_at = 0.0
+        self._sidecar_failures = 0
+        self._sidecar_fallback_encodes = 0
+        self._sidecar_recoveries = 0
         self._initialize()
     
     def _initialize(self):
         """Embedding 모델 초기화"""
         try:
+            # Embedding 사이드카 사용 (모델은 사이드카 프로세스가 로드)
+            if self.service == "sidecar":
+                self.sidecar = EmbeddingSidecarClient(
+                    Path(settings.embedding_sidecar_socket),
+                    settings.embedding_sidecar_timeout
+                )
+                self.model_type = "sidecar"
+                self._sidecar_fallback = None
+                logger.info(f"Embedding 사이드카 사용: {settings.embedding_sidecar_socket}")
+            
+            elif self.service != "local":
+                raise ValueError(f"지원하지 않는 Embedding 서비스: {self.service}")
+            
             # OpenAI Embeddings 사용 여부 확인
-            if "text-embedding" in self.model_name.lower() or "openai" in self.model_name.lower():
+            elif "text-embedding" in self.model_name.lower() or "openai" in self.model_name.lower():
                 if not OPENAI_AVAILABLE:
                     raise ImportError("openai 라이브러리가 설치되지 않았습니다.")
                 
-                from config.settings import settings
                 self.client = OpenAI(api_key=settings.openai_api_key)
                 self.model_type = "openai"
                 logger.info(f"OpenAI Embedding 모델 초기화: {self.model_name}")
@@ -50,14 +200,61 @@ class EmbeddingModel:
                 if not SENTENCE_TRANSFORMERS_AVAILABLE:
                     raise ImportError("sentence-transformers 라이브러리가 설치되지 않았습니다.")
                 
-                self.model = SentenceTransformer(self.model_name)
+                self.model = self._load_sentence_transformer()
                 self.model_type = "sentence_transformers"
-                logger.info(f"Sentence Transformers 모델 초기화: {self.model_name}")
+                logger.info(f"Sentence Transformers 모델 초기화: {self.model_name} (백엔드: {self.backend})")
         
         except Exception as e:
             logger.error(f"Embedding 모델 초기화 실패: {str(e)}")
             raise
     
+    def _load_sentence_transformer(self) -> "SentenceTransformer":
+        """
+        설정된 추론 백엔드로 Sentence Transformers 모델 로드
+        
+        Returns:
+            SentenceTransformer 인스턴스
+        
+        Raises:
+            ImportError: onnx 백엔드에 필요한 라이브러리가 없는 경우
+            ValueError: 지원하지 않는 백엔드인 경우
+        """
+        if self.backend == "torch":
+            return SentenceTransformer(self.model_name)
+        
+        elif self.backend == "torch_int8":
+            import torch
+            model = SentenceTransformer(self.model_name, device="cpu")
+            # Linear 가중치를 int8로 바꾸고 활성값은 추론 시 동적으로 양자화 (원본 가중치는 교체되어 해제)
+            return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        
+        elif self.backend == "onnx":
+            if not ONNX_AVAILABLE:
+                raise ImportError("onnx 백엔드에는 onnxruntime과 optimum이 필요합니다. (pip install optimum[onnxruntime])")
+            model_kwargs = {"file_name": settings.embedding_onnx_file} if settings.embedding_onnx_file else None
+            return SentenceTransformer(self.model_name, backend="onnx", model_kwargs=model_kwargs)
+        
+        else:
+            raise ValueError(f"지원하지 않는 Embedding 백엔드: {self.backend}")
+    
+    @property
+    def model_id(self) -> str:
+        """
+        Embedding 결과를 구분하는 모델 식별자 (디스크 캐시 유효성 확인용)
+        
+        양자화 백엔드는 결과가 PyTorch 모델과 미세하게 다르므로 백엔드까지 포함합니다.
+        사이드카를 사용하면 사이드카가 로드한 모델의 식별자를 사용합니다.
+        """
+        model_type = getattr(self, "model_type", None)
+        if model_type == "sidecar":
+            try:
+                return self.sidecar.model_id
+            except (ConnectionError, RuntimeError) as e:
+                logger.warning(f"Embedding 사이드카 모델 식별자 조회 실패, 로컬 설정 사용: {str(e)}")
+        if model_type == "openai" or self.backend == "torch":
+            return self.model_name
+        return f"{self.model_name}@{self.backend}"
+    
     def encode(self, texts: Union[str, List[str]], batch_size: int = 32) -> np.ndarray:
         """
         텍스트를 벡터로 변환
@@ -72,14 +269,19 @@ class EmbeddingModel:
         if isinstance(texts, str):
             texts = [texts]
         
+        if self.model_type == "sidecar":
+            return self._encode_sidecar(texts, batch_size)
+        
         try:
             if self.model_type == "openai":
-                # OpenAI Embeddings API 호출
-                response = self.client.embeddings.create(
-                    model=self.model_name,
-                    input=texts
-                )
-                embeddings = [item.embedding for item in response.data]
+                # OpenAI Embeddings API 호출 (요청당 입력 수 제한이 있으므로 batch_size 단위로 분할)
+                embeddings = []
+                for offset in range(0, len(texts), batch_size):
+                    response = self.client.embeddings.create(
+                        model=self.model_name,
+                        input=texts[offset:offset + batch_size]
+                    )
+                    embeddings.extend(item.embedding for item in response.data)
                 return np.array(embeddings)
             
             else:
@@ -96,17 +298,190 @@ class EmbeddingModel:
             logger.error(f"Embedding 생성 실패: {str(e)}")
             raise
     
+    def _encode_sidecar(self, texts: List[str], batch_size: int) -> np.ndarray:
+        """
+        Embedding 사이드카로 변환
+        
+        연결에 실패하면 설정에 따라 이 프로세스의 로컬 모델로 임시 전환하고,
+        EMBEDDING_SIDECAR_RETRY_SECONDS가 지난 뒤 사이드카에 다시 연결합니다.
+        사이드카가 복구되면 로컬 모델을 해제합니다.
+        
+        Args:
+            texts: 변환할 텍스트 리스트
+            batch_size: 배치 크기 (로컬 전환 시 사용, 사이드카는 자체 배치 크기 사용)
+        
+        Returns:
+            Embedding 벡터 배열
+        """
+        fallback = self._sidecar_fallback
+        if fallback is not None and time.monotonic() < self._sidecar_retry_at:
+            self._sidecar_fallback_encodes += 1
+            return fallback.encode(texts, batch_size=batch_size)
+        
+        try:
+            embeddings = self.sidecar.encode(texts)
+        except ConnectionError as e:
+            self._sidecar_failures += 1
+            if not settings.embedding_sidecar_fallback:
+                logger.error(f"Embedding 생성 실패: {str(e)}")
+                raise
+            return self._encode_local_fallback(texts, batch_size, e)
+        
+        if fallback is not None:
+            with self._reload_lock:
+                if self._sidecar_fallback is not None:
+                    logger.info("Embedding 사이드카 연결 복구 - 로컬 Embedding 모델을 해제합니다")
+                    self._sidecar_fallback = None
+                    self._sidecar_recoveries += 1
+        return embeddings
+    
+    def _encode_local_fallback(self, texts: List[str], batch_size: int, error: ConnectionError) -> np.ndarray:
+        """
+        사이드카 연결 실패 시 로컬 모델로 변환하고 다음 재연결 시각 설정
+        
+        Args:
+            texts: 변환할 텍스트 리스트
+            batch_size: 배치 크기
+            error: 사이드카 연결 오류
+        
+        Returns:
+            Embedding 벡터 배열
+        """
+        retry_seconds = settings.embedding_sidecar_retry_seconds
+        with self._reload_lock:
+            if self._sidecar_fallback is None:
+                logger.warning(
+                    f"{str(error)} - 사이드카가 복구될 때까지 이 프로세스에서 Embedding 모델을 직접 로드합니다 "
+                    f"({retry_seconds}초 후 재연결 시도)"
+                )
+                self._sidecar_fallback = EmbeddingModel(service="local")
+            else:
+                logger.warning(f"{str(error)} - 로컬 Embedding 모델로 계속 처리합니다 ({retry_seconds}초 후 재연결 시도)")
+            self._sidecar_retry_at = time.monotonic() + retry_seconds
+            fallback = self._sidecar_fallback
+        self._sidecar_fallback_encodes += 1
+        return fallback.encode(texts, batch_size=batch_size)
+    
+    def get_sidecar_stats(self) -> Dict[str, Any]:
+        """
+        사이드카 연결 실패와 로컬 전환 사용량
+        
+        Returns:
+            연결 실패 횟수, 로컬 모델 변환 횟수, 복구 횟수, 현재 로컬 전환 여부
+        """
+        return {
+            "sidecar_failures": self._sidecar_failures,
+            "fallback_encodes": self._sidecar_fallback_encodes,
+            "recoveries": self._sidecar_recoveries,
+            "fallback_active": self._sidecar_fallback is not None
+        }
+    
+    def _check_model_changed(self):
+        """settings.embedding_model/embedding_backend가 바뀌었으면 모델을 다시 로드하고 쿼리 캐시 무효화"""
+        if settings.embedding_model == self.model_name and settings.embedding_backend == self.backend:
+            return
+        with self._reload_lock:
+            if settings.embedding_model == self.model_name and settings.embedding_backend == self.backend:
+                return
+            logger.info(
+                f"Embedding 모델 변경 감지: {self.model_name}({self.backend}) → "
+                f"{settings.embedding_model}({settings.embedding_backend})"
+            )
+            self.model_name = settings.embedding_model
+            self.backend = settings.embedding_backend
+            self._initialize()
+            self.query_cache.clear()
+    
     def encode_query(self, query: str) -> np.ndarray:
         """
-        쿼리 텍스트를 벡터로 변환
+        쿼리 텍스트를 벡터로 변환 (쿼리 Embedding 캐시 사용)
         
         Args:
             query: 쿼리 텍스트
         
         Returns:
-            Embedding 벡터
+            Embedding 벡터 (캐시와 공유되는 읽기 전용 배열)
+        """
+        self._check_model_changed()
+        vector = self.query_cache.get(query)
+        if vector is not None:
+            return vector
+        return self.query_cache.set(query, self.encode(query)[0])
+    
+    def encode_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """
+        여러 쿼리를 벡터로 변환 (캐시에 없는 쿼리만 한 번의 배치로 계산)
+        
+        Args:
+            queries: 쿼리 텍스트 리스트 (중복 허용)
+        
+        Returns:
+            입력 순서와 같은 Embedding 벡터 리스트 (캐시와 공유되는 읽기 전용 배열)
         """
-        return self.encode(query)[0]
+        self._check_model_changed()
+        vectors: Dict[str, np.ndarray] = {}
+        for query in dict.fromkeys(queries):
+            vector = self.query_cache.get(query)
+            if vector is not None:
+                vectors[query] = vector
+        
+        missing = [query for query in dict.fromkeys(queries) if query not in vectors]
+        if missing:
+            for query, vector in zip(missing, self.encode(missing)):
+                vectors[query] = self.query_cache.set(query, vector)
+        return [vectors[query] for query in queries]
+    
+    def prewarm_query_cache(self, queries: List[str], cache_path: Optional[Path] = None) -> int:
+        """
+        노드 고정 쿼리의 Embedding을 미리 캐시에 적재
+        
+        디스크 파일(npz)이 있고 같은 모델로 만든 것이면 그대로 로드하고,
+        파일에 없는 쿼리만 한 번의 배치로 계산한 뒤 파일을 갱신합니다.
+        
+        Args:
+            queries: 미리 계산할 쿼리 리스트
+            cache_path: 디스크 캐시 파일 경로 (None이면 디스크 사용 안 함)
+        
+        Returns:
+            캐시에 적재된 쿼리 수
+        """
+        self._check_model_changed()
+        vectors: Dict[str, np.ndarray] = {}
+        
+        if cache_path is not None and cache_path.exists():
+            try:
+                with np.load(cache_path, allow_pickle=False) as data:
+                    if str(data["model_name"]) == self.model_id:
+                        vectors = dict(zip(data["queries"].tolist(), data["vectors"]))
+                    else:
+                        logger.info(f"쿼리 Embedding 디스크 캐시의 모델이 달라 무시: {cache_path}")
+            except Exception as e:
+                logger.warning(f"쿼리 Embedding 디스크 캐시 로드 실패: {cache_path} - {str(e)}")
+        
+        missing = [query for query in dict.fromkeys(queries) if query not in vectors]
+        if missing:
+            vectors.update(zip(missing, self.encode(missing)))
+        
+        for query in queries:
+            self.query_cache.set(query, vectors[query])
+        
+        if cache_path is not None and missing:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                names = list(vectors)
+                # np.savez는 확장자를 붙이므로 파일 객체로 저장
+                with open(cache_path, "wb") as f:
+                    np.savez(
+                        f,
+                        model_name=np.array(self.model_id),
+                        queries=np.array(names),
+                        vectors=np.stack([vectors[name] for name in names])
+                    )
+            except Exception as e:
+                logger.warning(f"쿼리 Embedding 디스크 캐시 저장 실패: {cache_path} - {str(e)}")
+        
+        logger.info(f"쿼리 Embedding 캐시 사전 적재: {len(queries)}개 (새로 계산 {len(missing)}개)")
+        return len(queries)
 
 
 # 전역 Embedding 모델 인스턴스
@@ -0,0 +1,183 @@
+"""
+RAG 인덱스 별칭(alias) 관리 모듈
+
+별칭(예: rag_documents)이 현재 서비스 중인 세대 컬렉션을 가리키도록 JSON 파일에 기록합니다.
+블루/그린 재인덱싱은 새 세대 컬렉션을 완성·검증한 뒤 별칭만 원자적으로 교체하므로
+검색 쪽은 쿼리마다 별칭을 해석하기만 하면 항상 완성된 인덱스를 조회합니다.
+이전 세대는 history에 보관되어 롤백에 사용됩니다.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class IndexAliasRegistry:
+    """인덱스 별칭 레지스트리 클래스"""
+    
+    def __init__(self, path: Path):
+        """
+        레지스트리 초기화
+        
+        Args:
+            path: 별칭 JSON 파일 경로
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached_signature: Optional[Tuple[int, int, int]] = None
+        self._cached_aliases: Dict[str, Dict[str, Any]] = {}
+    
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        별칭 파일 로드 (파일이 바뀌지 않았으면 캐시 사용)
+        
+        검색 쿼리마다 호출되므로 stat 결과(inode/mtime/size)가 같으면 다시 파싱하지 않습니다.
+        다른 프로세스가 교체한 경우에도 os.replace로 inode가 바뀌어 바로 반영됩니다.
+        """
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._cached_signature = None
+            self._cached_aliases = {}
+            return {}
+        
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        if signature != self._cached_signature:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self._cached_aliases = data.get("aliases", {})
+            except (OSError, ValueError) as e:
+                logger.warning(f"인덱스 별칭 파일 로드 실패, 이전 값 사용: {self.path} - {str(e)}")
+                return self._cached_aliases
+            self._cached_signature = signature
+        return self._cached_aliases
+    
+    def _write(self, aliases: Dict[str, Dict[str, Any]]):
+        """별칭 파일 저장 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않도록 함)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps({"aliases": aliases}, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        os.replace(temp_path, self.path)
+    
+    def _copy(self) -> Dict[str, Dict[str, Any]]:
+        """수정용 별칭 사본"""
+        return {
+            alias: {"active": entry["active"], "history": list(entry.get("history", []))}
+            for alias, entry in self._read().items()
+        }
+    
+    def resolve(self, alias: str) -> str:
+        """
+        별칭이 가리키는 컬렉션 이름 반환
+        
+        Args:
+            alias: 별칭 (별칭이 아니면 그대로 컬렉션 이름으로 사용)
+        
+        Returns:
+            컬렉션 이름
+        """
+        entry = self._read().get(alias)
+        return entry["active"] if entry else alias
+    
+    def history(self, alias: str) -> List[str]:
+        """
+        롤백 가능한 이전 세대 목록 (최근 세대가 마지막)
+        
+        Args:
+            alias: 별칭
+        
+        Returns:
+            컬렉션 이름 리스트
+        """
+        entry = self._read().get(alias)
+        return list(entry.get("history", [])) if entry else []
+    
+    def swap(self, alias: str, collection_name: str) -> Optional[str]:
+        """
+        별칭을 새 컬렉션으로 전환하고 이전 컬렉션을 history에 추가
+        
+        Args:
+            alias: 별칭
+            collection_name: 새로 서비스할 컬렉션 이름
+        
+        Returns:
+            이전에 서비스하던 컬렉션 이름 (없으면 None)
+        """
+        with self._lock:
+            aliases = self._copy()
+            entry = aliases.get(alias)
+            # 별칭이 없으면 별칭과 같은 이름의 기존 컬렉션이 서비스 중이던 것으로 간주
+            previous = entry["active"] if entry else alias
+            history = entry["history"] if entry else []
+            if previous != collection_name:
+                history = [name for name in history if name not in (previous, collection_name)] + [previous]
+            aliases[alias] = {"active": collection_name, "history": history}
+            self._write(aliases)
+        
+        logger.info(f"인덱스 별칭 전환: {alias} → {collection_name} (이전: {previous})")
+        return previous if previous != collection_name else None
+    
+    def rollback(self, alias: str) -> Tuple[str, str]:
+        """
+        별칭을 직전 세대로 되돌림
+        
+        Args:
+            alias: 별칭
+        
+        Returns:
+            (되돌리기 전 컬렉션 이름, 되돌린 후 컬렉션 이름)
+        
+        Raises:
+            ValueError: 롤백할 이전 세대가 없는 경우
+        """
+        with self._lock:
+            aliases = self._copy()
+            entry = aliases.get(alias)
+            if not entry or not entry["history"]:
+                raise ValueError(f"롤백할 이전 세대가 없습니다: {alias}")
+            current = entry["active"]
+            entry["active"] = entry["history"].pop()
+            self._write(aliases)
+        
+        logger.info(f"인덱스 별칭 롤백: {alias} → {entry['active']} (이전: {current})")
+        return current, entry["active"]
+    
+    def forget(self, alias: str, collection_names: List[str]):
+        """
+        history에서 컬렉션 제거 (오래된 세대 정리 후 호출)
+        
+        Args:
+            alias: 별칭
+            collection_names: 제거할 컬렉션 이름 리스트
+        """
+        with self._lock:
+            aliases = self._copy()
+            entry = aliases.get(alias)
+            if not entry:
+                return
+            entry["history"] = [name for name in entry["history"] if name not in collection_names]
+            self._write(aliases)
+    
+    def remove(self, alias: str):
+        """
+        별칭 삭제 (인덱스 전체 초기화 시)
+        
+        Args:
+            alias: 별칭
+        """
+        with self._lock:
+            aliases = self._copy()
+            if aliases.pop(alias, None) is not None:
+                self._write(aliases)
+
+
+# 전역 인덱스 별칭 레지스트리 인스턴스
+index_alias_registry = IndexAliasRegistry(Path(settings.vector_db_path) / "aliases.json")
@@ -0,0 +1,105 @@
+"""
+RAG 문서 파싱/Chunking 병렬 처리 모듈
+
+YAML 로드와 pydantic 검증, Chunk 문자열 조립은 CPU 작업이므로 프로세스 풀로 나눠 처리합니다.
+워커는 spawn 방식으로 시작되어 이 모듈(파서/Chunker)만 임포트하며, 벡터 DB나 Embedding 모델은
+메인 프로세스에서만 초기화됩니다. 결과는 파일 순서대로 스트리밍되어 Embedding 배치로 바로 전달됩니다.
+"""
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional
+from src.rag.parser import RAGDocumentParser
+from src.rag.chunker import RAGChunker, Chunk
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 워커 프로세스당 한 번만 생성하는 Chunker
+_chunker: Optional[RAGChunker] = None
+
+
+@dataclass
+class PreparedDocument:
+    """파일별 파싱/Chunking 결과"""
+    file_path: Path
+    chunks: List[Chunk] = field(default_factory=list)
+    error: Optional[str] = None
+    parse_seconds: float = 0.0
+    chunk_seconds: float = 0.0
+
+
+def prepare_document(file_path: Path) -> PreparedDocument:
+    """
+    문서 하나를 파싱하고 Chunking (예외는 error로 담아 반환하여 전체 실행이 중단되지 않도록 함)
+    
+    Args:
+        file_path: 문서 파일 경로
+    
+    Returns:
+        PreparedDocument
+    """
+    global _chunker
+    if _chunker is None:
+        _chunker = RAGChunker()
+    
+    started = time.perf_counter()
+    try:
+        doc = RAGDocumentParser.parse_document(file_path)
+        parsed = time.perf_counter()
+        chunks = _chunker.chunk_document(doc)
+    except Exception as e:
+        return PreparedDocument(
+            file_path=file_path,
+            error=f"{type(e).__name__}: {str(e)}",
+            parse_seconds=time.perf_counter() - started
+        )
+    
+    return PreparedDocument(
+        file_path=file_path,
+        chunks=chunks,
+        parse_seconds=parsed - started,
+        chunk_seconds=time.perf_counter() - parsed
+    )
+
+
+def resolve_worker_count(workers: int) -> int:
+    """
+    워커 수 결정 (0 이하이면 CPU 코어 수)
+    
+    Args:
+        workers: 설정된 워커 수
+    
+    Returns:
+        사용할 워커 수
+    """
+    return workers if workers > 0 else (os.cpu_count() or 1)
+
+
+def iter_prepared_documents(files: List[Path], workers: int) -> Iterator[PreparedDocument]:
+    """
+    파일 목록을 파싱/Chunking하여 파일 순서대로 반환
+    
+    워커가 1개이거나 파일이 1개 이하이면 현재 프로세스에서 순차 처리합니다.
+    
+    Args:
+        files: 문서 파일 경로 리스트
+        workers: 워커 프로세스 수
+    
+    Yields:
+        PreparedDocument
+    """
+    workers = min(workers, len(files))
+    if workers <= 1:
+        for file_path in files:
+            yield prepare_document(file_path)
+        return
+    
+    # 워커마다 여러 파일을 묶어 전달해 프로세스 간 통신 횟수를 줄임
+    chunksize = max(1, len(files) // (workers * 4))
+    logger.info(f"병렬 파싱/Chunking: 워커 {workers}개, 파일 {len(files)}개")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        yield from executor.map(prepare_document, files, chunksize=chunksize)
@@ -0,0 +1,299 @@
+"""
+K2 구조화 조회 테이블 모듈
+
+K2 문서(필수 필드·질문 기준)를 시작 시 한 번 파싱하여 (main_case_type, sub_case_type)별로
+필수 필드, 질문 순서, 질문 템플릿을 메모리에 올려 둡니다. 매 턴 고정 문자열("필수 필드")을
+Embedding하고 벡터 DB를 조회한 뒤 Chunk를 다시 파싱하던 경로를 딕셔너리 조회로 대체하며,
+테이블에 없는 사건 유형만 벡터 검색으로 폴백합니다 (src.utils.rag_helpers 참고).
+
+테이블은 구축 시점의 인덱스 별칭 세대와 원본 파일(경로/mtime/크기)에 묶여 있어, 다른 워커가
+재인덱싱하거나 롤백하여 세대가 바뀌거나 원본 파일이 바뀌면 다음 조회 때 다시 구축합니다.
+"""
+import re
+import time
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from src.rag.parser import RAGDocumentParser
+from src.rag.index_alias import index_alias_registry
+from src.utils.constants import CASE_TYPE_MAPPING
+from src.utils.logger import get_logger
+from config.settings import settings
+
+logger = get_logger(__name__)
+
+# 기본 RAG 문서 디렉토리 (프로젝트 루트 기준 data/rag)
+DEFAULT_RAG_DIR = Path(__file__).parent.parent.parent / "data" / "rag"
+
+# YAML 전체를 파싱하기 전에 K2 문서만 골라내기 위한 패턴
+_K2_MARKER = re.compile(r"^knowledge_type:\s*['\"]?K2['\"]?\s*$", re.MULTILINE)
+
+_DOCUMENT_SUFFIXES = (".yaml", ".yml", ".json")
+
+# 원본 파일 서명: (경로, mtime_ns, 크기) 튜플
+FileSignature = Tuple[Tuple[str, int, int], ...]
+
+
+@dataclass
+class K2Entry:
+    """사건 유형별 K2 조회 결과"""
+    main_case_type: str
+    sub_case_type: Optional[str]
+    doc_ids: List[str]
+    required_fields: List[str]
+    question_order: List[str]
+    question_templates: Dict[str, str] = field(default_factory=dict)
+
+
+def _normalize_case_type(case_type: Optional[str]) -> Optional[str]:
+    """사건 유형 정규화 (한글 → 영문, 빈 값 → None)"""
+    if not case_type:
+        return None
+    return CASE_TYPE_MAPPING.get(case_type, case_type)
+
+
+def _merge_entries(main_case_type: str, sub_case_type: Optional[str], docs: List[dict]) -> K2Entry:
+    """
+    같은 사건 유형의 K2 문서(시나리오별)를 하나의 조회 결과로 병합
+    
+    - 필수 필드: 모든 시나리오에 공통인 필드 (공통 필드가 없으면 첫 문서의 필드)
+    - 질문 순서: 필드별 가장 앞선 order 기준
+    - 질문 템플릿: doc_id 순으로 처음 등장한 질문
+    """
+    docs = sorted(docs, key=lambda doc: doc["doc_id"])
+    common = set(docs[0]["required_fields"])
+    for doc in docs[1:]:
+        common &= set(doc["required_fields"])
+    required_fields = [name for name in docs[0]["required_fields"] if name in common] or list(docs[0]["required_fields"])
+    
+    orders: Dict[str, Tuple[int, int]] = {}
+    templates: Dict[str, str] = {}
+    sequence = 0
+    for doc in docs:
+        for position, question in enumerate(doc["questions"]):
+            field_name = question.get("field")
+            if not field_name:
+                continue
+            # order가 같으면 먼저 등장한 질문 우선
+            sequence += 1
+            rank = (question.get("order", position + 1), sequence)
+            if field_name not in orders or rank < orders[field_name]:
+                orders[field_name] = rank
+            if question.get("question") and field_name not in templates:
+                templates[field_name] = question["question"]
+    
+    return K2Entry(
+        main_case_type=main_case_type,
+        sub_case_type=sub_case_type,
+        doc_ids=[doc["doc_id"] for doc in docs],
+        required_fields=required_fields,
+        question_order=sorted(orders, key=orders.get),
+        question_templates=templates
+    )
+
+
+class K2LookupTable:
+    """K2 구조화 조회 테이블 클래스"""
+    
+    def __init__(self, directory: Path = DEFAULT_RAG_DIR, alias: str = "rag_documents"):
+        """
+        조회 테이블 초기화 (build 또는 첫 조회 시 로드)
+        
+        Args:
+            directory: RAG 문서 디렉토리
+            alias: 변경 감지에 사용할 인덱스 별칭
+        """
+        self.directory = directory
+        self.alias = alias
+        self._entries: Dict[Tuple[str, Optional[str]], K2Entry] = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._loaded = False
+        self._builds = 0
+        self._generation: Optional[str] = None  # 구축 시점의 별칭 세대
+        self._files: FileSignature = ()  # 구축 시점의 원본 파일 서명
+        self._files_checked_at = 0.0
+    
+    @staticmethod
+    def _list_documents(directory: Path) -> List[Path]:
+        """디렉토리의 RAG 문서 파일 목록"""
+        return [
+            file_path for file_path in sorted(directory.rglob("*"))
+            if file_path.suffix in _DOCUMENT_SUFFIXES and file_path.is_file()
+        ]
+    
+    @staticmethod
+    def _file_signature(file_paths: List[Path]) -> FileSignature:
+        """원본 파일 서명 (파일 추가/삭제/수정 감지용)"""
+        signature = []
+        for file_path in file_paths:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            signature.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+    
+    @staticmethod
+    def _load_document(file_path: Path) -> Optional[dict]:
+        """K2 문서 파일을 조회용 딕셔너리로 변환 (K2 문서가 아니면 None)"""
+        if file_path.suffix in (".yaml", ".yml"):
+            if not _K2_MARKER.search(file_path.read_text(encoding="utf-8")):
+                return None
+            data = RAGDocumentParser.load_yaml(file_path)
+        else:
+            data = RAGDocumentParser.load_json(file_path)
+        if not isinstance(data, dict) or data.get("knowledge_type") != "K2":
+            return None
+        
+        doc = RAGDocumentParser.parse_k2_document(data)
+        raw_fields = data.get("required_fields") or []
+        if raw_fields and isinstance(raw_fields[0], dict):
+            # 딕셔너리 리스트인 경우 required=True인 필드만 필수로 취급
+            required_fields = [item.get("field") for item in raw_fields if item.get("field") and item.get("required", True)]
+        else:
+            required_fields = list(doc.required_fields)
+        
+        return {
+            "doc_id": doc.metadata.doc_id,
+            "main_case_type": _normalize_case_type(doc.metadata.main_case_type or doc.level1),
+            "sub_case_type": doc.metadata.sub_case_type or doc.level2,
+            "required_fields": required_fields,
+            "questions": doc.questions
+        }
+    
+    def build(self, directory: Optional[Path] = None) -> int:
+        """
+        K2 문서를 파싱하여 조회 테이블 구축 (재인덱싱 후 다시 호출하면 교체)
+        
+        Args:
+            directory: RAG 문서 디렉토리 (기본값: 초기화 시 지정한 디렉토리)
+        
+        Returns:
+            로드된 K2 문서 수
+        """
+        directory = directory or self.directory
+        # 파싱 전에 서명을 기록하여, 구축 중에 바뀐 파일은 다음 확인 때 다시 반영
+        generation = index_alias_registry.resolve(self.alias)
+        file_paths = self._list_documents(directory)
+        files = self._file_signature(file_paths)
+        
+        groups: Dict[Tuple[str, Optional[str]], List[dict]] = {}
+        loaded = 0
+        for file_path in file_paths:
+            try:
+                doc = self._load_document(file_path)
+            except Exception as e:
+                logger.warning(f"K2 조회 테이블 문서 로드 실패: {file_path} - {str(e)}")
+                continue
+            if not doc or not doc["main_case_type"]:
+                continue
+            loaded += 1
+            # 주 사건 유형 전체를 병합하면 공통 필수 필드가 거의 남지 않으므로 세부 유형 단위로만 병합
+            groups.setdefault((doc["main_case_type"], doc["sub_case_type"]), []).append(doc)
+        
+        entries = {
+            key: _merge_entries(key[0], key[1], docs)
+            for key, docs in groups.items()
+        }
+        with self._lock:
+            self._entries = entries
+            self.directory = directory
+            self._generation = generation
+            self._files = files
+            self._files_checked_at = time.monotonic()
+            self._loaded = True
+            self._builds += 1
+        
+        logger.info(
+            f"K2 조회 테이블 구축 완료: 문서 {loaded}개, 사건 유형 {len(entries)}개 (세대: {generation})"
+        )
+        return loaded
+    
+    def _is_stale(self) -> bool:
+        """
+        구축 이후 인덱스 별칭 세대나 원본 파일이 바뀌었는지 확인
+        
+        별칭 해석은 stat 한 번(index_alias_registry 캐시)이므로 매 조회 확인하고,
+        디렉토리 순회가 필요한 파일 확인은 RAG_K2_TABLE_REFRESH_SECONDS 간격으로만 수행합니다.
+        """
+        generation = index_alias_registry.resolve(self.alias)
+        if generation != self._generation:
+            logger.info(f"K2 조회 테이블 재구축: 인덱스 세대 변경 ({self._generation} → {generation})")
+            return True
+        
+        now = time.monotonic()
+        if now - self._files_checked_at < settings.rag_k2_table_refresh_seconds:
+            return False
+        self._files_checked_at = now
+        if self._file_signature(self._list_documents(self.directory)) != self._files:
+            logger.info("K2 조회 테이블 재구축: 원본 K2 문서 변경")
+            return True
+        return False
+    
+    def _ensure_loaded(self):
+        """첫 조회 시 또는 세대/원본 파일이 바뀐 경우 테이블 (재)구축"""
+        if self._loaded and not self._is_stale():
+            return
+        builds = self._builds
+        with self._build_lock:
+            # 기다리는 동안 다른 스레드가 다시 구축했으면 생략
+            if self._builds == builds:
+                self.build()
+    
+    def get(self, main_case_type: Optional[str], sub_case_type: Optional[str] = None) -> Optional[K2Entry]:
+        """
+        사건 유형별 K2 조회 (세부 유형이 테이블에 없으면 세부 유형 없는 K2 문서 기준)
+        
+        Args:
+            main_case_type: 주 사건 유형 (CIVIL 또는 민사)
+            sub_case_type: 세부 사건 유형 (CIVIL_CONTRACT 등)
+        
+        Returns:
+            K2Entry 또는 None (테이블에 없는 사건 유형)
+        """
+        main_case_type = _normalize_case_type(main_case_type)
+        if not main_case_type:
+            return None
+        self._ensure_loaded()
+        entries = self._entries
+        if sub_case_type and (main_case_type, sub_case_type) in entries:
+            return entries[(main_case_type, sub_case_type)]
+        return entries.get((main_case_type, None))
+    
+    def get_required_fields(self, main_case_type: Optional[str], sub_case_type: Optional[str] = None) -> List[str]:
+        """
+        필수 필드 목록 조회
+        
+        Returns:
+            필수 필드 리스트 (테이블에 없으면 빈 리스트)
+        """
+        entry = self.get(main_case_type, sub_case_type)
+        return list(entry.required_fields) if entry else []
+    
+    def get_question_template(
+        self,
+        field_name: str,
+        main_case_type: Optional[str],
+        sub_case_type: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        필드별 질문 템플릿 조회
+        
+        Returns:
+            질문 템플릿 또는 None
+        """
+        entry = self.get(main_case_type, sub_case_type)
+        return entry.question_templates.get(field_name) if entry else None
+    
+    def get_stats(self) -> Dict[str, int]:
+        """조회 테이블 통계"""
+        return {
+            "case_types": len(self._entries),
+            "documents": len({doc_id for entry in self._entries.values() for doc_id in entry.doc_ids})
+        }
+
+
+# 전역 K2 조회 테이블 인스턴스
+k2_lookup_table = K2LookupTable()
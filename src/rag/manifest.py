@@ -0,0 +1,107 @@
+"""
+RAG 증분 인덱싱 매니페스트 모듈
+
+컬렉션별로 "파일 경로 → 내용 해시 → Chunk ID 목록"을 JSON 파일로 저장합니다.
+증분 인덱싱 시 해시가 바뀐 파일만 다시 파싱/Embedding하고, 삭제된 파일의 Chunk를 제거하는 데 사용합니다.
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 메타데이터 저장 형식이 바뀌면 올려서 기존 매니페스트를 무효화 (다음 증분 인덱싱이 전체 재인덱싱)
+# 2: node_scope를 Node별 불리언 메타데이터 키로 저장
+MANIFEST_VERSION = 2
+
+
+def compute_file_hash(file_path: Path) -> str:
+    """
+    파일 내용 해시 계산
+    
+    Args:
+        file_path: 파일 경로
+    
+    Returns:
+        SHA-256 16진수 문자열
+    """
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+class IndexManifest:
+    """증분 인덱싱 매니페스트 클래스"""
+    
+    def __init__(self, path: Path):
+        """
+        매니페스트 초기화 (파일이 있으면 로드)
+        
+        Args:
+            path: 매니페스트 JSON 파일 경로
+        """
+        self.path = path
+        self.files: Dict[str, Dict[str, Any]] = {}
+        self._load()
+    
+    @classmethod
+    def for_collection(cls, collection_name: str) -> "IndexManifest":
+        """
+        컬렉션의 매니페스트 획득 (벡터 DB 디렉토리에 저장)
+        
+        Args:
+            collection_name: 컬렉션 이름
+        
+        Returns:
+            IndexManifest 인스턴스
+        """
+        return cls(Path(settings.vector_db_path) / "manifests" / f"{collection_name}.json")
+    
+    def _load(self):
+        """매니페스트 파일 로드 (없거나 손상된 경우 빈 매니페스트)"""
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == MANIFEST_VERSION:
+                self.files = data.get("files", {})
+            else:
+                logger.warning(f"매니페스트 버전 불일치, 전체 재인덱싱 필요: {self.path}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"매니페스트 로드 실패, 빈 매니페스트 사용: {self.path} - {str(e)}")
+    
+    def save(self):
+        """매니페스트 저장 (임시 파일에 쓴 뒤 교체하여 중간 상태가 남지 않도록 함)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps({"version": MANIFEST_VERSION, "files": self.files}, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        os.replace(temp_path, self.path)
+    
+    def delete(self):
+        """매니페스트 파일 삭제 (컬렉션 초기화 시)"""
+        self.files = {}
+        if self.path.exists():
+            self.path.unlink()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """파일 항목 조회 ({"hash": ..., "chunk_ids": [...]})"""
+        return self.files.get(key)
+    
+    def set(self, key: str, content_hash: str, chunk_ids: List[str]):
+        """파일 항목 저장"""
+        self.files[key] = {"hash": content_hash, "chunk_ids": chunk_ids}
+    
+    def remove(self, key: str) -> List[str]:
+        """
+        파일 항목 제거
+        
+        Returns:
+            제거된 파일의 Chunk ID 목록
+        """
+        entry = self.files.pop(key, None)
+        return entry["chunk_ids"] if entry else []
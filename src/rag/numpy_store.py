@@ -0,0 +1,496 @@
+"""
+NumPy 전수 검색(brute-force) 벡터 저장소 모듈
+
+수백~수천 개 Chunk 규모에서는 HNSW 인덱스나 SQLite 메타데이터 조회 없이 정규화된 float32 행렬과
+쿼리 벡터의 행렬곱 한 번으로 충분히 빠르게 top-k를 구할 수 있습니다.
+VECTOR_DB_TYPE=numpy일 때 VectorDBManager가 ChromaDB 클라이언트 대신 사용하며,
+RAG 코드에서 쓰는 ChromaDB 컬렉션 API(upsert/delete/query/get/count)와 같은 형식으로 동작합니다.
+
+- 벡터: 행 단위로 정규화된 연속 float32 행렬 (distance = 1 - 코사인 유사도)
+- 필터: knowledge_type/main_case_type/sub_case_type/node_scope_*는 정수 코드 배열로 저장해 벡터화된 비교로 마스크 생성
+- 저장: 컬렉션별 디렉토리에 embeddings.npy(메모리 맵으로 로드) + records.json
+"""
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import numpy as np
+from src.rag.schema import NODE_SCOPE_KEY_PREFIX
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 정수 코드 배열로 저장하여 벡터화된 필터링을 지원하는 메타데이터 필드
+# (Node별 불리언 키 node_scope_* 도 같은 방식으로 코드화)
+CATEGORICAL_FIELDS = ("knowledge_type", "main_case_type", "sub_case_type")
+
+EMBEDDINGS_FILE = "embeddings.npy"
+RECORDS_FILE = "records.json"
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """행 단위 L2 정규화 (영벡터는 그대로 유지)"""
+    matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+    if matrix.size == 0:
+        return matrix
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+@dataclass
+class _Snapshot:
+    """컬렉션의 불변 스냅샷 (쓰기 시 새 스냅샷으로 교체하므로 조회는 잠금 없이 수행)"""
+    ids: List[str] = field(default_factory=list)
+    documents: List[str] = field(default_factory=list)
+    metadatas: List[Dict[str, Any]] = field(default_factory=list)
+    matrix: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=np.float32))
+    index: Dict[str, int] = field(default_factory=dict)
+    codes: Dict[str, np.ndarray] = field(default_factory=dict)
+    vocab: Dict[str, Dict[Any, int]] = field(default_factory=dict)
+    
+    @classmethod
+    def build(
+        cls,
+        ids: List[str],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]],
+        matrix: np.ndarray
+    ) -> "_Snapshot":
+        """레코드와 행렬로 스냅샷 생성 (ID 인덱스와 범주형 코드 배열 계산)"""
+        codes: Dict[str, np.ndarray] = {}
+        vocab: Dict[str, Dict[Any, int]] = {}
+        scope_fields = sorted({
+            key for metadata in metadatas for key in metadata if key.startswith(NODE_SCOPE_KEY_PREFIX)
+        })
+        for field_name in CATEGORICAL_FIELDS + tuple(scope_fields):
+            # 코드 0은 값 없음
+            field_vocab: Dict[Any, int] = {}
+            column = np.zeros(len(ids), dtype=np.int32)
+            for row, metadata in enumerate(metadatas):
+                value = metadata.get(field_name)
+                if value is None:
+                    continue
+                column[row] = field_vocab.setdefault(value, len(field_vocab) + 1)
+            codes[field_name] = column
+            vocab[field_name] = field_vocab
+        
+        return cls(
+            ids=ids,
+            documents=documents,
+            metadatas=metadatas,
+            matrix=matrix,
+            index={doc_id: row for row, doc_id in enumerate(ids)},
+            codes=codes,
+            vocab=vocab
+        )
+
+
+class NumpyCollection:
+    """NumPy 벡터 컬렉션 클래스 (ChromaDB Collection 호환 API)"""
+    
+    def __init__(self, name: str, path: Path, metadata: Optional[Dict[str, Any]] = None):
+        """
+        컬렉션 초기화 (저장된 파일이 있으면 로드)
+        
+        Args:
+            name: 컬렉션 이름
+            path: 컬렉션 디렉토리
+            metadata: 컬렉션 메타데이터
+        """
+        self.name = name
+        self.path = path
+        self.metadata = metadata or {}
+        self._lock = threading.RLock()
+        self._snapshot = _Snapshot()
+        self._records_signature = None
+        self._load()
+    
+    # ------------------------------------------------------------------
+    # 저장/로드
+    # ------------------------------------------------------------------
+    
+    def _signature(self):
+        """records.json 변경 감지용 (inode, mtime, size)"""
+        try:
+            stat = (self.path / RECORDS_FILE).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    
+    def _load(self):
+        """디스크에서 로드 (embeddings.npy는 메모리 맵, 행 수가 레코드 수와 다르면 이전 상태 유지)"""
+        signature = self._signature()
+        if signature is None:
+            return
+        try:
+            records = json.loads((self.path / RECORDS_FILE).read_text(encoding="utf-8"))
+            ids = records["ids"]
+            matrix = np.load(self.path / EMBEDDINGS_FILE, mmap_mode="r") if ids else np.zeros((0, 0), dtype=np.float32)
+            if matrix.shape[0] != len(ids):
+                logger.warning(f"NumPy 컬렉션 파일 불일치, 이전 상태 유지: {self.name}")
+                return
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"NumPy 컬렉션 로드 실패: {self.name} - {str(e)}")
+            return
+        
+        self.metadata = records.get("metadata") or self.metadata
+        self._snapshot = _Snapshot.build(ids, records["documents"], records["metadatas"], matrix)
+        self._records_signature = signature
+    
+    def _maybe_reload(self):
+        """다른 프로세스가 파일을 갱신했으면 다시 로드"""
+        if self._signature() != self._records_signature:
+            with self._lock:
+                if self._signature() != self._records_signature:
+                    self._load()
+    
+    def _save(self, snapshot: _Snapshot):
+        """디스크 저장 (임시 파일에 쓴 뒤 교체, records.json을 마지막에 교체하여 커밋 지점으로 사용)"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        temp_embeddings = self.path / f"{EMBEDDINGS_FILE}.tmp"
+        with open(temp_embeddings, "wb") as f:
+            np.save(f, snapshot.matrix)
+        os.replace(temp_embeddings, self.path / EMBEDDINGS_FILE)
+        
+        temp_records = self.path / f"{RECORDS_FILE}.tmp"
+        temp_records.write_text(
+            json.dumps({
+                "metadata": self.metadata,
+                "ids": snapshot.ids,
+                "documents": snapshot.documents,
+                "metadatas": snapshot.metadatas
+            }, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        os.replace(temp_records, self.path / RECORDS_FILE)
+        self._records_signature = self._signature()
+    
+    def _commit(self, ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]], matrix: np.ndarray):
+        """새 스냅샷 저장 후 교체 (lock 보유 상태에서 호출)"""
+        snapshot = _Snapshot.build(ids, documents, metadatas, np.ascontiguousarray(matrix, dtype=np.float32))
+        self._save(snapshot)
+        self._snapshot = snapshot
+    
+    # ------------------------------------------------------------------
+    # 필터
+    # ------------------------------------------------------------------
+    
+    def _match(self, snapshot: _Snapshot, where: Optional[Dict[str, Any]]) -> np.ndarray:
+        """
+        where 조건을 행 마스크로 변환 ($and/$or, $eq/$ne/$in/$nin 지원)
+        
+        범주형 필드는 정수 코드 배열 비교로, 그 외 필드는 메타데이터를 순회하여 계산합니다.
+        """
+        count = len(snapshot.ids)
+        if not where:
+            return np.ones(count, dtype=bool)
+        
+        mask = np.ones(count, dtype=bool)
+        for key, condition in where.items():
+            if key == "$and":
+                for sub_condition in condition:
+                    mask &= self._match(snapshot, sub_condition)
+            elif key == "$or":
+                any_mask = np.zeros(count, dtype=bool)
+                for sub_condition in condition:
+                    any_mask |= self._match(snapshot, sub_condition)
+                mask &= any_mask
+            else:
+                mask &= self._match_field(snapshot, key, condition)
+        return mask
+    
+    @staticmethod
+    def _match_field(snapshot: _Snapshot, key: str, condition: Any) -> np.ndarray:
+        """단일 필드 조건을 행 마스크로 변환"""
+        operator, operand = next(iter(condition.items())) if isinstance(condition, dict) else ("$eq", condition)
+        if operator not in ("$eq", "$ne", "$in", "$nin"):
+            raise ValueError(f"지원하지 않는 where 연산자: {operator}")
+        values = operand if operator in ("$in", "$nin") else [operand]
+        
+        if key in snapshot.codes:
+            field_vocab = snapshot.vocab[key]
+            wanted = [field_vocab[value] for value in values if value in field_vocab]
+            mask = np.isin(snapshot.codes[key], wanted) if wanted else np.zeros(len(snapshot.ids), dtype=bool)
+        else:
+            mask = np.fromiter(
+                (metadata.get(key) in values for metadata in snapshot.metadatas),
+                dtype=bool,
+                count=len(snapshot.ids)
+            )
+        return ~mask if operator in ("$ne", "$nin") else mask
+    
+    # ------------------------------------------------------------------
+    # ChromaDB 호환 API
+    # ------------------------------------------------------------------
+    
+    def count(self) -> int:
+        """Chunk 개수"""
+        self._maybe_reload()
+        return len(self._snapshot.ids)
+    
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: List[List[float]],
+        documents: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Chunk 추가 또는 갱신 (같은 ID는 교체)
+        
+        Args:
+            ids: Chunk ID 리스트
+            embeddings: Embedding 벡터 리스트
+            documents: 문서 내용 리스트
+            metadatas: 메타데이터 리스트
+        """
+        if not ids:
+            return
+        documents = documents or [""] * len(ids)
+        metadatas = metadatas or [{} for _ in ids]
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        
+        with self._lock:
+            self._maybe_reload()
+            current = self._snapshot
+            if current.ids and current.matrix.shape[1] != vectors.shape[1]:
+                raise ValueError(
+                    f"Embedding 차원 불일치: 컬렉션 {current.matrix.shape[1]}, 입력 {vectors.shape[1]}"
+                )
+            
+            new_ids = list(current.ids)
+            new_documents = list(current.documents)
+            new_metadatas = list(current.metadatas)
+            index = dict(current.index)
+            update_rows, update_positions, append_positions = [], [], []
+            for position, doc_id in enumerate(ids):
+                row = index.get(doc_id)
+                if row is None:
+                    index[doc_id] = len(new_ids)
+                    new_ids.append(doc_id)
+                    new_documents.append(documents[position])
+                    new_metadatas.append(metadatas[position])
+                    append_positions.append(position)
+                else:
+                    new_documents[row] = documents[position]
+                    new_metadatas[row] = metadatas[position]
+                    update_rows.append(row)
+                    update_positions.append(position)
+            
+            matrix = np.array(current.matrix, dtype=np.float32) if current.ids else np.zeros((0, vectors.shape[1]), dtype=np.float32)
+            if update_rows:
+                matrix[update_rows] = vectors[update_positions]
+            if append_positions:
+                matrix = np.vstack([matrix, vectors[append_positions]])
+            self._commit(new_ids, new_documents, new_metadatas, matrix)
+    
+    def add(self, ids: List[str], embeddings: List[List[float]], documents=None, metadatas=None):
+        """Chunk 추가 (upsert와 동일)"""
+        self.upsert(ids=ids, embeddings=embeddings, documents=documents, metadatas=metadatas)
+    
+    def delete(self, ids: Optional[List[str]] = None, where: Optional[Dict[str, Any]] = None):
+        """
+        Chunk 삭제
+        
+        Args:
+            ids: 삭제할 Chunk ID 리스트
+            where: 삭제할 Chunk의 메타데이터 조건
+        """
+        with self._lock:
+            self._maybe_reload()
+            current = self._snapshot
+            keep = np.ones(len(current.ids), dtype=bool)
+            if ids is not None:
+                rows = [current.index[doc_id] for doc_id in ids if doc_id in current.index]
+                remove = np.zeros(len(current.ids), dtype=bool)
+                remove[rows] = True
+                if where is not None:
+                    remove &= self._match(current, where)
+                keep &= ~remove
+            elif where is not None:
+                keep &= ~self._match(current, where)
+            if keep.all():
+                return
+            
+            rows = np.flatnonzero(keep)
+            self._commit(
+                [current.ids[row] for row in rows],
+                [current.documents[row] for row in rows],
+                [current.metadatas[row] for row in rows],
+                np.asarray(current.matrix)[rows]
+            )
+    
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        where: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+        include: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Chunk 조회
+        
+        Args:
+            ids: 조회할 Chunk ID 리스트 (None이면 전체)
+            where: 메타데이터 조건
+            limit: 최대 개수
+            include: 포함할 항목 ("documents", "metadatas", "embeddings")
+        
+        Returns:
+            {"ids", "documents", "metadatas", "embeddings"}
+        """
+        self._maybe_reload()
+        snapshot = self._snapshot
+        include = include if include is not None else ["metadatas", "documents"]
+        if ids is not None:
+            rows = np.array([snapshot.index[doc_id] for doc_id in ids if doc_id in snapshot.index], dtype=np.int64)
+            if where is not None and len(rows):
+                rows = rows[self._match(snapshot, where)[rows]]
+        else:
+            rows = np.flatnonzero(self._match(snapshot, where))
+        if limit is not None:
+            rows = rows[:limit]
+        
+        return {
+            "ids": [snapshot.ids[row] for row in rows],
+            "documents": [snapshot.documents[row] for row in rows] if "documents" in include else None,
+            "metadatas": [snapshot.metadatas[row] for row in rows] if "metadatas" in include else None,
+            "embeddings": np.asarray(snapshot.matrix)[rows] if "embeddings" in include else None
+        }
+    
+    def query(
+        self,
+        query_embeddings: List[List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+        include: Optional[List[str]] = None,
+        ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        유사도 검색 (행렬곱 한 번 + argpartition으로 top-k)
+        
+        Args:
+            query_embeddings: 쿼리 Embedding 벡터 리스트
+            n_results: 쿼리별 결과 개수
+            where: 메타데이터 조건
+            include: ChromaDB 호환용 (항상 documents/metadatas/distances 반환)
+            ids: 검색 대상 Chunk ID 리스트 (None이면 전체)
+        
+        Returns:
+            {"ids", "documents", "metadatas", "distances"} (쿼리별 리스트의 리스트)
+        """
+        self._maybe_reload()
+        snapshot = self._snapshot
+        queries = _normalize_rows(np.atleast_2d(np.asarray(query_embeddings, dtype=np.float32)))
+        result = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        
+        if not snapshot.ids:
+            for key in result:
+                result[key] = [[] for _ in range(len(queries))]
+            return result
+        
+        mask = self._match(snapshot, where)
+        if ids is not None:
+            id_mask = np.zeros(len(snapshot.ids), dtype=bool)
+            id_mask[[snapshot.index[doc_id] for doc_id in ids if doc_id in snapshot.index]] = True
+            mask &= id_mask
+        candidates = None if mask.all() else np.flatnonzero(mask)
+        matrix = snapshot.matrix if candidates is None else np.asarray(snapshot.matrix)[candidates]
+        similarities = queries @ matrix.T
+        top_k = min(n_results, similarities.shape[1])
+        
+        for scores in similarities:
+            if top_k == 0:
+                top = np.array([], dtype=np.int64)
+            elif top_k < len(scores):
+                top = np.argpartition(-scores, top_k - 1)[:top_k]
+                top = top[np.argsort(-scores[top])]
+            else:
+                top = np.argsort(-scores)
+            rows = top if candidates is None else candidates[top]
+            result["ids"].append([snapshot.ids[row] for row in rows])
+            result["documents"].append([snapshot.documents[row] for row in rows])
+            result["metadatas"].append([snapshot.metadatas[row] for row in rows])
+            result["distances"].append((1.0 - scores[top]).tolist())
+        return result
+
+
+class NumpyVectorClient:
+    """NumPy 벡터 저장소 클라이언트 클래스 (ChromaDB 클라이언트 호환 API)"""
+    
+    def __init__(self, path: Path):
+        """
+        클라이언트 초기화
+        
+        Args:
+            path: 컬렉션 디렉토리들의 상위 디렉토리
+        """
+        self.path = path
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._collections: Dict[str, NumpyCollection] = {}
+        self._lock = threading.Lock()
+    
+    def _collection_path(self, name: str) -> Path:
+        """컬렉션 디렉토리 경로 (경로 구분자가 포함된 이름은 거부)"""
+        if not name or "/" in name or "\\" in name or name in (".", ".."):
+            raise ValueError(f"유효하지 않은 컬렉션 이름: {name}")
+        return self.path / name
+    
+    def get_or_create_collection(self, name: str, metadata: Optional[Dict[str, Any]] = None) -> NumpyCollection:
+        """컬렉션 획득 또는 생성"""
+        with self._lock:
+            if name not in self._collections:
+                collection_path = self._collection_path(name)
+                collection = NumpyCollection(name, collection_path, metadata)
+                if not collection_path.exists():
+                    collection._commit([], [], [], np.zeros((0, 0), dtype=np.float32))
+                self._collections[name] = collection
+            return self._collections[name]
+    
+    def get_collection(self, name: str) -> NumpyCollection:
+        """
+        기존 컬렉션 획득
+        
+        Raises:
+            ValueError: 컬렉션이 없는 경우
+        """
+        with self._lock:
+            if name in self._collections and self._collection_path(name).exists():
+                return self._collections[name]
+            if not (self._collection_path(name) / RECORDS_FILE).exists():
+                raise ValueError(f"컬렉션이 존재하지 않습니다: {name}")
+            self._collections[name] = NumpyCollection(name, self._collection_path(name))
+            return self._collections[name]
+    
+    def delete_collection(self, name: str):
+        """
+        컬렉션 삭제
+        
+        Raises:
+            ValueError: 컬렉션이 없는 경우
+        """
+        collection_path = self._collection_path(name)
+        with self._lock:
+            self._collections.pop(name, None)
+            if not collection_path.exists():
+                raise ValueError(f"컬렉션이 존재하지 않습니다: {name}")
+            for file_path in collection_path.iterdir():
+                file_path.unlink()
+            collection_path.rmdir()
+    
+    def list_collections(self) -> List[NumpyCollection]:
+        """컬렉션 목록"""
+        return [
+            self.get_collection(path.name)
+            for path in sorted(self.path.iterdir())
+            if (path / RECORDS_FILE).exists()
+        ]
+    
+    def heartbeat(self) -> int:
+        """연결 상태 확인 (저장 디렉토리 접근 가능 여부)"""
+        if not self.path.is_dir():
+            raise OSError(f"NumPy 벡터 저장소 디렉토리를 찾을 수 없습니다: {self.path}")
+        return 0
@@ -1,26 +1,72 @@
 """
 RAG 문서 인덱싱 파이프라인
+
+파일별로 파싱/Chunking한 결과를 모아 RAG_INDEX_BATCH_SIZE개 단위로 한 번에 Embedding을
+생성(EmbeddingModel.encode 배치)하고 벡터 DB에 일괄 upsert합니다. 배치 단위로 처리하므로
+문서 수와 관계없이 메모리 사용량 상한이 유지되며, 단계별 소요 시간을 집계합니다.
+
+파싱/Chunking 단계는 RAG_INDEX_WORKERS개 프로세스로 병렬 처리(src.rag.ingestion)되며 결과가 파일 순서대로
+Embedding 배치에 스트리밍됩니다.
+
+index_directory_incremental은 매니페스트(src.rag.manifest)와 비교해 변경된 파일만 다시 인덱싱합니다.
+rebuild는 새 세대 컬렉션에 전체 인덱스를 구축·검증한 뒤 별칭(src.rag.index_alias)을 전환하는
+블루/그린 재인덱싱으로, 구축 중에도 검색은 기존 세대를 그대로 조회합니다.
 """
 import json
+import time
+from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Iterator, Optional
 from src.rag.parser import RAGDocumentParser
+from src.rag.schema import node_scope_metadata_key
 from src.rag.chunker import RAGChunker, Chunk
+from src.rag.ingestion import iter_prepared_documents, resolve_worker_count
 from src.rag.vector_db import vector_db_manager
 from src.rag.embeddings import embedding_model
+from src.rag.manifest import IndexManifest, compute_file_hash
+from src.rag.index_alias import index_alias_registry
+from src.rag.sparse_index import sparse_index_store
+from config.settings import settings
+from src.utils.exceptions import ValidationError
+from src.utils.helpers import get_kst_now
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class IndexingStats:
+    """인덱싱 단계별 통계"""
+    files: int = 0
+    failed_files: int = 0
+    chunks: int = 0
+    failed_chunks: int = 0
+    batches: int = 0
+    parse_seconds: float = 0.0
+    chunk_seconds: float = 0.0
+    embed_seconds: float = 0.0
+    write_seconds: float = 0.0
+    sparse_seconds: float = 0.0
+    total_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리로 변환 (소요 시간은 소수점 3자리)"""
+        return {
+            key: round(value, 3) if isinstance(value, float) else value
+            for key, value in asdict(self).items()
+        }
+
+
 class RAGIndexingPipeline:
     """RAG 문서 인덱싱 파이프라인"""
     
     def __init__(self, collection_name: str = "rag_documents"):
-        self.collection_name = collection_name
+        self.alias = collection_name
+        self.collection_name = index_alias_registry.resolve(collection_name)
         self.collection = None
         self.parser = RAGDocumentParser()
         self.chunker = RAGChunker()
+        self.last_stats = IndexingStats()
         self._initialize_collection()
     
     def _initialize_collection(self):
@@ -43,6 +89,10 @@ class RAGIndexingPipeline:
         """
         cleaned = {}
         for key, value in metadata.items():
+            if key == "node_scope" and isinstance(value, list):
+                # node_scope는 Node별 불리언 키로도 저장하여 where 필터로 검색 범위를 좁힐 수 있도록 함
+                for node in value:
+                    cleaned[node_scope_metadata_key(str(node))] = True
             if value is None:
                 # None은 제거 (ChromaDB가 None을 허용하지 않음)
                 continue
@@ -62,6 +112,144 @@ class RAGIndexingPipeline:
                 cleaned[key] = str(value)
         return cleaned
     
+    def _prepare_document(self, file_path: Path, stats: IndexingStats) -> List[Chunk]:
+        """
+        문서 파싱 및 Chunking
+        
+        Args:
+            file_path: 문서 파일 경로
+            stats: 단계별 소요 시간을 누적할 통계
+        
+        Returns:
+            Chunk 리스트
+        """
+        started = time.perf_counter()
+        doc = self.parser.parse_document(file_path)
+        parsed = time.perf_counter()
+        chunks = self.chunker.chunk_document(doc)
+        
+        stats.parse_seconds += parsed - started
+        stats.chunk_seconds += time.perf_counter() - parsed
+        logger.debug(f"문서 파싱/Chunking 완료: {file_path.name} ({len(chunks)}개 Chunk)")
+        return chunks
+    
+    def _iter_prepared(
+        self,
+        files: List[Path],
+        stats: IndexingStats
+    ) -> Iterator[Tuple[Path, List[Chunk], Optional[str]]]:
+        """
+        파일 목록을 파싱/Chunking하여 파일 순서대로 반환
+        
+        워커가 2개 이상이면 프로세스 풀에서 병렬 처리하며, 이때 parse/chunk 소요 시간은
+        워커별 시간의 합계입니다. 파일별 오류는 전체 실행을 중단하지 않고 함께 반환합니다.
+        
+        Args:
+            files: 문서 파일 경로 리스트
+            stats: 통계
+        
+        Yields:
+            (파일 경로, Chunk 리스트, 오류 메시지 또는 None)
+        """
+        workers = resolve_worker_count(settings.rag_index_workers)
+        if workers <= 1 or len(files) <= 1:
+            for file_path in files:
+                try:
+                    yield file_path, self._prepare_document(file_path, stats), None
+                except Exception as e:
+                    yield file_path, [], str(e)
+            return
+        
+        for prepared in iter_prepared_documents(files, workers):
+            stats.parse_seconds += prepared.parse_seconds
+            stats.chunk_seconds += prepared.chunk_seconds
+            yield prepared.file_path, prepared.chunks, prepared.error
+    
+    def _write_batch(self, chunks: List[Chunk], stats: IndexingStats):
+        """
+        Chunk 배치의 Embedding을 한 번에 생성하고 벡터 DB에 일괄 upsert
+        
+        Args:
+            chunks: Chunk 리스트
+            stats: 단계별 소요 시간을 누적할 통계
+        """
+        # 같은 배치에 동일 ID가 있으면 upsert가 실패하므로 마지막 Chunk만 유지
+        unique_chunks: Dict[str, Chunk] = {}
+        for chunk in chunks:
+            if chunk.chunk_id in unique_chunks:
+                logger.warning(f"중복 Chunk ID (마지막 Chunk 사용): {chunk.chunk_id}")
+            unique_chunks[chunk.chunk_id] = chunk
+        chunks = list(unique_chunks.values())
+        if not chunks:
+            return
+        
+        started = time.perf_counter()
+        embeddings = embedding_model.encode(
+            [chunk.content for chunk in chunks],
+            batch_size=settings.rag_embedding_batch_size
+        )
+        encoded = time.perf_counter()
+        
+        # ChromaDB metadata는 리스트를 허용하지 않으므로 변환
+        self.collection.upsert(
+            ids=[chunk.chunk_id for chunk in chunks],
+            embeddings=embeddings.tolist(),
+            documents=[chunk.content for chunk in chunks],
+            metadatas=[RAGIndexingPipeline._clean_metadata(chunk.metadata) for chunk in chunks]
+        )
+        
+        stats.embed_seconds += encoded - started
+        stats.write_seconds += time.perf_counter() - encoded
+        stats.chunks += len(chunks)
+        stats.batches += 1
+    
+    def _flush(self, pending: List[Chunk], stats: IndexingStats) -> bool:
+        """
+        대기 중인 Chunk를 배치로 기록 (실패 시 해당 배치만 건너뜀)
+        
+        Args:
+            pending: 대기 중인 Chunk 리스트 (기록 후 비워짐)
+            stats: 통계
+        
+        Returns:
+            기록 성공 여부
+        """
+        if not pending:
+            return True
+        try:
+            self._write_batch(pending, stats)
+            return True
+        except Exception as e:
+            stats.failed_chunks += len(pending)
+            logger.error(f"배치 인덱싱 실패: {len(pending)}개 Chunk - {str(e)}")
+            return False
+        finally:
+            pending.clear()
+    
+    def _log_stats(self, stats: IndexingStats):
+        """단계별 소요 시간 로깅"""
+        logger.info(
+            f"인덱싱 통계: 파일 {stats.files}개(실패 {stats.failed_files}), "
+            f"Chunk {stats.chunks}개(실패 {stats.failed_chunks}), 배치 {stats.batches}개 | "
+            f"파싱 {stats.parse_seconds:.2f}초, Chunking {stats.chunk_seconds:.2f}초, "
+            f"Embedding {stats.embed_seconds:.2f}초, 저장 {stats.write_seconds:.2f}초, "
+            f"희소 인덱스 {stats.sparse_seconds:.2f}초, "
+            f"전체 {stats.total_seconds:.2f}초"
+        )
+    
+    def _build_sparse_index(self, stats: IndexingStats):
+        """
+        현재 컬렉션 내용으로 희소(BM25) 인덱스 재구축
+        
+        희소 인덱스는 검색 보조용이므로 실패해도 인덱싱 결과에는 영향을 주지 않고 로그만 남깁니다.
+        """
+        started = time.perf_counter()
+        try:
+            sparse_index_store.build(self.collection_name, self.collection)
+        except Exception as e:
+            logger.warning(f"희소 인덱스 구축 실패 (벡터 검색만 사용): {self.collection_name} - {str(e)}")
+        stats.sparse_seconds += time.perf_counter() - started
+    
     def index_document(self, file_path: Path) -> int:
         """
         단일 문서 인덱싱
@@ -72,59 +260,39 @@ class RAGIndexingPipeline:
         Returns:
             인덱싱된 Chunk 개수
         """
+        stats = IndexingStats(files=1)
+        started = time.perf_counter()
         try:
-            # 문서 파싱
-            doc = self.parser.parse_document(file_path)
-            logger.info(f"문서 파싱 완료: {file_path.name}")
-            
-            # Chunking
-            chunks = self.chunker.chunk_document(doc)
-
-            logger.info(f"Chunking 완료: {len(chunks)}개 Chunk 생성")
-            
-            # Embedding 생성 및 저장
-            chunk_ids = []
-            chunk_contents = []
-            chunk_embeddings = []
-            chunk_metadatas = []
-            
-            for chunk in chunks:
-                # Embedding 생성 (단일 텍스트이므로 첫 번째 결과만 사용)
-                embedding_result = embedding_model.encode(chunk.content)
-                # encode()는 항상 2차원 배열을 반환하므로, 단일 텍스트의 경우 [0]으로 첫 번째 벡터 추출
-                if embedding_result.ndim == 2:
-                    embedding = embedding_result[0].tolist()
-                else:
-                    embedding = embedding_result.tolist()
-                
-                # ChromaDB metadata는 리스트를 허용하지 않으므로 변환
-                cleaned_metadata = RAGIndexingPipeline._clean_metadata(chunk.metadata)
-                
-                chunk_ids.append(chunk.chunk_id)
-                chunk_contents.append(chunk.content)
-                chunk_embeddings.append(embedding)
-                chunk_metadatas.append(cleaned_metadata)
-
-
-            # 벡터 DB에 저장
-            self.collection.add(
-                ids=chunk_ids,
-                embeddings=chunk_embeddings,
-                documents=chunk_contents,
-                metadatas=chunk_metadatas
-            )
+            chunks = self._prepare_document(file_path, stats)
+            batch_size = max(1, settings.rag_index_batch_size)
+            for offset in range(0, len(chunks), batch_size):
+                self._write_batch(chunks[offset:offset + batch_size], stats)
+            self._build_sparse_index(stats)
             
-            logger.info(f"인덱싱 완료: {file_path.name} ({len(chunks)}개 Chunk)")
-            return len(chunks)
+            stats.total_seconds = time.perf_counter() - started
+            self.last_stats = stats
+            logger.info(f"인덱싱 완료: {file_path.name} ({stats.chunks}개 Chunk)")
+            return stats.chunks
         
         except Exception as e:
             logger.error(f"문서 인덱싱 실패: {file_path} - {str(e)}")
             raise
     
+    @staticmethod
+    def _list_files(directory: Path, recursive: bool) -> List[Path]:
+        """인덱싱 대상 파일 검색 (지원 확장자: yaml, yml, json)"""
+        files = []
+        for ext in (".yaml", ".yml", ".json"):
+            files.extend(directory.rglob(f"*{ext}") if recursive else directory.glob(f"*{ext}"))
+        return sorted(files)
+    
     def index_directory(self, directory: Path, recursive: bool = True) -> int:
         """
         디렉토리 내 모든 문서 인덱싱
         
+        파일별로 파싱/Chunking하고, Chunk가 RAG_INDEX_BATCH_SIZE개 모일 때마다
+        Embedding 생성과 upsert를 한 번에 수행합니다. 단계별 통계는 last_stats에 남습니다.
+        
         Args:
             directory: 문서 디렉토리 경로
             recursive: 재귀적 검색 여부
@@ -132,38 +300,305 @@ class RAGIndexingPipeline:
         Returns:
             인덱싱된 총 Chunk 개수
         """
-        total_chunks = 0
+        files = self._list_files(directory, recursive)
+        logger.info(f"인덱싱 대상 파일: {len(files)}개")
         
-        # 지원하는 파일 확장자
-        extensions = [".yaml", ".yml", ".json"]
+        stats = IndexingStats()
+        started = time.perf_counter()
+        batch_size = max(1, settings.rag_index_batch_size)
+        pending: List[Chunk] = []
         
-        # 파일 검색
-        if recursive:
-            files = []
-            for ext in extensions:
-                files.extend(directory.rglob(f"*{ext}"))
-        else:
-            files = []
-            for ext in extensions:
-                files.extend(directory.glob(f"*{ext}"))
+        for file_path, chunks, error in self._iter_prepared(files, stats):
+            if error:
+                stats.failed_files += 1
+                logger.error(f"파일 인덱싱 실패: {file_path} - {error}")
+                continue
+            pending.extend(chunks)
+            stats.files += 1
+            
+            while len(pending) >= batch_size:
+                batch = pending[:batch_size]
+                del pending[:batch_size]
+                self._flush(batch, stats)
         
-        logger.info(f"인덱싱 대상 파일: {len(files)}개")
+        self._flush(pending, stats)
+        self._build_sparse_index(stats)
         
-        for file_path in files:
+        stats.total_seconds = time.perf_counter() - started
+        self.last_stats = stats
+        self._log_stats(stats)
+        logger.info(f"전체 인덱싱 완료: {stats.chunks}개 Chunk")
+        return stats.chunks
+    
+    def index_directory_incremental(self, directory: Path, recursive: bool = True) -> Dict[str, int]:
+        """
+        디렉토리 증분 인덱싱
+        
+        매니페스트(파일 경로 → 내용 해시 → Chunk ID)와 비교해 새 파일/변경된 파일만 다시
+        파싱/Embedding하여 upsert하고, 변경으로 사라진 Chunk와 삭제된 파일의 Chunk를 제거합니다.
+        매니페스트는 저장에 성공한 파일만 갱신하므로 실패한 파일은 다음 실행 때 다시 시도됩니다.
+        
+        Args:
+            directory: 문서 디렉토리 경로
+            recursive: 재귀적 검색 여부
+        
+        Returns:
+            {"added", "updated", "removed", "skipped", "failed", "chunks"} 개수
+        """
+        manifest = IndexManifest.for_collection(self.collection_name)
+        files = self._list_files(directory, recursive)
+        logger.info(f"증분 인덱싱 대상 파일: {len(files)}개 (매니페스트 {len(manifest.files)}개)")
+        
+        result = {"added": 0, "updated": 0, "removed": 0, "skipped": 0, "failed": 0, "chunks": 0}
+        stats = IndexingStats()
+        started = time.perf_counter()
+        batch_size = max(1, settings.rag_index_batch_size)
+        pending: List[Chunk] = []
+        # 대기 중인 Chunk의 파일별 정보: (키, 해시, Chunk ID, 이전 Chunk ID)
+        pending_files: List[Tuple[str, str, List[str], List[str]]] = []
+        
+        def flush_pending():
+            succeeded = self._flush(pending, stats)
+            for key, content_hash, chunk_ids, previous_ids in pending_files:
+                if not succeeded:
+                    result["failed"] += 1
+                    continue
+                stale_ids = sorted(set(previous_ids) - set(chunk_ids))
+                if stale_ids:
+                    self.collection.delete(ids=stale_ids)
+                result["updated" if key in manifest.files else "added"] += 1
+                result["chunks"] += len(chunk_ids)
+                manifest.set(key, content_hash, chunk_ids)
+            pending_files.clear()
+        
+        # 삭제된 파일의 Chunk 제거 (다른 파일로 옮겨진 Chunk ID를 지우지 않도록 기록 전에 수행)
+        current_keys = {file_path.relative_to(directory).as_posix() for file_path in files}
+        for key in sorted(set(manifest.files) - current_keys):
+            chunk_ids = manifest.get(key)["chunk_ids"]
             try:
-                chunks_count = self.index_document(file_path)
-                total_chunks += chunks_count
+                if chunk_ids:
+                    self.collection.delete(ids=chunk_ids)
+                manifest.remove(key)
+                result["removed"] += 1
             except Exception as e:
-                logger.error(f"파일 인덱싱 실패: {file_path} - {str(e)}")
+                result["failed"] += 1
+                logger.error(f"삭제된 파일의 Chunk 제거 실패: {key} - {str(e)}")
+        
+        # 해시가 바뀐 파일만 파싱/Chunking 대상으로 선별
+        changed: Dict[Path, Tuple[str, str, Optional[Dict[str, Any]]]] = {}
+        for file_path in files:
+            key = file_path.relative_to(directory).as_posix()
+            try:
+                content_hash = compute_file_hash(file_path)
+            except OSError as e:
+                result["failed"] += 1
+                logger.error(f"파일 해시 계산 실패: {file_path} - {str(e)}")
                 continue
+            entry = manifest.get(key)
+            if entry and entry["hash"] == content_hash:
+                result["skipped"] += 1
+                continue
+            changed[file_path] = (key, content_hash, entry)
         
-        logger.info(f"전체 인덱싱 완료: {total_chunks}개 Chunk")
-        return total_chunks
+        for file_path, chunks, error in self._iter_prepared(list(changed), stats):
+            if error:
+                result["failed"] += 1
+                stats.failed_files += 1
+                logger.error(f"파일 인덱싱 실패: {file_path} - {error}")
+                continue
+            key, content_hash, entry = changed[file_path]
+            stats.files += 1
+            
+            pending.extend(chunks)
+            pending_files.append((
+                key,
+                content_hash,
+                [chunk.chunk_id for chunk in chunks],
+                entry["chunk_ids"] if entry else []
+            ))
+            # 파일 단위로 기록해야 매니페스트를 파일별로 갱신할 수 있음
+            if len(pending) >= batch_size:
+                flush_pending()
+        
+        flush_pending()
+        
+        manifest.save()
+        self._build_sparse_index(stats)
+        
+        stats.total_seconds = time.perf_counter() - started
+        self.last_stats = stats
+        self._log_stats(stats)
+        logger.info(
+            f"증분 인덱싱 완료: 추가 {result['added']}, 변경 {result['updated']}, 삭제 {result['removed']}, "
+            f"건너뜀 {result['skipped']}, 실패 {result['failed']} ({result['chunks']}개 Chunk 기록)"
+        )
+        return result
+    
+    @staticmethod
+    def _count_by_knowledge_type(collection) -> Dict[str, int]:
+        """
+        컬렉션의 knowledge_type별 Chunk 개수 집계
+        
+        Args:
+            collection: 컬렉션
+        
+        Returns:
+            {knowledge_type: Chunk 개수}
+        """
+        counts: Dict[str, int] = {}
+        metadatas = collection.get(include=["metadatas"])["metadatas"] or []
+        for metadata in metadatas:
+            knowledge_type = (metadata or {}).get("knowledge_type") or "unknown"
+            counts[knowledge_type] = counts.get(knowledge_type, 0) + 1
+        return counts
+    
+    def _validate_generation(self, collection) -> Dict[str, int]:
+        """
+        새 세대 컬렉션 검증 (별칭 전환 전)
+        
+        - 비어 있지 않아야 함
+        - 현재 세대에 있는 knowledge_type별 Chunk 수가 RAG_INDEX_MIN_COUNT_RATIO 이상 유지되어야 함
+        - 검증용 검색 쿼리(RAG_INDEX_SMOKE_QUERIES)마다 결과가 1개 이상 나와야 함
+        
+        Args:
+            collection: 새 세대 컬렉션
+        
+        Returns:
+            새 세대의 knowledge_type별 Chunk 개수
+        
+        Raises:
+            ValidationError: 검증 실패 시
+        """
+        counts = self._count_by_knowledge_type(collection)
+        if not counts:
+            raise ValidationError("새 인덱스에 Chunk가 없습니다", field="chunks")
+        
+        current = vector_db_manager.get_collection(self.collection_name)
+        current_counts = self._count_by_knowledge_type(current) if current is not None else {}
+        for knowledge_type, current_count in current_counts.items():
+            new_count = counts.get(knowledge_type, 0)
+            if new_count < current_count * settings.rag_index_min_count_ratio:
+                raise ValidationError(
+                    f"{knowledge_type} Chunk 수 급감: {current_count} → {new_count}",
+                    field="knowledge_type"
+                )
+        
+        for query in settings.rag_index_smoke_query_list:
+            results = collection.query(
+                query_embeddings=[embedding_model.encode_query(query).tolist()],
+                n_results=1
+            )
+            if not results["ids"] or not results["ids"][0]:
+                raise ValidationError(f"검증 쿼리 결과 없음: '{query}'", field="smoke_query")
+        
+        return counts
+    
+    def _drop_collection(self, collection_name: str):
+        """컬렉션과 매니페스트, 희소 인덱스 삭제 (실패해도 로그만 남김)"""
+        try:
+            vector_db_manager.delete_collection(collection_name)
+        except Exception as e:
+            logger.warning(f"컬렉션 삭제 실패: {collection_name} - {str(e)}")
+        IndexManifest.for_collection(collection_name).delete()
+        sparse_index_store.delete(collection_name)
+    
+    def _prune_generations(self):
+        """롤백용으로 보관할 세대 수(RAG_INDEX_KEEP_GENERATIONS)를 넘는 오래된 세대 삭제"""
+        history = index_alias_registry.history(self.alias)
+        keep = max(0, settings.rag_index_keep_generations)
+        expired = history[:len(history) - keep] if keep else history
+        for collection_name in expired:
+            self._drop_collection(collection_name)
+        if expired:
+            index_alias_registry.forget(self.alias, expired)
+            logger.info(f"오래된 인덱스 세대 삭제: {expired}")
+    
+    def rebuild(self, directory: Path, recursive: bool = True) -> Dict[str, Any]:
+        """
+        블루/그린 전체 재인덱싱
+        
+        새 세대 컬렉션({별칭}_{YYYYmmddHHMMSSffffff})에 전체 문서를 인덱싱하고 검증을 통과하면
+        별칭을 원자적으로 전환합니다. 구축/검증 중에는 검색이 기존 세대를 그대로 조회하며,
+        검증에 실패하면 새 세대를 삭제하고 기존 세대를 유지합니다.
+        
+        Args:
+            directory: 문서 디렉토리 경로
+            recursive: 재귀적 검색 여부
+        
+        Returns:
+            증분 인덱싱 결과 개수 + {"generation", "previous", "knowledge_type_counts"}
+        
+        Raises:
+            ValidationError: 새 세대 검증 실패 시
+        """
+        # 같은 초에 시작해도 기존 세대와 이름이 겹치지 않도록 마이크로초까지 포함
+        generation = f"{self.alias}_{get_kst_now().strftime('%Y%m%d%H%M%S%f')}"
+        logger.info(f"블루/그린 재인덱싱 시작: {self.alias} → {generation}")
+        
+        # 새 세대는 빈 매니페스트로 시작하므로 증분 인덱싱이 곧 전체 인덱싱이 되고,
+        # 이후 증분 인덱싱에 쓸 매니페스트도 함께 만들어짐
+        shadow = RAGIndexingPipeline(collection_name=generation)
+        try:
+            result = shadow.index_directory_incremental(directory, recursive)
+            counts = self._validate_generation(shadow.collection)
+        except Exception as e:
+            logger.error(f"새 인덱스 세대 구축/검증 실패, 기존 세대 유지: {generation} - {str(e)}")
+            self._drop_collection(generation)
+            raise
+        
+        previous = index_alias_registry.swap(self.alias, generation)
+        self.collection_name = generation
+        self.collection = shadow.collection
+        self.last_stats = shadow.last_stats
+        self._prune_generations()
+        
+        logger.info(f"블루/그린 재인덱싱 완료: {generation} (knowledge_type별 Chunk: {counts})")
+        return {**result, "generation": generation, "previous": previous, "knowledge_type_counts": counts}
+    
+    def rollback(self) -> Dict[str, str]:
+        """
+        별칭을 직전 세대로 되돌림 (되돌리기 전 세대는 삭제)
+        
+        Returns:
+            {"from": 되돌리기 전 컬렉션, "to": 되돌린 후 컬렉션}
+        
+        Raises:
+            ValueError: 롤백할 이전 세대가 없는 경우
+        """
+        current, restored = index_alias_registry.rollback(self.alias)
+        self.collection_name = restored
+        self._initialize_collection()
+        self._drop_collection(current)
+        return {"from": current, "to": restored}
+    
+    def list_generations(self) -> Dict[str, Any]:
+        """
+        현재 세대와 롤백 가능한 이전 세대 목록
+        
+        Returns:
+            {"alias", "active", "history"}
+        """
+        return {
+            "alias": self.alias,
+            "active": index_alias_registry.resolve(self.alias),
+            "history": index_alias_registry.history(self.alias)
+        }
     
     def clear_collection(self):
-        """컬렉션 초기화"""
+        """
+        컬렉션 및 증분 인덱싱 매니페스트 초기화
+        
+        별칭이 가리키는 현재 세대와 보관 중인 이전 세대를 모두 삭제합니다.
+        서비스 중단 없이 다시 만들려면 rebuild를 사용합니다.
+        """
         try:
+            for collection_name in index_alias_registry.history(self.alias):
+                self._drop_collection(collection_name)
             vector_db_manager.delete_collection(self.collection_name)
+            IndexManifest.for_collection(self.collection_name).delete()
+            sparse_index_store.delete(self.collection_name)
+            index_alias_registry.remove(self.alias)
+            self.collection_name = self.alias
             self._initialize_collection()
             logger.info(f"컬렉션 초기화 완료: {self.collection_name}")
         except Exception as e:
@@ -6,6 +6,25 @@ from typing import List, Optional, Literal
 from datetime import datetime
 from src.utils.helpers import get_kst_now
 
+# node_scope 리스트를 필터링 가능한 Node별 불리언 메타데이터 키로 펼칠 때 사용하는 접두사
+NODE_SCOPE_KEY_PREFIX = "node_scope_"
+
+
+def node_scope_metadata_key(node: str) -> str:
+    """
+    Node별 불리언 메타데이터 키 (예: VALIDATION → node_scope_VALIDATION)
+    
+    벡터 DB 메타데이터는 리스트를 저장할 수 없으므로 인덱싱 시 node_scope의 각 Node를
+    이 키에 True로 기록하고, 검색 시 {키: True} 조건으로 필터링합니다.
+    
+    Args:
+        node: Node 이름
+    
+    Returns:
+        메타데이터 키
+    """
+    return f"{NODE_SCOPE_KEY_PREFIX}{node}"
+
 
 class RAGDocumentMetadata(BaseModel):
     """RAG 문서 메타데이터 스키마"""
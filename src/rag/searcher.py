@@ -1,21 +1,53 @@
 """
 RAG 검색 모듈
 """
-from typing import List, Dict, Any, Optional
-import numpy as np
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
+from config.settings import settings
 from src.rag.vector_db import vector_db_manager
 from src.rag.embeddings import embedding_model
+from src.rag.index_alias import index_alias_registry
+from src.rag.schema import node_scope_metadata_key
+from src.rag.sparse_index import sparse_index_store
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 검색 모드
+# - vector: 벡터 검색만 사용
+# - hybrid: 벡터 검색과 BM25 검색 결과를 가중 RRF(Reciprocal Rank Fusion)로 결합
+# - prefilter: BM25 상위 후보 안에서만 벡터 검색 (후보가 없으면 벡터 검색)
+SEARCH_MODES = ("vector", "hybrid", "prefilter")
+
+# RRF 순위 평활 상수
+RRF_K = 60
+
+
+@dataclass
+class SearchSpec:
+    """RAGSearcher.search_many의 검색 조건"""
+    query: str
+    top_k: int = 5
+    knowledge_type: Optional[str] = None
+    main_case_type: Optional[str] = None
+    sub_case_type: Optional[str] = None
+    node_scope: Optional[str] = None
+    min_score: float = 0.0  # 최소 벡터 유사도 (hybrid 모드에서도 RRF 점수가 아닌 벡터 유사도에 적용)
+    mode: Optional[str] = None  # None이면 settings.rag_search_mode (hybrid 모드의 score는 RRF 점수)
+
 
 class RAGSearcher:
     """RAG 검색 클래스"""
     
     def __init__(self, collection_name: str = "rag_documents"):
-        self.collection_name = collection_name
+        self.alias = collection_name
+        self.collection_name = index_alias_registry.resolve(collection_name)
         self.collection = None
+        # 별칭 전환 시 컬렉션 이름과 컬렉션을 함께 교체 (그래프 워커 스레드가 인스턴스를 공유)
+        self._collection_lock = threading.Lock()
         self._initialize_collection()
     
     def _initialize_collection(self):
@@ -24,6 +56,94 @@ class RAGSearcher:
             name=self.collection_name
         )
     
+    def _resolve_collection(self) -> Tuple[str, Any]:
+        """
+        쿼리마다 별칭을 해석해 현재 서비스 중인 세대 컬렉션 반환
+        
+        블루/그린 재인덱싱으로 별칭이 전환되면 다음 쿼리부터 새 세대를 조회합니다.
+        이름과 컬렉션은 잠금 안에서 함께 교체하며, 호출자는 반환값만 사용하여
+        한 쿼리 안에서 서로 다른 세대의 이름과 컬렉션이 섞이지 않도록 합니다.
+        
+        Returns:
+            (컬렉션 이름, 컬렉션)
+        """
+        collection_name = index_alias_registry.resolve(self.alias)
+        with self._collection_lock:
+            if collection_name != self.collection_name:
+                logger.info(f"RAG 검색 컬렉션 전환: {self.collection_name} → {collection_name}")
+                self.collection = vector_db_manager.get_or_create_collection(name=collection_name)
+                self.collection_name = collection_name
+            return self.collection_name, self.collection
+    
+    @staticmethod
+    def _build_where(spec: "SearchSpec") -> Optional[Dict[str, Any]]:
+        """
+        검색 조건의 메타데이터 필터 구성 (ChromaDB는 조건이 2개 이상이면 $and 연산자 필요)
+        
+        Args:
+            spec: 검색 조건
+        
+        Returns:
+            where 필터 또는 None
+        """
+        where_conditions = []
+        if spec.knowledge_type:
+            where_conditions.append({"knowledge_type": spec.knowledge_type})
+        if spec.main_case_type:
+            where_conditions.append({"main_case_type": spec.main_case_type})
+        if spec.sub_case_type:
+            where_conditions.append({"sub_case_type": spec.sub_case_type})
+        if spec.node_scope:
+            # node_scope 리스트는 인덱싱 시 Node별 불리언 키로 저장됨 (RAGIndexingPipeline._clean_metadata)
+            where_conditions.append({node_scope_metadata_key(spec.node_scope): True})
+        
+        if len(where_conditions) == 0:
+            return None
+        if len(where_conditions) == 1:
+            return where_conditions[0]
+        return {"$and": where_conditions}
+    
+    @staticmethod
+    def _format_results(results: Dict[str, Any], index: int, top_k: int, min_score: float) -> List[Dict[str, Any]]:
+        """
+        벡터 DB 쿼리 결과 중 index번째 쿼리의 결과를 검색 결과 리스트로 변환
+        
+        Args:
+            results: 벡터 DB 쿼리 결과 (쿼리별 리스트의 리스트)
+            index: 쿼리 위치
+            top_k: 반환할 결과 개수 (그룹 내 최대 top_k로 조회했으므로 다시 자름)
+            min_score: 최소 유사도 점수
+        
+        Returns:
+            점수 내림차순 검색 결과 리스트
+        """
+        formatted_results = []
+        if not results["ids"] or index >= len(results["ids"]):
+            return formatted_results
+        
+        ids = results["ids"][index][:top_k]
+        for i, doc_id in enumerate(ids):
+            distance = results["distances"][index][i] if results["distances"] else None
+            metadata = results["metadatas"][index][i] if results["metadatas"] else {}
+            document = results["documents"][index][i] if results["documents"] else ""
+            
+            # 유사도 점수 계산 (distance를 score로 변환)
+            score = 1.0 - distance if distance is not None else 0.0
+            
+            # 최소 점수 필터링
+            if score >= min_score:
+                formatted_results.append({
+                    "doc_id": doc_id,
+                    "content": document,
+                    "metadata": metadata,
+                    "score": score,
+                    "distance": distance
+                })
+        
+        # 점수 순으로 정렬
+        formatted_results.sort(key=lambda x: x["score"], reverse=True)
+        return formatted_results
+    
     def search(
         self,
         query: str,
@@ -32,7 +152,8 @@ class RAGSearcher:
         main_case_type: Optional[str] = None,
         sub_case_type: Optional[str] = None,
         node_scope: Optional[str] = None,
-        min_score: float = 0.0
+        min_score: float = 0.0,
+        mode: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         RAG 검색 수행
@@ -44,73 +165,206 @@ class RAGSearcher:
             main_case_type: 주 사건 유형 필터
             sub_case_type: 세부 사건 유형 필터
             node_scope: Node 범위 필터
-            min_score: 최소 유사도 점수
+            min_score: 최소 유사도 점수 (hybrid 모드에서도 벡터 유사도 기준)
+            mode: 검색 모드 (vector, hybrid, prefilter / None이면 설정값)
         
         Returns:
             검색 결과 리스트
         """
+        return self.search_many([
+            SearchSpec(
+                query=query,
+                top_k=top_k,
+                knowledge_type=knowledge_type,
+                main_case_type=main_case_type,
+                sub_case_type=sub_case_type,
+                node_scope=node_scope,
+                min_score=min_score,
+                mode=mode
+            )
+        ])[0]
+    
+    @staticmethod
+    def _resolve_mode(spec: "SearchSpec") -> str:
+        """검색 모드 결정 (지정하지 않으면 settings.rag_search_mode)"""
+        mode = spec.mode or settings.rag_search_mode
+        if mode not in SEARCH_MODES:
+            raise ValueError(f"지원하지 않는 검색 모드: {mode}")
+        return mode
+    
+    def _fuse(
+        self,
+        collection,
+        dense_results: List[Dict[str, Any]],
+        sparse_hits: List[Tuple[str, float]],
+        top_k: int,
+        min_score: float
+    ) -> List[Dict[str, Any]]:
+        """
+        벡터 검색 결과와 BM25 결과를 가중 RRF로 결합
+        
+        RRF 점수는 최대 약 2/(RRF_K+1)로 유사도와 척도가 다르므로 min_score는 결합 전에
+        벡터 유사도에 적용합니다. 벡터 유사도가 min_score 미만인 Chunk는 BM25 순위와 관계없이 제외하고,
+        벡터 후보에 없어 유사도를 알 수 없는 BM25 전용 Chunk는 유지합니다.
+        
+        Args:
+            collection: 벡터 DB 컬렉션 (BM25에만 나온 Chunk의 내용 조회용)
+            dense_results: 벡터 검색 결과 (점수 내림차순)
+            sparse_hits: (Chunk ID, BM25 점수) 리스트 (점수 내림차순)
+            top_k: 반환할 결과 개수
+            min_score: 최소 벡터 유사도 점수
+        
+        Returns:
+            결합 점수 내림차순 검색 결과 리스트 (dense_score/sparse_score 포함)
+        """
+        rejected = {result["doc_id"] for result in dense_results if result["score"] < min_score}
+        if rejected:
+            dense_results = [result for result in dense_results if result["doc_id"] not in rejected]
+            sparse_hits = [(doc_id, score) for doc_id, score in sparse_hits if doc_id not in rejected]
+        
+        fused: Dict[str, float] = {}
+        for rank, result in enumerate(dense_results):
+            fused[result["doc_id"]] = fused.get(result["doc_id"], 0.0) + settings.rag_hybrid_dense_weight / (RRF_K + rank + 1)
+        for rank, (doc_id, _) in enumerate(sparse_hits):
+            fused[doc_id] = fused.get(doc_id, 0.0) + settings.rag_hybrid_sparse_weight / (RRF_K + rank + 1)
+        
+        ranked = sorted(fused, key=fused.get, reverse=True)[:top_k]
+        dense_by_id = {result["doc_id"]: result for result in dense_results}
+        sparse_by_id = dict(sparse_hits)
+        
+        # BM25에만 나온 Chunk는 내용과 메타데이터를 한 번에 조회
+        missing = [doc_id for doc_id in ranked if doc_id not in dense_by_id]
+        fetched: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        if missing:
+            data = collection.get(ids=missing, include=["documents", "metadatas"])
+            for i, doc_id in enumerate(data["ids"]):
+                fetched[doc_id] = (
+                    data["documents"][i] if data["documents"] else "",
+                    data["metadatas"][i] if data["metadatas"] else {}
+                )
+        
+        formatted_results = []
+        for doc_id in ranked:
+            dense = dense_by_id.get(doc_id)
+            if dense is None and doc_id not in fetched:
+                # 희소 인덱스 구축 이후 삭제된 Chunk
+                continue
+            content, metadata = (dense["content"], dense["metadata"]) if dense else fetched[doc_id]
+            formatted_results.append({
+                "doc_id": doc_id,
+                "content": content,
+                "metadata": metadata,
+                "score": fused[doc_id],
+                "distance": dense["distance"] if dense else None,
+                "dense_score": dense["score"] if dense else None,
+                "sparse_score": sparse_by_id.get(doc_id)
+            })
+        return formatted_results
+    
+    def _search_sparse(
+        self,
+        collection_name: str,
+        specs: List["SearchSpec"],
+        modes: List[str],
+        wheres: List[Optional[Dict[str, Any]]]
+    ) -> List[Optional[List[Tuple[str, float]]]]:
+        """
+        hybrid/prefilter 검색의 BM25 단계 (지연 시간 예산을 넘기면 남은 검색은 벡터 검색만 사용)
+        
+        Returns:
+            검색별 (Chunk ID, BM25 점수) 리스트 또는 None (BM25 미사용)
+        """
+        sparse_hits: List[Optional[List[Tuple[str, float]]]] = [None] * len(specs)
+        if all(mode == "vector" for mode in modes):
+            return sparse_hits
+        
+        sparse_index = sparse_index_store.get(collection_name)
+        if sparse_index is None:
+            logger.debug(f"희소 인덱스 없음, 벡터 검색만 사용: {collection_name}")
+            return sparse_hits
+        
+        deadline = time.perf_counter() + settings.rag_hybrid_latency_budget_ms / 1000
+        for position, spec in enumerate(specs):
+            if modes[position] == "vector":
+                continue
+            hits = sparse_index.search(spec.query, settings.rag_hybrid_candidates, wheres[position], deadline)
+            if hits is None:
+                logger.warning(
+                    f"BM25 검색 지연 시간 예산({settings.rag_hybrid_latency_budget_ms}ms) 초과, "
+                    f"벡터 검색만 사용: 쿼리='{spec.query}'"
+                )
+                break
+            sparse_hits[position] = hits
+        return sparse_hits
+    
+    def search_many(self, specs: List["SearchSpec"]) -> List[List[Dict[str, Any]]]:
+        """
+        여러 검색을 한 번에 수행
+        
+        모든 쿼리를 한 번의 배치로 Embedding하고, 필터가 같은 검색끼리 묶어
+        필터 그룹마다 벡터 DB 쿼리를 한 번만 실행합니다.
+        hybrid 검색은 벡터 후보와 BM25 후보를 RRF로 결합하고, prefilter 검색은
+        BM25 후보 Chunk 안에서만 벡터 검색을 수행합니다.
+        
+        Args:
+            specs: 검색 조건 리스트
+        
+        Returns:
+            입력 순서와 같은 검색 결과 리스트의 리스트
+        """
+        if not specs:
+            return []
+        
         try:
-            # 쿼리 Embedding 생성
-            query_embedding = embedding_model.encode_query(query).tolist()
+            modes = [self._resolve_mode(spec) for spec in specs]
+            wheres = [self._build_where(spec) for spec in specs]
+            collection_name, collection = self._resolve_collection()
+            sparse_hits = self._search_sparse(collection_name, specs, modes, wheres)
+            query_embeddings = embedding_model.encode_queries([spec.query for spec in specs])
             
-            # 메타데이터 필터 구성 (ChromaDB는 $and 연산자 필요)
-            where_conditions = []
-            if knowledge_type:
-                where_conditions.append({"knowledge_type": knowledge_type})
-            if main_case_type:
-                where_conditions.append({"main_case_type": main_case_type})
-            if sub_case_type:
-                where_conditions.append({"sub_case_type": sub_case_type})
-            if node_scope:
-                # node_scope는 리스트이므로 $in 사용 또는 각 요소 확인
-                # ChromaDB는 배열 필드에 대해 직접 매칭이 어려우므로 일단 제외
-                # 필요시 메타데이터에 별도 필드로 저장하는 것을 권장
-                pass
+            # (필터, 후보 ID)별 그룹 (입력 순서 유지) - prefilter 검색은 후보 ID가 달라 각각 실행
+            groups: Dict[str, List[int]] = {}
+            group_args: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[List[str]]]] = {}
+            n_results: List[int] = []
+            for position, spec in enumerate(specs):
+                candidate_ids = None
+                if modes[position] == "prefilter" and sparse_hits[position]:
+                    candidate_ids = [doc_id for doc_id, _ in sparse_hits[position]]
+                n_results.append(
+                    max(spec.top_k, settings.rag_hybrid_candidates)
+                    if modes[position] == "hybrid" and sparse_hits[position] is not None
+                    else spec.top_k
+                )
+                key = json.dumps([wheres[position], candidate_ids], sort_keys=True, ensure_ascii=False)
+                groups.setdefault(key, []).append(position)
+                group_args[key] = (wheres[position], candidate_ids)
             
-            # where 필터 구성
-            if len(where_conditions) == 0:
-                where = None
-            elif len(where_conditions) == 1:
-                where = where_conditions[0]
-            else:
-                where = {"$and": where_conditions}
+            all_results: List[List[Dict[str, Any]]] = [[] for _ in specs]
+            for key, positions in groups.items():
+                where, candidate_ids = group_args[key]
+                query_kwargs = {"ids": candidate_ids} if candidate_ids else {}
+                results = collection.query(
+                    query_embeddings=[query_embeddings[position].tolist() for position in positions],
+                    n_results=max(n_results[position] for position in positions),
+                    where=where,
+                    **query_kwargs
+                )
+                for index, position in enumerate(positions):
+                    spec = specs[position]
+                    if modes[position] == "hybrid" and sparse_hits[position] is not None:
+                        dense_results = self._format_results(results, index, n_results[position], float("-inf"))
+                        all_results[position] = self._fuse(
+                            collection, dense_results, sparse_hits[position], spec.top_k, spec.min_score
+                        )
+                    else:
+                        all_results[position] = self._format_results(results, index, spec.top_k, spec.min_score)
             
-            # 검색 수행
-            results = self.collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
-                where=where
+            logger.debug(
+                f"검색 완료: 쿼리 {len(specs)}개, 필터 그룹 {len(groups)}개, "
+                f"결과={[len(results) for results in all_results]}"
             )
             
-            # 결과 포맷팅
-            formatted_results = []
-            
-            if results["ids"] and len(results["ids"][0]) > 0:
-                for i in range(len(results["ids"][0])):
-                    doc_id = results["ids"][0][i]
-                    distance = results["distances"][0][i] if results["distances"] else None
-                    metadata = results["metadatas"][0][i] if results["metadatas"] else {}
-                    document = results["documents"][0][i] if results["documents"] else ""
-                    
-                    # 유사도 점수 계산 (distance를 score로 변환)
-                    score = 1.0 - distance if distance is not None else 0.0
-                    
-                    # 최소 점수 필터링
-                    if score >= min_score:
-                        formatted_results.append({
-                            "doc_id": doc_id,
-                            "content": document,
-                            "metadata": metadata,
-                            "score": score,
-                            "distance": distance
-                        })
-            
-            # 점수 순으로 정렬
-            formatted_results.sort(key=lambda x: x["score"], reverse=True)
-            
-            logger.debug(f"검색 완료: 쿼리='{query}', 결과={len(formatted_results)}개")
-            
-            return formatted_results
+            return all_results
         
         except Exception as e:
             logger.error(f"RAG 검색 실패: {str(e)}")
@@ -120,7 +374,8 @@ class RAGSearcher:
         self,
         query: str,
         knowledge_type: str,
-        top_k: int = 5
+        top_k: int = 5,
+        mode: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """
         지식 타입별 검색
@@ -129,6 +384,7 @@ class RAGSearcher:
             query: 검색 쿼리
             knowledge_type: 지식 타입 (K1, K2, K3, K4)
             top_k: 반환할 결과 개수
+            mode: 검색 모드 (None이면 설정값)
         
         Returns:
             검색 결과 리스트
@@ -136,7 +392,8 @@ class RAGSearcher:
         return self.search(
             query=query,
             top_k=top_k,
-            knowledge_type=knowledge_type
+            knowledge_type=knowledge_type,
+            mode=mode
         )
     
     def search_by_case_type(
@@ -0,0 +1,315 @@
+"""
+RAG 희소(BM25) 인덱스 모듈
+
+다국어 MiniLM Embedding만으로는 "대여금", "과징금", "양육권" 같은 정확한 법률 용어가 포함된
+문서가 상위에 오지 않는 경우가 있어, 벡터 인덱스와 함께 문자 bigram BM25 인덱스를 구축합니다.
+한국어는 조사가 붙어 어절이 달라지므로(대여금을/대여금은) 형태소 분석 없이 어절 내부 문자 bigram을
+색인어로 사용합니다.
+
+인덱스는 인덱싱 파이프라인 실행이 끝날 때 컬렉션 내용 전체로 다시 만들어지며
+벡터 DB 디렉토리의 sparse/{컬렉션}.json에 저장됩니다. 검색 쪽은 파일이 바뀌었을 때만 다시 로드합니다.
+"""
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SPARSE_INDEX_VERSION = 1
+
+# BM25 파라미터
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    색인어 추출 (어절별 문자 bigram, 한 글자 어절은 그대로)
+    
+    Args:
+        text: 텍스트
+    
+    Returns:
+        색인어 리스트 (중복 포함)
+    """
+    tokens = []
+    for word in _WORD_PATTERN.findall((text or "").lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def _matches(metadata: Dict[str, Any], where: Optional[Dict[str, Any]]) -> bool:
+    """메타데이터가 where 조건($and/$or, $eq/$ne/$in/$nin)을 만족하는지 확인"""
+    if not where:
+        return True
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(_matches(metadata, sub_condition) for sub_condition in condition):
+                return False
+        elif key == "$or":
+            if not any(_matches(metadata, sub_condition) for sub_condition in condition):
+                return False
+        else:
+            operator, operand = next(iter(condition.items())) if isinstance(condition, dict) else ("$eq", condition)
+            value = metadata.get(key)
+            if operator == "$eq":
+                matched = value == operand
+            elif operator == "$ne":
+                matched = value != operand
+            elif operator == "$in":
+                matched = value in operand
+            elif operator == "$nin":
+                matched = value not in operand
+            else:
+                raise ValueError(f"지원하지 않는 where 연산자: {operator}")
+            if not matched:
+                return False
+    return True
+
+
+class BM25Index:
+    """BM25 희소 인덱스 클래스"""
+    
+    def __init__(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        doc_lengths: List[int],
+        postings: Dict[str, Tuple[List[int], List[int]]]
+    ):
+        """
+        인덱스 초기화 (build 또는 load로 생성)
+        
+        Args:
+            ids: Chunk ID 리스트
+            metadatas: Chunk 메타데이터 리스트 (where 필터용)
+            doc_lengths: Chunk별 색인어 수
+            postings: 색인어 → (Chunk 위치 리스트, 출현 횟수 리스트)
+        """
+        self.ids = ids
+        self.metadatas = metadatas
+        self.postings = postings
+        self._doc_lengths = np.asarray(doc_lengths, dtype=np.float32)
+        self._arrays = {
+            term: (np.asarray(rows, dtype=np.int32), np.asarray(counts, dtype=np.float32))
+            for term, (rows, counts) in postings.items()
+        }
+        average_length = float(self._doc_lengths.mean()) if len(ids) else 0.0
+        # 문서 길이 정규화 항은 쿼리와 무관하므로 미리 계산
+        self._length_norm = BM25_K1 * (1 - BM25_B + BM25_B * self._doc_lengths / (average_length or 1.0))
+        self._mask_cache: Dict[str, np.ndarray] = {}
+        self._mask_lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @classmethod
+    def build(cls, ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]) -> "BM25Index":
+        """
+        Chunk 내용으로 인덱스 구축
+        
+        Args:
+            ids: Chunk ID 리스트
+            documents: Chunk 내용 리스트
+            metadatas: Chunk 메타데이터 리스트
+        
+        Returns:
+            BM25Index 인스턴스
+        """
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        doc_lengths = []
+        for row, document in enumerate(documents):
+            tokens = tokenize(document)
+            doc_lengths.append(len(tokens))
+            for term, count in Counter(tokens).items():
+                rows, counts = postings.setdefault(term, ([], []))
+                rows.append(row)
+                counts.append(count)
+        return cls(list(ids), [dict(metadata or {}) for metadata in metadatas], doc_lengths, postings)
+    
+    def save(self, path: Path):
+        """인덱스 저장 (임시 파일에 쓴 뒤 교체하여 읽는 쪽이 중간 상태를 보지 않도록 함)"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_text(
+            json.dumps({
+                "version": SPARSE_INDEX_VERSION,
+                "ids": self.ids,
+                "metadatas": self.metadatas,
+                "doc_lengths": self._doc_lengths.astype(int).tolist(),
+                "postings": self.postings
+            }, ensure_ascii=False),
+            encoding="utf-8"
+        )
+        os.replace(temp_path, path)
+    
+    @classmethod
+    def load(cls, path: Path) -> Optional["BM25Index"]:
+        """
+        저장된 인덱스 로드
+        
+        Returns:
+            BM25Index 또는 None (버전 불일치)
+        """
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("version") != SPARSE_INDEX_VERSION:
+            logger.warning(f"희소 인덱스 버전 불일치, 다음 인덱싱 때 다시 구축됩니다: {path}")
+            return None
+        postings = {term: (rows, counts) for term, (rows, counts) in data["postings"].items()}
+        return cls(data["ids"], data["metadatas"], data["doc_lengths"], postings)
+    
+    def _filter_mask(self, where: Optional[Dict[str, Any]]) -> Optional[np.ndarray]:
+        """where 조건의 Chunk 마스크 (조건 조합별 캐시, 조건이 없으면 None)"""
+        if not where:
+            return None
+        key = json.dumps(where, sort_keys=True, ensure_ascii=False)
+        mask = self._mask_cache.get(key)
+        if mask is None:
+            mask = np.fromiter((_matches(metadata, where) for metadata in self.metadatas), dtype=bool, count=len(self.ids))
+            with self._mask_lock:
+                self._mask_cache[key] = mask
+        return mask
+    
+    def search(
+        self,
+        query: str,
+        top_k: int,
+        where: Optional[Dict[str, Any]] = None,
+        deadline: Optional[float] = None
+    ) -> Optional[List[Tuple[str, float]]]:
+        """
+        BM25 검색
+        
+        Args:
+            query: 검색 쿼리
+            top_k: 반환할 결과 개수
+            where: 메타데이터 조건
+            deadline: time.perf_counter() 기준 마감 시각 (넘기면 None 반환)
+        
+        Returns:
+            (Chunk ID, BM25 점수) 리스트 (점수 내림차순, 점수 0인 Chunk 제외) 또는 None (시간 초과)
+        """
+        if not self.ids or top_k <= 0:
+            return []
+        
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for term, query_count in Counter(tokenize(query)).items():
+            if deadline is not None and time.perf_counter() > deadline:
+                return None
+            posting = self._arrays.get(term)
+            if posting is None:
+                continue
+            rows, counts = posting
+            idf = math.log(1 + (len(self.ids) - len(rows) + 0.5) / (len(rows) + 0.5))
+            scores[rows] += query_count * idf * counts * (BM25_K1 + 1) / (counts + self._length_norm[rows])
+        
+        mask = self._filter_mask(where)
+        if mask is not None:
+            scores[~mask] = 0.0
+        
+        candidates = np.flatnonzero(scores > 0)
+        if len(candidates) > top_k:
+            candidates = candidates[np.argpartition(-scores[candidates], top_k - 1)[:top_k]]
+        candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.ids[row], float(scores[row])) for row in candidates]
+
+
+class SparseIndexStore:
+    """컬렉션별 희소 인덱스 저장소 클래스"""
+    
+    def __init__(self, path: Path):
+        """
+        저장소 초기화
+        
+        Args:
+            path: 인덱스 파일 디렉토리
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[Tuple[int, int, int], BM25Index]] = {}
+    
+    def _index_path(self, collection_name: str) -> Path:
+        return self.path / f"{collection_name}.json"
+    
+    def build(self, collection_name: str, collection) -> int:
+        """
+        컬렉션 전체 내용으로 희소 인덱스를 다시 구축하여 저장
+        
+        Args:
+            collection_name: 컬렉션 이름
+            collection: 벡터 DB 컬렉션 (get 지원)
+        
+        Returns:
+            색인된 Chunk 수
+        """
+        data = collection.get(include=["documents", "metadatas"])
+        index = BM25Index.build(data["ids"], data["documents"] or [], data["metadatas"] or [])
+        index.save(self._index_path(collection_name))
+        logger.info(f"희소 인덱스 구축 완료: {collection_name} ({len(index)}개 Chunk, 색인어 {len(index.postings)}개)")
+        return len(index)
+    
+    def get(self, collection_name: str) -> Optional[BM25Index]:
+        """
+        컬렉션의 희소 인덱스 획득 (파일이 바뀌었을 때만 다시 로드)
+        
+        Args:
+            collection_name: 컬렉션 이름
+        
+        Returns:
+            BM25Index 또는 None (아직 구축되지 않은 경우)
+        """
+        path = self._index_path(collection_name)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._cache.get(collection_name)
+        if cached and cached[0] == signature:
+            return cached[1]
+        
+        with self._lock:
+            cached = self._cache.get(collection_name)
+            if cached and cached[0] == signature:
+                return cached[1]
+            try:
+                index = BM25Index.load(path)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"희소 인덱스 로드 실패: {path} - {str(e)}")
+                return cached[1] if cached else None
+            if index is None:
+                return None
+            self._cache[collection_name] = (signature, index)
+            return index
+    
+    def delete(self, collection_name: str):
+        """
+        컬렉션의 희소 인덱스 삭제
+        
+        Args:
+            collection_name: 컬렉션 이름
+        """
+        with self._lock:
+            self._cache.pop(collection_name, None)
+            path = self._index_path(collection_name)
+            if path.exists():
+                path.unlink()
+
+
+# 전역 희소 인덱스 저장소 인스턴스
+sparse_index_store = SparseIndexStore(Path(settings.vector_db_path) / "sparse")
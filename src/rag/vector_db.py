@@ -6,6 +6,7 @@ from chromadb.config import Settings
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from config.settings import settings
+from src.rag.numpy_store import NumpyVectorClient
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -36,6 +37,12 @@ class VectorDBManager:
                 )
                 
                 logger.info(f"ChromaDB 초기화 완료: {db_path}")
+            elif settings.vector_db_type == "numpy":
+                # NumPy 전수 검색 저장소 초기화 (소규모 코퍼스용, ChromaDB와 같은 컬렉션 API)
+                db_path = Path(settings.vector_db_path) / "numpy"
+                self.client = NumpyVectorClient(db_path)
+                
+                logger.info(f"NumPy 벡터 저장소 초기화 완료: {db_path}")
             else:
                 raise ValueError(f"지원하지 않는 벡터 DB 타입: {settings.vector_db_type}")
         
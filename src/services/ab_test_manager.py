@@ -1,8 +1,9 @@
 """
 A/B 테스트 관리 모듈
 기존 방식 vs Q-A 매칭 방식 비교 테스트
+사건 분류 다중 호출 방식 vs 단일 호출(fused) 방식 비교 테스트
 """
-from typing import Dict, Any, Optional, Literal
+from typing import Dict, Any, Optional, Literal, MutableMapping
 from enum import Enum
 from src.utils.logger import get_logger
 from config.settings import settings
@@ -16,6 +17,12 @@ class FactExtractionMethod(str, Enum):
     QA_MATCHING = "qa_matching"  # Q-A 매칭 방식
 
 
+class ClassificationMethod(str, Enum):
+    """사건 분류 방식"""
+    MULTI_CALL = "multi_call"  # 의미 추출 / 분류 / 1차 서술 분석 개별 호출
+    FUSED = "fused"  # 단일 구조화 JSON 호출
+
+
 class ABTestManager:
     """A/B 테스트 관리 클래스"""
     
@@ -45,7 +52,31 @@ class ABTestManager:
             }
         }
         
-        logger.info(f"A/B 테스트 관리자 초기화: 기본 방식={self.default_method}")
+        # 사건 분류 방식 A/B 테스트 (세션별 할당은 세션 State의 classification_method에 저장)
+        self.default_classification_method = getattr(
+            settings,
+            'classification_method',
+            ClassificationMethod.MULTI_CALL.value
+        )
+        self.classification_stats: Dict[str, Dict[str, Any]] = {
+            method.value: self._empty_classification_stat()
+            for method in ClassificationMethod
+        }
+        
+        logger.info(
+            f"A/B 테스트 관리자 초기화: 기본 방식={self.default_method}, "
+            f"분류 방식={self.default_classification_method}"
+        )
+    
+    @staticmethod
+    def _empty_classification_stat() -> Dict[str, Any]:
+        """사건 분류 방식별 빈 통계"""
+        return {
+            "session_count": 0,
+            "success_count": 0,
+            "fallback_count": 0,
+            "total_latency_ms": 0.0
+        }
     
     def assign_method(self, session_id: str, method: Optional[str] = None) -> str:
         """
@@ -142,6 +173,8 @@ class ABTestManager:
                 "success_count": 0,
                 "error_count": 0
             }
+        for method in self.classification_stats:
+            self.classification_stats[method] = self._empty_classification_stat()
         logger.info("A/B 테스트 통계 초기화 완료")
     
     def is_legacy_method(self, session_id: str) -> bool:
@@ -169,6 +202,89 @@ class ABTestManager:
         """
         method = self.get_method(session_id)
         return method == FactExtractionMethod.QA_MATCHING.value
+    
+    
+    def assign_classification_method(self, session_id: str, method: Optional[str] = None) -> str:
+        """
+        세션에 사건 분류 방식 할당 (할당 결과는 호출자가 세션 State에 저장)
+        
+        Args:
+            session_id: 세션 ID
+            method: 할당할 방식 (None이면 기본 방식 또는 랜덤 할당)
+        
+        Returns:
+            할당된 방식
+        """
+        if method is None:
+            import random
+            method = random.choice([
+                ClassificationMethod.MULTI_CALL.value,
+                ClassificationMethod.FUSED.value
+            ]) if getattr(settings, 'classification_ab_test_enabled', False) else self.default_classification_method
+        
+        self.classification_stats[method]["session_count"] += 1
+        
+        logger.info(f"[A/B 테스트] 세션 {session_id}에 분류 방식 {method} 할당")
+        return method
+    
+    def get_classification_method(self, state: MutableMapping[str, Any]) -> str:
+        """
+        세션의 할당된 사건 분류 방식 조회 (할당되지 않았으면 할당하여 State에 기록)
+        
+        할당을 세션 State에 저장하므로 재시작 후나 다른 워커에서도 같은 세션은 같은 방식을 사용합니다.
+        
+        Args:
+            state: 세션 State Context
+        
+        Returns:
+            할당된 방식
+        """
+        method = state.get("classification_method")
+        if method not in self.classification_stats:
+            method = self.assign_classification_method(state.get("session_id", "unknown"))
+            state["classification_method"] = method
+        return method
+    
+    def record_classification(self, session_id: str, method: str, latency_ms: float, fallback: bool = False):
+        """
+        사건 분류 결과 기록
+        
+        Args:
+            session_id: 세션 ID
+            method: 세션에 할당된 사건 분류 방식
+            latency_ms: 분류 소요 시간 (밀리초)
+            fallback: fused 결과 검증 실패로 다중 호출 방식으로 폴백했는지 여부
+        """
+        stat = self.classification_stats[method]
+        stat["total_latency_ms"] += latency_ms
+        if fallback:
+            stat["fallback_count"] += 1
+        else:
+            stat["success_count"] += 1
+        logger.debug(
+            f"[A/B 테스트] 분류 방식 {method} 기록: session_id={session_id}, "
+            f"latency={latency_ms:.1f}ms, fallback={fallback}"
+        )
+    
+    def get_classification_stats(self) -> Dict[str, Any]:
+        """
+        사건 분류 방식별 통계 조회
+        
+        Returns:
+            통계 딕셔너리 (평균 소요 시간, 폴백 비율 포함)
+        """
+        result = {}
+        for method, stat in self.classification_stats.items():
+            finished = stat["success_count"] + stat["fallback_count"]
+            result[method] = {
+                "session_count": stat["session_count"],
+                "success_count": stat["success_count"],
+                "fallback_count": stat["fallback_count"],
+                "fallback_rate": (stat["fallback_count"] / finished * 100) if finished > 0 else 0.0,
+                "avg_latency_ms": round(stat["total_latency_ms"] / finished, 2) if finished > 0 else 0.0
+            }
+        
+        return result
 
 
 # 전역 A/B 테스트 관리자 인스턴스
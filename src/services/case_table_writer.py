@@ -0,0 +1,115 @@
+"""
+정규화 사건 테이블 비동기 기록 모듈
+
+세션 재개는 chat_session.state_snapshot으로 이루어지므로 CaseFact/CaseParty/CaseEvidence/
+CaseMissingField는 리포팅/조회용입니다. VALIDATION 노드의 이 테이블 기록을 응답 경로에서
+분리하여 전용 스레드 하나에서 순서대로 실행합니다 (같은 세션의 기록 순서 보장).
+
+이 테이블을 읽는 쪽(SUMMARY 노드 등)은 읽기 전에 flush(session_id)로 해당 세션의
+대기 중인 기록이 끝나기를 기다립니다.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional
+from config.settings import settings
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class CaseTableWriter:
+    """정규화 사건 테이블 기록 클래스"""
+    
+    def __init__(self, async_mode: bool = True):
+        """
+        Args:
+            async_mode: True면 전용 스레드에서 기록, False면 호출 스레드에서 바로 기록
+        """
+        self.async_mode = async_mode
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # 세션별 마지막 기록 작업 (스레드 하나에서 순서대로 실행되므로 마지막 작업만 기다리면 됨)
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._completed = 0
+        self._failed = 0
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """기록 스레드 반환 (최초 사용 시 생성)"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="case-table-writer")
+            return self._executor
+    
+    def submit(self, session_id: str, func: Callable[..., Any], *args: Any):
+        """
+        기록 작업 등록
+        
+        Args:
+            session_id: 세션 ID
+            func: 기록 함수
+            *args: 기록 함수 인자 (호출 이후 변경되지 않는 값이어야 함)
+        """
+        if not self.async_mode:
+            self._run(func, *args)
+            return
+        future = self._get_executor().submit(self._run, func, *args)
+        with self._lock:
+            self._pending[session_id] = future
+        future.add_done_callback(lambda done: self._forget(session_id, done))
+    
+    def _run(self, func: Callable[..., Any], *args: Any):
+        try:
+            func(*args)
+            with self._lock:
+                self._completed += 1
+        except Exception as e:
+            with self._lock:
+                self._failed += 1
+            logger.error(f"사건 테이블 기록 실패: {str(e)}", exc_info=True)
+    
+    def _forget(self, session_id: str, future: Future):
+        with self._lock:
+            if self._pending.get(session_id) is future:
+                del self._pending[session_id]
+    
+    def flush(self, session_id: Optional[str] = None, timeout: Optional[float] = None) -> bool:
+        """
+        대기 중인 기록 완료 대기
+        
+        Args:
+            session_id: 세션 ID (None이면 전체)
+            timeout: 최대 대기 시간 (초)
+        
+        Returns:
+            시간 안에 모두 완료되었는지 여부
+        """
+        with self._lock:
+            if session_id is None:
+                futures = list(self._pending.values())
+            else:
+                futures = [self._pending[session_id]] if session_id in self._pending else []
+        if not futures:
+            return True
+        _, not_done = wait(futures, timeout=timeout)
+        return not not_done
+    
+    def shutdown(self, wait: bool = True):
+        """기록 스레드 종료 (wait=True면 대기 중인 기록을 모두 수행)"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """기록 통계 조회"""
+        with self._lock:
+            return {
+                "async_mode": self.async_mode,
+                "pending_sessions": len(self._pending),
+                "completed": self._completed,
+                "failed": self._failed
+            }
+
+
+# 전역 사건 테이블 기록 인스턴스
+case_table_writer = CaseTableWriter(async_mode=settings.case_tables_async_write)
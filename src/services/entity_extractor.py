@@ -1,13 +1,23 @@
 """
 엔티티 추출 함수 모듈
+
+날짜/금액/상대방은 먼저 사전 컴파일된 패턴 엔진(entity_patterns)으로 추출하고,
+추출하지 못한 경우에만 GPT로 폴백합니다. 필드별 폴백 비율과 사유를 집계합니다.
 """
 import re
+import threading
 from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from datetime import datetime
 from src.services.gpt_client import gpt_client
+from src.services.semantic_cache import semantic_cache
+from src.services.entity_patterns import (
+    PatternMatch,
+    match_date,
+    match_amount,
+    match_counterparty
+)
 from src.utils.logger import get_logger
-from src.utils.constants import KOREAN_NUMBER_MAPPING, Limits
-from src.utils.helpers import get_kst_now
+from src.utils.constants import Limits
 
 logger = get_logger(__name__)
 
@@ -17,84 +27,71 @@ class EntityExtractor:
     
     def __init__(self):
         self.gpt_client = gpt_client
+        self._stats_lock = threading.Lock()
+        self._fallback_stats: Dict[str, Dict[str, Any]] = {}
+    
+    def _record_extraction(self, field: str, match: PatternMatch):
+        """
+        필드별 결정적 추출 결과 집계 (실패 시 GPT 폴백 사유 기록)
+        
+        Args:
+            field: 필드명 (date, amount, party)
+            match: 패턴 추출 결과
+        """
+        with self._stats_lock:
+            stats = self._fallback_stats.setdefault(field, {
+                "calls": 0,
+                "deterministic": 0,
+                "gpt_fallback": 0,
+                "reasons": {}
+            })
+            stats["calls"] += 1
+            if match.value is not None:
+                stats["deterministic"] += 1
+                return
+            stats["gpt_fallback"] += 1
+            reason = match.fallback_reason.value if match.fallback_reason else "unknown"
+            stats["reasons"][reason] = stats["reasons"].get(reason, 0) + 1
+        
+        logger.debug(f"[엔티티 추출] {field} 패턴 추출 실패, GPT 폴백: reason={reason}")
+    
+    def get_fallback_stats(self) -> Dict[str, Any]:
+        """
+        필드별 GPT 폴백 통계 조회
+        
+        Returns:
+            {field: {calls, deterministic, gpt_fallback, fallback_rate, reasons}}
+        """
+        with self._stats_lock:
+            return {
+                field: {
+                    **stats,
+                    "reasons": dict(stats["reasons"]),
+                    "fallback_rate": round(stats["gpt_fallback"] / stats["calls"] * 100, 2) if stats["calls"] else 0.0
+                }
+                for field, stats in self._fallback_stats.items()
+            }
+    
+    def reset_fallback_stats(self):
+        """GPT 폴백 통계 초기화"""
+        with self._stats_lock:
+            self._fallback_stats.clear()
     
     def extract_date(self, text: str) -> Optional[str]:
         """
-        날짜 추출
+        날짜 추출 (패턴 추출 실패 시 GPT 폴백)
         
         Args:
             text: 입력 텍스트
         
         Returns:
-            추출된 날짜 문자열 (YYYY-MM-DD 형식) 또는 None
+            추출된 날짜 문자열 (YYYY-MM-DD 형식, 기간이면 시작일) 또는 None
         """
         try:
-            # 프롬프트 파일에서 로드 시도
-            from src.services.prompt_loader import prompt_loader
-            prompt_template = prompt_loader.load_prompt("date", sub_dir="entity_extraction")
-            if prompt_template:
-                prompt = prompt_template.format(text=text)
-            else:
-                # 기본 프롬프트 사용
-                prompt = f"""다음 텍스트에서 날짜를 추출하여 YYYY-MM-DD 형식으로 반환하세요.
-
-텍스트: {text}
-
-YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "null"을 반환하세요."""
-        except Exception as prompt_error:
-            logger.debug(f"프롬프트 로드 실패, 기본 프롬프트 사용: {str(prompt_error)}")
-            prompt = f"""다음 텍스트에서 날짜를 추출하여 YYYY-MM-DD 형식으로 반환하세요.
-
-텍스트: {text}
-
-YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "null"을 반환하세요."""
-        
-        try:
-            # 상대적 날짜 패턴
-            now = get_kst_now()
-            relative_patterns = {
-                r'어제': lambda m: (now - timedelta(days=1)).strftime("%Y-%m-%d"),
-                r'오늘': lambda m: now.strftime("%Y-%m-%d"),
-                r'내일': lambda m: (now + timedelta(days=1)).strftime("%Y-%m-%d"),
-                r'(\d+)일\s*전': lambda m: (now - timedelta(days=int(m.group(1)))).strftime("%Y-%m-%d"),
-                r'(\d+)일\s*후': lambda m: (now + timedelta(days=int(m.group(1)))).strftime("%Y-%m-%d"),
-                r'작년\s*(\d+)월\s*(\d+)일?': lambda m: self._get_relative_date(-1, int(m.group(1)), int(m.group(2))),
-                r'작년\s*(\d+)월': lambda m: self._get_relative_date(-1, int(m.group(1))),
-                r'올해\s*(\d+)월\s*(\d+)일?': lambda m: self._get_relative_date(0, int(m.group(1)), int(m.group(2))),
-                r'올해\s*(\d+)월': lambda m: self._get_relative_date(0, int(m.group(1))),
-                r'(\d+)월\s*(\d+)일': lambda m: self._get_relative_date(0, int(m.group(1)), int(m.group(2))),  # "11월 20일" 형식
-                r'(\d+)월': lambda m: self._get_relative_date(0, int(m.group(1))),  # "11월" 형식
-                r'(\d+)개월\s*전': lambda m: (now - timedelta(days=30 * int(m.group(1)))).strftime("%Y-%m-%d"),
-                r'(\d+)년\s*전': lambda m: (now - timedelta(days=365 * int(m.group(1)))).strftime("%Y-%m-%d"),
-            }
-            
-            # 절대적 날짜 패턴
-            absolute_patterns = [
-                r'(\d{4})[년\.\-\/](\d{1,2})[월\.\-\/](\d{1,2})일?',  # 2023-10-15
-                r'(\d{4})[년\.\-\/](\d{1,2})월',  # 2023-10
-            ]
-            
-            # 상대적 날짜 매칭
-            for pattern, func in relative_patterns.items():
-                match = re.search(pattern, text)
-                if match:
-                    date = func(match)
-                    if isinstance(date, datetime):
-                        return date.strftime("%Y-%m-%d")
-                    return date
-            
-            # 절대적 날짜 매칭
-            for pattern in absolute_patterns:
-                match = re.search(pattern, text)
-                if match:
-                    year = int(match.group(1))
-                    month = int(match.group(2))
-                    day = int(match.group(3)) if len(match.groups()) >= 3 else 1
-                    try:
-                        date = datetime(year, month, day)
-                        return date.strftime("%Y-%m-%d")
-                    except ValueError:
-                        continue
+            match = match_date(text)
+            self._record_extraction("date", match)
+            if match.value is not None:
+                return match.value
             
             # GPT API를 사용한 날짜 추출 (패턴 매칭 실패 시)
             return self._extract_date_with_gpt(text)
@@ -103,20 +100,24 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
             logger.error(f"날짜 추출 실패: {str(e)}")
             return None
     
-    def _get_relative_date(self, year_offset: int, month: int, day: int = 1) -> datetime:
-        """상대적 날짜 계산"""
-        now = get_kst_now()
-        target_year = now.year + year_offset
+    def _extract_date_with_gpt(self, text: str) -> Optional[str]:
+        """GPT API를 사용한 날짜 추출 (의미 캐시 사용)"""
         try:
-            return datetime(target_year, month, day)
-        except ValueError:
-            # 잘못된 날짜(예: 2월 30일)인 경우 해당 월의 마지막 날로 조정
-            from calendar import monthrange
-            last_day = monthrange(target_year, month)[1]
-            return datetime(target_year, month, min(day, last_day))
+            return semantic_cache.get_or_compute(
+                "entity_date", text, lambda: self._request_date_with_gpt(text)
+            )
+        
+        except Exception as e:
+            logger.error(f"GPT 날짜 추출 실패: {str(e)}")
+            return None
     
-    def _extract_date_with_gpt(self, text: str) -> Optional[str]:
-        """GPT API를 사용한 날짜 추출"""
+    def _request_date_with_gpt(self, text: str) -> Optional[str]:
+        """
+        GPT API 날짜 추출 호출 및 응답 파싱
+        
+        Raises:
+            GPTAPIError: API 호출 실패 시
+        """
         prompt = f"""다음 텍스트에서 날짜를 추출하여 YYYY-MM-DD 형식으로 반환하세요.
 텍스트에 날짜가 없으면 "없음"을 반환하세요.
 
@@ -124,31 +125,28 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
 
 날짜:"""
         
-        try:
-            response = self.gpt_client.chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=Limits.MAX_TOKENS_DATE_EXTRACTION
-            )
-            
-            date_str = response["content"].strip()
-            if date_str == "없음" or not date_str:
-                return None
-            
-            # 날짜 형식 검증
-            try:
-                datetime.strptime(date_str, "%Y-%m-%d")
-                return date_str
-            except ValueError:
-                return None
+        response = self.gpt_client.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=Limits.MAX_TOKENS_DATE_EXTRACTION
+        )
         
-        except Exception as e:
-            logger.error(f"GPT 날짜 추출 실패: {str(e)}")
+        date_str = response["content"].strip()
+        if date_str == "없음" or not date_str:
+            return None
+        
+        # 날짜 형식 검증
+        try:
+            datetime.strptime(date_str, "%Y-%m-%d")
+            return date_str
+        except ValueError:
             return None
     
     def extract_amount(self, text: str) -> Optional[int]:
         """
-        금액 추출
+        금액 추출 (패턴 추출 실패 시 GPT 폴백)
+        
+        "300만원", "삼백오십만 원", "1억 2천만원", "3천5백" 같은 한글 숫자 표현을 처리합니다.
         
         Args:
             text: 입력 텍스트
@@ -157,32 +155,10 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
             추출된 금액 (원 단위 정수) 또는 None
         """
         try:
-            # 패턴: 숫자 + 단위 (예: 5천만원, 5000만원)
-            patterns = [
-                r'(\d+(?:\.\d+)?)\s*(만|억|조)?\s*원',
-                r'(\d+(?:\.\d+)?)\s*(천|만|억|조)',
-            ]
-            
-            for pattern in patterns:
-                match = re.search(pattern, text)
-                if match:
-                    number = float(match.group(1))
-                    unit = match.group(2) if len(match.groups()) >= 2 else None
-                    
-                    if unit:
-                        multiplier = KOREAN_NUMBER_MAPPING.get(unit, 1)
-                        amount = int(number * multiplier)
-                    else:
-                        amount = int(number)
-                    
-                    return amount
-            
-            # 한글 숫자 패턴 (예: 오천만원)
-            korean_pattern = r'([일이삼사오육칠팔구]+)\s*(천|만|억|조)?\s*원'
-            match = re.search(korean_pattern, text)
-            if match:
-                # 간단한 한글 숫자 변환 (복잡한 경우 GPT 사용)
-                return self._extract_amount_with_gpt(text)
+            match = match_amount(text)
+            self._record_extraction("amount", match)
+            if match.value is not None:
+                return match.value
             
             # GPT API를 사용한 금액 추출
             return self._extract_amount_with_gpt(text)
@@ -192,7 +168,23 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
             return None
     
     def _extract_amount_with_gpt(self, text: str) -> Optional[int]:
-        """GPT API를 사용한 금액 추출"""
+        """GPT API를 사용한 금액 추출 (의미 캐시 사용)"""
+        try:
+            return semantic_cache.get_or_compute(
+                "entity_amount", text, lambda: self._request_amount_with_gpt(text)
+            )
+        
+        except Exception as e:
+            logger.error(f"GPT 금액 추출 실패: {str(e)}")
+            return None
+    
+    def _request_amount_with_gpt(self, text: str) -> Optional[int]:
+        """
+        GPT API 금액 추출 호출 및 응답 파싱
+        
+        Raises:
+            GPTAPIError: API 호출 실패 시
+        """
         prompt = f"""다음 텍스트에서 금액을 추출하여 숫자만 반환하세요 (원 단위).
 금액이 없으면 "없음"을 반환하세요.
 
@@ -200,31 +192,26 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
 
 금액 (숫자만):"""
         
-        try:
-            response = self.gpt_client.chat_completion(
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=Limits.MAX_TOKENS_DATE_EXTRACTION
-            )
-            
-            amount_str = response["content"].strip()
-            if amount_str == "없음" or not amount_str:
-                return None
-            
-            # 숫자만 추출
-            numbers = re.findall(r'\d+', amount_str)
-            if numbers:
-                return int(numbers[0])
-            
-            return None
+        response = self.gpt_client.chat_completion(
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.3,
+            max_tokens=Limits.MAX_TOKENS_DATE_EXTRACTION
+        )
         
-        except Exception as e:
-            logger.error(f"GPT 금액 추출 실패: {str(e)}")
+        amount_str = response["content"].strip()
+        if amount_str == "없음" or not amount_str:
             return None
+        
+        # 숫자만 추출
+        numbers = re.findall(r'\d+', amount_str)
+        if numbers:
+            return int(numbers[0])
+        
+        return None
     
     def extract_party(self, text: str) -> Dict[str, Any]:
         """
-        인물/당사자 추출
+        인물/당사자 추출 (관계/이름 패턴 추출 실패 시 GPT 폴백)
         
         Args:
             text: 입력 텍스트
@@ -232,6 +219,11 @@ YYYY-MM-DD 형식의 날짜만 반환하세요. 날짜를 찾을 수 없으면 "
         Returns:
             당사자 정보 딕셔너리
         """
+        match = match_counterparty(text)
+        self._record_extraction("party", match)
+        if match.value is not None:
+            return match.value
+        
         try:
             # 프롬프트 파일에서 로드 시도
             from src.services.prompt_loader import prompt_loader
@@ -0,0 +1,478 @@
+"""
+결정적(패턴 기반) 엔티티 추출 엔진
+
+날짜, 금액, 상대방, 증거 패턴을 모듈 로드 시 한 번만 컴파일하고, 입력을 한 번 훑어(finditer)
+모든 후보를 위치 순서대로 찾습니다. 한글 숫자(KOREAN_NUMBER_MAPPING, 예: "삼백오십만 원",
+"3천5백만"), 상대 날짜("지난달 15일", "일주일 전"), 기간("3월부터 5월까지")을 처리합니다.
+
+추출에 실패하면 GPT 폴백 사유(FallbackReason)를 함께 반환하므로, 호출 측은 필드별 폴백
+비율과 사유를 집계할 수 있습니다.
+"""
+import re
+from calendar import monthrange
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+from src.utils.constants import (
+    KOREAN_NUMBER_MAPPING,
+    COUNTERPARTY_RELATIONSHIP_KEYWORDS,
+    EVIDENCE_TYPE_KEYWORDS,
+    EVIDENCE_KEYWORDS_POSITIVE,
+    PARTY_ROLES
+)
+from src.utils.helpers import get_kst_now
+
+
+class FallbackReason(str, Enum):
+    """GPT 폴백 사유"""
+    NO_MATCH = "no_match"  # 패턴 없음
+    INVALID_DATE = "invalid_date"  # 날짜 형태이나 존재하지 않는 날짜 (예: 13월)
+    YEAR_ONLY = "year_only"  # 연도만 언급 (예: "작년에", "2023년")
+    VAGUE = "vague_expression"  # 모호한 표현 (예: "얼마 전", "몇백만원")
+
+
+@dataclass
+class PatternMatch:
+    """결정적 추출 결과 (value가 None이면 fallback_reason에 GPT 폴백 사유)"""
+    value: Any = None
+    fallback_reason: Optional[FallbackReason] = None
+    range_end: Optional[str] = None  # 기간 표현의 종료일 (YYYY-MM-DD)
+
+
+# ============================================================================
+# 숫자
+# ============================================================================
+
+_KOREAN_DIGITS = "일이삼사오육칠팔구"
+_KOREAN_NUMERALS = _KOREAN_DIGITS + "십백천만억조"
+
+# 고유어 수사 (상대 날짜의 "한 달 전", "두 주 후" 등)
+_NATIVE_COUNTS: Dict[str, int] = {
+    "한": 1, "두": 2, "세": 3, "네": 4, "다섯": 5,
+    "여섯": 6, "일곱": 7, "여덟": 8, "아홉": 9, "열": 10
+}
+
+# 날수 단어 (하루 전, 이틀 후 등)
+_DAY_COUNT_WORDS: Dict[str, int] = {
+    "하루": 1, "이틀": 2, "사흘": 3, "나흘": 4, "닷새": 5,
+    "엿새": 6, "이레": 7, "열흘": 10, "보름": 15
+}
+
+_DIGIT_RUN_PATTERN = re.compile(r'\d+(?:\.\d+)?')
+
+
+def parse_korean_number(token: str) -> Optional[int]:
+    """
+    아라비아 숫자와 한글 숫자/단위가 섞인 수 표현을 정수로 변환
+    
+    예: "삼백오십만" → 3500000, "3천5백만" → 35000000, "1억 2천만" → 120000000,
+    "1.5억" → 150000000, "3,000,000" → 3000000
+    
+    Args:
+        token: 수 표현
+    
+    Returns:
+        정수 값 (해석할 수 없으면 None)
+    """
+    token = token.replace(",", "").replace(" ", "")
+    if not token:
+        return None
+    
+    total = 0.0  # 만/억/조 단위로 확정된 값
+    section = 0.0  # 만 미만 구간 값
+    current: Optional[float] = None  # 단위가 붙기 전 숫자
+    index = 0
+    
+    while index < len(token):
+        char = token[index]
+        if char.isdigit():
+            match = _DIGIT_RUN_PATTERN.match(token, index)
+            current = float(match.group(0))
+            index = match.end()
+            continue
+        
+        value = KOREAN_NUMBER_MAPPING.get(char)
+        if value is None:
+            return None
+        
+        if value < 10:
+            current = value
+        elif value < 10000:
+            # 십/백/천: 앞 숫자가 없으면 1 (예: "백만" = 1 * 100 * 10000)
+            section += (current if current is not None else 1) * value
+            current = None
+        else:
+            # 만/억/조: 지금까지의 구간 값에 곱해 확정
+            section += current or 0
+            total += (section or 1) * value
+            section = 0.0
+            current = None
+        index += 1
+    
+    return int(round(total + section + (current or 0)))
+
+
+# ============================================================================
+# 날짜
+# ============================================================================
+
+_COUNT = rf'\d+|[{_KOREAN_DIGITS}십]+|{"|".join(sorted(_NATIVE_COUNTS, key=len, reverse=True))}'
+
+# 위치 순서대로 모든 날짜 표현을 찾는 단일 패턴 (같은 위치에서는 앞쪽 대안이 우선)
+_DATE_PATTERN = re.compile(
+    r'(?P<ymd_y>\d{4})\s*[.\-/]\s*(?P<ymd_m>\d{1,2})\s*[.\-/]\s*(?P<ymd_d>\d{1,2})(?!\d)'
+    r'|(?P<ky>\d{4})\s*년\s*(?P<km>\d{1,2})\s*월(?:\s*(?P<kd>\d{1,2})\s*일)?'
+    r'|(?P<yw>재작년|작년|지난해|올해|금년|내년)\s*(?P<yw_m>\d{1,2})\s*월(?:\s*(?P<yw_d>\d{1,2})\s*일)?'
+    r'|(?P<mw>지난\s*달|저번\s*달|이번\s*달|다음\s*달)(?:\s*(?P<mw_d>\d{1,2})\s*일)?'
+    r'|(?P<ww>지난\s*주|저번\s*주|이번\s*주|다음\s*주)'
+    rf'|(?P<rel_n>{_COUNT})\s*(?P<rel_unit>주일|주|개월|달|년|일)\s*(?P<rel_dir>전|후|뒤)'
+    rf'|(?P<dcw>{"|".join(_DAY_COUNT_WORDS)})\s*(?P<dcw_dir>전|후|뒤)'
+    r'|(?P<dw>그저께|그제|어제|오늘|내일|모레)'
+    r'|(?<!\d)(?P<m>\d{1,2})\s*월(?:\s*(?P<d>\d{1,2})\s*일)?'
+    r'|(?P<yw_only>재작년|작년|지난해|올해|금년|내년)'
+    r'|(?P<y_only>\d{4})\s*년'
+)
+
+# 두 날짜 표현 사이가 기간 구분자인지 확인 (예: "부터", "~", "에서")
+_DATE_RANGE_GAP_PATTERN = re.compile(r'\s*(?:부터|에서|[~∼〜\-–])\s*(?:[~∼〜\-–]\s*)?')
+
+# 같은 달의 종료일만 적은 기간 (예: "3월 1일~15일")
+_DATE_RANGE_DAY_END_PATTERN = re.compile(r'\s*(?:부터|에서|[~∼〜\-–])\s*(?P<day>\d{1,2})\s*일')
+
+_VAGUE_DATE_PATTERN = re.compile(r'얼마\s*전|최근|요즘|몇\s*(?:일|주|달|개월|년)|예전|옛날|오래\s*전|언젠가')
+
+_YEAR_OFFSETS: Dict[str, int] = {
+    "재작년": -2, "작년": -1, "지난해": -1, "올해": 0, "금년": 0, "내년": 1
+}
+
+_MONTH_OFFSETS: Dict[str, int] = {"지난": -1, "저번": -1, "이번": 0, "다음": 1}
+
+_DAY_WORD_OFFSETS: Dict[str, int] = {
+    "그저께": -2, "그제": -2, "어제": -1, "오늘": 0, "내일": 1, "모레": 2
+}
+
+# 상대 기간 단위별 일수 (기존 계산 방식과 동일하게 1개월=30일, 1년=365일)
+_RELATIVE_UNIT_DAYS: Dict[str, int] = {
+    "일": 1, "주": 7, "주일": 7, "개월": 30, "달": 30, "년": 365
+}
+
+
+@dataclass
+class _DateMention:
+    """날짜 표현 한 건"""
+    date: Optional[datetime]
+    is_month_only: bool
+    start: int
+    end: int
+    fallback_reason: Optional[FallbackReason] = None
+
+
+def _build_date(year: int, month: int, day: Optional[int], clamp_day: bool = False) -> Optional[datetime]:
+    """
+    날짜 생성 (월/일이 범위를 벗어나면 None)
+    
+    clamp_day가 True면 말일을 넘는 일을 말일로 조정합니다. 월을 기준 시각에서 계산하는
+    상대 표현("지난달 31일")에만 사용하고, 월을 직접 적은 "3월 32일"은 존재하지 않는 날짜로 봅니다.
+    """
+    if not 1 <= month <= 12:
+        return None
+    if day is None:
+        return datetime(year, month, 1)
+    last_day = monthrange(year, month)[1]
+    if day < 1 or (day > last_day and not clamp_day):
+        return None
+    return datetime(year, month, min(day, last_day))
+
+
+def _shift_month(now: datetime, offset: int) -> Tuple[int, int]:
+    """현재 월에서 offset개월 이동한 (연, 월)"""
+    month_index = now.year * 12 + (now.month - 1) + offset
+    return month_index // 12, month_index % 12 + 1
+
+
+def _parse_count(token: str) -> Optional[int]:
+    """상대 날짜의 수량 해석 (아라비아 숫자, 한자어/고유어 수사)"""
+    if token in _NATIVE_COUNTS:
+        return _NATIVE_COUNTS[token]
+    return parse_korean_number(token)
+
+
+def _to_mention(match: "re.Match", now: datetime) -> _DateMention:
+    """정규식 매치를 날짜 표현으로 변환"""
+    groups = match.groupdict()
+    date: Optional[datetime] = None
+    is_month_only = False
+    
+    if groups["ymd_y"]:
+        date = _build_date(int(groups["ymd_y"]), int(groups["ymd_m"]), int(groups["ymd_d"]))
+    
+    elif groups["ky"]:
+        is_month_only = groups["kd"] is None
+        date = _build_date(int(groups["ky"]), int(groups["km"]), int(groups["kd"]) if groups["kd"] else None)
+    
+    elif groups["yw"]:
+        is_month_only = groups["yw_d"] is None
+        year = now.year + _YEAR_OFFSETS[groups["yw"]]
+        date = _build_date(year, int(groups["yw_m"]), int(groups["yw_d"]) if groups["yw_d"] else None)
+    
+    elif groups["mw"]:
+        is_month_only = groups["mw_d"] is None
+        year, month = _shift_month(now, _MONTH_OFFSETS[groups["mw"][:2]])
+        date = _build_date(year, month, int(groups["mw_d"]) if groups["mw_d"] else None, clamp_day=True)
+    
+    elif groups["ww"]:
+        date = now + timedelta(days=7 * _MONTH_OFFSETS[groups["ww"][:2]])
+    
+    elif groups["rel_n"]:
+        count = _parse_count(groups["rel_n"])
+        if count is not None:
+            days = count * _RELATIVE_UNIT_DAYS[groups["rel_unit"]]
+            date = now - timedelta(days=days) if groups["rel_dir"] == "전" else now + timedelta(days=days)
+    
+    elif groups["dcw"]:
+        days = _DAY_COUNT_WORDS[groups["dcw"]]
+        date = now - timedelta(days=days) if groups["dcw_dir"] == "전" else now + timedelta(days=days)
+    
+    elif groups["dw"]:
+        date = now + timedelta(days=_DAY_WORD_OFFSETS[groups["dw"]])
+    
+    elif groups["m"]:
+        is_month_only = groups["d"] is None
+        date = _build_date(now.year, int(groups["m"]), int(groups["d"]) if groups["d"] else None)
+    
+    else:
+        # 연도만 언급된 경우 날짜를 특정할 수 없음
+        return _DateMention(None, False, match.start(), match.end(), FallbackReason.YEAR_ONLY)
+    
+    if date is None:
+        return _DateMention(None, False, match.start(), match.end(), FallbackReason.INVALID_DATE)
+    return _DateMention(date, is_month_only, match.start(), match.end())
+
+
+def _range_end(text: str, mentions: List[_DateMention], index: int) -> Optional[str]:
+    """
+    index번째 날짜 표현이 기간의 시작이면 종료일 반환
+    
+    종료일이 월 단위("5월까지")면 해당 월의 말일을 사용합니다.
+    """
+    start = mentions[index]
+    if index + 1 < len(mentions) and mentions[index + 1].date is not None:
+        end = mentions[index + 1]
+        if _DATE_RANGE_GAP_PATTERN.fullmatch(text, start.end, end.start):
+            end_date = end.date
+            if end.is_month_only:
+                end_date = end_date.replace(day=monthrange(end_date.year, end_date.month)[1])
+            return end_date.strftime("%Y-%m-%d")
+    
+    day_end = _DATE_RANGE_DAY_END_PATTERN.match(text, start.end)
+    if day_end and not start.is_month_only:
+        end_date = _build_date(start.date.year, start.date.month, int(day_end.group("day")))
+        if end_date is not None:
+            return end_date.strftime("%Y-%m-%d")
+    return None
+
+
+def match_date(text: str, now: Optional[datetime] = None) -> PatternMatch:
+    """
+    텍스트에서 첫 번째 날짜(기간이면 시작일과 종료일) 추출
+    
+    Args:
+        text: 입력 텍스트
+        now: 상대 날짜 기준 시각 (None이면 현재 KST)
+    
+    Returns:
+        PatternMatch (value: YYYY-MM-DD, range_end: 기간 종료일)
+    """
+    if not text:
+        return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
+    
+    now = now or get_kst_now()
+    mentions = [_to_mention(match, now) for match in _DATE_PATTERN.finditer(text)]
+    
+    for index, mention in enumerate(mentions):
+        if mention.date is not None:
+            return PatternMatch(
+                value=mention.date.strftime("%Y-%m-%d"),
+                range_end=_range_end(text, mentions, index)
+            )
+    
+    if mentions:
+        return PatternMatch(fallback_reason=mentions[0].fallback_reason)
+    if _VAGUE_DATE_PATTERN.search(text):
+        return PatternMatch(fallback_reason=FallbackReason.VAGUE)
+    return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
+
+
+# ============================================================================
+# 금액
+# ============================================================================
+
+# 숫자 덩어리: 아라비아 숫자(+단위) 또는 한글 숫자/단위 연속, 단위(십~조) 뒤에는 공백 허용
+# ("1억 2천만", "삼십 만원", "천 오백만원"은 이어 붙여 하나의 수로 해석)
+_AMOUNT_SEGMENT = rf'(?:\d[\d,]*(?:\.\d+)?(?:\s?[십백천만억조]+)?|[{_KOREAN_NUMERALS}]+)'
+_AMOUNT_PATTERN = re.compile(
+    rf'(?P<number>{_AMOUNT_SEGMENT}(?:(?:(?<=[십백천만억조])\s+)?{_AMOUNT_SEGMENT})*)\s*(?P<won>원)?'
+)
+_HANGUL_SYLLABLE_PATTERN = re.compile(r'[가-힣]')
+_VAGUE_AMOUNT_PATTERN = re.compile(r'몇\s*[십백천만억]|수\s*[십백천]?\s*만|수\s*억|얼마')
+
+# 단위와 띄어 쓴 한 글자 한글 숫자 ("이 백만원"의 "이"는 지시어일 수도 있음)
+_SPLIT_NUMERAL_PATTERN = re.compile(rf'(?<![가-힣])[{_KOREAN_DIGITS}]\s+$')
+
+# 억/조 뒤 마지막 구간이 십/백/천으로 끝나 "만"이 생략된 것으로 보이는 표현 ("1억 5천")
+_ELIDED_UNIT_PATTERN = re.compile(r'[억조][^만억조]*[십백천]\s*$')
+
+
+def _accept_amount_token(match: "re.Match", text: str) -> Optional[str]:
+    """
+    금액 후보 검증 후 해석할 수 표현 반환 (금액이 아니면 None)
+    
+    - 억/조로 시작하는 표현은 금액으로 보지 않습니다 ("조사", "억지").
+    - "원"이 붙으면 금액으로 인정하되, 한글로만 된 표현은 단위(십~조)가 있어야 합니다 ("사원" 제외).
+    - "원"이 없으면 끝에 붙은 한글 숫자는 조사로 보고 제거합니다 ("1억이 넘는" → "1억").
+      아라비아 숫자는 천/만/억/조 단위가 있어야 하고, 한글로만 된 표현은 "삼백오십만"처럼
+      만/억/조로 끝나며 뒤에 한글이 이어지지 않아야 합니다 ("천만에요", "일만 했어요" 제외).
+    """
+    token = match.group("number")
+    has_won = match.group("won") is not None
+    if not has_won:
+        token = token.rstrip(_KOREAN_DIGITS + " ")
+    if not token or token[0] in "억조":
+        return None
+    
+    has_digit = any(char.isdigit() for char in token)
+    if has_won:
+        return token if has_digit or any(char in "십백천만억조" for char in token) else None
+    
+    if has_digit:
+        return token if any(char in "천만억조" for char in token) else None
+    
+    following = text[match.start("number") + len(token):][:1]
+    if (
+        len(token) >= 2
+        and token[-1] in "만억조"
+        and (token[-1] != "만" or any(char in "십백천" for char in token))
+        and not _HANGUL_SYLLABLE_PATTERN.match(following)
+    ):
+        return token
+    return None
+
+
+def match_amount(text: str) -> PatternMatch:
+    """
+    텍스트에서 첫 번째 금액(원 단위) 추출
+    
+    Args:
+        text: 입력 텍스트
+    
+    Returns:
+        PatternMatch (value: 정수 금액, "이 백만원"/"1억 5천"처럼 모호하면 fallback_reason=VAGUE)
+    """
+    if not text:
+        return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
+    
+    for match in _AMOUNT_PATTERN.finditer(text):
+        if match.start() > 0 and text[match.start() - 1] in "몇수":
+            # "몇백만원", "수천만원" 같은 어림수는 금액으로 확정하지 않음
+            continue
+        token = _accept_amount_token(match, text)
+        if token is None:
+            continue
+        split_numeral = token[0] in "십백천만억조" and _SPLIT_NUMERAL_PATTERN.search(text, 0, match.start())
+        if split_numeral or _ELIDED_UNIT_PATTERN.search(token):
+            # 숫자와 단위가 떨어져 있거나 단위가 생략되어 금액을 확정할 수 없음
+            return PatternMatch(fallback_reason=FallbackReason.VAGUE)
+        amount = parse_korean_number(token)
+        if amount:
+            return PatternMatch(value=amount)
+    
+    if _VAGUE_AMOUNT_PATTERN.search(text):
+        return PatternMatch(fallback_reason=FallbackReason.VAGUE)
+    return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
+
+
+# ============================================================================
+# 상대방
+# ============================================================================
+
+_COUNTERPARTY_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in sorted(COUNTERPARTY_RELATIONSHIP_KEYWORDS, key=len, reverse=True))
+)
+
+# "홍길동 씨", "김철수씨" 형태의 이름 ("님"은 "사장님" 같은 호칭과 구분되지 않아 제외)
+_PERSON_NAME_PATTERN = re.compile(r'(?<![가-힣])(?P<name>[가-힣]{2,4})\s*씨')
+_NON_NAME_WORDS = {"아저", "아가", "마음"}
+
+
+def match_counterparty(text: str) -> PatternMatch:
+    """
+    텍스트에서 상대방 관계/이름 추출
+    
+    Args:
+        text: 입력 텍스트
+    
+    Returns:
+        PatternMatch (value: extract_party와 같은 형태의 당사자 딕셔너리)
+    """
+    relationship = _COUNTERPARTY_PATTERN.search(text or "")
+    name = next(
+        (match for match in _PERSON_NAME_PATTERN.finditer(text or "") if match.group("name") not in _NON_NAME_WORDS),
+        None
+    )
+    if relationship is None and name is None:
+        return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
+    
+    keyword = relationship.group(0) if relationship else None
+    return PatternMatch(value={
+        "name": name.group("name") if name else None,
+        "role": PARTY_ROLES["COUNTERPARTY"],
+        "type": COUNTERPARTY_RELATIONSHIP_KEYWORDS.get(keyword, "개인"),
+        "relationship": keyword
+    })
+
+
+# ============================================================================
+# 증거
+# ============================================================================
+
+# 증거 타입 키워드 (EVIDENCE_TYPE_KEYWORDS 순서 유지, 단어 경계 매칭)
+_EVIDENCE_TYPE_PATTERNS: List[Tuple["re.Pattern", str]] = [
+    (re.compile(r'\b' + re.escape(keyword) + r'\b'), evidence_type)
+    for keyword, evidence_type in EVIDENCE_TYPE_KEYWORDS.items()
+]
+
+
+# 증거 긍정 키워드 (단어 경계 매칭, 하나라도 있으면 증거 있음)
+_EVIDENCE_POSITIVE_PATTERN = re.compile(
+    r'\b(?:' + "|".join(re.escape(keyword) for keyword in EVIDENCE_KEYWORDS_POSITIVE) + r')\b'
+)
+
+
+def has_evidence_keyword(text: str) -> bool:
+    """
+    텍스트에 증거 긍정 키워드(EVIDENCE_KEYWORDS_POSITIVE)가 있는지 확인
+    
+    Args:
+        text: 입력 텍스트 (소문자 변환은 호출 측에서 수행)
+    
+    Returns:
+        키워드 포함 여부
+    """
+    return _EVIDENCE_POSITIVE_PATTERN.search(text or "") is not None
+
+
+def match_evidence_type(text: str) -> PatternMatch:
+    """
+    텍스트에서 증거 타입 추출 (EVIDENCE_TYPE_KEYWORDS 정의 순서 우선)
+    
+    Args:
+        text: 입력 텍스트 (소문자 변환은 호출 측에서 수행)
+    
+    Returns:
+        PatternMatch (value: 증거 타입)
+    """
+    for pattern, evidence_type in _EVIDENCE_TYPE_PATTERNS:
+        if pattern.search(text or ""):
+            return PatternMatch(value=evidence_type)
+    return PatternMatch(fallback_reason=FallbackReason.NO_MATCH)
@@ -1,29 +1,32 @@
 """
 GPT API 응답 캐싱 모듈
 동일한 프롬프트에 대한 중복 호출 방지
+
+백엔드는 GPT_CACHE_BACKEND 설정으로 선택합니다.
+- memory: 프로세스 내 LRU 캐시 (기본값)
+- sqlite: 로컬 SQLite(WAL) 파일 캐시 (uvicorn 워커 간 공유, 재시작 후에도 유지)
+
+메모리 캐시는 항목 수/바이트 크기 상한을 넘으면 가장 오래 사용되지 않은 항목(LRU)부터
+제거합니다. TTL이 모든 항목에 동일하므로 저장 순서가 곧 만료 순서이며, 만료 항목은
+저장 순서 큐의 앞쪽에서만 제거하여 전체 스캔 없이 정리합니다.
 """
+from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from pathlib import Path
 import hashlib
 import json
+import sqlite3
+import threading
+import time
+from config.settings import settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class GPTCache:
-    """GPT API 응답 캐시 클래스"""
-    
-    def __init__(self, ttl_seconds: int = 3600):
-        """
-        GPT 캐시 초기화
-        
-        Args:
-            ttl_seconds: 캐시 유효 시간 (초, 기본값: 1시간)
-        """
-        self.cache: Dict[str, Dict[str, Any]] = {}
-        self.ttl_seconds = ttl_seconds
-        logger.info(f"GPT 캐시 초기화: TTL={ttl_seconds}초")
+class GPTCacheBackend(ABC):
+    """GPT 응답 캐시 백엔드 추상 클래스 (캐시 키/크기 계산 공통, 조회/저장/삭제/통계는 백엔드가 구현)"""
     
     def _generate_key(self, messages: list, model: str, **kwargs) -> str:
         """
@@ -51,6 +54,105 @@ class GPTCache:
         
         return cache_key
     
+    @staticmethod
+    def _estimate_size(response: Dict[str, Any]) -> int:
+        """응답 크기 추정 (JSON 직렬화 바이트 수)"""
+        return len(json.dumps(response, ensure_ascii=False, default=str).encode('utf-8'))
+    
+    @abstractmethod
+    def get(self, messages: list, model: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """캐시에서 응답 조회"""
+    
+    @abstractmethod
+    def set(self, messages: list, model: str, response: Dict[str, Any], **kwargs):
+        """캐시에 응답 저장"""
+    
+    @abstractmethod
+    def clear(self) -> int:
+        """캐시 전체 삭제"""
+    
+    @abstractmethod
+    def clear_expired(self) -> int:
+        """만료된 캐시만 삭제"""
+    
+    @abstractmethod
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+
+
+class GPTCache(GPTCacheBackend):
+    """GPT API 응답 캐시 클래스 (메모리 LRU, 스레드 안전)"""
+    
+    def __init__(
+        self,
+        ttl_seconds: int = 3600,
+        max_entries: int = 1000,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        """
+        GPT 캐시 초기화
+        
+        Args:
+            ttl_seconds: 캐시 유효 시간 (초, 기본값: 1시간)
+            max_entries: 최대 항목 수
+            max_bytes: 최대 캐시 크기 (바이트, 응답 JSON 직렬화 크기 기준)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        
+        # LRU 순서 (마지막이 가장 최근 사용): {key: {"response", "size", "expires_at"}}
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # 만료 순서 (저장 순서와 동일): {key: expires_at}
+        self._expiry: "OrderedDict[str, float]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        
+        # 메트릭
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        
+        logger.info(
+            f"GPT 캐시 초기화: TTL={ttl_seconds}초, max_entries={self.max_entries}, "
+            f"max_bytes={self.max_bytes}"
+        )
+    
+    def _remove(self, cache_key: str):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        item = self.cache.pop(cache_key, None)
+        self._expiry.pop(cache_key, None)
+        if item is not None:
+            self._total_bytes -= item["size"]
+    
+    def _purge_expired(self, now: float) -> int:
+        """
+        만료 항목 제거 (lock 보유 상태에서 호출)
+        
+        만료 순서 큐의 앞쪽에서 만료되지 않은 항목을 만나면 중단합니다.
+        
+        Returns:
+            제거된 항목 수
+        """
+        removed = 0
+        while self._expiry:
+            cache_key, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                break
+            self._remove(cache_key)
+            removed += 1
+        self._expirations += removed
+        return removed
+    
+    def _evict_overflow(self):
+        """항목 수/크기 상한 초과 시 LRU 항목 제거 (lock 보유 상태에서 호출)"""
+        while self.cache and (len(self.cache) > self.max_entries or self._total_bytes > self.max_bytes):
+            cache_key = next(iter(self.cache))
+            self._remove(cache_key)
+            self._evictions += 1
+    
     def get(self, messages: list, model: str, **kwargs) -> Optional[Dict[str, Any]]:
         """
         캐시에서 응답 조회
@@ -65,18 +167,17 @@ class GPTCache:
         """
         cache_key = self._generate_key(messages, model, **kwargs)
         
-        if cache_key in self.cache:
-            cached_item = self.cache[cache_key]
-            cached_time = cached_item["timestamp"]
+        with self._lock:
+            self._purge_expired(time.monotonic())
             
-            # TTL 확인
-            if datetime.now() - cached_time < timedelta(seconds=self.ttl_seconds):
+            item = self.cache.get(cache_key)
+            if item is not None:
+                self.cache.move_to_end(cache_key)
+                self._hits += 1
                 logger.debug(f"GPT 캐시 히트: key={cache_key[:8]}...")
-                return cached_item["response"]
-            else:
-                # 만료된 캐시 제거
-                del self.cache[cache_key]
-                logger.debug(f"GPT 캐시 만료: key={cache_key[:8]}...")
+                return item["response"]
+            
+            self._misses += 1
         
         logger.debug(f"GPT 캐시 미스: key={cache_key[:8]}...")
         return None
@@ -92,35 +193,55 @@ class GPTCache:
             **kwargs: 추가 파라미터
         """
         cache_key = self._generate_key(messages, model, **kwargs)
+        size = self._estimate_size(response)
         
-        self.cache[cache_key] = {
-            "response": response,
-            "timestamp": datetime.now()
-        }
+        with self._lock:
+            if size > self.max_bytes:
+                self._rejected += 1
+                logger.debug(f"GPT 캐시 저장 생략 (크기 초과): key={cache_key[:8]}..., size={size}")
+                return
+            
+            now = time.monotonic()
+            self._purge_expired(now)
+            self._remove(cache_key)
+            
+            expires_at = now + self.ttl_seconds
+            self.cache[cache_key] = {
+                "response": response,
+                "size": size,
+                "expires_at": expires_at
+            }
+            self._expiry[cache_key] = expires_at
+            self._total_bytes += size
+            
+            self._evict_overflow()
         
         logger.debug(f"GPT 캐시 저장: key={cache_key[:8]}...")
     
-    def clear(self):
-        """캐시 전체 삭제"""
-        count = len(self.cache)
-        self.cache.clear()
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            count = len(self.cache)
+            self.cache.clear()
+            self._expiry.clear()
+            self._total_bytes = 0
         logger.info(f"GPT 캐시 전체 삭제: {count}개 항목")
+        return count
     
     def clear_expired(self):
         """만료된 캐시만 삭제"""
-        now = datetime.now()
-        expired_keys = [
-            key for key, item in self.cache.items()
-            if now - item["timestamp"] >= timedelta(seconds=self.ttl_seconds)
-        ]
-        
-        for key in expired_keys:
-            del self.cache[key]
+        with self._lock:
+            removed = self._purge_expired(time.monotonic())
         
-        if expired_keys:
-            logger.info(f"GPT 캐시 만료 항목 삭제: {len(expired_keys)}개")
+        if removed:
+            logger.info(f"GPT 캐시 만료 항목 삭제: {removed}개")
         
-        return len(expired_keys)
+        return removed
     
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -129,21 +250,340 @@ class GPTCache:
         Returns:
             통계 딕셔너리
         """
-        now = datetime.now()
-        total_count = len(self.cache)
-        expired_count = sum(
-            1 for item in self.cache.values()
-            if now - item["timestamp"] >= timedelta(seconds=self.ttl_seconds)
+        with self._lock:
+            self._purge_expired(time.monotonic())
+            lookups = self._hits + self._misses
+            
+            return {
+                "backend": "memory",
+                "total_entries": len(self.cache),
+                "total_bytes": self._total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected": self._rejected
+            }
+
+
+class SQLiteGPTCache(GPTCacheBackend):
+    """
+    GPT API 응답 캐시 클래스 (SQLite/WAL 파일 백엔드)
+    
+    같은 파일을 여러 uvicorn 워커가 공유하므로 한 워커의 응답을 다른 워커도 재사용하고,
+    재시작 후에도 캐시가 유지됩니다. 연결은 스레드별로 생성합니다.
+    히트/미스 카운터는 프로세스별 값이며, 항목 수/크기는 파일 전체 기준입니다.
+    """
+    
+    # 조회 시 last_access 갱신 최소 간격 (초) - 히트마다 쓰기 잠금을 잡지 않도록 제한
+    TOUCH_INTERVAL_SECONDS = 60
+    
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: int = 3600,
+        max_entries: int = 1000,
+        max_bytes: int = 50 * 1024 * 1024,
+        compact_every: int = 100
+    ):
+        """
+        SQLite 캐시 초기화
+        
+        Args:
+            db_path: SQLite 파일 경로
+            ttl_seconds: 캐시 유효 시간 (초)
+            max_entries: 최대 항목 수 (압축 시 적용)
+            max_bytes: 최대 캐시 크기 (바이트, 압축 시 적용)
+            compact_every: 저장 N회마다 압축(만료/상한 초과 항목 삭제) 수행
+        """
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(1, max_bytes)
+        self.compact_every = max(1, compact_every)
+        
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sets_since_compaction = 0
+        
+        # 메트릭 (프로세스별)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._rejected = 0
+        
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS gpt_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_gpt_cache_expires_at ON gpt_cache (expires_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_gpt_cache_last_access ON gpt_cache (last_access)")
+        
+        logger.info(
+            f"GPT 캐시 초기화 (SQLite): path={db_path}, TTL={ttl_seconds}초, "
+            f"max_entries={self.max_entries}, max_bytes={self.max_bytes}"
         )
+    
+    def _connect(self) -> sqlite3.Connection:
+        """현재 스레드의 SQLite 연결 반환 (최초 사용 시 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+    
+    def get(self, messages: list, model: str, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        캐시에서 응답 조회
         
-        return {
-            "total_entries": total_count,
-            "expired_entries": expired_count,
-            "active_entries": total_count - expired_count,
-            "ttl_seconds": self.ttl_seconds
-        }
+        Args:
+            messages: 메시지 리스트
+            model: 모델명
+            **kwargs: 추가 파라미터
+        
+        Returns:
+            캐시된 응답 또는 None
+        """
+        cache_key = self._generate_key(messages, model, **kwargs)
+        now = time.time()
+        
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, expires_at, last_access FROM gpt_cache WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            
+            if row is not None and row[1] > now:
+                if now - row[2] >= self.TOUCH_INTERVAL_SECONDS:
+                    with conn:
+                        conn.execute(
+                            "UPDATE gpt_cache SET last_access = ? WHERE cache_key = ?",
+                            (now, cache_key)
+                        )
+                with self._lock:
+                    self._hits += 1
+                logger.debug(f"GPT 캐시 히트 (SQLite): key={cache_key[:8]}...")
+                return json.loads(row[0])
+        
+        except sqlite3.Error as e:
+            # 캐시 장애는 API 호출로 대체 (요청 실패로 이어지지 않도록)
+            logger.warning(f"GPT 캐시 조회 실패 (SQLite): {str(e)}")
+        
+        with self._lock:
+            self._misses += 1
+        logger.debug(f"GPT 캐시 미스 (SQLite): key={cache_key[:8]}...")
+        return None
+    
+    def set(self, messages: list, model: str, response: Dict[str, Any], **kwargs):
+        """
+        캐시에 응답 저장
+        
+        Args:
+            messages: 메시지 리스트
+            model: 모델명
+            response: API 응답
+            **kwargs: 추가 파라미터
+        """
+        cache_key = self._generate_key(messages, model, **kwargs)
+        payload = json.dumps(response, ensure_ascii=False, default=str)
+        size = len(payload.encode('utf-8'))
+        
+        if size > self.max_bytes:
+            with self._lock:
+                self._rejected += 1
+            logger.debug(f"GPT 캐시 저장 생략 (크기 초과): key={cache_key[:8]}..., size={size}")
+            return
+        
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO gpt_cache (cache_key, response, size, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (cache_key, payload, size, now + self.ttl_seconds, now)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"GPT 캐시 저장 실패 (SQLite): {str(e)}")
+            return
+        
+        logger.debug(f"GPT 캐시 저장 (SQLite): key={cache_key[:8]}...")
+        
+        with self._lock:
+            self._sets_since_compaction += 1
+            should_compact = self._sets_since_compaction >= self.compact_every
+            if should_compact:
+                self._sets_since_compaction = 0
+        if should_compact:
+            self.compact()
+    
+    def compact(self) -> Dict[str, int]:
+        """
+        만료 항목 삭제 후 항목 수/크기 상한을 넘는 항목을 last_access 오래된 순으로 삭제
+        
+        Returns:
+            {"expired": 만료 삭제 수, "evicted": 상한 초과 삭제 수}
+        """
+        now = time.time()
+        try:
+            conn = self._connect()
+            with conn:
+                expired = conn.execute("DELETE FROM gpt_cache WHERE expires_at <= ?", (now,)).rowcount
+                
+                # 항목 수 상한 초과분 삭제
+                evicted = conn.execute(
+                    "DELETE FROM gpt_cache WHERE cache_key IN ("
+                    "  SELECT cache_key FROM gpt_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?"
+                    ")",
+                    (self.max_entries,)
+                ).rowcount
+                
+                # 크기 상한 초과분 삭제 (최근 사용 순 누적 크기가 상한을 넘는 항목)
+                evicted += conn.execute(
+                    "DELETE FROM gpt_cache WHERE cache_key IN ("
+                    "  SELECT cache_key FROM ("
+                    "    SELECT cache_key, SUM(size) OVER (ORDER BY last_access DESC, cache_key) AS cumulative"
+                    "    FROM gpt_cache"
+                    "  ) WHERE cumulative > ?"
+                    ")",
+                    (self.max_bytes,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"GPT 캐시 압축 실패 (SQLite): {str(e)}")
+            return {"expired": 0, "evicted": 0}
+        
+        with self._lock:
+            self._expirations += expired
+            self._evictions += evicted
+        
+        if expired or evicted:
+            logger.info(f"GPT 캐시 압축 (SQLite): 만료 {expired}개, 상한 초과 {evicted}개 삭제")
+        return {"expired": expired, "evicted": evicted}
+    
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            삭제된 항목 수
+        """
+        try:
+            conn = self._connect()
+            with conn:
+                count = conn.execute("DELETE FROM gpt_cache").rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"GPT 캐시 전체 삭제 실패 (SQLite): {str(e)}")
+            return 0
+        logger.info(f"GPT 캐시 전체 삭제 (SQLite): {count}개 항목")
+        return count
+    
+    def clear_expired(self) -> int:
+        """만료된 캐시만 삭제"""
+        try:
+            conn = self._connect()
+            with conn:
+                removed = conn.execute("DELETE FROM gpt_cache WHERE expires_at <= ?", (time.time(),)).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"GPT 캐시 만료 항목 삭제 실패 (SQLite): {str(e)}")
+            return 0
+        
+        with self._lock:
+            self._expirations += removed
+        
+        if removed:
+            logger.info(f"GPT 캐시 만료 항목 삭제 (SQLite): {removed}개")
+        
+        return removed
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+        
+        Returns:
+            통계 딕셔너리
+        """
+        try:
+            total_entries, total_bytes = self._connect().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM gpt_cache WHERE expires_at > ?",
+                (time.time(),)
+            ).fetchone()
+        except sqlite3.Error as e:
+            # 파일 통계를 읽지 못해도 프로세스별 카운터는 반환
+            logger.warning(f"GPT 캐시 통계 조회 실패 (SQLite): {str(e)}")
+            total_entries, total_bytes = None, None
+        
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "backend": "sqlite",
+                "path": self.db_path,
+                "total_entries": total_entries,
+                "total_bytes": total_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "rejected": self._rejected
+            }
 
 
-# 전역 GPT 캐시 인스턴스 (TTL: 1시간)
-gpt_cache = GPTCache(ttl_seconds=3600)
+def create_gpt_cache() -> GPTCacheBackend:
+    """
+    설정(GPT_CACHE_BACKEND)에 따라 캐시 백엔드 생성
+    
+    SQLite 파일을 열 수 없으면(잘못된 경로, 읽기 전용 파일 시스템 등) 모듈 import가 실패하지 않도록
+    오류를 기록하고 메모리 캐시를 사용합니다.
+    
+    Returns:
+        GPT 캐시 백엔드 인스턴스
+    
+    Raises:
+        ValueError: 지원하지 않는 백엔드인 경우
+    """
+    backend = settings.gpt_cache_backend
+    if backend not in ("memory", "sqlite"):
+        raise ValueError(f"지원하지 않는 GPT 캐시 백엔드: {backend}")
+    
+    if backend == "sqlite":
+        try:
+            return SQLiteGPTCache(
+                db_path=settings.gpt_cache_sqlite_path,
+                ttl_seconds=settings.gpt_cache_ttl_seconds,
+                max_entries=settings.gpt_cache_max_entries,
+                max_bytes=settings.gpt_cache_max_bytes
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.error(
+                f"SQLite GPT 캐시 생성 실패, 메모리 캐시 사용: {settings.gpt_cache_sqlite_path} - {str(e)}"
+            )
+    
+    return GPTCache(
+        ttl_seconds=settings.gpt_cache_ttl_seconds,
+        max_entries=settings.gpt_cache_max_entries,
+        max_bytes=settings.gpt_cache_max_bytes
+    )
+
 
+# 전역 GPT 캐시 인스턴스
+gpt_cache = create_gpt_cache()
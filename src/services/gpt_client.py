@@ -2,8 +2,9 @@
 GPT API 클라이언트 모듈
 """
 import time
-from typing import List, Dict, Any, Optional
-from openai import OpenAI
+import asyncio
+from typing import List, Dict, Any, Optional, Callable
+from openai import OpenAI, AsyncOpenAI
 from openai import RateLimitError, APIError, APIConnectionError, APITimeoutError
 from config.settings import settings
 from src.utils.logger import get_logger
@@ -39,6 +40,7 @@ class GPTClient:
         self.retry_delay = retry_delay
         
         self.client = OpenAI(api_key=self.api_key)
+        self.async_client = AsyncOpenAI(api_key=self.api_key)
         logger.info(f"GPT 클라이언트 초기화 완료: 모델={self.model}")
     
     def _retry_with_backoff(self, func, *args, **kwargs):
@@ -87,6 +89,183 @@ class GPTClient:
             status_code=getattr(last_exception, 'status_code', None) if last_exception else None
         )
     
+    async def _retry_with_backoff_async(self, func, *args, **kwargs):
+        """
+        지수 백오프를 사용한 재시도 로직 (비동기)
+        
+        대기 중 이벤트 루프를 블로킹하지 않도록 asyncio.sleep을 사용합니다.
+        
+        Args:
+            func: 실행할 코루틴 함수
+            *args, **kwargs: 함수 인자
+        
+        Returns:
+            함수 실행 결과
+        """
+        last_exception = None
+        
+        for attempt in range(self.max_retries):
+            try:
+                return await func(*args, **kwargs)
+            
+            except RateLimitError as e:
+                wait_time = self.retry_delay * (2 ** attempt)
+                logger.warning(
+                    f"Rate Limit 오류 (시도 {attempt + 1}/{self.max_retries}), "
+                    f"{wait_time}초 대기 후 재시도..."
+                )
+                await asyncio.sleep(wait_time)
+                last_exception = e
+            
+            except (APIConnectionError, APITimeoutError) as e:
+                wait_time = self.retry_delay * (2 ** attempt)
+                logger.warning(
+                    f"연결 오류 (시도 {attempt + 1}/{self.max_retries}), "
+                    f"{wait_time}초 대기 후 재시도..."
+                )
+                await asyncio.sleep(wait_time)
+                last_exception = e
+            
+            except APIError as e:
+                # 재시도 불가능한 오류
+                logger.error(f"GPT API 오류: {str(e)}")
+                raise GPTAPIError(f"API 오류: {str(e)}", status_code=getattr(e, 'status_code', None))
+        
+        # 모든 재시도 실패
+        raise GPTAPIError(
+            f"최대 재시도 횟수 초과: {str(last_exception)}",
+            status_code=getattr(last_exception, 'status_code', None) if last_exception else None
+        )
+    
+    def _build_result(
+        self,
+        response,
+        session_id: Optional[str] = None,
+        node_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Chat Completion 응답을 결과 딕셔너리로 변환하고 비용 추적
+        
+        Args:
+            response: OpenAI Chat Completion 응답 객체
+            session_id: 세션 ID (비용 추적용, 선택적)
+            node_name: 노드 이름 (비용 추적용, 선택적)
+        
+        Returns:
+            결과 딕셔너리
+        """
+        result = {
+            "content": response.choices[0].message.content,
+            "role": response.choices[0].message.role,
+            "usage": {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "completion_tokens": response.usage.completion_tokens,
+                "total_tokens": response.usage.total_tokens
+            },
+            "model": response.model,
+            "finish_reason": response.choices[0].finish_reason
+        }
+        
+        self._track_cost(result, session_id=session_id, node_name=node_name)
+        return result
+    
+    def _track_cost(
+        self,
+        result: Dict[str, Any],
+        session_id: Optional[str] = None,
+        node_name: Optional[str] = None
+    ):
+        """
+        결과 딕셔너리의 토큰 사용량으로 비용 추적 (session_id가 있는 경우만)
+        
+        Args:
+            result: 결과 딕셔너리 (usage, model 포함)
+            session_id: 세션 ID
+            node_name: 노드 이름
+        """
+        if not session_id:
+            return
+        
+        cost_info = cost_tracker.track_api_call(
+            session_id=session_id,
+            model=result["model"],
+            prompt_tokens=result["usage"]["prompt_tokens"],
+            completion_tokens=result["usage"]["completion_tokens"],
+            node_name=node_name
+        )
+        result["cost"] = cost_info["cost"]
+        result["cost_info"] = cost_info
+    
+    def _get_cached(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        session_id: Optional[str],
+        node_name: Optional[str],
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회 (캐싱이 비활성화된 경우 None)
+        """
+        if not getattr(settings, 'gpt_cache_enabled', False):
+            return None
+        
+        cached_response = gpt_cache.get(messages, self.model, temperature=temperature, max_tokens=max_tokens, **kwargs)
+        if cached_response:
+            logger.debug("GPT API 캐시에서 응답 반환")
+            # 캐시된 응답에도 비용 추적 적용 (실제 API 호출은 없지만 통계용)
+            if session_id:
+                # 캐시 히트는 비용이 0이지만 통계에는 기록
+                logger.debug(f"캐시 히트: session_id={session_id}, node={node_name}")
+        return cached_response
+    
+    def _set_cached(
+        self,
+        messages: List[Dict[str, str]],
+        result: Dict[str, Any],
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ):
+        """
+        응답 캐시 저장 (캐싱이 활성화된 경우)
+        """
+        if getattr(settings, 'gpt_cache_enabled', False):
+            gpt_cache.set(messages, self.model, result, temperature=temperature, max_tokens=max_tokens, **kwargs)
+    
+    async def _get_cached_async(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        session_id: Optional[str],
+        node_name: Optional[str],
+        **kwargs
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 응답 조회 (비동기, SQLite 백엔드의 파일 I/O가 이벤트 루프를 막지 않도록 스레드에서 실행)
+        """
+        if not getattr(settings, 'gpt_cache_enabled', False):
+            return None
+        return await asyncio.to_thread(
+            self._get_cached, messages, temperature, max_tokens, session_id, node_name, **kwargs
+        )
+    
+    async def _set_cached_async(
+        self,
+        messages: List[Dict[str, str]],
+        result: Dict[str, Any],
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ):
+        """
+        응답 캐시 저장 (비동기, 스레드에서 실행)
+        """
+        if getattr(settings, 'gpt_cache_enabled', False):
+            await asyncio.to_thread(self._set_cached, messages, result, temperature, max_tokens, **kwargs)
+    
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -111,16 +290,9 @@ class GPTClient:
             API 응답 딕셔너리
         """
         # 캐시 확인 (캐싱이 활성화된 경우)
-        use_cache = getattr(settings, 'gpt_cache_enabled', False)
-        if use_cache:
-            cached_response = gpt_cache.get(messages, self.model, temperature=temperature, max_tokens=max_tokens, **kwargs)
-            if cached_response:
-                logger.debug("GPT API 캐시에서 응답 반환")
-                # 캐시된 응답에도 비용 추적 적용 (실제 API 호출은 없지만 통계용)
-                if session_id:
-                    # 캐시 히트는 비용이 0이지만 통계에는 기록
-                    logger.debug(f"캐시 히트: session_id={session_id}, node={node_name}")
-                return cached_response
+        cached_response = self._get_cached(messages, temperature, max_tokens, session_id, node_name, **kwargs)
+        if cached_response:
+            return cached_response
         
         def _call():
             return self.client.chat.completions.create(
@@ -135,33 +307,10 @@ class GPTClient:
             response = self._retry_with_backoff(_call)
             
             # 응답 파싱
-            result = {
-                "content": response.choices[0].message.content,
-                "role": response.choices[0].message.role,
-                "usage": {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens
-                },
-                "model": response.model,
-                "finish_reason": response.choices[0].finish_reason
-            }
-            
-            # 비용 추적 (session_id가 있는 경우만)
-            if session_id:
-                cost_info = cost_tracker.track_api_call(
-                    session_id=session_id,
-                    model=response.model,
-                    prompt_tokens=response.usage.prompt_tokens,
-                    completion_tokens=response.usage.completion_tokens,
-                    node_name=node_name
-                )
-                result["cost"] = cost_info["cost"]
-                result["cost_info"] = cost_info
+            result = self._build_result(response, session_id=session_id, node_name=node_name)
             
             # 캐시 저장 (캐싱이 활성화된 경우)
-            if use_cache:
-                gpt_cache.set(messages, self.model, result, temperature=temperature, max_tokens=max_tokens, **kwargs)
+            self._set_cached(messages, result, temperature, max_tokens, **kwargs)
             
             logger.debug(f"Chat Completion 성공: 토큰 사용량={result['usage']['total_tokens']}, 비용=${result.get('cost', 0):.6f}")
             return result
@@ -170,6 +319,150 @@ class GPTClient:
             logger.error(f"Chat Completion 실패: {str(e)}")
             raise
     
+    async def chat_completion_async(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        session_id: Optional[str] = None,
+        node_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Chat Completion API 호출 (비동기)
+        
+        AsyncOpenAI 클라이언트를 사용하므로 응답 대기 중에도 이벤트 루프가
+        다른 요청을 처리할 수 있습니다. 인자와 반환값은 chat_completion과 동일합니다.
+        
+        Args:
+            messages: 메시지 리스트
+            temperature: 온도 파라미터
+            max_tokens: 최대 토큰 수
+            session_id: 세션 ID (비용 추적용, 선택적)
+            node_name: 노드 이름 (비용 추적용, 선택적)
+            **kwargs: 추가 파라미터
+        
+        Returns:
+            API 응답 딕셔너리
+        """
+        cached_response = await self._get_cached_async(messages, temperature, max_tokens, session_id, node_name, **kwargs)
+        if cached_response:
+            return cached_response
+        
+        async def _call():
+            return await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+        
+        try:
+            response = await self._retry_with_backoff_async(_call)
+            
+            result = self._build_result(response, session_id=session_id, node_name=node_name)
+            await self._set_cached_async(messages, result, temperature, max_tokens, **kwargs)
+            
+            logger.debug(f"Chat Completion(async) 성공: 토큰 사용량={result['usage']['total_tokens']}, 비용=${result.get('cost', 0):.6f}")
+            return result
+        
+        except Exception as e:
+            logger.error(f"Chat Completion(async) 실패: {str(e)}")
+            raise
+    
+    async def chat_completion_stream_async(
+        self,
+        messages: List[Dict[str, str]],
+        on_token: Callable[[str], None],
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        session_id: Optional[str] = None,
+        node_name: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Chat Completion 스트리밍 API 호출 (비동기)
+        
+        토큰이 도착할 때마다 on_token을 호출하고, 완료 후 chat_completion과 동일한
+        형식의 결과 딕셔너리를 반환합니다. 캐시 히트 시 전체 응답을 한 번에 전달합니다.
+        재시도는 스트림 연결 단계에서만 수행합니다 (토큰 전달 이후에는 재시도하지 않음).
+        
+        Args:
+            messages: 메시지 리스트
+            on_token: 토큰 문자열을 받는 콜백
+            temperature: 온도 파라미터
+            max_tokens: 최대 토큰 수
+            session_id: 세션 ID (비용 추적용, 선택적)
+            node_name: 노드 이름 (비용 추적용, 선택적)
+            **kwargs: 추가 파라미터
+        
+        Returns:
+            API 응답 딕셔너리
+        """
+        cached_response = await self._get_cached_async(messages, temperature, max_tokens, session_id, node_name, **kwargs)
+        if cached_response:
+            if cached_response.get("content"):
+                on_token(cached_response["content"])
+            return cached_response
+        
+        async def _call():
+            return await self.async_client.chat.completions.create(
+                model=self.model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                stream_options={"include_usage": True},
+                **kwargs
+            )
+        
+        try:
+            stream = await self._retry_with_backoff_async(_call)
+            
+            content_parts: List[str] = []
+            role = "assistant"
+            model = self.model
+            finish_reason = None
+            usage = None
+            
+            async for chunk in stream:
+                model = chunk.model or model
+                if chunk.usage:
+                    usage = chunk.usage
+                if not chunk.choices:
+                    continue
+                
+                choice = chunk.choices[0]
+                if choice.delta.role:
+                    role = choice.delta.role
+                if choice.finish_reason:
+                    finish_reason = choice.finish_reason
+                if choice.delta.content:
+                    content_parts.append(choice.delta.content)
+                    on_token(choice.delta.content)
+            
+            result = {
+                "content": "".join(content_parts),
+                "role": role,
+                "usage": {
+                    "prompt_tokens": usage.prompt_tokens if usage else 0,
+                    "completion_tokens": usage.completion_tokens if usage else 0,
+                    "total_tokens": usage.total_tokens if usage else 0
+                },
+                "model": model,
+                "finish_reason": finish_reason
+            }
+            self._track_cost(result, session_id=session_id, node_name=node_name)
+            await self._set_cached_async(messages, result, temperature, max_tokens, **kwargs)
+            
+            logger.debug(f"Chat Completion(stream) 성공: 토큰 사용량={result['usage']['total_tokens']}, 비용=${result.get('cost', 0):.6f}")
+            return result
+        
+        except Exception as e:
+            logger.error(f"Chat Completion(stream) 실패: {str(e)}")
+            raise
+    
     def embedding(
         self,
         texts: List[str],
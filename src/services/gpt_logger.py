@@ -34,15 +34,15 @@ class GPTLogger:
             token_input: 입력 토큰 수
             token_output: 출력 토큰 수
             latency_ms: 응답 시간 (밀리초)
-            db_session: DB 세션 (None이면 새로 생성)
+            db_session: DB 세션 (None이면 현재 턴의 작업 단위에 등록하여 턴 마지막에 기록)
         """
         try:
             if db_session is None:
-                with db_manager.get_db_session() as session:
-                    GPTLogger._save_log(
-                        session, session_id, node_name, model,
-                        token_input, token_output, latency_ms
-                    )
+                db_manager.enlist(
+                    GPTLogger._save_log, session_id, node_name, model,
+                    token_input, token_output, latency_ms,
+                    best_effort=True
+                )
             else:
                 GPTLogger._save_log(
                     db_session, session_id, node_name, model,
@@ -62,7 +62,7 @@ class GPTLogger:
         token_output: int,
         latency_ms: int
     ):
-        """로그 저장 (내부 함수)"""
+        """로그 저장 (내부 함수, 커밋은 호출자가 수행)"""
         log_entry = AIProcessLog(
             session_id=session_id,
             node_name=node_name,
@@ -73,7 +73,6 @@ class GPTLogger:
         )
         
         session.add(log_entry)
-        session.commit()
     
     @staticmethod
     def log_with_timing(
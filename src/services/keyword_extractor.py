@@ -3,6 +3,7 @@
 """
 from typing import List, Dict, Any
 from src.services.gpt_client import gpt_client
+from src.services.semantic_cache import semantic_cache
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,86 +26,176 @@ class KeywordExtractor:
         Returns:
             키워드 리스트
         """
-        prompt = f"""다음 텍스트에서 법률 사건 분류에 중요한 핵심 키워드를 추출하세요.
-키워드는 쉼표로 구분하여 나열하세요. 최대 {max_keywords}개까지 추출하세요.
-
-텍스트: {text}
-
-키워드:"""
+        prompt = self._build_keywords_prompt(text, max_keywords)
         
-        try:
+        def _request() -> List[str]:
             response = self.gpt_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=200
             )
-            
-            keywords_str = response["content"].strip()
-            keywords = [kw.strip() for kw in keywords_str.split(",")]
-            
-            logger.debug(f"키워드 추출 완료: {len(keywords)}개")
-            return keywords[:max_keywords]
+            return self._parse_keywords(response["content"], max_keywords)
+        
+        try:
+            return semantic_cache.get_or_compute("keywords", text, _request, scope=str(max_keywords))
         
         except Exception as e:
             logger.error(f"키워드 추출 실패: {str(e)}")
             return []
     
-    def extract_semantic_features(self, text: str) -> Dict[str, Any]:
+    async def extract_keywords_async(self, text: str, max_keywords: int = 10) -> List[str]:
         """
-        의미적 특징 추출 (사건 유형 분류용)
+        핵심 키워드 추출 (비동기)
         
         Args:
             text: 입력 텍스트
+            max_keywords: 최대 키워드 개수
         
         Returns:
-            의미적 특징 딕셔너리
+            키워드 리스트
         """
-        prompt = f"""다음 텍스트를 분석하여 법률 사건 분류에 필요한 의미적 특징을 추출하세요.
-JSON 형식으로 반환하세요:
-{{
-    "domain": "민사/형사/가사/행정/기타",
-    "keywords": ["키워드1", "키워드2", ...],
-    "main_issue": "주요 쟁점 요약",
-    "related_concepts": ["관련 개념1", "관련 개념2", ...]
-}}
+        prompt = self._build_keywords_prompt(text, max_keywords)
+        
+        async def _request() -> List[str]:
+            response = await self.gpt_client.chat_completion_async(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=200
+            )
+            return self._parse_keywords(response["content"], max_keywords)
+        
+        try:
+            return await semantic_cache.get_or_compute_async("keywords", text, _request, scope=str(max_keywords))
+        
+        except Exception as e:
+            logger.error(f"키워드 추출 실패: {str(e)}")
+            return []
+    
+    @staticmethod
+    def _build_keywords_prompt(text: str, max_keywords: int) -> str:
+        """키워드 추출 프롬프트 생성"""
+        return f"""다음 텍스트에서 법률 사건 분류에 중요한 핵심 키워드를 추출하세요.
+키워드는 쉼표로 구분하여 나열하세요. 최대 {max_keywords}개까지 추출하세요.
 
 텍스트: {text}
 
-JSON:"""
+키워드:"""
+    
+    @staticmethod
+    def _parse_keywords(content: str, max_keywords: int) -> List[str]:
+        """키워드 추출 응답 파싱"""
+        keywords_str = content.strip()
+        keywords = [kw.strip() for kw in keywords_str.split(",")]
         
-        try:
+        logger.debug(f"키워드 추출 완료: {len(keywords)}개")
+        return keywords[:max_keywords]
+    
+    def extract_semantic_features(self, text: str) -> Dict[str, Any]:
+        """
+        의미적 특징 추출 (사건 유형 분류용)
+        
+        Args:
+            text: 입력 텍스트
+        
+        Returns:
+            의미적 특징 딕셔너리
+        """
+        prompt = self._build_semantic_features_prompt(text)
+        
+        def _request() -> Dict[str, Any]:
             response = self.gpt_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=300
             )
-            
-            # 응답에서 JSON 추출 (견고한 파싱 사용)
-            from src.utils.helpers import parse_json_from_text
-            content = response["content"].strip()
-            result = parse_json_from_text(content, default={
+            return self._parse_semantic_features(response["content"])
+        
+        try:
+            return semantic_cache.get_or_compute("semantic_features", text, _request)
+        
+        except Exception as e:
+            logger.error(f"의미적 특징 추출 실패: {str(e)}")
+            # 폴백: 기본 키워드만 추출
+            keywords = self.extract_keywords(text, max_keywords=5)
+            return {
                 "domain": None,
-                "keywords": [],
+                "keywords": keywords,
                 "main_issue": None,
                 "related_concepts": []
-            })
-            
-            if result is None:
-                raise ValueError("JSON 파싱 실패")
-            
-            logger.debug(f"의미적 특징 추출 완료: domain={result.get('domain')}")
-            return result
+            }
+    
+    async def extract_semantic_features_async(self, text: str) -> Dict[str, Any]:
+        """
+        의미적 특징 추출 (비동기)
+        
+        Args:
+            text: 입력 텍스트
+        
+        Returns:
+            의미적 특징 딕셔너리
+        """
+        prompt = self._build_semantic_features_prompt(text)
+        
+        async def _request() -> Dict[str, Any]:
+            response = await self.gpt_client.chat_completion_async(
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=300
+            )
+            return self._parse_semantic_features(response["content"])
+        
+        try:
+            return await semantic_cache.get_or_compute_async("semantic_features", text, _request)
         
         except Exception as e:
             logger.error(f"의미적 특징 추출 실패: {str(e)}")
             # 폴백: 기본 키워드만 추출
-            keywords = self.extract_keywords(text, max_keywords=5)
+            keywords = await self.extract_keywords_async(text, max_keywords=5)
             return {
                 "domain": None,
                 "keywords": keywords,
                 "main_issue": None,
                 "related_concepts": []
             }
+    
+    @staticmethod
+    def _build_semantic_features_prompt(text: str) -> str:
+        """의미적 특징 추출 프롬프트 생성"""
+        return f"""다음 텍스트를 분석하여 법률 사건 분류에 필요한 의미적 특징을 추출하세요.
+JSON 형식으로 반환하세요:
+{{
+    "domain": "민사/형사/가사/행정/기타",
+    "keywords": ["키워드1", "키워드2", ...],
+    "main_issue": "주요 쟁점 요약",
+    "related_concepts": ["관련 개념1", "관련 개념2", ...]
+}}
+
+텍스트: {text}
+
+JSON:"""
+    
+    @staticmethod
+    def _parse_semantic_features(content: str) -> Dict[str, Any]:
+        """
+        의미적 특징 응답 파싱
+        
+        Raises:
+            ValueError: JSON 파싱 실패 시
+        """
+        # 응답에서 JSON 추출 (견고한 파싱 사용)
+        from src.utils.helpers import parse_json_from_text
+        result = parse_json_from_text(content.strip(), default={
+            "domain": None,
+            "keywords": [],
+            "main_issue": None,
+            "related_concepts": []
+        })
+        
+        if result is None:
+            raise ValueError("JSON 파싱 실패")
+        
+        logger.debug(f"의미적 특징 추출 완료: domain={result.get('domain')}")
+        return result
 
 
 # 전역 키워드 추출기 인스턴스
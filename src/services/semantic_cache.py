@@ -0,0 +1,419 @@
+"""
+의미 유사도(임베딩) 기반 GPT 결과 캐시 모듈
+
+날짜/금액 추출, 키워드/의미 추출, 사건 분류처럼 낮은 temperature로 짧고 반복적인 입력을
+처리하는 호출의 "파싱된 결과"를 캐시합니다. 입력 문장을 RAG와 같은 embedding_model로
+벡터화한 뒤, 같은 노드에서 이전에 처리한 입력과의 코사인 유사도가 노드별 임계값 이상이면
+GPT 호출 없이 캐시된 결과를 반환합니다.
+
+- 노드별 opt-in: SEMANTIC_CACHE_NODES에 등록된 노드만 캐시를 사용합니다.
+- 숫자 가드: 입력에 포함된 숫자/한글 수사/상대 날짜 표현이 다르면("300만원" vs "500만원",
+  "삼백만원" vs "오백만원", "어제" vs "그제", "3일 전" vs "3일 후") 유사도와 무관하게 미스로 처리합니다.
+- 오탐 감사: 히트 중 SEMANTIC_CACHE_AUDIT_RATE 비율은 GPT를 실제로 호출해 캐시 결과와 비교하고,
+  불일치(오탐)는 통계에 기록한 뒤 해당 항목을 새 결과로 교체합니다.
+"""
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Tuple
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+import asyncio
+import copy
+import random
+import re
+import threading
+import time
+import numpy as np
+from config.settings import settings
+from src.utils.constants import KOREAN_NUMBER_MAPPING
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 숫자 가드용 패턴 (금액/날짜 등 숫자가 다른 입력은 의미가 비슷해도 결과가 다름)
+# - 수량 + 기간 단위 + 방향: "3일 전", "두 달 후", "삼 주 뒤"
+# - 아라비아 숫자 + 단위: "300만", "300억" (단위까지 비교)
+# - 단위를 포함한 한글 수사(KOREAN_NUMBER_MAPPING): "삼백만", "오십"
+# - 상대 날짜 단어: "어제", "그제", "작년", "지난달", "이틀"
+_KOREAN_NUMERALS = "".join(KOREAN_NUMBER_MAPPING)
+_KOREAN_UNITS = "".join(char for char, value in KOREAN_NUMBER_MAPPING.items() if value >= 10)
+_NATIVE_COUNT = r'한|두|세|네|다섯|여섯|일곱|여덟|아홉|열'
+_RELATIVE_DATE_WORDS = (
+    r'그저께|그제|어제|오늘|내일|모레|글피|재작년|작년|지난해|올해|금년|내년'
+    r'|(?:지난|저번|이번|다음)\s?(?:달|주)|하루|이틀|사흘|나흘|닷새|엿새|이레|열흘|보름'
+)
+_NUMBER_PATTERN = re.compile(
+    rf'(?:\d+|[{_KOREAN_NUMERALS}]+|{_NATIVE_COUNT}|하루|이틀|사흘|나흘|닷새|엿새|이레|열흘|보름)'
+    r'\s?(?:주일|주|개월|달|년|해|일)?\s?(?:전|후|뒤)(?=[에엔의도쯤]|[^가-힣]|$)'
+    rf'|\d+(?:\.\d+)?\s?[{_KOREAN_UNITS}]*'
+    rf'|(?=[{_KOREAN_NUMERALS}]*[{_KOREAN_UNITS}])[{_KOREAN_NUMERALS}]{{2,}}'
+    rf'|{_RELATIVE_DATE_WORDS}'
+)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# 노드별로 보관하는 최근 오탐 사례 수
+MAX_RECENT_FALSE_HITS = 20
+
+
+@dataclass
+class _Entry:
+    """캐시 항목"""
+    text: str
+    numbers: Tuple[str, ...]
+    vector: np.ndarray
+    value: Any
+    expires_at: float
+
+
+@dataclass
+class _Probe:
+    """조회 결과 (미스인 경우 entry는 None, 임베딩 실패 시 vector는 None)"""
+    normalized: str
+    numbers: Tuple[str, ...]
+    vector: Optional[np.ndarray]
+    entry: Optional[_Entry] = None
+    similarity: float = 0.0
+
+
+class _Bucket:
+    """노드(+scope)별 캐시 저장소 (LRU)"""
+    
+    def __init__(self):
+        self.entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._matrix: Optional[np.ndarray] = None
+        self._keys: List[str] = []
+    
+    def invalidate(self):
+        """유사도 계산용 행렬 무효화 (항목 추가/삭제 시)"""
+        self._matrix = None
+    
+    def matrix(self) -> Tuple[List[str], Optional[np.ndarray]]:
+        """항목 벡터를 쌓은 행렬 반환 (변경이 없으면 재사용)"""
+        if self._matrix is None and self.entries:
+            self._keys = list(self.entries.keys())
+            self._matrix = np.vstack([self.entries[key].vector for key in self._keys])
+        return self._keys, self._matrix
+
+
+def _normalize_text(text: str) -> str:
+    """공백 정규화 (정확 일치 비교용)"""
+    return _WHITESPACE_PATTERN.sub(" ", text or "").strip()
+
+
+class SemanticCache:
+    """의미 유사도 기반 결과 캐시 클래스"""
+    
+    def __init__(
+        self,
+        enabled: bool = False,
+        nodes: Optional[List[str]] = None,
+        threshold: float = 0.95,
+        node_thresholds: Optional[Dict[str, float]] = None,
+        max_entries: int = 500,
+        ttl_seconds: int = 3600,
+        audit_rate: float = 0.05,
+        encoder: Optional[Callable[[str], np.ndarray]] = None
+    ):
+        """
+        의미 캐시 초기화
+        
+        Args:
+            enabled: 캐시 활성화 여부
+            nodes: 캐시를 사용할 노드 이름 목록
+            threshold: 기본 코사인 유사도 임계값
+            node_thresholds: 노드별 임계값 (기본값보다 우선)
+            max_entries: 노드별 최대 항목 수 (초과 시 LRU 제거)
+            ttl_seconds: 항목 유효 시간 (초)
+            audit_rate: 히트 중 GPT를 실제 호출해 검증하는 비율 (0~1)
+            encoder: 텍스트 → 벡터 함수 (None이면 RAG embedding_model 사용)
+        """
+        self.enabled = enabled
+        self.nodes = set(nodes or [])
+        self.threshold = threshold
+        self.node_thresholds = dict(node_thresholds or {})
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.audit_rate = min(max(audit_rate, 0.0), 1.0)
+        self._encoder = encoder
+        
+        self._buckets: Dict[Tuple[str, str], _Bucket] = {}
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._recent_false_hits: Dict[str, deque] = {}
+    
+    def is_enabled(self, node_name: str) -> bool:
+        """해당 노드에서 의미 캐시를 사용하는지 여부"""
+        return self.enabled and node_name in self.nodes
+    
+    def get_threshold(self, node_name: str) -> float:
+        """노드별 유사도 임계값 반환"""
+        return self.node_thresholds.get(node_name, self.threshold)
+    
+    def _encode(self, text: str) -> np.ndarray:
+        """텍스트를 정규화된(단위 길이) 벡터로 변환"""
+        if self._encoder is None:
+            # RAG 임베딩 모델은 캐시를 실제로 사용할 때만 로드
+            from src.rag.embeddings import embedding_model
+            self._encoder = embedding_model.encode_query
+        
+        vector = np.asarray(self._encoder(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def _record(self, node_name: str, **increments: int):
+        """노드별 통계 누적 (lock 보유 상태에서 호출)"""
+        stats = self._stats.setdefault(node_name, {
+            "lookups": 0,
+            "hits": 0,
+            "exact_hits": 0,
+            "audits": 0,
+            "false_hits": 0,
+            "embedding_errors": 0
+        })
+        for key, value in increments.items():
+            stats[key] += value
+    
+    def _lookup(self, node_name: str, scope: str, text: str) -> _Probe:
+        """
+        유사 입력 조회
+        
+        Args:
+            node_name: 노드 이름
+            scope: 결과에 영향을 주는 추가 파라미터 (정확히 일치해야 함)
+            text: 입력 텍스트
+        
+        Returns:
+            조회 결과
+        """
+        normalized = _normalize_text(text)
+        numbers = tuple(token.replace(" ", "") for token in _NUMBER_PATTERN.findall(normalized))
+        now = time.monotonic()
+        
+        with self._lock:
+            self._record(node_name, lookups=1)
+            bucket = self._buckets.get((node_name, scope))
+            if bucket is not None:
+                self._purge_expired(bucket, now)
+                entry = bucket.entries.get(normalized)
+                if entry is not None:
+                    # 정확 일치는 임베딩 없이 바로 히트
+                    bucket.entries.move_to_end(normalized)
+                    self._record(node_name, hits=1, exact_hits=1)
+                    return _Probe(normalized, numbers, entry.vector, entry, 1.0)
+        
+        try:
+            vector = self._encode(normalized)
+        except Exception as e:
+            logger.warning(f"[의미 캐시] 임베딩 실패, 캐시 미사용: node={node_name}, error={str(e)}")
+            with self._lock:
+                self._record(node_name, embedding_errors=1)
+            return _Probe(normalized, numbers, None)
+        
+        probe = _Probe(normalized, numbers, vector)
+        with self._lock:
+            bucket = self._buckets.get((node_name, scope))
+            if bucket is None:
+                return probe
+            
+            keys, matrix = bucket.matrix()
+            if matrix is None:
+                return probe
+            
+            similarities = matrix @ vector
+            threshold = self.get_threshold(node_name)
+            for index in np.argsort(similarities)[::-1]:
+                similarity = float(similarities[index])
+                if similarity < threshold:
+                    break
+                entry = bucket.entries.get(keys[index])
+                if entry is None or entry.numbers != numbers:
+                    continue
+                bucket.entries.move_to_end(keys[index])
+                probe.entry = entry
+                probe.similarity = similarity
+                self._record(node_name, hits=1)
+                break
+        
+        return probe
+    
+    def _purge_expired(self, bucket: _Bucket, now: float):
+        """만료 항목 제거 (lock 보유 상태에서 호출)"""
+        expired = [key for key, entry in bucket.entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del bucket.entries[key]
+        if expired:
+            bucket.invalidate()
+    
+    def _should_audit(self) -> bool:
+        """이번 히트를 GPT 호출로 검증할지 여부"""
+        return self.audit_rate > 0 and random.random() < self.audit_rate
+    
+    def _store(self, node_name: str, scope: str, probe: _Probe, value: Any):
+        """
+        결과 저장 (감사 대상 히트였다면 캐시 결과와 비교해 오탐 기록)
+        
+        Args:
+            node_name: 노드 이름
+            scope: 추가 파라미터
+            probe: 조회 결과
+            value: GPT 호출로 얻은 결과
+        """
+        if probe.vector is None or value is None:
+            return
+        
+        with self._lock:
+            bucket = self._buckets.setdefault((node_name, scope), _Bucket())
+            
+            if probe.entry is not None:
+                self._record(node_name, audits=1)
+            
+            if probe.entry is not None and probe.entry.value != value:
+                # 오탐: 캐시 결과가 실제 결과와 다름 → 기록 후 해당 항목 제거
+                self._record(node_name, false_hits=1)
+                self._recent_false_hits.setdefault(node_name, deque(maxlen=MAX_RECENT_FALSE_HITS)).append({
+                    "text": probe.normalized,
+                    "matched_text": probe.entry.text,
+                    "similarity": round(probe.similarity, 4),
+                    "cached_value": repr(probe.entry.value),
+                    "actual_value": repr(value)
+                })
+                logger.warning(
+                    f"[의미 캐시] 오탐 감지: node={node_name}, similarity={probe.similarity:.4f}, "
+                    f"text='{probe.normalized[:50]}', matched='{probe.entry.text[:50]}'"
+                )
+                bucket.entries.pop(probe.entry.text, None)
+            
+            bucket.entries[probe.normalized] = _Entry(
+                text=probe.normalized,
+                numbers=probe.numbers,
+                vector=probe.vector,
+                value=copy.deepcopy(value),
+                expires_at=time.monotonic() + self.ttl_seconds
+            )
+            bucket.entries.move_to_end(probe.normalized)
+            while len(bucket.entries) > self.max_entries:
+                bucket.entries.popitem(last=False)
+            bucket.invalidate()
+    
+    def get_or_compute(
+        self,
+        node_name: str,
+        text: str,
+        compute: Callable[[], Any],
+        scope: str = ""
+    ) -> Any:
+        """
+        유사 입력의 캐시 결과를 반환하거나, 없으면 compute()를 실행해 결과를 저장
+        
+        compute()의 예외는 그대로 전파되며 None 결과는 저장하지 않습니다.
+        
+        Args:
+            node_name: 노드 이름 (SEMANTIC_CACHE_NODES에 등록된 경우에만 캐시 사용)
+            text: 유사도 비교 대상 입력 텍스트
+            compute: 캐시 미스 시 GPT를 호출해 파싱된 결과를 반환하는 함수
+            scope: 결과에 영향을 주는 추가 파라미터 (정확히 일치해야 재사용)
+        
+        Returns:
+            캐시된 결과 또는 compute() 결과
+        """
+        if not self.is_enabled(node_name):
+            return compute()
+        
+        probe = self._lookup(node_name, scope, text)
+        if probe.entry is not None and not self._should_audit():
+            logger.debug(f"[의미 캐시] 히트: node={node_name}, similarity={probe.similarity:.4f}")
+            return copy.deepcopy(probe.entry.value)
+        
+        value = compute()
+        self._store(node_name, scope, probe, value)
+        return value
+    
+    async def get_or_compute_async(
+        self,
+        node_name: str,
+        text: str,
+        compute: Callable[[], Awaitable[Any]],
+        scope: str = ""
+    ) -> Any:
+        """
+        유사 입력의 캐시 결과를 반환하거나, 없으면 compute()를 실행해 결과를 저장 (비동기)
+        
+        임베딩 계산은 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        
+        Args:
+            node_name: 노드 이름
+            text: 유사도 비교 대상 입력 텍스트
+            compute: 캐시 미스 시 실행할 코루틴 함수
+            scope: 결과에 영향을 주는 추가 파라미터
+        
+        Returns:
+            캐시된 결과 또는 compute() 결과
+        """
+        if not self.is_enabled(node_name):
+            return await compute()
+        
+        probe = await asyncio.to_thread(self._lookup, node_name, scope, text)
+        if probe.entry is not None and not self._should_audit():
+            logger.debug(f"[의미 캐시] 히트: node={node_name}, similarity={probe.similarity:.4f}")
+            return copy.deepcopy(probe.entry.value)
+        
+        value = await compute()
+        self._store(node_name, scope, probe, value)
+        return value
+    
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제 (통계는 유지)
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            count = sum(len(bucket.entries) for bucket in self._buckets.values())
+            self._buckets.clear()
+        logger.info(f"의미 캐시 전체 삭제: {count}개 항목")
+        return count
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        노드별 캐시 통계 조회
+        
+        Returns:
+            통계 딕셔너리 (false_hit_rate는 감사한 히트 중 오탐 비율)
+        """
+        with self._lock:
+            entries_by_node: Dict[str, int] = {}
+            for (node_name, _), bucket in self._buckets.items():
+                entries_by_node[node_name] = entries_by_node.get(node_name, 0) + len(bucket.entries)
+            
+            nodes = {}
+            for node_name in sorted(self.nodes | set(self._stats)):
+                stats = dict(self._stats.get(node_name, {}))
+                lookups = stats.get("lookups", 0)
+                audits = stats.get("audits", 0)
+                nodes[node_name] = {
+                    **stats,
+                    "entries": entries_by_node.get(node_name, 0),
+                    "threshold": self.get_threshold(node_name),
+                    "hit_rate": round(stats.get("hits", 0) / lookups * 100, 2) if lookups else 0.0,
+                    "false_hit_rate": round(stats.get("false_hits", 0) / audits * 100, 2) if audits else 0.0,
+                    "recent_false_hits": list(self._recent_false_hits.get(node_name, []))
+                }
+            
+            return {
+                "enabled": self.enabled,
+                "audit_rate": self.audit_rate,
+                "ttl_seconds": self.ttl_seconds,
+                "max_entries_per_node": self.max_entries,
+                "nodes": nodes
+            }
+
+
+# 전역 의미 캐시 인스턴스
+semantic_cache = SemanticCache(
+    enabled=settings.semantic_cache_enabled,
+    nodes=settings.semantic_cache_node_list,
+    threshold=settings.semantic_cache_threshold,
+    node_thresholds=settings.semantic_cache_threshold_map,
+    max_entries=settings.semantic_cache_max_entries,
+    ttl_seconds=settings.semantic_cache_ttl_seconds,
+    audit_rate=settings.semantic_cache_audit_rate
+)
@@ -1,16 +1,28 @@
 """
 세션 관리 서비스 모듈
+
+세션 상태는 저장 시 프로세스 내 캐시에도 함께 기록되어(write-through) 다음 메시지에서
+DB 조회 없이 로드됩니다. 캐시 동작과 다중 워커 버전 확인은 session_state_cache 모듈을 참고하세요.
+
+conversation_history는 chat_turn 테이블에 Q-A 쌍 한 행씩 추가 기록하며(메시지당 새 Q-A 쌍만 INSERT),
+상태 스냅샷에는 포함하지 않습니다. chat_session.conversation_history JSON 컬럼은 마이그레이션 기간 동안
+호환용으로 함께 기록합니다 (CONVERSATION_HISTORY_JSON_WRITE).
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from datetime import datetime, timedelta
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from src.utils.helpers import get_kst_now
-from src.db.connection import db_manager
+from src.db.connection import db_manager, run_after_commit
 from src.db.models.chat_session import ChatSession
+from src.db.models.chat_turn import ChatTurn
 from src.langgraph.state import StateContext, create_initial_context
+from src.services.session_state_cache import session_state_cache
+from src.services.state_snapshot import decode_state_snapshot, encode_state_snapshot
 from src.utils.helpers import generate_session_id, generate_user_hash
 from src.utils.logger import get_logger
 from src.utils.constants import SessionStatus, PARTY_ROLES
+from src.utils.exceptions import SessionStateConflictError
 from config.settings import settings
 
 logger = get_logger(__name__)
@@ -91,103 +103,45 @@ class SessionManager:
             StateContext 또는 None
         """
         try:
-            # DB 세션 컨텍스트 내에서 모든 속성 접근
+            # 캐시 히트 시 state_version만 조회하여 비교 후 반환 (검증을 끄면 DB 조회 없이 반환)
+            cached = session_state_cache.get(session_id)
+            if cached is not None:
+                context, version = cached
+                if not settings.session_state_cache_verify or _get_state_version(session_id) == version:
+                    logger.debug(f"세션 상태 캐시 사용: {session_id} (version={version})")
+                    context["state_version"] = version
+                    return context
+                logger.info(f"다른 워커가 세션 상태를 갱신하여 DB에서 다시 로드: {session_id}")
+                session_state_cache.invalidate(session_id, conflict=True)
+            
             with db_manager.get_db_session() as db_session:
-                session = db_session.query(ChatSession).filter(
-                    ChatSession.session_id == session_id
-                ).first()
+                # 기본 키 조회 한 번으로 저장 시점의 상태 전체를 복원
+                session = db_session.get(ChatSession, session_id)
                 
                 if not session:
                     return None
                 
-                # DB에서 상태 복원 (DB 세션 컨텍스트 내에서 접근)
-                context = create_initial_context(session_id)
-                context["current_state"] = session.current_state
-                context["completion_rate"] = session.completion_rate
+                state_version = session.state_version or 0
+                conversation_history = _load_turns(db_session, session_id)
+                if not conversation_history and session.conversation_history:
+                    # chat_turn 이전 세션은 JSON 컬럼의 기록을 처음 로드할 때 chat_turn으로 옮김
+                    conversation_history = list(session.conversation_history)
+                    _append_turns(db_session, session_id, conversation_history, [])
+                    logger.info(f"conversation_history를 chat_turn으로 이전: {session_id}, {len(conversation_history)}개 Q-A 쌍")
                 
-                # case_master에서 추가 정보 로드
-                from src.db.models.case_master import CaseMaster
-                from src.db.models.case_fact import CaseFact
-                from src.db.models.case_party import CaseParty
-                case = db_session.query(CaseMaster).filter(
-                    CaseMaster.session_id == session_id
-                ).first()
-                
-                if case:
-                    context["case_type"] = case.main_case_type
-                    context["sub_case_type"] = case.sub_case_type
-                    
-                    # CaseFact에서 facts 복원
-                    facts = {}
-                    
-                    # 모든 CaseFact를 조회하여 최신 값으로 업데이트
-                    all_facts = db_session.query(CaseFact).filter(
-                        CaseFact.case_id == case.case_id
-                    ).order_by(CaseFact.created_at.desc()).all()
-                    
-                    # 최신 값만 사용 (첫 번째 항목)
-                    if all_facts:
-                        latest_fact = all_facts[0]
-                        if latest_fact.incident_date:
-                            facts["incident_date"] = latest_fact.incident_date.strftime("%Y-%m-%d")
-                        if latest_fact.amount:
-                            facts["amount"] = latest_fact.amount
-                    
-                    # CaseParty에서 counterparty 복원
-                    counterparty = db_session.query(CaseParty).filter(
-                        CaseParty.case_id == case.case_id,
-                        CaseParty.party_role == PARTY_ROLES["COUNTERPARTY"]
-                    ).first()
-                    
-                    if counterparty and counterparty.party_description:
-                        facts["counterparty"] = counterparty.party_description
-                    
-                    # CaseEvidence에서 evidence 복원
-                    from src.db.models.case_evidence import CaseEvidence
-                    evidence = db_session.query(CaseEvidence).filter(
-                        CaseEvidence.case_id == case.case_id
-                    ).order_by(CaseEvidence.created_at.desc()).first()
-                    
-                    if evidence:
-                        facts["evidence"] = evidence.available
-                        if evidence.evidence_type:
-                            facts["evidence_type"] = evidence.evidence_type
-                    
-                    context["facts"] = facts
-                    
-                    # asked_fields 초기화 (중복 질문 방지)
-                    context["asked_fields"] = []
-                    
-                    logger.debug(f"세션 상태 로드 완료: {session_id}, facts={list(facts.keys())}")
-                
-                # conversation_history 복원 (DB 세션 컨텍스트 내에서 접근 - 반드시 with 블록 안에서!)
-                # case가 있든 없든 conversation_history는 복원해야 함
-                if session.conversation_history:
-                    context["conversation_history"] = session.conversation_history
-                    logger.debug(f"conversation_history 복원: session_id={session_id}, {len(session.conversation_history)}개 Q-A 쌍")
+                context = decode_state_snapshot(session.state_snapshot)
+                if context is not None:
+                    # 세션 행의 진행 상태가 기준 (그래프 밖에서 갱신될 수 있음)
+                    context["current_state"] = session.current_state
+                    context["completion_rate"] = session.completion_rate
+                    context["conversation_history"] = conversation_history
+                    logger.debug(f"세션 상태 스냅샷 로드 완료: {session_id} (version={state_version})")
                 else:
-                    context["conversation_history"] = []
-            
-            # asked_fields 복원: conversation_history에서 추출
-            conversation_history = context.get("conversation_history", [])
-            asked_fields = [qa.get("field") for qa in conversation_history if qa.get("field")]
-            context["asked_fields"] = asked_fields
-            
-            # missing_fields 계산: required_fields - asked_fields
-            case_type = context.get("case_type")
-            if case_type:
-                from src.utils.constants import REQUIRED_FIELDS_BY_CASE_TYPE, REQUIRED_FIELDS
-                required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, REQUIRED_FIELDS)
-                missing_fields = [field for field in required_fields if field not in asked_fields]
-                context["missing_fields"] = missing_fields
-                logger.debug(f"missing_fields 계산: session_id={session_id}, required={len(required_fields)}, asked={len(asked_fields)}, missing={len(missing_fields)}")
-            else:
-                context["missing_fields"] = []
-            
-            # skipped_fields는 초기화 (CASE_CLASSIFICATION 노드에서 설정됨)
-            if "skipped_fields" not in context:
-                context["skipped_fields"] = []
+                    # 스냅샷이 없는 세션(마이그레이션 이전 저장)은 정규화된 사건 테이블에서 복원
+                    context = _restore_state_from_tables(db_session, session, conversation_history)
+                context["state_version"] = state_version
             
+            session_state_cache.put(session_id, context, state_version)
             return context
         
         except Exception as e:
@@ -206,47 +160,349 @@ class SessionManager:
         Args:
             session_id: 세션 ID
             state: StateContext
-            db_session: DB 세션 (None이면 새로 생성)
+            db_session: DB 세션 (None이면 현재 턴의 작업 단위에 등록하여 턴 마지막에 기록)
         """
         try:
             if db_session is None:
-                with db_manager.get_db_session() as session:
-                    _update_session(session, session_id, state)
+                db_manager.enlist(_update_session, session_id, state)
             else:
                 _update_session(db_session, session_id, state)
         
         except Exception as e:
+            session_state_cache.invalidate(session_id)
             logger.error(f"세션 상태 저장 실패: {session_id} - {str(e)}")
             raise
+    
+    @staticmethod
+    def invalidate_session_state(session_id: str, db_session: Optional[Session] = None):
+        """
+        세션 상태 캐시 무효화 (상담 종료 등 그래프 밖에서 세션이 바뀐 경우)
+        
+        Args:
+            session_id: 세션 ID
+            db_session: 진행 중인 DB 세션 (주어지면 지금 무효화하고, 먼저 등록된 저장의 캐시 갱신 이후인
+                커밋 시점에 한 번 더 무효화)
+        """
+        session_state_cache.invalidate(session_id)
+        if db_session is not None:
+            run_after_commit(db_session, lambda: session_state_cache.invalidate(session_id))
 
 
-def _update_session(session: Session, session_id: str, state: StateContext):
-    """세션 업데이트 (내부 함수)"""
-    chat_session = session.query(ChatSession).filter(
-        ChatSession.session_id == session_id
+def _restore_state_from_tables(
+    db_session: Session,
+    session: ChatSession,
+    conversation_history: List[Dict[str, Any]]
+) -> StateContext:
+    """
+    정규화된 사건 테이블(CaseMaster/CaseFact/CaseParty/CaseEvidence)에서 세션 상태 복원
+    
+    state_snapshot이 없는 세션용입니다. facts는 일부 필드만, asked_fields/missing_fields는
+    conversation_history에서 다시 계산하며 current_question 등 나머지 상태는 복원되지 않습니다.
+    
+    Args:
+        db_session: DB 세션
+        session: ChatSession 인스턴스
+        conversation_history: chat_turn에서 로드한 Q-A 쌍 리스트
+    
+    Returns:
+        StateContext
+    """
+    session_id = session.session_id
+    context = create_initial_context(session_id)
+    context["current_state"] = session.current_state
+    context["completion_rate"] = session.completion_rate
+    
+    # case_master에서 추가 정보 로드
+    from src.db.models.case_master import CaseMaster
+    from src.db.models.case_fact import CaseFact
+    from src.db.models.case_party import CaseParty
+    case = db_session.query(CaseMaster).filter(
+        CaseMaster.session_id == session_id
     ).first()
     
-    if not chat_session:
-        logger.warning(f"세션을 찾을 수 없습니다: {session_id}")
-        return
+    if case:
+        context["case_type"] = case.main_case_type
+        context["sub_case_type"] = case.sub_case_type
+        
+        # CaseFact에서 facts 복원
+        facts = {}
+        
+        # 모든 CaseFact를 조회하여 최신 값으로 업데이트
+        all_facts = db_session.query(CaseFact).filter(
+            CaseFact.case_id == case.case_id
+        ).order_by(CaseFact.created_at.desc()).all()
+        
+        # 최신 값만 사용 (첫 번째 항목)
+        if all_facts:
+            latest_fact = all_facts[0]
+            if latest_fact.incident_date:
+                facts["incident_date"] = latest_fact.incident_date.strftime("%Y-%m-%d")
+            if latest_fact.amount:
+                facts["amount"] = latest_fact.amount
+        
+        # CaseParty에서 counterparty 복원
+        counterparty = db_session.query(CaseParty).filter(
+            CaseParty.case_id == case.case_id,
+            CaseParty.party_role == PARTY_ROLES["COUNTERPARTY"]
+        ).first()
+        
+        if counterparty and counterparty.party_description:
+            facts["counterparty"] = counterparty.party_description
+        
+        # CaseEvidence에서 evidence 복원
+        from src.db.models.case_evidence import CaseEvidence
+        evidence = db_session.query(CaseEvidence).filter(
+            CaseEvidence.case_id == case.case_id
+        ).order_by(CaseEvidence.created_at.desc()).first()
+        
+        if evidence:
+            facts["evidence"] = evidence.available
+            if evidence.evidence_type:
+                facts["evidence_type"] = evidence.evidence_type
+        
+        context["facts"] = facts
+        
+        # asked_fields 초기화 (중복 질문 방지)
+        context["asked_fields"] = []
+        
+        logger.debug(f"세션 상태 로드 완료: {session_id}, facts={list(facts.keys())}")
+    
+    # case가 있든 없든 conversation_history는 복원해야 함
+    context["conversation_history"] = conversation_history
+    
+    # asked_fields 복원: conversation_history에서 추출
+    asked_fields = [qa.get("field") for qa in conversation_history if qa.get("field")]
+    context["asked_fields"] = asked_fields
+    
+    # missing_fields 계산: required_fields - asked_fields
+    case_type = context.get("case_type")
+    if case_type:
+        from src.utils.constants import REQUIRED_FIELDS_BY_CASE_TYPE, REQUIRED_FIELDS
+        required_fields = REQUIRED_FIELDS_BY_CASE_TYPE.get(case_type, REQUIRED_FIELDS)
+        missing_fields = [field for field in required_fields if field not in asked_fields]
+        context["missing_fields"] = missing_fields
+        logger.debug(f"missing_fields 계산: session_id={session_id}, required={len(required_fields)}, asked={len(asked_fields)}, missing={len(missing_fields)}")
+    else:
+        context["missing_fields"] = []
+    
+    # skipped_fields는 초기화 (CASE_CLASSIFICATION 노드에서 설정됨)
+    if "skipped_fields" not in context:
+        context["skipped_fields"] = []
+    
+    return context
+
+
+def _qa_to_turn(session_id: str, seq: int, qa: Dict[str, Any]) -> Dict[str, Any]:
+    """Q-A 쌍을 chat_turn 행 값으로 변환"""
+    return {
+        "session_id": session_id,
+        "seq": seq,
+        "field": qa.get("field"),
+        "question": None if qa.get("question") is None else str(qa["question"]),
+        "answer": None if qa.get("answer") is None else str(qa["answer"]),
+        "source": qa.get("source"),
+        "timestamp": None if qa.get("timestamp") is None else str(qa["timestamp"])
+    }
+
+
+def _turn_to_qa(turn: ChatTurn) -> Dict[str, Any]:
+    """chat_turn 행을 Q-A 쌍으로 변환 (값이 없는 키는 생략하여 노드가 만든 형태와 동일하게 유지)"""
+    qa = {"question": turn.question, "field": turn.field, "answer": turn.answer}
+    if turn.source is not None:
+        qa["source"] = turn.source
+    if turn.timestamp is not None:
+        qa["timestamp"] = turn.timestamp
+    return qa
+
+
+def _load_turns(
+    db_session: Session,
+    session_id: str,
+    start: int = 0,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    chat_turn에서 Q-A 쌍 범위 조회 (순번 순)
+    
+    Args:
+        db_session: DB 세션
+        session_id: 세션 ID
+        start: 시작 순번
+        limit: 최대 개수 (None이면 끝까지)
     
+    Returns:
+        Q-A 쌍 리스트
+    """
+    query = db_session.query(ChatTurn).filter(
+        ChatTurn.session_id == session_id,
+        ChatTurn.seq >= start
+    ).order_by(ChatTurn.seq)
+    if limit is not None:
+        query = query.limit(limit)
+    return [_turn_to_qa(turn) for turn in query.all()]
+
+
+def _append_turns(
+    db_session: Session,
+    session_id: str,
+    conversation_history: List[Dict[str, Any]],
+    persisted: Optional[List[Dict[str, Any]]]
+) -> int:
+    """
+    이미 기록된 Q-A 쌍 이후의 새 Q-A 쌍만 chat_turn에 추가 (커밋은 호출자가 수행)
+    
+    기록된 부분과 앞부분이 다르면(다른 워커의 저장, 대화 기록 재구성 등) 세션의 기록을 지우고 다시 씁니다.
+    
+    Args:
+        db_session: DB 세션
+        session_id: 세션 ID
+        conversation_history: 저장할 전체 Q-A 쌍 리스트
+        persisted: 이미 기록된 Q-A 쌍 리스트 (None이면 DB에서 조회)
+    
+    Returns:
+        추가한 행 수
+    """
+    if persisted is None:
+        persisted = _load_turns(db_session, session_id)
+    
+    start = len(persisted)
+    unchanged = len(conversation_history) >= start and all(
+        _qa_to_turn(session_id, seq, qa) == _qa_to_turn(session_id, seq, old)
+        for seq, (qa, old) in enumerate(zip(conversation_history, persisted))
+    )
+    if not unchanged:
+        logger.info(f"conversation_history가 기록과 달라 chat_turn을 다시 기록: {session_id}")
+        db_session.query(ChatTurn).filter(ChatTurn.session_id == session_id).delete(synchronize_session=False)
+        start = 0
+    
+    rows = [_qa_to_turn(session_id, seq, qa) for seq, qa in enumerate(conversation_history[start:], start=start)]
+    if rows:
+        # 여러 행이어도 INSERT 문 한 번 (executemany)
+        db_session.execute(insert(ChatTurn), rows)
+    return len(rows)
+
+
+def get_conversation_turns(session_id: str, start: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    세션의 Q-A 쌍 범위 조회 (세션 상태 전체를 로드하지 않고 대화 기록만 필요한 경우)
+    
+    Args:
+        session_id: 세션 ID
+        start: 시작 순번
+        limit: 최대 개수 (None이면 끝까지)
+    
+    Returns:
+        Q-A 쌍 리스트
+    """
+    with db_manager.get_db_session() as db_session:
+        return _load_turns(db_session, session_id, start, limit)
+
+
+def _get_state_version(session_id: str) -> Optional[int]:
+    """DB의 chat_session.state_version 조회 (세션이 없으면 None)"""
+    with db_manager.get_db_session() as db_session:
+        version = db_session.query(ChatSession.state_version).filter(
+            ChatSession.session_id == session_id
+        ).scalar()
+        return None if version is None else int(version)
+
+
+def _update_session(session: Session, session_id: str, state: StateContext):
+    """
+    세션 업데이트 (내부 함수, 커밋은 호출자가 수행하며 캐시는 커밋된 뒤 갱신)
+    
+    StateContext 전체를 state_snapshot 컬럼에 함께 저장하여 다음 로드가 기본 키 조회 한 번으로 끝나도록 합니다.
+    저장은 상태를 로드한 시점의 state_version이 DB와 같을 때만 갱신하는 UPDATE 한 번으로 수행합니다.
+    버전이 다르면(다른 요청/워커가 먼저 저장) 덮어쓰지 않고 캐시를 버린 뒤 SessionStateConflictError를 발생시킵니다.
+    
+    Raises:
+        SessionStateConflictError: 로드 이후 다른 요청이 세션 상태를 저장한 경우
+    """
     # current_state 우선순위: result의 current_state > next_state > 기본값 "INIT"
     current_state = state.get("current_state")
     if not current_state:
         # next_state가 있으면 그것을 current_state로 사용
         current_state = state.get("next_state", "INIT")
     
-    chat_session.current_state = current_state
-    chat_session.completion_rate = state.get("completion_rate", 0)
-    chat_session.updated_at = get_kst_now()
+    # 다음 로드가 세션 행과 같은 current_state를 보도록 맞춘 사본을 스냅샷/캐시에 사용
+    saved_state = dict(state)
+    saved_state["current_state"] = current_state
+    has_history = "conversation_history" in state
+    conversation_history = state.get("conversation_history") or []
+    
+    # 상태를 로드한 시점의 버전 (노드가 새 dict를 반환하여 빠졌으면 캐시된 버전, 둘 다 없으면 DB의 현재 버전)
+    cached = session_state_cache.peek(session_id)
+    base_version = state.get("state_version")
+    if base_version is None and cached is not None:
+        base_version = cached[1]
+    if base_version is None:
+        base_version = session.query(ChatSession.state_version).filter(
+            ChatSession.session_id == session_id
+        ).scalar()
+        if base_version is None:
+            logger.warning(f"세션을 찾을 수 없습니다: {session_id}")
+            return
+    new_version = base_version + 1
+    
+    values = {
+        ChatSession.current_state: current_state,
+        ChatSession.completion_rate: state.get("completion_rate", 0),
+        ChatSession.updated_at: get_kst_now(),
+        ChatSession.state_version: new_version,
+        # conversation_history는 chat_turn에, state_version은 컬럼에 기록하므로 스냅샷에서 제외
+        ChatSession.state_snapshot: encode_state_snapshot(
+            {key: value for key, value in saved_state.items() if key not in ("conversation_history", "state_version")}
+        )
+    }
+    if has_history and settings.conversation_history_json_write:
+        values[ChatSession.conversation_history] = conversation_history
+    
+    updated = session.query(ChatSession).filter(
+        ChatSession.session_id == session_id,
+        ChatSession.state_version == base_version
+    ).update(values, synchronize_session=False)
+    if not updated:
+        exists = session.query(ChatSession.session_id).filter(
+            ChatSession.session_id == session_id
+        ).scalar()
+        if exists is None:
+            logger.warning(f"세션을 찾을 수 없습니다: {session_id}")
+            return
+        logger.info(f"다른 요청이 세션 상태를 먼저 저장하여 저장 거부: {session_id} (version={base_version})")
+        session_state_cache.invalidate(session_id, conflict=True)
+        raise SessionStateConflictError(session_id)
     
-    # conversation_history 저장 (Q-A 쌍 리스트)
-    if "conversation_history" in state:
-        chat_session.conversation_history = state.get("conversation_history", [])
-        logger.debug(f"conversation_history 저장: session_id={session_id}, {len(chat_session.conversation_history)}개 Q-A 쌍")
+    # conversation_history 저장 (새 Q-A 쌍만 chat_turn에 추가, JSON 컬럼은 호환용)
+    if has_history:
+        # 같은 버전의 캐시 상태가 곧 기록된 Q-A 쌍이므로 DB 조회 없이 새 Q-A 쌍만 추가
+        persisted = None
+        if cached is not None and cached[1] == base_version:
+            persisted = cached[0].get("conversation_history") or []
+        appended = _append_turns(session, session_id, conversation_history, persisted)
+        logger.debug(f"conversation_history 저장: session_id={session_id}, {len(conversation_history)}개 Q-A 쌍 (추가 {appended}개)")
     
-    logger.debug(f"세션 상태 저장: session_id={session_id}, current_state={current_state}, completion_rate={chat_session.completion_rate}")
-    session.commit()
+    saved_state["state_version"] = new_version
+    
+    def _on_commit():
+        # 같은 상태 dict를 다시 저장해도 충돌하지 않도록 호출자의 상태에도 새 버전 반영
+        state["state_version"] = new_version
+        _cache_saved_state(session_id, saved_state, new_version)
+    
+    run_after_commit(session, _on_commit)
+    logger.debug(f"세션 상태 저장: session_id={session_id}, current_state={current_state}, version={new_version}")
+
+
+def _cache_saved_state(session_id: str, state: StateContext, version: int):
+    """저장한 상태를 캐시에 기록"""
+    if state.get("current_state") == "COMPLETED":
+        # 종료된 세션은 더 이상 메시지를 받지 않으므로 캐시하지 않음
+        session_state_cache.invalidate(session_id)
+        return
+    if "conversation_history" not in state:
+        # DB의 기존 conversation_history를 알 수 없으므로 다음 로드는 DB에서 복원
+        session_state_cache.invalidate(session_id)
+        return
+    session_state_cache.put(session_id, state, version)
 
 
 def validate_session_id(session_id: str) -> bool:
@@ -295,7 +551,7 @@ def save_session_state(
     Args:
         session_id: 세션 ID
         state: StateContext
-        db_session: DB 세션 (None이면 새로 생성)
+        db_session: DB 세션 (None이면 현재 턴의 작업 단위에 등록하여 턴 마지막에 기록)
     """
     SessionManager.save_session_state(session_id, state, db_session)
 
@@ -314,6 +570,7 @@ def cleanup_expired_sessions():
             
             for session in expired_sessions:
                 session.status = SessionStatus.ABORTED.value
+                session_state_cache.invalidate(session.session_id)
             
             db_session.commit()
             
@@ -0,0 +1,177 @@
+"""
+세션 상태 캐시 모듈
+
+메시지마다 ChatSession/CaseMaster/CaseFact/CaseParty/CaseEvidence를 조회하여 StateContext를
+다시 만드는 대신, 마지막으로 저장한 StateContext를 프로세스 내 LRU 캐시에 보관합니다.
+
+- 저장 시 캐시를 함께 갱신(write-through)하고, 상담 종료/세션 만료 시 무효화합니다.
+- 항목마다 chat_session.state_version을 함께 보관합니다. 저장은 버전이 같을 때만 갱신하는
+  조건부 UPDATE로 수행하므로, 다른 워커가 더 새로운 상태를 저장했으면 충돌을 감지하고 캐시를 버립니다.
+- 로드 시 버전만 조회하여(전체 복원 대비 1회 조회) 다른 워커가 더 새로운 상태를 저장했으면 DB에서
+  다시 로드합니다 (SESSION_STATE_CACHE_VERIFY, 기본 true). 세션을 워커에 고정한 배포에서만 끌 수 있습니다.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from config.settings import settings
+from src.langgraph.state import StateContext
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class SessionStateCache:
+    """세션 상태 LRU/TTL 캐시 클래스 (스레드 안전)"""
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        """
+        캐시 초기화
+        
+        Args:
+            max_entries: 최대 세션 수 (0 이하이면 캐시 비활성화)
+            ttl_seconds: 마지막 사용 이후 유효 시간 (초)
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # LRU 순서 (마지막이 가장 최근 사용): {session_id: (state, state_version, expires_at)}
+        self._entries: "OrderedDict[str, Tuple[StateContext, int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._conflicts = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """캐시 사용 여부"""
+        return self.max_entries > 0
+    
+    def get(self, session_id: str) -> Optional[Tuple[StateContext, int]]:
+        """
+        캐시 조회 (히트 시 가장 최근 사용으로 갱신하고 유효 시간 연장)
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            (StateContext 사본, state_version) 또는 None
+        """
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry[2] <= now:
+                if entry is not None:
+                    del self._entries[session_id]
+                self._misses += 1
+                return None
+            state, version, _ = entry
+            self._entries[session_id] = (state, version, now + self.ttl_seconds)
+            self._entries.move_to_end(session_id)
+            self._hits += 1
+        # 그래프 노드가 상태를 직접 수정하므로 캐시 원본이 아닌 사본 반환
+        return copy.deepcopy(state), version
+    
+    def peek(self, session_id: str) -> Optional[Tuple[StateContext, int]]:
+        """
+        캐시 원본 조회 (사본을 만들지 않으며 통계/LRU 순서에 영향 없음, 호출자는 수정 금지)
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            (StateContext 원본, state_version) 또는 None
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry[2] <= time.monotonic():
+                return None
+            return entry[0], entry[1]
+    
+    def version(self, session_id: str) -> Optional[int]:
+        """
+        캐시된 상태의 state_version 조회 (통계/LRU 순서에 영향 없음)
+        
+        Args:
+            session_id: 세션 ID
+        
+        Returns:
+            state_version 또는 None (캐시에 없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._entries.get(session_id)
+            if entry is None or entry[2] <= time.monotonic():
+                return None
+            return entry[1]
+    
+    def put(self, session_id: str, state: StateContext, version: int):
+        """
+        캐시 저장 (상한 초과 시 가장 오래 사용되지 않은 세션 제거)
+        
+        Args:
+            session_id: 세션 ID
+            state: 저장된 StateContext
+            version: 저장 후 chat_session.state_version
+        """
+        if not self.enabled:
+            return
+        state = copy.deepcopy(state)
+        with self._lock:
+            self._entries[session_id] = (state, version, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def invalidate(self, session_id: str, conflict: bool = False) -> bool:
+        """
+        세션 항목 삭제
+        
+        Args:
+            session_id: 세션 ID
+            conflict: 다른 워커의 저장으로 인한 무효화 여부 (통계용)
+        
+        Returns:
+            삭제 여부
+        """
+        with self._lock:
+            if conflict:
+                self._conflicts += 1
+            return self._entries.pop(session_id, None) is not None
+    
+    def clear(self) -> int:
+        """
+        캐시 전체 삭제
+        
+        Returns:
+            삭제된 항목 수
+        """
+        with self._lock:
+            cleared = len(self._entries)
+            self._entries.clear()
+            return cleared
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 조회"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "conflicts": self._conflicts,
+                "hit_rate": round(self._hits / lookups * 100, 2) if lookups else 0.0
+            }
+
+
+# 전역 세션 상태 캐시 인스턴스
+session_state_cache = SessionStateCache(
+    max_entries=settings.session_state_cache_max_entries if settings.session_state_cache_enabled else 0,
+    ttl_seconds=settings.session_state_cache_ttl_seconds
+)
@@ -0,0 +1,61 @@
+"""
+세션 상태 스냅샷 직렬화 모듈
+
+StateContext를 chat_session.state_snapshot 한 컬럼에 저장하여, 세션 재개 시 CaseFact/CaseParty/
+CaseEvidence에서 facts를 다시 조합하지 않고 세션 행 조회로 복원합니다.
+conversation_history는 chat_turn 테이블에 따로 기록되므로 스냅샷에 포함하지 않습니다.
+정규화된 사건 테이블에서 복원하면 current_question, skipped_fields, initial_analysis 등이 사라지지만
+스냅샷은 저장 시점의 상태를 그대로 보존합니다.
+
+형식: [형식 버전 1바이트][zlib 압축된 JSON]
+"""
+import json
+import zlib
+from typing import Optional
+from src.langgraph.state import StateContext
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# 스냅샷 형식 버전 (형식이 바뀌면 증가, 다른 버전의 스냅샷은 정규화 테이블에서 복원)
+STATE_SNAPSHOT_FORMAT = 1
+
+# zlib 압축 레벨 (대화 기록 위주의 텍스트라 기본 레벨로도 1/3~1/5로 줄어듦)
+_COMPRESSION_LEVEL = 6
+
+
+def encode_state_snapshot(state: StateContext) -> bytes:
+    """
+    StateContext를 스냅샷 바이트로 직렬화
+    
+    Args:
+        state: StateContext
+    
+    Returns:
+        스냅샷 바이트 (JSON으로 표현할 수 없는 값은 문자열로 저장)
+    """
+    payload = json.dumps(state, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8")
+    return bytes([STATE_SNAPSHOT_FORMAT]) + zlib.compress(payload, _COMPRESSION_LEVEL)
+
+
+def decode_state_snapshot(data: Optional[bytes]) -> Optional[StateContext]:
+    """
+    스냅샷 바이트를 StateContext로 복원
+    
+    Args:
+        data: 스냅샷 바이트
+    
+    Returns:
+        StateContext 또는 None (스냅샷이 없거나, 형식 버전이 다르거나, 손상된 경우)
+    """
+    if not data:
+        return None
+    if data[0] != STATE_SNAPSHOT_FORMAT:
+        logger.info(f"세션 상태 스냅샷 형식 버전 불일치: {data[0]} (현재 {STATE_SNAPSHOT_FORMAT})")
+        return None
+    try:
+        state = json.loads(zlib.decompress(data[1:]).decode("utf-8"))
+    except (zlib.error, UnicodeDecodeError, ValueError) as e:
+        logger.warning(f"세션 상태 스냅샷 복원 실패: {str(e)}")
+        return None
+    return state if isinstance(state, dict) else None
@@ -1,7 +1,7 @@
 """
 요약 생성 함수 모듈
 """
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Callable
 from src.services.gpt_client import gpt_client
 from src.services.prompt_loader import prompt_loader
 from src.utils.logger import get_logger
@@ -54,20 +54,20 @@ class Summarizer:
             logger.error(f"중간 요약 생성 실패: {str(e)}")
             return ""
     
-    def generate_final_summary(
+    def _build_final_summary_prompt(
         self,
         context: Dict[str, Any],
         format_template: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> str:
         """
-        최종 요약 생성
+        최종 요약 프롬프트 생성
         
         Args:
             context: 전체 Context 딕셔너리
             format_template: K4 포맷 템플릿
         
         Returns:
-            구조화된 요약 딕셔너리
+            프롬프트 문자열
         """
         # Context 정보 정리
         main_case_type = context.get('case_type', '') or context.get('main_case_type', '')
@@ -173,6 +173,57 @@ class Summarizer:
                 user_inputs_section, sections_info, important_info_guide_first
             )
         
+        return prompt
+    
+    @staticmethod
+    def _parse_final_summary(content: str, completion_rate: int) -> Dict[str, Any]:
+        """
+        최종 요약 GPT 응답 파싱
+        
+        Args:
+            content: GPT 응답 본문
+            completion_rate: 완성도
+        
+        Returns:
+            구조화된 요약 딕셔너리
+        """
+        # 응답에서 JSON 추출 (견고한 파싱 사용)
+        from src.utils.helpers import parse_json_from_text
+        summary_dict = parse_json_from_text(content.strip(), default={})
+        
+        if summary_dict is None:
+            summary_dict = {}
+        
+        # 요약 텍스트 생성
+        summary_text = "\n".join([
+            f"{key}: {value}"
+            for key, value in summary_dict.items()
+        ])
+        
+        return {
+            "summary_text": summary_text,
+            "structured_data": summary_dict,
+            "completion_rate": completion_rate
+        }
+    
+    def generate_final_summary(
+        self,
+        context: Dict[str, Any],
+        format_template: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        최종 요약 생성
+        
+        Args:
+            context: 전체 Context 딕셔너리
+            format_template: K4 포맷 템플릿
+        
+        Returns:
+            구조화된 요약 딕셔너리
+        """
+        completion_rate = context.get('completion_rate', 0)
+        prompt = self._build_final_summary_prompt(context, format_template)
+        
         try:
             response = self.gpt_client.chat_completion(
                 messages=[{"role": "user", "content": prompt}],
@@ -180,26 +231,55 @@ class Summarizer:
                 max_tokens=800
             )
             
-            # 응답에서 JSON 추출 (견고한 파싱 사용)
-            from src.utils.helpers import parse_json_from_text
-            content = response["content"].strip()
-            summary_dict = parse_json_from_text(content, default={})
-            
-            if summary_dict is None:
-                summary_dict = {}
-            
-            # 요약 텍스트 생성
-            summary_text = "\n".join([
-                f"{key}: {value}"
-                for key, value in summary_dict.items()
-            ])
-            
-            result = {
-                "summary_text": summary_text,
-                "structured_data": summary_dict,
+            result = self._parse_final_summary(response["content"], completion_rate)
+            logger.info("최종 요약 생성 완료")
+            return result
+        
+        except Exception as e:
+            logger.error(f"최종 요약 생성 실패: {str(e)}")
+            return {
+                "summary_text": "",
+                "structured_data": {},
                 "completion_rate": completion_rate
             }
+    
+    async def generate_final_summary_async(
+        self,
+        context: Dict[str, Any],
+        format_template: Optional[Dict[str, Any]] = None,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        최종 요약 생성 (비동기)
+        
+        Args:
+            context: 전체 Context 딕셔너리
+            format_template: K4 포맷 템플릿
+            on_token: 토큰 수신 콜백 (지정 시 스트리밍 API 사용)
+        
+        Returns:
+            구조화된 요약 딕셔너리
+        """
+        completion_rate = context.get('completion_rate', 0)
+        prompt = self._build_final_summary_prompt(context, format_template)
+        messages = [{"role": "user", "content": prompt}]
+        
+        try:
+            if on_token:
+                response = await self.gpt_client.chat_completion_stream_async(
+                    messages=messages,
+                    on_token=on_token,
+                    temperature=0.3,
+                    max_tokens=800
+                )
+            else:
+                response = await self.gpt_client.chat_completion_async(
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=800
+                )
             
+            result = self._parse_final_summary(response["content"], completion_rate)
             logger.info("최종 요약 생성 완료")
             return result
         
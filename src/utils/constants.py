@@ -110,6 +110,43 @@ PARTY_ROLES: Dict[str, str] = {
     "COUNTERPARTY": "상대방"
 }
 
+# 상대방 관계 키워드 → 당사자 타입 (긴 키워드 우선 매칭)
+COUNTERPARTY_RELATIONSHIP_KEYWORDS: Dict[str, str] = {
+    "전 남자친구": "개인",
+    "전 여자친구": "개인",
+    "남자친구": "개인",
+    "여자친구": "개인",
+    "직장 동료": "개인",
+    "직장동료": "개인",
+    "친구": "개인",
+    "지인": "개인",
+    "동료": "개인",
+    "선배": "개인",
+    "후배": "개인",
+    "이웃": "개인",
+    "남편": "개인",
+    "아내": "개인",
+    "배우자": "개인",
+    "전남편": "개인",
+    "전처": "개인",
+    "부모": "개인",
+    "형제": "개인",
+    "친척": "개인",
+    "집주인": "개인",
+    "임대인": "개인",
+    "임차인": "개인",
+    "세입자": "개인",
+    "사장": "개인",
+    "고용주": "개인",
+    "거래처": "법인",
+    "회사": "법인",
+    "업체": "법인",
+    "법인": "법인",
+    "은행": "법인",
+    "보험사": "법인",
+    "쇼핑몰": "법인"
+}
+
 
 # ============================================================================
 # 세션 상태
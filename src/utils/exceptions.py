@@ -41,6 +41,15 @@ class GPTAPIError(LegalChatbotError):
         super().__init__(f"GPT API 오류: {message}", self.ERROR_CODE)
 
 
+class SessionStateConflictError(LegalChatbotError):
+    """다른 요청이 세션 상태를 먼저 저장하여 저장이 거부되었을 때 발생하는 예외"""
+    ERROR_CODE = "SESSION_STATE_CONFLICT"
+    
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        super().__init__(f"다른 요청이 세션 상태를 먼저 갱신했습니다: {session_id}", self.ERROR_CODE)
+
+
 class RAGSearchError(LegalChatbotError):
     """RAG 검색 실패 시 발생하는 예외"""
     ERROR_CODE = "RAG_SEARCH_ERROR"
@@ -8,17 +8,19 @@
 import re
 from typing import Dict, Any, Optional, Tuple
 from src.utils.constants import (
-    EVIDENCE_KEYWORDS_POSITIVE,
     EVIDENCE_KEYWORDS_NEGATIVE,
     EVIDENCE_SIMPLE_POSITIVE_KEYWORDS,
-    EVIDENCE_TYPE_KEYWORDS,
     Limits
 )
 from src.services.entity_extractor import entity_extractor
+from src.services.entity_patterns import has_evidence_keyword, match_evidence_type, match_amount
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 날짜 관련 표현 여부 확인용 패턴 (has_date_pattern)
+_DATE_HINT_PATTERN = re.compile(r'\d+[월일년]|올해|작년|내년|인지|발생')
+
 
 def extract_evidence_from_input(
     user_input: str,
@@ -51,33 +53,12 @@ def extract_evidence_from_input(
         # "네", "있어요", "있음", "있다고" 같은 단순 긍정 응답인 경우
         if any(keyword in user_input_lower for keyword in EVIDENCE_SIMPLE_POSITIVE_KEYWORDS):
             # 증거 타입이 포함되어 있는지 확인
-            evidence_type = None
-            for keyword, evidence_type_value in EVIDENCE_TYPE_KEYWORDS.items():
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, user_input_lower):
-                    evidence_type = evidence_type_value
-                    break
-            
-            return True, evidence_type
+            return True, match_evidence_type(user_input_lower).value
     
     # 긍정 키워드 확인 (단어 경계 확인으로 정확한 매칭)
-    positive_match = False
-    for keyword in EVIDENCE_KEYWORDS_POSITIVE:
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, user_input_lower):
-            positive_match = True
-            break
-    
-    if positive_match:
+    if has_evidence_keyword(user_input_lower):
         # 명시적 증거 키워드가 있으면 evidence_type도 함께 추출
-        evidence_type = None
-        for keyword, evidence_type_value in EVIDENCE_TYPE_KEYWORDS.items():
-            pattern = r'\b' + re.escape(keyword) + r'\b'
-            if re.search(pattern, user_input_lower):
-                evidence_type = evidence_type_value
-                break
-        
-        return True, evidence_type
+        return True, match_evidence_type(user_input_lower).value
     elif any(keyword in user_input_lower for keyword in EVIDENCE_KEYWORDS_NEGATIVE):
         return False, None
     
@@ -101,15 +82,7 @@ def extract_evidence_type_from_input(
     if current_evidence_type:
         return current_evidence_type
     
-    user_input_lower = user_input.lower()
-    evidence_type = None
-    
-    for keyword, evidence_type_value in EVIDENCE_TYPE_KEYWORDS.items():
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, user_input_lower):
-            evidence_type = evidence_type_value
-            break
-    
+    evidence_type = match_evidence_type(user_input.lower()).value
     if evidence_type:
         return evidence_type
     
@@ -169,11 +142,13 @@ def extract_amount_from_input(
     if any(keyword in user_input_lower for keyword in negative_keywords):
         return None  # 명시적으로 None 반환 (다음 필드로 넘어가도록)
     
-    # 숫자 추출 (한글 숫자 단위 처리)
-    numbers = re.findall(
-        r'\d+',
-        user_input.replace(',', '').replace('만', '0000').replace('천', '000')
-    )
+    # 단위/한글 숫자가 있는 금액 표현 (예: "300만원", "삼백오십만 원", "1억 2천만")
+    amount = match_amount(user_input).value
+    if amount is not None and amount >= Limits.MIN_AMOUNT_THRESHOLD:
+        return amount
+    
+    # 금액 질문에 대한 숫자만의 답변 (예: "3000000")
+    numbers = re.findall(r'\d+', user_input.replace(',', ''))
     
     if numbers:
         try:
@@ -231,12 +206,5 @@ def has_date_pattern(user_input: str) -> bool:
     Returns:
         날짜 패턴 포함 여부
     """
-    date_patterns = [
-        r'\d+월', r'\d+일', r'\d+년',
-        r'올해', r'작년', r'내년',
-        r'올해\s*\d+월', r'작년\s*\d+월',
-        r'인지', r'발생'
-    ]
-    
-    return any(re.search(pattern, user_input) for pattern in date_patterns)
+    return _DATE_HINT_PATTERN.search(user_input) is not None
 
@@ -5,6 +5,7 @@ import logging
 import logging.config
 import time
 import functools
+import inspect
 from pathlib import Path
 from typing import Callable, Any
 import yaml
@@ -88,6 +89,32 @@ def log_execution_time(logger: logging.Logger = None):
         logger: 로거 인스턴스 (None이면 함수명으로 로거 생성)
     """
     def decorator(func: Callable) -> Callable:
+        # 코루틴 함수(async 노드 등)는 await 완료 시점까지 측정
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs) -> Any:
+                if logger is None:
+                    log = get_logger(func.__module__)
+                else:
+                    log = logger
+                
+                start_time = time.time()
+                try:
+                    result = await func(*args, **kwargs)
+                    execution_time = time.time() - start_time
+                    log.info(
+                        f"{func.__name__} 실행 완료 - 실행 시간: {execution_time:.3f}초"
+                    )
+                    return result
+                except Exception as e:
+                    execution_time = time.time() - start_time
+                    log.error(
+                        f"{func.__name__} 실행 실패 - 실행 시간: {execution_time:.3f}초 - 오류: {str(e)}"
+                    )
+                    raise
+            
+            return async_wrapper
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
             if logger is None:
@@ -5,11 +5,141 @@ RAG 검색 결과를 파싱하여 실제로 활용할 수 있도록 변환
 import yaml
 from typing import Dict, Any, List, Optional
 from src.rag.parser import RAGDocumentParser
+from src.rag.k2_table import k2_lookup_table
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def get_known_node_queries() -> List[str]:
+    """
+    노드가 반복 사용하는 고정 RAG 쿼리 목록 (쿼리 Embedding 캐시 사전 적재용)
+    
+    Returns:
+        쿼리 리스트
+    """
+    from src.utils.constants import FIELD_INPUT_TYPE_MAPPING, REQUIRED_FIELDS
+    fields = list(dict.fromkeys(list(REQUIRED_FIELDS) + list(FIELD_INPUT_TYPE_MAPPING)))
+    return ["필수 필드", "요약 포맷"] + [f"{field} 질문" for field in fields]
+
+
+def get_k2_required_fields(main_case_type: Optional[str], sub_case_type: Optional[str] = None) -> List[str]:
+    """
+    사건 유형별 K2 필수 필드 조회
+    
+    K2 조회 테이블(메모리)을 우선 사용하고, 테이블에 없는 사건 유형만 벡터 검색으로 폴백합니다.
+    
+    Args:
+        main_case_type: 주 사건 유형 (CIVIL 또는 민사)
+        sub_case_type: 세부 사건 유형 (CIVIL_CONTRACT 등)
+    
+    Returns:
+        필수 필드 목록 (찾지 못하면 빈 리스트)
+    """
+    required_fields = k2_lookup_table.get_required_fields(main_case_type, sub_case_type)
+    if required_fields:
+        return required_fields
+    
+    from src.rag.searcher import rag_searcher
+    rag_results = rag_searcher.search(
+        query="필수 필드",
+        knowledge_type="K2",
+        main_case_type=main_case_type,
+        sub_case_type=sub_case_type,
+        top_k=1
+    )
+    return extract_required_fields_from_rag(rag_results)
+
+
+def get_k2_question_template(
+    field: str,
+    main_case_type: Optional[str],
+    sub_case_type: Optional[str] = None
+) -> Optional[str]:
+    """
+    사건 유형별 K2 질문 템플릿 조회
+    
+    K2 조회 테이블(메모리)을 우선 사용하고, 테이블에 없는 사건 유형만 벡터 검색으로 폴백합니다.
+    
+    Args:
+        field: 필드명 (예: "incident_date", "counterparty")
+        main_case_type: 주 사건 유형
+        sub_case_type: 세부 사건 유형
+    
+    Returns:
+        질문 템플릿 문자열 또는 None
+    """
+    entry = k2_lookup_table.get(main_case_type, sub_case_type)
+    if entry:
+        return entry.question_templates.get(field)
+    
+    from src.rag.searcher import rag_searcher
+    rag_results = rag_searcher.search(
+        query=f"{field} 질문",
+        knowledge_type="K2",
+        main_case_type=main_case_type,
+        sub_case_type=sub_case_type,
+        top_k=1
+    )
+    return extract_question_template_from_rag(rag_results, field)
+
+
+def get_k2_field_guide(
+    main_case_type: Optional[str],
+    sub_case_type: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    사건 유형별 K2 필수 필드와 필드별 질문 템플릿을 한 번에 조회
+    
+    K2 조회 테이블(메모리)을 우선 사용하고, 테이블에 없는 사건 유형은 필수 필드와 질문 템플릿
+    쿼리를 search_many 한 번으로 묶어 벡터 검색합니다 (Embedding 배치 1회, 벡터 DB 쿼리 1회).
+    
+    Args:
+        main_case_type: 주 사건 유형
+        sub_case_type: 세부 사건 유형
+        fields: 질문 템플릿을 조회할 필드 리스트
+    
+    Returns:
+        {"required_fields": [...], "question_templates": {필드명: 질문}}
+    """
+    fields = list(dict.fromkeys(fields or []))
+    entry = k2_lookup_table.get(main_case_type, sub_case_type)
+    if entry:
+        return {
+            "required_fields": list(entry.required_fields),
+            "question_templates": {
+                field: entry.question_templates[field]
+                for field in fields
+                if field in entry.question_templates
+            }
+        }
+    
+    from src.rag.searcher import rag_searcher, SearchSpec
+    queries = ["필수 필드"] + [f"{field} 질문" for field in fields]
+    all_results = rag_searcher.search_many([
+        SearchSpec(
+            query=query,
+            knowledge_type="K2",
+            main_case_type=main_case_type,
+            sub_case_type=sub_case_type,
+            top_k=1
+        )
+        for query in queries
+    ])
+    
+    question_templates = {}
+    for field, rag_results in zip(fields, all_results[1:]):
+        question = extract_question_template_from_rag(rag_results, field)
+        if question:
+            question_templates[field] = question
+    
+    return {
+        "required_fields": extract_required_fields_from_rag(all_results[0]),
+        "question_templates": question_templates
+    }
+
+
 def extract_required_fields_from_rag(rag_results: List[Dict[str, Any]]) -> List[str]:
     """
     RAG K2 결과에서 필수 필드 목록 추출
@@ -0,0 +1,77 @@
+"""
+Embedding 추론 백엔드 parity 통합 테스트
+
+양자화/ONNX 백엔드의 Embedding이 PyTorch float32 모델과 코사인 유사도 기준으로 거의 같은지,
+그리고 검색 순위(쿼리별 최근접 문서)가 유지되는지 확인합니다. 실제 모델 파일이 필요하며,
+sentence-transformers가 없거나 모델을 받을 수 없는 환경(오프라인 CI)에서는 건너뜁니다.
+"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("sentence_transformers")
+
+from src.rag import embeddings as embeddings_module
+from src.rag.embeddings import EmbeddingModel
+
+MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+QUERIES = [
+    "필수 필드",
+    "친구에게 빌려준 돈을 돌려받지 못했어요",
+    "전세 보증금을 집주인이 돌려주지 않습니다",
+    "이혼하면서 양육권을 가져오고 싶어요",
+]
+
+DOCUMENTS = [
+    "대여금 반환 청구: 금전을 빌려주었으나 변제기가 지나도 돌려받지 못한 경우",
+    "임대차보증금 반환: 임대차 종료 후 임대인이 보증금을 반환하지 않는 경우",
+    "양육권 및 친권자 지정: 이혼 시 미성년 자녀의 양육자를 정하는 경우",
+    "과징금 부과 처분 취소: 행정청의 과징금 처분에 불복하는 경우",
+]
+
+# 백엔드별 최소 코사인 유사도
+MIN_COSINE = {"torch_int8": 0.97, "onnx": 0.999}
+
+
+def _load(backend: str) -> EmbeddingModel:
+    try:
+        with patch.object(embeddings_module.settings, "embedding_model", MODEL_NAME), \
+                patch.object(embeddings_module.settings, "embedding_backend", backend):
+            return EmbeddingModel()
+    except OSError as e:
+        # 모델 파일이 없고 Hugging Face Hub에서 받을 수 없음 (오프라인 등)
+        pytest.skip(f"Embedding 모델을 로드할 수 없습니다: {MODEL_NAME} - {str(e)}")
+
+
+def _cosine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    return np.sum(a * b, axis=1) / (np.linalg.norm(a, axis=1) * np.linalg.norm(b, axis=1))
+
+
+@pytest.fixture(scope="module")
+def reference() -> EmbeddingModel:
+    """PyTorch float32 기준 모델"""
+    return _load("torch")
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("backend", ["torch_int8", "onnx"])
+def test_backend_matches_torch_embeddings(reference: EmbeddingModel, backend: str):
+    """백엔드 Embedding이 기준 모델과 코사인 유사도 임계값 이상이고 최근접 문서가 같음"""
+    if backend == "onnx" and not embeddings_module.ONNX_AVAILABLE:
+        pytest.skip("onnxruntime/optimum 미설치")
+    model = _load(backend)
+
+    texts = QUERIES + DOCUMENTS
+    expected = reference.encode(texts)
+    actual = model.encode(texts)
+    assert actual.shape == expected.shape
+    assert _cosine(expected, actual).min() >= MIN_COSINE[backend]
+
+    def nearest(vectors: np.ndarray) -> list:
+        queries, documents = vectors[:len(QUERIES)], vectors[len(QUERIES):]
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+        documents = documents / np.linalg.norm(documents, axis=1, keepdims=True)
+        return (queries @ documents.T).argmax(axis=1).tolist()
+
+    assert nearest(actual) == nearest(expected)
@@ -3,6 +3,7 @@ Q-A 매칭 방식 통합 테스트
 전체 대화 흐름 테스트 (1차 서술 분석 → 질문 필터링 → Q-A 저장 → Facts 추출)
 """
 import pytest
+from contextlib import contextmanager
 from unittest.mock import Mock, patch, MagicMock
 from src.langgraph.state import create_initial_context, StateContext
 from src.langgraph.nodes import (
@@ -13,6 +14,18 @@ from src.langgraph.nodes import (
 )
 
 
+@contextmanager
+def _without_k2_guide():
+    """K2 조회 테이블과 벡터 검색 폴백 모두 결과 없음 (기본 필수 필드/질문 사용)"""
+    with patch('src.utils.rag_helpers.k2_lookup_table') as mock_k2, \
+         patch('src.rag.searcher.rag_searcher') as mock_rag:
+        mock_k2.get.return_value = None
+        mock_k2.get_required_fields.return_value = []
+        mock_rag.search.return_value = []
+        mock_rag.search_many.side_effect = lambda specs: [[] for _ in specs]
+        yield mock_rag
+
+
 @pytest.mark.integration
 class TestQAMatchingFlow:
     """Q-A 매칭 방식 전체 흐름 테스트"""
@@ -120,9 +133,7 @@ class TestQAMatchingFlow:
         state["conversation_history"] = []
         state["skipped_fields"] = []
         
-        with patch('src.langgraph.nodes.fact_collection_node.rag_searcher') as mock_rag:
-            mock_rag.search.return_value = []
-            
+        with _without_k2_guide():
             result = fact_collection_node(state)
             
             # Q-A 쌍이 저장되었는지 확인
@@ -153,7 +164,7 @@ class TestQAMatchingFlow:
             }
         ]
         
-        with patch('src.langgraph.nodes.validation_node.rag_searcher') as mock_rag, \
+        with _without_k2_guide() as mock_rag, \
              patch('src.langgraph.nodes.validation_node._extract_facts_from_conversation') as mock_extract, \
              patch('src.langgraph.nodes.validation_node.db_manager') as mock_db:
             
@@ -188,9 +199,7 @@ class TestQAMatchingFlow:
         state["conversation_history"] = []
         state["last_user_input"] = ""  # 사용자 입력 없음
         
-        with patch('src.langgraph.nodes.fact_collection_node.rag_searcher') as mock_rag:
-            mock_rag.search.return_value = []
-            
+        with _without_k2_guide():
             result = fact_collection_node(state)
             
             # 다음 질문이 skipped_fields에 포함되지 않았는지 확인
@@ -210,7 +219,7 @@ class TestQAMatchingFlow:
         state["skipped_fields"] = ["incident_date", "amount"]  # 이미 답변됨
         state["conversation_history"] = []
         
-        with patch('src.langgraph.nodes.re_question_node.rag_searcher') as mock_rag, \
+        with _without_k2_guide() as mock_rag, \
              patch('src.langgraph.nodes.re_question_node.get_next_missing_field') as mock_next:
             
             mock_rag.search.return_value = []
@@ -244,7 +253,7 @@ class TestQAMatchingErrorHandling:
             }
         ]
         
-        with patch('src.langgraph.nodes.validation_node.rag_searcher') as mock_rag, \
+        with _without_k2_guide() as mock_rag, \
              patch('src.langgraph.nodes.validation_node._extract_facts_from_conversation') as mock_extract, \
              patch('src.langgraph.nodes.validation_node.db_manager') as mock_db:
             
@@ -0,0 +1,166 @@
+"""
+CASE_CLASSIFICATION 병렬 실행 / 1차 서술 분석 선실행 단위 테스트
+"""
+import contextvars
+import importlib
+import pytest
+from unittest.mock import patch, AsyncMock
+
+# 패키지에서 같은 이름의 노드 함수를 re-export하므로 모듈을 직접 로드
+node = importlib.import_module("src.langgraph.nodes.case_classification_node")
+
+
+def _k1_result(main_case_type: str, sub_case_type: str):
+    return [{"metadata": {"main_case_type": main_case_type, "sub_case_type": sub_case_type}}]
+
+
+def _make_state():
+    return {
+        "session_id": "sess_test",
+        "last_user_input": "친구가 300만원을 빌려가서 갚지 않습니다.",
+        "facts": {},
+    }
+
+
+ANALYSIS = {
+    "extracted_facts": {"amount": 3000000},
+    "answered_fields": ["amount"],
+    "missing_fields": ["incident_date"],
+}
+
+
+def _patches(k1_by_query, analyze):
+    """외부 호출(GPT, RAG, DB) 모킹"""
+    def search_candidates(keywords, user_input):
+        query = " ".join(keywords) if keywords else user_input
+        return k1_by_query(query)
+
+    return [
+        patch.object(node.keyword_extractor, "extract_semantic_features",
+                     return_value={"keywords": ["대여금"]}),
+        patch.object(node.keyword_extractor, "extract_semantic_features_async",
+                     new=AsyncMock(return_value={"keywords": ["대여금"]})),
+        patch.object(node, "_search_case_type_candidates", side_effect=search_candidates),
+        patch.object(node, "_get_required_fields", return_value=["amount", "incident_date"]),
+        patch.object(node, "_analyze_initial_description", side_effect=analyze),
+        patch.object(node, "_analyze_initial_description_async",
+                     new=AsyncMock(side_effect=analyze)),
+        patch.object(node, "_save_case_master"),
+        patch.object(node, "_set_next_question",
+                     side_effect=lambda state, *args: {**state, "next_state": "FACT_COLLECTION"}),
+        patch.object(node, "_classify_with_gpt"),
+        patch.object(node.settings, "classification_speculative_analysis", True),
+    ]
+
+
+def _run_with_patches(patches, func, *args):
+    for p in patches:
+        p.start()
+    try:
+        return func(*args)
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+@pytest.mark.unit
+def test_speculative_analysis_reused_when_candidate_matches():
+    """K1 후보와 확정 사건 유형이 같으면 1차 서술 분석을 한 번만 수행하는지 테스트"""
+    calls = []
+
+    def analyze(description, case_type, required_fields):
+        calls.append(case_type)
+        return ANALYSIS
+
+    patches = _patches(lambda query: _k1_result("민사", "대여금"), analyze)
+    result = _run_with_patches(patches, node.case_classification_node, _make_state())
+
+    assert calls == ["CIVIL"]
+    assert result["case_type"] == "CIVIL"
+    assert result["skipped_fields"] == ["amount"]
+    assert result["missing_fields"] == ["incident_date"]
+
+
+@pytest.mark.unit
+def test_speculative_analysis_discarded_when_candidate_differs():
+    """K1 후보와 확정 사건 유형이 다르면 확정 사건 유형으로 다시 분석하는지 테스트"""
+    calls = []
+
+    def analyze(description, case_type, required_fields):
+        calls.append(case_type)
+        return ANALYSIS
+
+    def k1_by_query(query):
+        # 원문 조회는 형사 후보, 키워드 조회는 민사로 확정
+        return _k1_result("민사", "대여금") if query == "대여금" else _k1_result("형사", "사기")
+
+    patches = _patches(k1_by_query, analyze)
+    result = _run_with_patches(patches, node.case_classification_node, _make_state())
+
+    assert "CIVIL" in calls
+    assert result["case_type"] == "CIVIL"
+    assert result["initial_analysis"] == ANALYSIS
+
+
+@pytest.mark.unit
+async def test_async_node_reuses_speculative_analysis():
+    """비동기 노드에서도 선실행 결과를 재사용하는지 테스트"""
+    calls = []
+
+    def analyze(description, case_type, required_fields):
+        calls.append(case_type)
+        return ANALYSIS
+
+    patches = _patches(lambda query: _k1_result("민사", "대여금"), analyze)
+    for p in patches:
+        p.start()
+    try:
+        result = await node.case_classification_node_async(_make_state())
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+    assert calls == ["CIVIL"]
+    assert result["case_type"] == "CIVIL"
+    assert result["next_state"] == "FACT_COLLECTION"
+
+
+@pytest.mark.unit
+def test_speculation_skipped_when_top_candidates_disagree():
+    """원문 K1 상위 후보의 사건 유형이 엇갈리면 선실행하지 않는지 테스트"""
+    calls = []
+
+    def analyze(description, case_type, required_fields):
+        calls.append(case_type)
+        return ANALYSIS
+
+    def k1_by_query(query):
+        if query == "대여금":
+            return _k1_result("민사", "대여금")
+        return _k1_result("형사", "사기") + _k1_result("민사", "대여금")
+
+    patches = _patches(k1_by_query, analyze)
+    result = _run_with_patches(patches, node.case_classification_node, _make_state())
+
+    assert calls == ["CIVIL"]
+    assert result["case_type"] == "CIVIL"
+
+
+@pytest.mark.unit
+def test_fanout_tasks_see_caller_context():
+    """병렬 작업이 호출한 쪽의 컨텍스트 변수(턴 단위 DB 작업 등)를 그대로 보는지 테스트"""
+    marker = contextvars.ContextVar("marker", default=None)
+    seen = []
+
+    def analyze(description, case_type, required_fields):
+        seen.append(marker.get())
+        return ANALYSIS
+
+    patches = _patches(lambda query: _k1_result("민사", "대여금"), analyze)
+    token = marker.set("turn-1")
+    try:
+        _run_with_patches(patches, node.case_classification_node, _make_state())
+    finally:
+        marker.reset(token)
+
+    assert seen == ["turn-1"]
@@ -0,0 +1,47 @@
+"""
+정규화 사건 테이블 비동기 기록 단위 테스트
+"""
+import threading
+import pytest
+from src.services.case_table_writer import CaseTableWriter
+
+
+@pytest.mark.unit
+def test_writes_run_in_order_off_the_caller_thread_and_flush_waits():
+    """기록은 전용 스레드에서 등록 순서대로 실행되고 flush는 세션의 기록이 끝날 때까지 대기"""
+    writer = CaseTableWriter(async_mode=True)
+    release = threading.Event()
+    written = []
+
+    def write(session_id, value):
+        release.wait(5)
+        written.append((session_id, value, threading.current_thread().name))
+
+    writer.submit("sess_a", write, "sess_a", 1)
+    writer.submit("sess_b", write, "sess_b", 2)
+    writer.submit("sess_a", write, "sess_a", 3)
+    assert written == []
+    assert writer.flush("sess_a", timeout=0.05) is False
+
+    release.set()
+    assert writer.flush("sess_a", timeout=5) is True
+    assert [value for _, value, _ in written] == [1, 2, 3]
+    assert all(name.startswith("case-table-writer") for _, _, name in written)
+    writer.shutdown()
+
+
+@pytest.mark.unit
+def test_sync_mode_and_failures_are_counted():
+    """동기 모드는 바로 기록하고 실패는 예외를 전파하지 않고 집계"""
+    writer = CaseTableWriter(async_mode=False)
+    written = []
+    writer.submit("sess_a", written.append, 1)
+
+    def fail():
+        raise RuntimeError("DB 오류")
+
+    writer.submit("sess_a", fail)
+    assert written == [1]
+    assert writer.flush() is True
+    stats = writer.get_stats()
+    assert (stats["completed"], stats["failed"], stats["pending_sessions"]) == (1, 1, 0)
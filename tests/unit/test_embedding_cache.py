@@ -0,0 +1,138 @@
+"""
+쿼리 Embedding LRU 캐시 단위 테스트
+"""
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+from src.rag import embeddings as embeddings_module
+from src.rag.embeddings import EmbeddingModel, QueryEmbeddingCache
+
+
+def _fake_encode(texts, batch_size=32):
+    if isinstance(texts, str):
+        texts = [texts]
+    return np.array([[float(len(text)), 1.0] for text in texts])
+
+
+def _model(cache_size: int = 8) -> EmbeddingModel:
+    """실제 모델을 로드하지 않는 EmbeddingModel"""
+    with patch.object(embeddings_module.settings, "query_embedding_cache_size", cache_size), \
+            patch.object(EmbeddingModel, "_initialize"):
+        model = EmbeddingModel()
+    model.encode = _fake_encode
+    return model
+
+
+@pytest.mark.unit
+def test_query_cache_lru_eviction_and_stats():
+    """상한 초과 시 가장 오래 사용되지 않은 항목부터 제거"""
+    cache = QueryEmbeddingCache(max_entries=2)
+    cache.set("a", np.ones(2))
+    cache.set("b", np.ones(2))
+    assert cache.get("a") is not None
+    cache.set("c", np.ones(2))
+
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    stats = cache.get_stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (2, 2, 1, 1)
+
+
+@pytest.mark.unit
+def test_encode_query_reuses_cached_vector():
+    """같은 쿼리는 모델을 다시 호출하지 않고 읽기 전용 벡터 재사용"""
+    model = _model()
+    with patch.object(model, "encode", side_effect=_fake_encode) as encode:
+        first = model.encode_query("필수 필드")
+        second = model.encode_query("필수 필드")
+
+    assert encode.call_count == 1
+    assert first is second
+    assert not first.flags.writeable
+    assert model.query_cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.unit
+def test_encode_query_is_thread_safe():
+    """동시 호출에서도 결과와 통계가 일관됨"""
+    model = _model()
+    queries = ["필수 필드", "amount 질문", "요약 포맷"] * 50
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(model.encode_query, queries))
+
+    assert all(result[0] == len(query) for query, result in zip(queries, results))
+    stats = model.query_cache.get_stats()
+    assert stats["hits"] + stats["misses"] == len(queries)
+    assert stats["entries"] == 3
+
+
+@pytest.mark.unit
+def test_model_change_invalidates_cache():
+    """settings.embedding_model이 바뀌면 모델을 다시 로드하고 캐시 무효화"""
+    model = _model()
+    model.encode_query("필수 필드")
+
+    with patch.object(embeddings_module.settings, "embedding_model", "other-model"), \
+            patch.object(model, "_initialize") as initialize:
+        model.encode_query("amount 질문")
+
+    initialize.assert_called_once()
+    assert model.model_name == "other-model"
+    assert model.query_cache.get_stats()["entries"] == 1
+
+
+@pytest.mark.unit
+def test_prewarm_loads_from_disk_for_same_model(tmp_path: Path):
+    """사전 적재는 디스크 캐시가 같은 모델이면 재계산 없이 로드"""
+    cache_path = tmp_path / "query_embeddings.npz"
+    queries = ["필수 필드", "amount 질문"]
+
+    first = _model()
+    with patch.object(first, "encode", side_effect=_fake_encode) as encode:
+        assert first.prewarm_query_cache(queries, cache_path) == 2
+    assert encode.call_count == 1
+    assert cache_path.exists()
+
+    second = _model()
+    with patch.object(second, "encode", side_effect=_fake_encode) as encode:
+        second.prewarm_query_cache(queries + ["요약 포맷"], cache_path)
+        vector = second.encode_query("amount 질문")
+
+    # 디스크에 없던 "요약 포맷"만 새로 계산
+    encode.assert_called_once_with(["요약 포맷"])
+    assert vector[0] == len("amount 질문")
+
+    third = _model()
+    third.model_name = "other-model"
+    with patch.object(embeddings_module.settings, "embedding_model", "other-model"), \
+            patch.object(third, "encode", side_effect=_fake_encode) as encode:
+        third.prewarm_query_cache(queries, cache_path)
+    encode.assert_called_once_with(queries)
+
+
+@pytest.mark.unit
+def test_backend_change_reloads_model_and_changes_model_id():
+    """settings.embedding_backend가 바뀌면 모델을 다시 로드하고 디스크 캐시 식별자도 달라짐"""
+    model = _model()
+    model.encode_query("필수 필드")
+    assert model.model_id == model.model_name
+
+    with patch.object(embeddings_module.settings, "embedding_backend", "torch_int8"), \
+            patch.object(model, "_initialize") as initialize:
+        model.encode_query("amount 질문")
+
+    initialize.assert_called_once()
+    assert model.backend == "torch_int8"
+    assert model.model_id == f"{model.model_name}@torch_int8"
+    assert model.query_cache.get_stats()["entries"] == 1
+
+
+@pytest.mark.unit
+def test_unknown_backend_is_rejected():
+    """지원하지 않는 백엔드는 모델을 로드하기 전에 거부"""
+    model = _model()
+    model.backend = "tensorrt"
+    with pytest.raises(ValueError):
+        model._load_sentence_transformer()
@@ -0,0 +1,127 @@
+"""
+Embedding 사이드카 단위 테스트
+"""
+import threading
+import numpy as np
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.rag import embeddings as embeddings_module
+from src.rag.embedding_sidecar import EmbeddingSidecarClient, EmbeddingSidecarServer, MicroBatcher
+from src.rag.embeddings import EmbeddingModel
+
+
+class _FakeModel:
+    """호출 횟수를 기록하는 가짜 encode (텍스트 길이로 벡터 생성)"""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def encode(self, texts):
+        with self.lock:
+            self.calls.append(list(texts))
+        if any(text == "boom" for text in texts):
+            raise RuntimeError("encode 실패")
+        return np.array([[float(len(text)), 1.0] for text in texts])
+
+
+@pytest.fixture
+def sidecar(tmp_path: Path):
+    """임시 소켓에서 실행되는 사이드카 서버"""
+    model = _FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch=64, max_wait_ms=50)
+    batcher.start()
+    socket_path = tmp_path / "embedding.sock"
+    server = EmbeddingSidecarServer(socket_path, batcher, "fake-model")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path, model, batcher
+    server.shutdown()
+    server.server_close()
+    batcher.stop()
+
+
+@pytest.mark.unit
+def test_client_encodes_through_sidecar(sidecar):
+    """요청 순서대로 벡터를 받고 모델 식별자를 조회"""
+    socket_path, _, _ = sidecar
+    client = EmbeddingSidecarClient(socket_path, timeout=5)
+
+    vectors = client.encode(["a", "abc"])
+    assert vectors.dtype == np.float32
+    assert vectors.tolist() == [[1.0, 1.0], [3.0, 1.0]]
+    assert client.encode([]).shape[0] == 0
+    assert client.model_id == "fake-model"
+
+
+@pytest.mark.unit
+def test_concurrent_requests_are_micro_batched(sidecar):
+    """동시에 들어온 요청을 모아 한 번에 계산하고 요청별 결과를 정확히 나눔"""
+    socket_path, model, batcher = sidecar
+    client = EmbeddingSidecarClient(socket_path, timeout=5)
+    requests = [["x" * (i + 1), "y" * (i + 10)] for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(client.encode, requests))
+
+    for texts, vectors in zip(requests, results):
+        assert vectors[:, 0].tolist() == [float(len(text)) for text in texts]
+    assert batcher.requests == 8
+    assert len(model.calls) < 8
+
+
+@pytest.mark.unit
+def test_encode_error_is_returned_and_connection_reused(sidecar):
+    """encode 실패는 RuntimeError로 전달되고 같은 연결로 다음 요청을 처리"""
+    socket_path, _, _ = sidecar
+    client = EmbeddingSidecarClient(socket_path, timeout=5)
+
+    with pytest.raises(RuntimeError, match="encode 실패"):
+        client.encode(["boom"])
+    assert client.encode(["ok"]).tolist() == [[2.0, 1.0]]
+
+
+@pytest.mark.unit
+def test_embedding_model_uses_sidecar_and_falls_back(sidecar, tmp_path: Path):
+    """sidecar 서비스는 사이드카로 위임하고, 연결 실패 시 설정에 따라 로컬 모델로 임시 전환"""
+    socket_path, _, _ = sidecar
+    with patch.object(embeddings_module.settings, "embedding_sidecar_socket", str(socket_path)):
+        model = EmbeddingModel(service="sidecar")
+    assert model.model_type == "sidecar"
+    assert model.encode("abcd").tolist() == [[4.0, 1.0]]
+    assert model.model_id == "fake-model"
+
+    missing_socket = str(tmp_path / "missing.sock")
+    with patch.object(embeddings_module.settings, "embedding_sidecar_socket", missing_socket), \
+            patch.object(embeddings_module.settings, "embedding_sidecar_fallback", False):
+        model = EmbeddingModel(service="sidecar")
+        with pytest.raises(ConnectionError):
+            model.encode("abcd")
+
+    local_client = MagicMock()
+    local_client.embeddings.create.return_value = SimpleNamespace(data=[SimpleNamespace(embedding=[0.0, 1.0])])
+    with patch.object(embeddings_module.settings, "embedding_sidecar_socket", missing_socket), \
+            patch.object(embeddings_module.settings, "embedding_model", "text-embedding-3-small"), \
+            patch.object(embeddings_module, "OpenAI", return_value=local_client):
+        model = EmbeddingModel(service="sidecar")
+        assert model.encode("abcd").tolist() == [[0.0, 1.0]]
+        assert model.encode("abcd").tolist() == [[0.0, 1.0]]
+    assert model.service == "sidecar"
+    assert model.model_type == "sidecar"
+    assert model.get_sidecar_stats() == {
+        "sidecar_failures": 1, "fallback_encodes": 2, "recoveries": 0, "fallback_active": True
+    }
+
+    # 재연결 간격이 지나면 사이드카를 다시 시도하고, 복구되면 로컬 모델을 해제
+    model.sidecar.socket_path = socket_path
+    model._sidecar_retry_at = 0.0
+    assert model.encode("abcd").tolist() == [[4.0, 1.0]]
+    assert model.get_sidecar_stats() == {
+        "sidecar_failures": 1, "fallback_encodes": 2, "recoveries": 1, "fallback_active": False
+    }
+
+    with pytest.raises(ValueError):
+        EmbeddingModel(service="remote")
@@ -0,0 +1,155 @@
+"""
+결정적 엔티티 추출 엔진 단위 테스트
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from src.services.entity_patterns import (
+    FallbackReason,
+    parse_korean_number,
+    match_date,
+    match_amount,
+    match_counterparty,
+    match_evidence_type
+)
+from src.services.entity_extractor import EntityExtractor
+
+NOW = datetime(2025, 6, 15)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("token, expected", [
+    ("삼백오십만", 3500000),
+    ("3천5백", 3500),
+    ("3천5백만", 35000000),
+    ("1억 2천만", 120000000),
+    ("1.5억", 150000000),
+    ("3,000,000", 3000000),
+    ("만", 10000),
+])
+def test_parse_korean_number(token, expected):
+    """한글 숫자/단위 혼합 표현 변환"""
+    assert parse_korean_number(token) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, expected", [
+    ("어제 빌려줬어요", "2025-06-14"),
+    ("2023년 3월 15일에", "2023-03-15"),
+    ("2023.3.5", "2023-03-05"),
+    ("작년 3월", "2024-03-01"),
+    ("지난달 10일", "2025-05-10"),
+    ("일주일 전", "2025-06-08"),
+    ("삼일 전", "2025-06-12"),
+    ("두 달 전", "2025-04-16"),
+    ("이틀 전", "2025-06-13"),
+    ("11월 20일에 만났어요", "2025-11-20"),
+    ("이번달 31일", "2025-06-30"),
+])
+def test_match_date(text, expected):
+    """상대/절대 날짜 추출"""
+    assert match_date(text, NOW).value == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, start, end", [
+    ("3월부터 5월까지", "2025-03-01", "2025-05-31"),
+    ("3월 1일~15일", "2025-03-01", "2025-03-15"),
+    ("2024-01-02 ~ 2024-02-03", "2024-01-02", "2024-02-03"),
+])
+def test_match_date_range(text, start, end):
+    """기간 표현은 시작일과 종료일 반환"""
+    result = match_date(text, NOW)
+    assert (result.value, result.range_end) == (start, end)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, reason", [
+    ("작년에 있었던 일", FallbackReason.YEAR_ONLY),
+    ("얼마 전에", FallbackReason.VAGUE),
+    ("13월에", FallbackReason.INVALID_DATE),
+    ("3월 32일", FallbackReason.INVALID_DATE),
+    ("2024년 2월 30일", FallbackReason.INVALID_DATE),
+    ("잘 모르겠어요", FallbackReason.NO_MATCH),
+])
+def test_match_date_fallback_reason(text, reason):
+    """날짜 추출 실패 시 폴백 사유 반환"""
+    result = match_date(text, NOW)
+    assert result.value is None
+    assert result.fallback_reason == reason
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text, expected", [
+    ("300만원 빌려줬어요", 3000000),
+    ("삼백오십만 원", 3500000),
+    ("1억 2천만원", 120000000),
+    ("1억이 넘는 돈", 100000000),
+    ("오천만원", 50000000),
+    ("5 만원", 50000),
+    ("삼십 만원", 300000),
+    ("오십 만원", 500000),
+    ("3백 만원", 3000000),
+    ("천 오백만원", 15000000),
+    ("만 오천원", 15000),
+    ("사원이에요", None),
+    ("천만에요", None),
+    ("3월 15일", None),
+])
+def test_match_amount(text, expected):
+    """금액 추출 (금액이 아닌 한글 단어는 제외)"""
+    assert match_amount(text).value == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("text", [
+    "몇백만원 정도",
+    "1억 5천",
+    "이 백만원짜리",
+])
+def test_match_amount_vague(text):
+    """어림수, 단위가 생략되거나 숫자와 단위가 떨어진 표현은 금액으로 확정하지 않음"""
+    result = match_amount(text)
+    assert result.value is None
+    assert result.fallback_reason == FallbackReason.VAGUE
+
+
+@pytest.mark.unit
+def test_match_counterparty_and_evidence():
+    """상대방 관계/이름 및 증거 타입 추출"""
+    party = match_counterparty("김철수 씨가 회사 대표예요").value
+    assert party["name"] == "김철수"
+    assert party["type"] == "법인"
+    assert match_counterparty("그냥요").value is None
+    assert match_evidence_type("계약서 있어요").value == "계약서"
+
+
+@pytest.mark.unit
+def test_extractor_tracks_fallback_rate():
+    """패턴 추출 실패 시에만 GPT 폴백하고 필드별 폴백 비율 집계"""
+    extractor = EntityExtractor()
+    with patch.object(extractor, "_extract_date_with_gpt", return_value="2024-05-01") as gpt_fallback:
+        assert extractor.extract_date("2024년 5월 1일") == "2024-05-01"
+        assert extractor.extract_date("얼마 전에") == "2024-05-01"
+
+    gpt_fallback.assert_called_once_with("얼마 전에")
+    stats = extractor.get_fallback_stats()["date"]
+    assert stats["deterministic"] == 1
+    assert stats["gpt_fallback"] == 1
+    assert stats["fallback_rate"] == 50.0
+    assert stats["reasons"] == {"vague_expression": 1}
+
+
+@pytest.mark.unit
+async def test_fallback_stats_are_exposed_by_stats_endpoint():
+    """GPT 폴백 통계는 /stats/entity-extraction으로 조회"""
+    from src.api.routers import stats as stats_router
+
+    extractor = EntityExtractor()
+    with patch.object(extractor, "_extract_date_with_gpt", return_value=None):
+        extractor.extract_date("얼마 전에")
+
+    with patch.object(stats_router, "entity_extractor", extractor):
+        response = await stats_router.get_entity_extraction_stats("test")
+
+    assert response["data"]["date"]["gpt_fallback"] == 1
@@ -0,0 +1,164 @@
+"""
+단일 호출(fused) 사건 분류 단위 테스트
+"""
+import importlib
+import json
+import pytest
+from unittest.mock import patch
+from src.langgraph.nodes.fused_classification import (
+    _validate_fused_result,
+    _parse_fused_content
+)
+from src.services.ab_test_manager import ABTestManager, ClassificationMethod
+
+node = importlib.import_module("src.langgraph.nodes.case_classification_node")
+
+
+VALID_RESPONSE = {
+    "domain": "민사",
+    "keywords": ["대여금", "변제"],
+    "main_issue": "대여금 미변제",
+    "main_case_type": "민사",
+    "sub_case_type": "대여금",
+    "extracted_facts": {
+        "incident_date": "2024-01-02",
+        "amount": 3000000,
+        "counterparty": "친구",
+        "counterparty_type": "개인",
+        "evidence": None,
+        "evidence_type": None
+    },
+    "answered_fields": ["incident_date", "amount", "counterparty", "counterparty_type"],
+    "missing_fields": ["evidence", "evidence_type"]
+}
+
+
+class TestValidateFusedResult:
+    """fused 응답 검증 테스트"""
+
+    @pytest.mark.unit
+    def test_valid_response(self):
+        """정상 응답은 검증 통과"""
+        assert _validate_fused_result(VALID_RESPONSE) is None
+
+    @pytest.mark.unit
+    def test_unknown_case_type(self):
+        """알 수 없는 사건 유형은 검증 실패"""
+        assert _validate_fused_result({**VALID_RESPONSE, "main_case_type": "기타"}) is not None
+
+    @pytest.mark.unit
+    def test_missing_extracted_facts(self):
+        """extracted_facts 누락 시 검증 실패"""
+        response = {k: v for k, v in VALID_RESPONSE.items() if k != "extracted_facts"}
+        assert _validate_fused_result(response) is not None
+
+    @pytest.mark.unit
+    def test_invalid_json_returns_none(self):
+        """JSON 파싱 실패 시 None 반환 (다중 호출 폴백)"""
+        assert _parse_fused_content("not json") is None
+
+    @pytest.mark.unit
+    def test_parse_normalizes_result(self):
+        """정상 응답 정규화"""
+        result = _parse_fused_content(json.dumps(VALID_RESPONSE, ensure_ascii=False))
+
+        assert result["main_case_type"] == "민사"
+        assert result["semantic_features"]["keywords"] == ["대여금", "변제"]
+        assert result["extracted_facts"]["amount"] == 3000000
+
+
+def _node_patches(fused_content):
+    """외부 호출(GPT, RAG, DB) 모킹"""
+    manager = ABTestManager()
+    manager.default_classification_method = ClassificationMethod.FUSED.value
+    return manager, [
+        patch.object(node, "ab_test_manager", manager),
+        patch.object(node, "_search_case_type_candidates", return_value=[]),
+        patch.object(node, "_get_required_fields", return_value=["incident_date", "counterparty", "amount", "evidence"]),
+        patch.object(node, "_save_case_master"),
+        patch.object(node, "_set_next_question",
+                     side_effect=lambda state, *args: {**state, "next_state": "FACT_COLLECTION"}),
+        patch("src.langgraph.nodes.fused_classification.gpt_client.chat_completion",
+              return_value={"content": fused_content}),
+    ]
+
+
+@pytest.mark.unit
+def test_fused_node_single_call():
+    """fused 방식은 단일 호출 결과로 분류와 answered/missing 필드를 설정"""
+    manager, patches = _node_patches(json.dumps(VALID_RESPONSE, ensure_ascii=False))
+    multi_call = patch.object(node, "_classify_multi_call")
+    for p in patches + [multi_call]:
+        p.start()
+    try:
+        result = node.case_classification_node({
+            "session_id": "sess_fused",
+            "last_user_input": "친구가 2024년 1월 2일에 300만원을 빌려갔습니다."
+        })
+        multi_call_mock = node._classify_multi_call
+    finally:
+        for p in reversed(patches + [multi_call]):
+            p.stop()
+
+    multi_call_mock.assert_not_called()
+    assert result["classification_method"] == "fused"
+    assert result["case_type"] == "CIVIL"
+    assert result["skipped_fields"] == ["incident_date", "counterparty", "amount"]
+    assert result["missing_fields"] == ["evidence"]
+    assert manager.get_classification_stats()["fused"]["success_count"] == 1
+
+
+@pytest.mark.unit
+def test_fused_node_falls_back_on_invalid_response():
+    """fused 응답 검증 실패 시 다중 호출 방식으로 폴백"""
+    manager, patches = _node_patches("{\"main_case_type\": \"unknown\"}")
+    multi_call = patch.object(
+        node, "_classify_multi_call",
+        side_effect=lambda state, *args: {**state, "next_state": "FACT_COLLECTION"}
+    )
+    for p in patches + [multi_call]:
+        p.start()
+    try:
+        node.case_classification_node({
+            "session_id": "sess_fallback",
+            "last_user_input": "친구가 돈을 갚지 않습니다."
+        })
+        multi_call_mock = node._classify_multi_call
+    finally:
+        for p in reversed(patches + [multi_call]):
+            p.stop()
+
+    multi_call_mock.assert_called_once()
+    assert manager.get_classification_stats()["fused"]["fallback_count"] == 1
+
+
+@pytest.mark.unit
+def test_assigned_method_is_kept_in_session_state():
+    """할당된 분류 방식은 세션 State에 저장되어 새 관리자(재시작/다른 워커)에서도 유지"""
+    first = ABTestManager()
+    first.default_classification_method = ClassificationMethod.FUSED.value
+    state = {"session_id": "sess_ab"}
+    assert first.get_classification_method(state) == "fused"
+    assert state["classification_method"] == "fused"
+
+    restarted = ABTestManager()
+    restarted.default_classification_method = ClassificationMethod.MULTI_CALL.value
+    assert restarted.get_classification_method(state) == "fused"
+    assert restarted.get_classification_stats()["fused"]["session_count"] == 0
+
+
+@pytest.mark.unit
+async def test_classification_stats_are_exposed_by_stats_endpoint():
+    """분류 방식 A/B 통계는 사실 추출 방식 통계와 함께 /stats/ab-test로 조회"""
+    from src.api.routers import stats as stats_router
+
+    manager = ABTestManager()
+    method = manager.get_classification_method({"session_id": "sess_ab"})
+    manager.record_classification("sess_ab", method, 120.0)
+
+    with patch.object(stats_router, "ab_test_manager", manager):
+        response = await stats_router.get_ab_test_stats("test")
+
+    assert response["data"]["classification"][method]["success_count"] == 1
+    assert response["data"]["classification"][method]["avg_latency_ms"] == 120.0
+    assert "fact_extraction" in response["data"]
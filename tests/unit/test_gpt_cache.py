@@ -0,0 +1,199 @@
+"""
+GPT 응답 캐시 단위 테스트
+"""
+import json
+import sqlite3
+import threading
+import pytest
+from unittest.mock import patch
+from src.services import gpt_cache as gpt_cache_module
+from src.services.gpt_cache import GPTCache, GPTCacheBackend, SQLiteGPTCache, create_gpt_cache
+
+
+def _messages(text: str):
+    return [{"role": "user", "content": text}]
+
+
+def _response(content: str):
+    return {"content": content, "usage": {"total_tokens": 1}}
+
+
+@pytest.mark.unit
+def test_hit_and_miss_counters():
+    """히트/미스 카운터 테스트"""
+    cache = GPTCache(ttl_seconds=60, max_entries=10)
+    cache.set(_messages("a"), "gpt-test", _response("A"))
+
+    assert cache.get(_messages("a"), "gpt-test")["content"] == "A"
+    assert cache.get(_messages("b"), "gpt-test") is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 50.0
+
+
+@pytest.mark.unit
+def test_lru_eviction_by_entry_count():
+    """항목 수 상한 초과 시 가장 오래 사용되지 않은 항목 제거"""
+    cache = GPTCache(ttl_seconds=60, max_entries=2)
+    cache.set(_messages("a"), "gpt-test", _response("A"))
+    cache.set(_messages("b"), "gpt-test", _response("B"))
+    cache.get(_messages("a"), "gpt-test")  # a를 최근 사용으로 갱신
+    cache.set(_messages("c"), "gpt-test", _response("C"))
+
+    assert cache.get(_messages("b"), "gpt-test") is None
+    assert cache.get(_messages("a"), "gpt-test") is not None
+    assert cache.get(_messages("c"), "gpt-test") is not None
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.unit
+def test_eviction_by_byte_size():
+    """바이트 상한 초과 시 제거 및 상한보다 큰 응답은 저장하지 않음"""
+    entry_size = GPTCache._estimate_size(_response("x" * 100))
+    cache = GPTCache(ttl_seconds=60, max_entries=100, max_bytes=entry_size * 2)
+
+    for key in ("a", "b", "c"):
+        cache.set(_messages(key), "gpt-test", _response("x" * 100))
+
+    stats = cache.get_stats()
+    assert stats["total_entries"] == 2
+    assert stats["total_bytes"] <= entry_size * 2
+
+    cache.set(_messages("huge"), "gpt-test", _response("x" * 1000))
+    assert cache.get(_messages("huge"), "gpt-test") is None
+    assert cache.get_stats()["rejected"] == 1
+
+
+@pytest.mark.unit
+def test_expired_entries_removed_without_lookup():
+    """만료 항목은 같은 키 조회 없이도 다음 캐시 접근 시 제거"""
+    now = [1000.0]
+    with patch("src.services.gpt_cache.time.monotonic", side_effect=lambda: now[0]):
+        cache = GPTCache(ttl_seconds=10, max_entries=10)
+        cache.set(_messages("a"), "gpt-test", _response("A"))
+        cache.set(_messages("b"), "gpt-test", _response("B"))
+
+        now[0] += 11
+        cache.set(_messages("c"), "gpt-test", _response("C"))
+
+        stats = cache.get_stats()
+        assert stats["total_entries"] == 1
+        assert stats["expirations"] == 2
+
+
+@pytest.mark.unit
+def test_concurrent_access_keeps_limits():
+    """여러 스레드에서 동시에 접근해도 상한과 크기 계산이 유지되는지 테스트"""
+    cache = GPTCache(ttl_seconds=60, max_entries=50)
+
+    def worker(worker_id: int):
+        for i in range(200):
+            key = f"{worker_id}-{i % 80}"
+            if cache.get(_messages(key), "gpt-test") is None:
+                cache.set(_messages(key), "gpt-test", _response(key))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    stats = cache.get_stats()
+    assert stats["total_entries"] <= 50
+    assert stats["total_bytes"] == sum(item["size"] for item in cache.cache.values())
+    assert stats["hits"] + stats["misses"] == 8 * 200
+
+
+@pytest.mark.unit
+def test_sqlite_cache_shared_between_instances(tmp_path):
+    """같은 파일을 쓰는 인스턴스(워커) 간 캐시 공유 및 재시작 후 유지"""
+    db_path = str(tmp_path / "gpt_cache.db")
+    worker_a = SQLiteGPTCache(db_path, ttl_seconds=60)
+    worker_b = SQLiteGPTCache(db_path, ttl_seconds=60)
+
+    worker_a.set(_messages("a"), "gpt-test", _response("A"))
+    assert worker_b.get(_messages("a"), "gpt-test")["content"] == "A"
+    assert worker_b.get(_messages("b"), "gpt-test") is None
+
+    restarted = SQLiteGPTCache(db_path, ttl_seconds=60)
+    assert restarted.get(_messages("a"), "gpt-test")["content"] == "A"
+    assert restarted.get_stats()["total_entries"] == 1
+
+
+@pytest.mark.unit
+def test_sqlite_cache_ttl_expiry(tmp_path):
+    """SQLite 캐시 만료 항목은 조회되지 않고 clear_expired로 삭제"""
+    now = [1000.0]
+    with patch("src.services.gpt_cache.time.time", side_effect=lambda: now[0]):
+        cache = SQLiteGPTCache(str(tmp_path / "gpt_cache.db"), ttl_seconds=10)
+        cache.set(_messages("a"), "gpt-test", _response("A"))
+
+        now[0] += 11
+        assert cache.get(_messages("a"), "gpt-test") is None
+        assert cache.clear_expired() == 1
+
+
+@pytest.mark.unit
+def test_sqlite_cache_compaction(tmp_path):
+    """압축 시 항목 수/크기 상한을 넘는 오래된 항목 삭제"""
+    now = [1000.0]
+    entry_size = len(json.dumps(_response("x" * 100), ensure_ascii=False).encode("utf-8"))
+    with patch("src.services.gpt_cache.time.time", side_effect=lambda: now[0]):
+        cache = SQLiteGPTCache(
+            str(tmp_path / "gpt_cache.db"),
+            ttl_seconds=3600,
+            max_entries=3,
+            max_bytes=entry_size * 2,
+            compact_every=1000
+        )
+        for key in ("a", "b", "c", "d"):
+            now[0] += 1
+            cache.set(_messages(key), "gpt-test", _response("x" * 100))
+
+        assert cache.get_stats()["total_entries"] == 4
+        assert cache.compact() == {"expired": 0, "evicted": 2}
+        assert cache.get(_messages("a"), "gpt-test") is None
+        assert cache.get(_messages("d"), "gpt-test") is not None
+        assert cache.get_stats()["total_bytes"] <= entry_size * 2
+
+
+@pytest.mark.unit
+def test_sqlite_cache_errors_do_not_propagate(tmp_path):
+    """SQLite 오류(잠금, 디스크 등)는 조회/저장/삭제/통계 모두 요청 실패로 이어지지 않음"""
+    cache = SQLiteGPTCache(str(tmp_path / "gpt_cache.db"), ttl_seconds=60)
+    cache.set(_messages("a"), "gpt-test", _response("A"))
+
+    with patch.object(cache, "_connect", side_effect=sqlite3.OperationalError("database is locked")):
+        assert cache.get(_messages("a"), "gpt-test") is None
+        cache.set(_messages("b"), "gpt-test", _response("B"))
+        assert cache.clear() == 0
+        assert cache.clear_expired() == 0
+        stats = cache.get_stats()
+
+    assert stats["total_entries"] is None
+    assert stats["misses"] == 1
+
+
+@pytest.mark.unit
+def test_incomplete_backend_fails_on_creation():
+    """메서드를 모두 구현하지 않은 백엔드는 생성 시점에 실패"""
+    class PartialCache(GPTCacheBackend):
+        def get(self, messages, model, **kwargs):
+            return None
+
+    with pytest.raises(TypeError):
+        PartialCache()
+
+
+@pytest.mark.unit
+def test_unusable_sqlite_path_falls_back_to_memory(tmp_path):
+    """SQLite 캐시 파일을 만들 수 없으면 오류 없이 메모리 캐시 사용"""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    with patch.object(gpt_cache_module.settings, "gpt_cache_backend", "sqlite"), \
+            patch.object(gpt_cache_module.settings, "gpt_cache_sqlite_path", str(blocker / "gpt_cache.db")):
+        cache = create_gpt_cache()
+
+    assert isinstance(cache, GPTCache)
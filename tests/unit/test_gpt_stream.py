@@ -0,0 +1,114 @@
+"""
+GPT 스트리밍 호출 단위 테스트
+"""
+import threading
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from src.services.gpt_client import GPTClient
+from src.langgraph.streaming import JSONTextStreamer
+
+
+def _chunk(content=None, finish_reason=None, usage=None, role=None):
+    """스트리밍 청크 객체 생성"""
+    choices = []
+    if content is not None or finish_reason is not None or role is not None:
+        choices = [SimpleNamespace(
+            delta=SimpleNamespace(content=content, role=role),
+            finish_reason=finish_reason
+        )]
+    return SimpleNamespace(model="gpt-test", choices=choices, usage=usage)
+
+
+async def _stream(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.unit
+async def test_chat_completion_stream_emits_tokens_in_order():
+    """토큰이 도착 순서대로 콜백에 전달되고 결과가 조합되는지 테스트"""
+    client = GPTClient(api_key="sk-test", model="gpt-test")
+    usage = SimpleNamespace(prompt_tokens=10, completion_tokens=3, total_tokens=13)
+    chunks = [
+        _chunk(role="assistant", content=""),
+        _chunk(content="{\"a\":"),
+        _chunk(content=" 1"),
+        _chunk(content="}", finish_reason="stop"),
+        _chunk(usage=usage),
+    ]
+    client.async_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=AsyncMock(return_value=_stream(chunks))
+    )))
+    received = []
+
+    with patch("src.services.gpt_client.settings") as mock_settings:
+        mock_settings.gpt_cache_enabled = False
+        result = await client.chat_completion_stream_async(
+            messages=[{"role": "user", "content": "hi"}],
+            on_token=received.append
+        )
+
+    assert received == ["{\"a\":", " 1", "}"]
+    assert result["content"] == "{\"a\": 1}"
+    assert result["finish_reason"] == "stop"
+    assert result["usage"]["total_tokens"] == 13
+    create_kwargs = client.async_client.chat.completions.create.call_args.kwargs
+    assert create_kwargs["stream"] is True
+
+
+@pytest.mark.unit
+async def test_chat_completion_stream_cache_hit_emits_once():
+    """캐시 히트 시 전체 응답이 한 번에 전달되는지 테스트"""
+    client = GPTClient(api_key="sk-test", model="gpt-test")
+    cached = {"content": "cached text", "usage": {"total_tokens": 0}}
+    received = []
+
+    with patch.object(client, "_get_cached", return_value=cached), \
+            patch("src.services.gpt_client.settings") as mock_settings:
+        mock_settings.gpt_cache_enabled = True
+        result = await client.chat_completion_stream_async(
+            messages=[{"role": "user", "content": "hi"}],
+            on_token=received.append
+        )
+
+    assert received == ["cached text"]
+    assert result is cached
+
+
+@pytest.mark.unit
+def test_json_text_streamer_converts_summary_json_to_text():
+    """JSON 요약 토큰이 경계와 관계없이 "키: 값" 텍스트로 변환되는지 테스트"""
+    raw = '```json\n{"사건_유형": "민사", "핵심_사실관계": "\\"300만원\\" 대여\\n\\uac00", "금액": 3000000, "증거": ["계약서", "카톡"]}\n```'
+    received = []
+    streamer = JSONTextStreamer(received.append)
+
+    for index in range(0, len(raw), 3):
+        streamer.feed(raw[index:index + 3])
+
+    assert "".join(received) == (
+        "사건_유형: 민사\n"
+        "핵심_사실관계: \"300만원\" 대여\n가\n"
+        "금액: 3000000\n"
+        "증거: 계약서, 카톡\n"
+    )
+
+
+@pytest.mark.unit
+async def test_async_cache_lookup_runs_off_event_loop():
+    """비동기 경로의 캐시 조회/저장이 이벤트 루프 스레드가 아닌 곳에서 실행되는지 테스트"""
+    client = GPTClient(api_key="sk-test", model="gpt-test")
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def get_cached(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return {"content": "cached", "usage": {"total_tokens": 0}}
+
+    with patch.object(client, "_get_cached", side_effect=get_cached), \
+            patch("src.services.gpt_client.settings") as mock_settings:
+        mock_settings.gpt_cache_enabled = True
+        result = await client.chat_completion_async(messages=[{"role": "user", "content": "hi"}])
+
+    assert result["content"] == "cached"
+    assert threads and loop_thread not in threads
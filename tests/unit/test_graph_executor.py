@@ -0,0 +1,81 @@
+"""
+그래프 워커 풀 단위 테스트
+"""
+import asyncio
+import threading
+import time
+import pytest
+from src.langgraph.executor import GraphExecutor
+
+
+@pytest.mark.unit
+async def test_submit_runs_off_event_loop():
+    """동기 함수가 이벤트 루프 스레드가 아닌 워커 스레드에서 실행되는지 테스트"""
+    executor = GraphExecutor(max_workers=2, max_concurrency=2)
+    loop_thread = threading.get_ident()
+
+    worker_thread = await executor.submit(threading.get_ident)
+
+    assert worker_thread != loop_thread
+    assert executor.get_stats()["completed"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.unit
+async def test_concurrency_cap_and_queue_depth():
+    """동시 실행 수 상한과 대기열 깊이 메트릭 테스트"""
+    executor = GraphExecutor(max_workers=4, max_concurrency=1)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def slow_task():
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    await asyncio.gather(*[executor.submit(slow_task) for _ in range(3)])
+
+    stats = executor.get_stats()
+    assert max_running == 1
+    assert stats["completed"] == 3
+    assert stats["max_queue_depth"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["in_flight"] == 0
+    executor.shutdown()
+
+
+@pytest.mark.unit
+async def test_event_loop_stays_responsive():
+    """그래프 실행 중에도 이벤트 루프가 다른 작업을 처리하는지 테스트"""
+    executor = GraphExecutor(max_workers=1, max_concurrency=1)
+
+    task = asyncio.create_task(executor.submit(time.sleep, 0.2))
+    started = time.monotonic()
+    await asyncio.sleep(0.01)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.1
+    await task
+    executor.shutdown()
+
+
+@pytest.mark.unit
+async def test_failed_task_is_counted():
+    """예외가 발생한 작업의 전파 및 실패 카운트 테스트"""
+    executor = GraphExecutor(max_workers=1, max_concurrency=1)
+
+    def failing_task():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await executor.submit(failing_task)
+
+    stats = executor.get_stats()
+    assert stats["failed"] == 1
+    assert stats["in_flight"] == 0
+    executor.shutdown()
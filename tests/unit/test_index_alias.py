@@ -0,0 +1,54 @@
+"""
+RAG 인덱스 별칭 레지스트리 단위 테스트
+"""
+import pytest
+from pathlib import Path
+from src.rag.index_alias import IndexAliasRegistry
+
+
+@pytest.mark.unit
+def test_resolve_without_alias_returns_name(tmp_path: Path):
+    """별칭이 없으면 이름을 그대로 컬렉션 이름으로 사용"""
+    registry = IndexAliasRegistry(tmp_path / "aliases.json")
+    assert registry.resolve("rag_documents") == "rag_documents"
+    assert registry.history("rag_documents") == []
+
+
+@pytest.mark.unit
+def test_swap_and_rollback(tmp_path: Path):
+    """전환 시 이전 세대를 history에 보관하고 롤백 시 직전 세대로 복귀"""
+    registry = IndexAliasRegistry(tmp_path / "aliases.json")
+
+    assert registry.swap("rag_documents", "rag_documents_1") == "rag_documents"
+    assert registry.swap("rag_documents", "rag_documents_2") == "rag_documents_1"
+    assert registry.resolve("rag_documents") == "rag_documents_2"
+    assert registry.history("rag_documents") == ["rag_documents", "rag_documents_1"]
+
+    assert registry.rollback("rag_documents") == ("rag_documents_2", "rag_documents_1")
+    assert registry.resolve("rag_documents") == "rag_documents_1"
+    assert registry.history("rag_documents") == ["rag_documents"]
+
+
+@pytest.mark.unit
+def test_rollback_without_history_raises(tmp_path: Path):
+    """이전 세대가 없으면 롤백 불가"""
+    registry = IndexAliasRegistry(tmp_path / "aliases.json")
+    with pytest.raises(ValueError):
+        registry.rollback("rag_documents")
+
+
+@pytest.mark.unit
+def test_swap_is_visible_to_other_registry_instances(tmp_path: Path):
+    """다른 프로세스(인스턴스)가 전환한 별칭도 다음 해석부터 반영"""
+    path = tmp_path / "aliases.json"
+    reader = IndexAliasRegistry(path)
+    writer = IndexAliasRegistry(path)
+
+    writer.swap("rag_documents", "rag_documents_1")
+    assert reader.resolve("rag_documents") == "rag_documents_1"
+    writer.swap("rag_documents", "rag_documents_2")
+    assert reader.resolve("rag_documents") == "rag_documents_2"
+
+    writer.forget("rag_documents", ["rag_documents"])
+    writer.remove("rag_documents")
+    assert reader.resolve("rag_documents") == "rag_documents"
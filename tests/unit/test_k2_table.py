@@ -0,0 +1,139 @@
+"""
+K2 구조화 조회 테이블 단위 테스트
+"""
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from src.rag import k2_table
+from src.rag.k2_table import K2LookupTable
+from src.utils import rag_helpers
+
+K2_CONTRACT_BREACH = """doc_id: K2-CONTRACT_BREACH
+knowledge_type: K2
+level1: CIVIL
+level2: CIVIL_CONTRACT
+scenario: CONTRACT_BREACH
+required_fields:
+- incident_date
+- counterparty
+- amount
+questions:
+- order: 2
+  field: counterparty
+  question: 상대방은 누구인가요?
+- order: 1
+  field: incident_date
+  question: 계약 위반은 언제 있었나요?
+"""
+
+K2_CONTRACT_REFUND = """doc_id: K2-CONTRACT_REFUND
+knowledge_type: K2
+level1: CIVIL
+level2: CIVIL_CONTRACT
+scenario: CONTRACT_REFUND
+required_fields:
+- incident_date
+- amount
+questions:
+- order: 1
+  field: amount
+  question: 환불받을 금액은 얼마인가요?
+"""
+
+K2_KOREAN_META = """doc_id: K2-CIVIL-LOAN-001
+knowledge_type: K2
+main_case_type: 민사
+sub_case_type: CIVIL_LOAN
+required_fields:
+  - field: loan_date
+    required: true
+  - field: interest
+    required: false
+questions: []
+"""
+
+
+@pytest.fixture
+def table(tmp_path: Path) -> K2LookupTable:
+    (tmp_path / "civil").mkdir()
+    (tmp_path / "civil" / "breach.yaml").write_text(K2_CONTRACT_BREACH, encoding="utf-8")
+    (tmp_path / "civil" / "refund.yaml").write_text(K2_CONTRACT_REFUND, encoding="utf-8")
+    (tmp_path / "loan.yaml").write_text(K2_KOREAN_META, encoding="utf-8")
+    (tmp_path / "k1.yaml").write_text("doc_id: K1-X\nknowledge_type: K1\n", encoding="utf-8")
+    (tmp_path / "broken.yaml").write_text("knowledge_type: K2\nrequired_fields: [", encoding="utf-8")
+    lookup_table = K2LookupTable(tmp_path)
+    lookup_table.build()
+    return lookup_table
+
+
+@pytest.mark.unit
+def test_merges_scenarios_by_case_type(table: K2LookupTable):
+    """같은 세부 유형의 시나리오는 공통 필수 필드와 질문 순서/템플릿으로 병합"""
+    entry = table.get("CIVIL", "CIVIL_CONTRACT")
+    assert entry.doc_ids == ["K2-CONTRACT_BREACH", "K2-CONTRACT_REFUND"]
+    assert entry.required_fields == ["incident_date", "amount"]
+    assert entry.question_order == ["incident_date", "amount", "counterparty"]
+    assert table.get_question_template("amount", "민사", "CIVIL_CONTRACT") == "환불받을 금액은 얼마인가요?"
+    assert table.get_stats() == {"case_types": 2, "documents": 3}
+
+
+@pytest.mark.unit
+def test_korean_case_type_and_optional_fields(table: K2LookupTable):
+    """한글 주 사건 유형은 영문으로 정규화하고 required=false 필드는 제외"""
+    assert table.get_required_fields("CIVIL", "CIVIL_LOAN") == ["loan_date"]
+    assert table.get_required_fields("CIVIL", "UNKNOWN") == []
+    assert table.get("CRIMINAL", "CRIMINAL_FRAUD") is None
+    assert table.get(None) is None
+
+
+@pytest.mark.unit
+def test_helpers_fall_back_to_vector_search_only_on_miss(table: K2LookupTable):
+    """테이블에 있는 사건 유형은 벡터 검색 없이 조회하고, 없을 때만 폴백"""
+    with patch.object(rag_helpers, "k2_lookup_table", table), \
+            patch("src.rag.searcher.rag_searcher.search", return_value=[]) as search:
+        assert rag_helpers.get_k2_required_fields("CIVIL", "CIVIL_CONTRACT") == ["incident_date", "amount"]
+        assert rag_helpers.get_k2_question_template("incident_date", "CIVIL", "CIVIL_CONTRACT") == "계약 위반은 언제 있었나요?"
+        search.assert_not_called()
+
+        assert rag_helpers.get_k2_required_fields("FAMILY", "FAMILY_DIVORCE") == []
+        search.assert_called_once()
+
+
+@pytest.mark.unit
+def test_field_guide_batches_fallback_lookups(table: K2LookupTable):
+    """테이블에 없는 사건 유형은 필수 필드와 질문 템플릿을 search_many 한 번으로 조회"""
+    with patch.object(rag_helpers, "k2_lookup_table", table), \
+            patch("src.rag.searcher.rag_searcher.search_many", return_value=[[], [], []]) as search_many:
+        guide = rag_helpers.get_k2_field_guide("CIVIL", "CIVIL_CONTRACT", ["incident_date", "amount"])
+        assert guide["required_fields"] == ["incident_date", "amount"]
+        assert guide["question_templates"]["incident_date"] == "계약 위반은 언제 있었나요?"
+        search_many.assert_not_called()
+
+        guide = rag_helpers.get_k2_field_guide("FAMILY", "FAMILY_DIVORCE", ["incident_date", "amount"])
+        assert guide == {"required_fields": [], "question_templates": {}}
+        search_many.assert_called_once()
+        assert [spec.query for spec in search_many.call_args.args[0]] == ["필수 필드", "incident_date 질문", "amount 질문"]
+
+
+@pytest.mark.unit
+def test_rebuilds_when_index_generation_changes(table: K2LookupTable, tmp_path: Path):
+    """다른 워커의 재인덱싱/롤백으로 별칭 세대가 바뀌면 다음 조회 때 다시 구축"""
+    (tmp_path / "loan.yaml").write_text(K2_KOREAN_META.replace("loan_date", "repayment_date"), encoding="utf-8")
+    with patch.object(k2_table.settings, "rag_k2_table_refresh_seconds", 3600):
+        assert table.get_required_fields("CIVIL", "CIVIL_LOAN") == ["loan_date"]
+
+        with patch.object(k2_table.index_alias_registry, "resolve", return_value="rag_documents_20250101000000000000"):
+            assert table.get_required_fields("CIVIL", "CIVIL_LOAN") == ["repayment_date"]
+
+
+@pytest.mark.unit
+def test_rebuilds_when_source_files_change(table: K2LookupTable, tmp_path: Path):
+    """원본 K2 문서가 추가/수정되면 확인 간격마다 감지하여 다시 구축"""
+    with patch.object(k2_table.settings, "rag_k2_table_refresh_seconds", 0):
+        assert table.get("CRIMINAL", "CRIMINAL_FRAUD") is None
+        (tmp_path / "fraud.yaml").write_text(
+            "doc_id: K2-FRAUD\nknowledge_type: K2\nlevel1: CRIMINAL\nlevel2: CRIMINAL_FRAUD\n"
+            "required_fields:\n- amount\nquestions: []\n",
+            encoding="utf-8"
+        )
+        assert table.get_required_fields("CRIMINAL", "CRIMINAL_FRAUD") == ["amount"]
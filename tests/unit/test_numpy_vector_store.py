@@ -0,0 +1,106 @@
+"""
+NumPy 전수 검색 벡터 저장소 단위 테스트
+"""
+import numpy as np
+import pytest
+from pathlib import Path
+from src.rag.numpy_store import NumpyVectorClient
+
+
+def _seed(client: NumpyVectorClient, name: str = "rag_documents"):
+    """테스트용 컬렉션 생성 (축 방향 벡터 4개)"""
+    collection = client.get_or_create_collection(name)
+    collection.upsert(
+        ids=["a", "b", "c", "d"],
+        embeddings=[[1, 0, 0], [0, 2, 0], [0, 0, 3], [1, 1, 0]],
+        documents=["문서 A", "문서 B", "문서 C", "문서 D"],
+        metadatas=[
+            {"knowledge_type": "K1", "main_case_type": "CIVIL", "doc_id": "a"},
+            {"knowledge_type": "K2", "main_case_type": "CIVIL", "doc_id": "b"},
+            {"knowledge_type": "K2", "main_case_type": "CRIMINAL", "doc_id": "c"},
+            {"knowledge_type": "K3", "doc_id": "d"},
+        ]
+    )
+    return collection
+
+
+@pytest.mark.unit
+def test_query_returns_top_k_by_cosine(tmp_path: Path):
+    """코사인 유사도 순으로 top-k 반환 (distance = 1 - 유사도)"""
+    collection = _seed(NumpyVectorClient(tmp_path))
+
+    results = collection.query(query_embeddings=[[1.0, 0.2, 0.0]], n_results=2)
+
+    assert results["ids"] == [["a", "d"]]
+    assert results["documents"][0] == ["문서 A", "문서 D"]
+    assert results["distances"][0][0] < results["distances"][0][1]
+    assert results["distances"][0][0] == pytest.approx(1 - 1 / np.sqrt(1.04), abs=1e-5)
+
+
+@pytest.mark.unit
+def test_query_with_where_filters(tmp_path: Path):
+    """범주형 코드 필터와 $and/$in/$ne 조건"""
+    collection = _seed(NumpyVectorClient(tmp_path))
+    query = [[1.0, 1.0, 1.0]]
+
+    results = collection.query(query_embeddings=query, n_results=10, where={"knowledge_type": "K2"})
+    assert sorted(results["ids"][0]) == ["b", "c"]
+
+    results = collection.query(
+        query_embeddings=query,
+        n_results=10,
+        where={"$and": [{"knowledge_type": {"$in": ["K1", "K2"]}}, {"main_case_type": "CIVIL"}]}
+    )
+    assert sorted(results["ids"][0]) == ["a", "b"]
+
+    results = collection.query(query_embeddings=query, n_results=10, where={"knowledge_type": {"$ne": "K2"}})
+    assert sorted(results["ids"][0]) == ["a", "d"]
+
+    results = collection.query(query_embeddings=query, n_results=10, where={"knowledge_type": "K4"})
+    assert results["ids"] == [[]]
+
+
+@pytest.mark.unit
+def test_upsert_replaces_and_delete_removes(tmp_path: Path):
+    """같은 ID는 교체되고 삭제된 Chunk는 조회되지 않음"""
+    collection = _seed(NumpyVectorClient(tmp_path))
+
+    collection.upsert(ids=["a"], embeddings=[[0, 0, 1]], documents=["문서 A2"], metadatas=[{"knowledge_type": "K2"}])
+    assert collection.count() == 4
+    assert collection.get(ids=["a"])["documents"] == ["문서 A2"]
+    assert sorted(collection.get(where={"knowledge_type": "K2"})["ids"]) == ["a", "b", "c"]
+
+    collection.delete(ids=["a", "zz"])
+    collection.delete(where={"knowledge_type": "K3"})
+    assert collection.count() == 2
+    assert collection.get(ids=["a"])["ids"] == []
+    assert collection.get(include=["metadatas"])["documents"] is None
+
+
+@pytest.mark.unit
+def test_persistence_and_collection_management(tmp_path: Path):
+    """다른 클라이언트에서 다시 로드 가능하고 컬렉션 삭제 후에는 조회 불가"""
+    _seed(NumpyVectorClient(tmp_path))
+
+    client = NumpyVectorClient(tmp_path)
+    collection = client.get_collection("rag_documents")
+    assert collection.count() == 4
+    assert collection.query(query_embeddings=[[0, 0, 1]], n_results=1)["ids"] == [["c"]]
+    assert [col.name for col in client.list_collections()] == ["rag_documents"]
+
+    client.delete_collection("rag_documents")
+    assert client.list_collections() == []
+    with pytest.raises(ValueError):
+        client.get_collection("rag_documents")
+
+
+@pytest.mark.unit
+def test_reload_after_external_update(tmp_path: Path):
+    """다른 프로세스(클라이언트)가 갱신한 내용을 조회 시 반영"""
+    reader = _seed(NumpyVectorClient(tmp_path))
+    writer = NumpyVectorClient(tmp_path).get_collection("rag_documents")
+
+    writer.upsert(ids=["e"], embeddings=[[0, 1, 1]], documents=["문서 E"], metadatas=[{"knowledge_type": "K1"}])
+
+    assert reader.count() == 5
+    assert reader.query(query_embeddings=[[0, 1, 1]], n_results=1)["ids"] == [["e"]]
@@ -2,11 +2,13 @@
 Q-A 매칭 방식 헬퍼 함수 단위 테스트
 """
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from typing import Dict, Any, List
 from src.langgraph.nodes.qa_helpers import (
     _analyze_initial_description,
+    _analyze_initial_description_async,
     _extract_facts_from_conversation,
+    _extract_facts_from_conversation_async,
     _fallback_extract_facts_from_conversation
 )
 
@@ -228,6 +230,52 @@ class TestExtractFactsFromConversation:
             assert result == {}
 
 
+class TestAsyncHelpers:
+    """비동기 헬퍼 함수 테스트"""
+    
+    @pytest.mark.unit
+    async def test_analyze_initial_description_async_success(self):
+        """비동기 1차 서술 분석이 동기 버전과 같은 형식을 반환하는지 테스트"""
+        mock_response = {
+            "content": """{
+                "extracted_facts": {"amount": 3000000},
+                "answered_fields": ["amount"],
+                "missing_fields": ["evidence"]
+            }"""
+        }
+        
+        with patch('src.langgraph.nodes.qa_helpers.gpt_client') as mock_gpt:
+            mock_gpt.chat_completion_async = AsyncMock(return_value=mock_response)
+            
+            result = await _analyze_initial_description_async(
+                "300만원을 빌려줬습니다.", "CIVIL", ["amount", "evidence"]
+            )
+            
+            mock_gpt.chat_completion_async.assert_awaited_once()
+            mock_gpt.chat_completion.assert_not_called()
+            assert result["extracted_facts"]["amount"] == 3000000
+            assert result["missing_fields"] == ["evidence"]
+    
+    @pytest.mark.unit
+    async def test_extract_facts_from_conversation_async_json_parse_error(self):
+        """비동기 facts 추출 시 JSON 파싱 실패 처리 테스트"""
+        conversation_history = [
+            {
+                "question": "금액은 얼마인가요?",
+                "field": "amount",
+                "answer": "300만원입니다.",
+                "timestamp": "2024-01-01T10:00:00"
+            }
+        ]
+        
+        with patch('src.langgraph.nodes.qa_helpers.gpt_client') as mock_gpt:
+            mock_gpt.chat_completion_async = AsyncMock(return_value={"content": "invalid json"})
+            
+            result = await _extract_facts_from_conversation_async(conversation_history, "CIVIL")
+            
+            assert result == {}
+
+
 class TestFallbackExtractFactsFromConversation:
     """폴백 엔티티 추출 함수 테스트"""
     
@@ -0,0 +1,252 @@
+"""
+RAG 배치 인덱싱 파이프라인 단위 테스트
+"""
+import numpy as np
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+from src.rag import pipeline as pipeline_module
+from src.rag.chunker import Chunk
+from src.rag.index_alias import IndexAliasRegistry
+from src.rag.ingestion import iter_prepared_documents
+from src.rag.pipeline import RAGIndexingPipeline
+
+
+@pytest.fixture(autouse=True)
+def _serial_ingestion():
+    """모의 _prepare_document가 호출되도록 파싱/Chunking을 현재 프로세스에서 순차 처리"""
+    with patch.object(pipeline_module.settings, "rag_index_workers", 1):
+        yield
+
+
+def _pipeline():
+    """벡터 DB 대신 모의 컬렉션을 쓰는 파이프라인"""
+    with patch.object(pipeline_module.vector_db_manager, "get_or_create_collection", return_value=MagicMock()):
+        return RAGIndexingPipeline(collection_name="test_documents")
+
+
+def _fake_encode(texts, batch_size=32):
+    return np.ones((len(texts), 4))
+
+
+def _chunks(prefix: str, count: int):
+    return [Chunk(chunk_id=f"{prefix}-chunk-{i}", content=f"{prefix} {i}", metadata={"tags": ["a", "b"]})
+            for i in range(count)]
+
+
+@pytest.mark.unit
+def test_index_directory_batches_across_files(tmp_path: Path):
+    """여러 파일의 Chunk를 모아 배치 단위로 Embedding 생성 및 upsert"""
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.yaml").write_text("knowledge_type: K0\n", encoding="utf-8")
+
+    rag_pipeline = _pipeline()
+    chunk_map = {"a": _chunks("a", 3), "b": _chunks("b", 3), "c": _chunks("c", 2)}
+
+    with patch.object(pipeline_module.settings, "rag_index_batch_size", 4), \
+            patch.object(rag_pipeline, "_prepare_document", side_effect=lambda path, stats: list(chunk_map[path.stem])), \
+            patch.object(pipeline_module.embedding_model, "encode", side_effect=_fake_encode) as encode:
+        total = rag_pipeline.index_directory(tmp_path)
+
+    assert total == 8
+    assert encode.call_count == 2
+    upserts = rag_pipeline.collection.upsert.call_args_list
+    assert [len(call.kwargs["ids"]) for call in upserts] == [4, 4]
+    assert upserts[0].kwargs["metadatas"][0] == {"tags": "a, b"}
+
+    stats = rag_pipeline.last_stats.to_dict()
+    assert stats["files"] == 3
+    assert stats["batches"] == 2
+    assert set(stats) >= {"parse_seconds", "chunk_seconds", "embed_seconds", "write_seconds", "total_seconds"}
+
+
+@pytest.mark.unit
+def test_index_directory_skips_failed_files(tmp_path: Path):
+    """파싱 실패 파일은 건너뛰고 나머지는 인덱싱"""
+    (tmp_path / "ok.yaml").write_text("", encoding="utf-8")
+    (tmp_path / "broken.yaml").write_text("", encoding="utf-8")
+
+    def prepare(path, stats):
+        if path.stem == "broken":
+            raise ValueError("parse error")
+        return _chunks("ok", 2)
+
+    rag_pipeline = _pipeline()
+    with patch.object(rag_pipeline, "_prepare_document", side_effect=prepare), \
+            patch.object(pipeline_module.embedding_model, "encode", side_effect=_fake_encode):
+        assert rag_pipeline.index_directory(tmp_path) == 2
+
+    assert rag_pipeline.last_stats.failed_files == 1
+
+
+@pytest.mark.unit
+def test_duplicate_chunk_ids_in_batch_are_deduplicated():
+    """같은 배치의 중복 Chunk ID는 마지막 Chunk만 upsert"""
+    rag_pipeline = _pipeline()
+    chunks = _chunks("dup", 2) + [Chunk(chunk_id="dup-chunk-0", content="latest", metadata={})]
+
+    with patch.object(pipeline_module.embedding_model, "encode", side_effect=_fake_encode):
+        rag_pipeline._write_batch(chunks, pipeline_module.IndexingStats())
+
+    kwargs = rag_pipeline.collection.upsert.call_args.kwargs
+    assert kwargs["ids"] == ["dup-chunk-0", "dup-chunk-1"]
+    assert kwargs["documents"][0] == "latest"
+
+
+@pytest.mark.unit
+def test_clean_metadata_expands_node_scope_to_boolean_keys():
+    """node_scope 리스트는 표시용 문자열과 Node별 불리언 키로 저장"""
+    cleaned = RAGIndexingPipeline._clean_metadata({
+        "knowledge_type": "K2",
+        "node_scope": ["FACT_COLLECTION", "VALIDATION"],
+        "sub_case_type": None
+    })
+
+    assert cleaned == {
+        "knowledge_type": "K2",
+        "node_scope": "FACT_COLLECTION, VALIDATION",
+        "node_scope_FACT_COLLECTION": True,
+        "node_scope_VALIDATION": True
+    }
+
+
+@pytest.mark.unit
+def test_index_directory_incremental_reindexes_only_changed_files(tmp_path: Path):
+    """증분 인덱싱은 해시가 바뀐 파일만 다시 Embedding하고 삭제된 파일의 Chunk 제거"""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for name in ("a", "b"):
+        (docs / f"{name}.yaml").write_text(f"id: {name}\n", encoding="utf-8")
+
+    chunk_map = {"a": _chunks("a", 3), "b": _chunks("b", 2)}
+    rag_pipeline = _pipeline()
+
+    with patch.object(pipeline_module.settings, "vector_db_path", str(tmp_path / "vdb")), \
+            patch.object(rag_pipeline, "_prepare_document", side_effect=lambda path, stats: list(chunk_map[path.stem])), \
+            patch.object(pipeline_module.embedding_model, "encode", side_effect=_fake_encode) as encode:
+        first = rag_pipeline.index_directory_incremental(docs)
+        assert (first["added"], first["chunks"]) == (2, 5)
+
+        second = rag_pipeline.index_directory_incremental(docs)
+        assert (second["skipped"], second["chunks"]) == (2, 0)
+        assert encode.call_count == 1
+
+        # a 파일 수정 (Chunk 수 감소) → 남은 Chunk ID 삭제
+        (docs / "a.yaml").write_text("id: a\nchanged: true\n", encoding="utf-8")
+        chunk_map["a"] = _chunks("a", 1)
+        third = rag_pipeline.index_directory_incremental(docs)
+        assert (third["updated"], third["skipped"], third["chunks"]) == (1, 1, 1)
+        rag_pipeline.collection.delete.assert_called_with(ids=["a-chunk-1", "a-chunk-2"])
+
+        # b 파일 삭제 → 매니페스트와 컬렉션에서 제거
+        (docs / "b.yaml").unlink()
+        fourth = rag_pipeline.index_directory_incremental(docs)
+        assert fourth["removed"] == 1
+        rag_pipeline.collection.delete.assert_called_with(ids=["b-chunk-0", "b-chunk-1"])
+
+        manifest = pipeline_module.IndexManifest.for_collection("test_documents")
+        assert set(manifest.files) == {"a.yaml"}
+
+
+def _collection(knowledge_types):
+    """knowledge_type 메타데이터와 검색 결과를 반환하는 모의 컬렉션"""
+    collection = MagicMock()
+    collection.get.return_value = {"metadatas": [{"knowledge_type": kt} for kt in knowledge_types]}
+    collection.query.return_value = {"ids": [["doc"]] if knowledge_types else [[]]}
+    return collection
+
+
+@pytest.mark.unit
+def test_rebuild_swaps_alias_after_validation(tmp_path: Path):
+    """새 세대 구축·검증 후 별칭을 전환하고 보관 수를 넘는 세대 삭제"""
+    registry = IndexAliasRegistry(tmp_path / "aliases.json")
+    registry.swap("test_documents", "test_documents_old1")
+    registry.swap("test_documents", "test_documents_old2")
+    collections = {"test_documents_old2": _collection(["K1", "K2", "K2"])}
+
+    def get_or_create(name, metadata=None):
+        return collections.setdefault(name, _collection(["K1", "K2", "K2", "K3"]))
+
+    with patch.object(pipeline_module, "index_alias_registry", registry), \
+            patch.object(pipeline_module.settings, "vector_db_path", str(tmp_path / "vdb")), \
+            patch.object(pipeline_module.settings, "rag_index_keep_generations", 1), \
+            patch.object(pipeline_module.vector_db_manager, "get_or_create_collection", side_effect=get_or_create), \
+            patch.object(pipeline_module.vector_db_manager, "get_collection", side_effect=collections.get), \
+            patch.object(pipeline_module.vector_db_manager, "delete_collection") as delete_collection, \
+            patch.object(pipeline_module.embedding_model, "encode_query", return_value=np.ones(4)), \
+            patch.object(RAGIndexingPipeline, "index_directory_incremental", return_value={"chunks": 4}):
+        rag_pipeline = RAGIndexingPipeline(collection_name="test_documents")
+        assert rag_pipeline.collection_name == "test_documents_old2"
+
+        result = rag_pipeline.rebuild(tmp_path)
+
+    generation = result["generation"]
+    assert generation.startswith("test_documents_")
+    assert result["previous"] == "test_documents_old2"
+    assert result["knowledge_type_counts"] == {"K1": 1, "K2": 2, "K3": 1}
+    assert registry.resolve("test_documents") == generation
+    assert registry.history("test_documents") == ["test_documents_old2"]
+    deleted = [call.args[0] for call in delete_collection.call_args_list]
+    assert deleted == ["test_documents", "test_documents_old1"]
+
+
+@pytest.mark.unit
+def test_rebuild_keeps_current_generation_when_validation_fails(tmp_path: Path):
+    """knowledge_type별 Chunk 수가 급감하면 전환하지 않고 새 세대 삭제"""
+    registry = IndexAliasRegistry(tmp_path / "aliases.json")
+    registry.swap("test_documents", "test_documents_old")
+    collections = {"test_documents_old": _collection(["K1", "K2", "K2", "K2"])}
+
+    def get_or_create(name, metadata=None):
+        return collections.setdefault(name, _collection(["K1"]))
+
+    with patch.object(pipeline_module, "index_alias_registry", registry), \
+            patch.object(pipeline_module.settings, "vector_db_path", str(tmp_path / "vdb")), \
+            patch.object(pipeline_module.vector_db_manager, "get_or_create_collection", side_effect=get_or_create), \
+            patch.object(pipeline_module.vector_db_manager, "get_collection", side_effect=collections.get), \
+            patch.object(pipeline_module.vector_db_manager, "delete_collection") as delete_collection, \
+            patch.object(RAGIndexingPipeline, "index_directory_incremental", return_value={"chunks": 1}):
+        rag_pipeline = RAGIndexingPipeline(collection_name="test_documents")
+        with pytest.raises(pipeline_module.ValidationError):
+            rag_pipeline.rebuild(tmp_path)
+
+    assert registry.resolve("test_documents") == "test_documents_old"
+    assert delete_collection.call_args.args[0].startswith("test_documents_2")
+
+
+@pytest.mark.unit
+def test_parallel_ingestion_matches_serial_and_collects_errors(tmp_path: Path):
+    """프로세스 풀 파싱/Chunking 결과는 순차 처리와 같은 순서/내용이며 파일별 오류를 수집"""
+    rag_dir = Path(__file__).resolve().parents[2] / "data" / "rag"
+    files = sorted((rag_dir / "K2_required_fields").rglob("*.yaml"))[:6]
+    broken = tmp_path / "broken.yaml"
+    broken.write_text("knowledge_type: [", encoding="utf-8")
+    files.insert(2, broken)
+
+    serial = list(iter_prepared_documents(files, workers=1))
+    parallel = list(iter_prepared_documents(files, workers=2))
+
+    assert [doc.file_path for doc in parallel] == files
+    assert [[chunk.chunk_id for chunk in doc.chunks] for doc in parallel] == \
+        [[chunk.chunk_id for chunk in doc.chunks] for doc in serial]
+    assert parallel[2].error and not parallel[2].chunks
+    assert all(doc.error is None and doc.chunks for i, doc in enumerate(parallel) if i != 2)
+
+
+@pytest.mark.unit
+def test_incremental_run_without_changes_reports_index_total(tmp_path: Path):
+    """변경 없는 증분 인덱싱도 상태의 total_chunks는 이번 실행 기록 수가 아닌 인덱스 전체 Chunk 수"""
+    from src.api.routers import rag as rag_router
+
+    pipeline = MagicMock()
+    pipeline.index_directory_incremental.return_value = {"skipped": 3, "chunks": 0}
+    with patch.object(rag_router, "ALLOWED_RAG_BASE_DIR", tmp_path), \
+            patch.object(rag_router, "RAGIndexingPipeline", return_value=pipeline), \
+            patch.object(rag_router, "_count_active_chunks", return_value=("rag_documents__g1", 42)), \
+            patch("src.rag.k2_table.k2_lookup_table.build"):
+        rag_router._index_documents(clear_existing=False)
+        status = rag_router.IndexingStatusManager.get_status()
+        rag_router.IndexingStatusManager.reset()
+
+    assert status["total_chunks"] == 42
+    assert status["last_result"]["chunks"] == 0
@@ -0,0 +1,157 @@
+"""
+RAG 검색기 일괄 검색(search_many) 단위 테스트
+"""
+import numpy as np
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+from src.rag import searcher as searcher_module
+from src.rag.numpy_store import NumpyVectorClient
+from src.rag.searcher import RAGSearcher, SearchSpec
+from src.rag.sparse_index import SparseIndexStore
+
+VECTORS = {
+    "필수 필드": [1.0, 0.0, 0.0],
+    "질문": [0.0, 1.0, 0.0],
+    "요약 포맷": [0.0, 0.0, 1.0],
+    "필수 필드 요건": [0.0, 1.0, 0.0],
+}
+
+
+def _fake_encode(texts, batch_size=32):
+    if isinstance(texts, str):
+        texts = [texts]
+    return np.array([VECTORS[text] for text in texts])
+
+
+@pytest.fixture
+def searcher(tmp_path: Path):
+    """NumPy 저장소와 가짜 Embedding을 사용하는 검색기"""
+    collection = NumpyVectorClient(tmp_path).get_or_create_collection("rag_documents")
+    collection.upsert(
+        ids=["k2-fields", "k2-question", "k4-format"],
+        embeddings=[[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+        documents=["필수 필드 문서", "질문 문서", "요약 포맷 문서"],
+        metadatas=[
+            {"knowledge_type": "K2", "main_case_type": "CIVIL", "node_scope_FACT_COLLECTION": True},
+            {"knowledge_type": "K2", "main_case_type": "CIVIL", "node_scope_VALIDATION": True},
+            {"knowledge_type": "K4", "main_case_type": "CIVIL", "node_scope_SUMMARY": True},
+        ]
+    )
+    sparse_store = SparseIndexStore(tmp_path / "sparse")
+    sparse_store.build("rag_documents", collection)
+    searcher = RAGSearcher.__new__(RAGSearcher)
+    with patch.object(RAGSearcher, "_resolve_collection", return_value=("rag_documents", collection)), \
+            patch.object(searcher_module, "sparse_index_store", sparse_store), \
+            patch.object(searcher_module.embedding_model, "encode", side_effect=_fake_encode) as encode, \
+            patch.object(searcher_module.embedding_model, "_check_model_changed"):
+        searcher_module.embedding_model.query_cache.clear()
+        yield searcher, collection, encode
+    searcher_module.embedding_model.query_cache.clear()
+
+
+@pytest.mark.unit
+def test_search_many_batches_embedding_and_filter_groups(searcher):
+    """쿼리는 한 번에 Embedding하고 필터가 같은 검색은 벡터 DB 쿼리 한 번으로 처리"""
+    searcher, collection, encode = searcher
+    specs = [
+        SearchSpec(query="필수 필드", knowledge_type="K2", main_case_type="CIVIL", top_k=1),
+        SearchSpec(query="요약 포맷", knowledge_type="K4", main_case_type="CIVIL", top_k=1),
+        SearchSpec(query="질문", knowledge_type="K2", main_case_type="CIVIL", top_k=2),
+    ]
+
+    with patch.object(collection, "query", wraps=collection.query) as query:
+        results = searcher.search_many(specs)
+
+    assert encode.call_count == 1
+    assert query.call_count == 2
+    assert [[result["doc_id"] for result in rows] for rows in results] == [
+        ["k2-fields"],
+        ["k4-format"],
+        ["k2-question", "k2-fields"],
+    ]
+
+
+@pytest.mark.unit
+def test_search_matches_search_many(searcher):
+    """단건 search는 search_many와 같은 결과"""
+    searcher, _, _ = searcher
+
+    single = searcher.search(query="질문", knowledge_type="K2", top_k=2, min_score=0.5)
+    batched = searcher.search_many([SearchSpec(query="질문", knowledge_type="K2", top_k=2, min_score=0.5)])
+
+    assert single == batched[0]
+    assert [result["doc_id"] for result in single] == ["k2-question"]
+    assert searcher.search_many([]) == []
+
+
+@pytest.mark.unit
+def test_node_scope_is_pushed_down_to_where_filter(searcher):
+    """node_scope는 Node별 불리언 키 조건으로 벡터 DB 쿼리에 전달"""
+    searcher, collection, _ = searcher
+
+    with patch.object(collection, "query", wraps=collection.query) as query:
+        results = searcher.search_by_node_scope(query="필수 필드", node_scope="VALIDATION", top_k=3)
+
+    assert query.call_args.kwargs["where"] == {"node_scope_VALIDATION": True}
+    assert [result["doc_id"] for result in results] == ["k2-question"]
+    assert searcher.search(query="필수 필드", knowledge_type="K2", node_scope="SUMMARY") == []
+
+
+@pytest.mark.unit
+def test_hybrid_and_prefilter_modes_use_exact_term_matches(searcher):
+    """hybrid는 BM25 순위를 RRF로 결합하고 prefilter는 BM25 후보 안에서만 벡터 검색"""
+    searcher, _, _ = searcher
+    query = "필수 필드 요건"
+
+    vector = searcher.search(query=query, knowledge_type="K2", top_k=2, mode="vector")
+    hybrid = searcher.search(query=query, knowledge_type="K2", top_k=2, mode="hybrid")
+    prefilter = searcher.search(query=query, knowledge_type="K2", top_k=2, mode="prefilter")
+
+    assert [result["doc_id"] for result in vector] == ["k2-question", "k2-fields"]
+    assert [result["doc_id"] for result in hybrid] == ["k2-fields", "k2-question"]
+    assert hybrid[0]["sparse_score"] > 0 and hybrid[1]["sparse_score"] is None
+    assert [result["doc_id"] for result in prefilter] == ["k2-fields"]
+
+    with pytest.raises(ValueError):
+        searcher.search(query=query, mode="unknown")
+
+
+
+@pytest.mark.unit
+def test_hybrid_applies_min_score_to_vector_similarity(searcher):
+    """hybrid 모드의 min_score는 RRF 점수가 아닌 벡터 유사도에 적용"""
+    searcher, _, _ = searcher
+
+    results = searcher.search(query="필수 필드 요건", knowledge_type="K2", top_k=2, mode="hybrid", min_score=0.5)
+
+    # BM25가 1위로 올린 k2-fields도 벡터 유사도(0.0)가 기준 미만이면 제외
+    assert [result["doc_id"] for result in results] == ["k2-question"]
+    assert results[0]["dense_score"] >= 0.5
+
+@pytest.mark.unit
+def test_hybrid_falls_back_to_vector_when_budget_exceeded(searcher):
+    """BM25 단계가 지연 시간 예산을 넘기면 벡터 검색 결과 그대로 반환"""
+    searcher, _, _ = searcher
+
+    with patch.object(searcher_module.settings, "rag_hybrid_latency_budget_ms", -1.0):
+        results = searcher.search(query="필수 필드 요건", knowledge_type="K2", top_k=2, mode="hybrid")
+
+    assert [result["doc_id"] for result in results] == ["k2-question", "k2-fields"]
+    assert "sparse_score" not in results[0]
+
+
+@pytest.mark.unit
+def test_resolve_collection_returns_matching_generation(tmp_path: Path):
+    """별칭이 전환되면 같은 세대의 컬렉션 이름과 컬렉션을 함께 반환"""
+    client = NumpyVectorClient(tmp_path)
+    with patch.object(searcher_module.index_alias_registry, "resolve", return_value="rag_documents__g1"), \
+            patch.object(searcher_module, "vector_db_manager", client):
+        searcher = RAGSearcher()
+        first_name, first_collection = searcher._resolve_collection()
+    with patch.object(searcher_module.index_alias_registry, "resolve", return_value="rag_documents__g2"), \
+            patch.object(searcher_module, "vector_db_manager", client):
+        second_name, second_collection = searcher._resolve_collection()
+
+    assert first_name == "rag_documents__g1" and first_collection.name == "rag_documents__g1"
+    assert second_name == "rag_documents__g2" and second_collection.name == "rag_documents__g2"
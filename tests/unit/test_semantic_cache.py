@@ -0,0 +1,143 @@
+"""
+의미(임베딩 유사도) 캐시 단위 테스트
+"""
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+from src.services.semantic_cache import SemanticCache
+
+# 테스트용 고정 임베딩 (유사 문장은 같은 방향의 벡터)
+VECTORS = {
+    "300만원 빌려줬어요": [1.0, 0.0, 0.0],
+    "300만원을 빌려줬어요": [0.99, 0.1, 0.0],
+    "500만원 빌려줬어요": [0.99, 0.1, 0.0],
+    "사기를 당했어요": [0.0, 1.0, 0.0],
+}
+
+
+def _cache(**kwargs):
+    encoder = MagicMock(side_effect=lambda text: np.array(VECTORS[text]))
+    options = {
+        "enabled": True,
+        "nodes": ["entity_amount"],
+        "threshold": 0.95,
+        "audit_rate": 0.0,
+        "encoder": encoder,
+    }
+    options.update(kwargs)
+    return SemanticCache(**options), encoder
+
+
+@pytest.mark.unit
+def test_similar_input_reuses_result():
+    """유사 입력은 GPT 호출 없이 캐시 결과 반환"""
+    cache, _ = _cache()
+    compute = MagicMock(return_value=3000000)
+
+    assert cache.get_or_compute("entity_amount", "300만원 빌려줬어요", compute) == 3000000
+    assert cache.get_or_compute("entity_amount", "300만원을 빌려줬어요", compute) == 3000000
+
+    compute.assert_called_once()
+    stats = cache.get_stats()["nodes"]["entity_amount"]
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+
+@pytest.mark.unit
+def test_exact_match_skips_embedding():
+    """정확히 같은 입력은 임베딩 계산 없이 히트"""
+    cache, encoder = _cache()
+    compute = MagicMock(return_value=3000000)
+
+    cache.get_or_compute("entity_amount", "300만원 빌려줬어요", compute)
+    cache.get_or_compute("entity_amount", " 300만원  빌려줬어요 ", compute)
+
+    assert encoder.call_count == 1
+    assert cache.get_stats()["nodes"]["entity_amount"]["exact_hits"] == 1
+
+
+@pytest.mark.unit
+def test_different_numbers_never_hit():
+    """숫자가 다른 입력은 유사도가 높아도 미스"""
+    cache, _ = _cache()
+    compute = MagicMock(side_effect=[3000000, 5000000])
+
+    cache.get_or_compute("entity_amount", "300만원 빌려줬어요", compute)
+    assert cache.get_or_compute("entity_amount", "500만원 빌려줬어요", compute) == 5000000
+    assert compute.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("first, second", [
+    ("삼백만원 빌려줬어요", "오백만원 빌려줬어요"),
+    ("300만원 빌려줬어요", "300억원 빌려줬어요"),
+    ("어제 빌려줬어요", "그제 빌려줬어요"),
+    ("3일 전에 빌려줬어요", "3일 후에 빌려줬어요"),
+    ("한 달 전 빌려줬어요", "두 달 전 빌려줬어요"),
+])
+def test_different_korean_numbers_and_relative_dates_never_hit(first, second):
+    """한글 수사, 단위, 상대 날짜 표현이 다른 입력은 유사도가 높아도 미스"""
+    cache, _ = _cache(encoder=MagicMock(return_value=np.array([1.0, 0.0, 0.0])))
+    compute = MagicMock(side_effect=["first", "second"])
+
+    cache.get_or_compute("entity_amount", first, compute)
+    assert cache.get_or_compute("entity_amount", second, compute) == "second"
+    assert compute.call_count == 2
+
+
+@pytest.mark.unit
+def test_below_threshold_and_disabled_node():
+    """임계값 미만 입력과 opt-in하지 않은 노드는 항상 GPT 호출"""
+    cache, encoder = _cache(node_thresholds={"entity_amount": 0.999})
+    compute = MagicMock(return_value=3000000)
+
+    cache.get_or_compute("entity_amount", "300만원 빌려줬어요", compute)
+    cache.get_or_compute("entity_amount", "300만원을 빌려줬어요", compute)
+    assert compute.call_count == 2
+
+    encoder.reset_mock()
+    cache.get_or_compute("keywords", "사기를 당했어요", compute)
+    encoder.assert_not_called()
+
+
+@pytest.mark.unit
+def test_audit_records_false_hit_and_replaces_entry():
+    """감사 대상 히트가 실제 결과와 다르면 오탐으로 기록하고 항목 교체"""
+    cache, _ = _cache(audit_rate=1.0)
+    compute = MagicMock(side_effect=[3000000, 3000000, 30000000])
+
+    cache.get_or_compute("entity_amount", "300만원 빌려줬어요", compute)
+    cache.get_or_compute("entity_amount", "300만원을 빌려줬어요", compute)
+    assert cache.get_or_compute("entity_amount", "300만원을 빌려줬어요", compute) == 30000000
+
+    stats = cache.get_stats()["nodes"]["entity_amount"]
+    assert stats["audits"] == 2
+    assert stats["false_hits"] == 1
+    assert stats["false_hit_rate"] == 50.0
+    assert stats["recent_false_hits"][0]["matched_text"] == "300만원을 빌려줬어요"
+
+
+@pytest.mark.unit
+def test_failures_are_not_cached():
+    """예외와 None 결과는 캐시하지 않음"""
+    cache, _ = _cache()
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("entity_amount", "300만원 빌려줬어요", MagicMock(side_effect=RuntimeError()))
+    assert cache.get_or_compute("entity_amount", "300만원 빌려줬어요", MagicMock(return_value=None)) is None
+    assert cache.get_stats()["nodes"]["entity_amount"]["entries"] == 0
+
+
+@pytest.mark.unit
+async def test_get_or_compute_async():
+    """비동기 경로도 캐시 결과 재사용"""
+    cache, _ = _cache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return 3000000
+
+    assert await cache.get_or_compute_async("entity_amount", "300만원 빌려줬어요", compute) == 3000000
+    assert await cache.get_or_compute_async("entity_amount", "300만원을 빌려줬어요", compute) == 3000000
+    assert len(calls) == 1
@@ -0,0 +1,375 @@
+"""
+세션 상태 캐시 단위 테스트
+"""
+import copy
+import time
+import pytest
+from contextlib import asynccontextmanager, contextmanager
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from unittest.mock import patch
+from src.db.base import Base
+from src.db.models.chat_session import ChatSession
+from src.db.models.chat_turn import ChatTurn
+from src.services import session_manager
+from src.services.session_state_cache import SessionStateCache
+from src.services.state_snapshot import encode_state_snapshot
+from src.utils.exceptions import SessionStateConflictError
+
+SESSION_ID = "sess_cache_test_0001"
+
+
+class _SQLiteManager:
+    """인메모리 SQLite DB 매니저 (실행된 SQL 문 기록)"""
+
+    def __init__(self):
+        self.engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+        Base.metadata.create_all(self.engine)
+        self.SessionLocal = sessionmaker(bind=self.engine, autoflush=False)
+        self.statements = []
+        self.turns = 0
+        self.in_turn = False
+        event.listen(self.engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.split()[0].upper())
+
+    @contextmanager
+    def get_db_session(self):
+        session = self.SessionLocal()
+        try:
+            yield session
+            session.commit()
+        finally:
+            session.close()
+
+    def enlist(self, func, *args, best_effort=False):
+        with self.get_db_session() as session:
+            func(session, *args)
+
+    @asynccontextmanager
+    async def unit_of_work(self):
+        self.turns += 1
+        self.in_turn = True
+        try:
+            yield
+        finally:
+            self.in_turn = False
+
+
+@pytest.fixture
+def db():
+    """세션 하나가 저장된 DB와 빈 캐시"""
+    manager = _SQLiteManager()
+    with manager.get_db_session() as session:
+        session.add(ChatSession(session_id=SESSION_ID, channel="web", current_state="INIT", status="ACTIVE"))
+    cache = SessionStateCache(max_entries=8, ttl_seconds=60)
+    with patch.object(session_manager, "db_manager", manager), \
+            patch.object(session_manager, "session_state_cache", cache):
+        manager.statements.clear()
+        yield manager, cache
+
+
+def _state(current_state: str, history_size: int) -> dict:
+    return {
+        "session_id": SESSION_ID,
+        "current_state": current_state,
+        "completion_rate": history_size * 10,
+        "facts": {"amount": 1000},
+        "conversation_history": [{"field": f"f{i}", "answer": str(i)} for i in range(history_size)]
+    }
+
+
+@pytest.mark.unit
+def test_cache_lru_ttl_and_copies():
+    """LRU 상한/TTL 만료를 적용하고 캐시 원본 대신 사본을 반환"""
+    cache = SessionStateCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", {"facts": {}}, 1)
+    cache.put("b", {"facts": {}}, 1)
+    state, version = cache.get("a")
+    state["facts"]["amount"] = 1
+    cache.put("c", {"facts": {}}, 1)
+
+    assert cache.get("a")[0] == {"facts": {}}
+    assert cache.get("b") is None
+    assert version == 1
+
+    cache.ttl_seconds = 0
+    cache.put("d", {}, 3)
+    time.sleep(0.01)
+    assert cache.get("d") is None
+    assert cache.version("d") is None
+    stats = cache.get_stats()
+    assert (stats["evictions"], stats["hits"], stats["misses"]) == (2, 2, 2)
+
+
+@pytest.mark.unit
+def test_saved_state_is_loaded_with_version_check_only(db):
+    """저장한 상태는 다음 로드에서 state_version 조회 한 번으로 반환되고, 이후 저장은 조건부 UPDATE와 새 Q-A 쌍 INSERT 한 번씩"""
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 1))
+    assert cache.version(SESSION_ID) == 1
+
+    # 세션을 워커에 고정한 배포(검증 끔)는 DB 조회 없이 반환
+    manager.statements.clear()
+    with patch.object(session_manager.settings, "session_state_cache_verify", False):
+        session_manager.load_session_state(SESSION_ID)
+    assert manager.statements == []
+
+    state = session_manager.load_session_state(SESSION_ID)
+    assert manager.statements == ["SELECT"]
+    manager.statements.clear()
+    assert state["current_state"] == "FACT_COLLECTION"
+    assert state["facts"] == {"amount": 1000}
+
+    state["conversation_history"].append({"field": "f1", "answer": "1"})
+    session_manager.save_session_state(SESSION_ID, state)
+    assert manager.statements == ["UPDATE", "INSERT"]
+    assert cache.version(SESSION_ID) == 2
+
+    with manager.get_db_session() as session:
+        row = session.get(ChatSession, SESSION_ID)
+        assert (row.state_version, len(row.conversation_history)) == (2, 2)
+
+
+@pytest.mark.unit
+def test_cache_miss_loads_from_db_and_caches(db):
+    """캐시가 비어 있으면 DB에서 복원한 뒤 캐시에 기록"""
+    manager, cache = db
+    state = session_manager.load_session_state(SESSION_ID)
+    assert state["current_state"] == "INIT"
+    assert "SELECT" in manager.statements
+    assert cache.version(SESSION_ID) == 0
+
+    manager.statements.clear()
+    assert session_manager.load_session_state(SESSION_ID)["current_state"] == "INIT"
+    assert manager.statements == ["SELECT"]
+    assert session_manager.load_session_state("sess_missing_0001") is None
+
+
+@pytest.mark.unit
+def test_newer_state_from_another_worker_falls_back_to_db(db):
+    """다른 워커가 더 새로운 상태를 저장하면 저장 시 충돌을 감지하고, 검증 모드에서는 로드 시 DB를 사용"""
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 1))
+
+    # 다른 워커의 저장 (state_version 증가)
+    with manager.get_db_session() as session:
+        row = session.get(ChatSession, SESSION_ID)
+        row.current_state = "VALIDATION"
+        row.conversation_history = _state("VALIDATION", 3)["conversation_history"]
+        row.state_snapshot = encode_state_snapshot(_state("VALIDATION", 3))
+        row.state_version = 2
+        session_manager._append_turns(session, SESSION_ID, row.conversation_history, None)
+
+    with patch.object(session_manager.settings, "session_state_cache_verify", True):
+        state = session_manager.load_session_state(SESSION_ID)
+    assert state["current_state"] == "VALIDATION"
+    assert len(state["conversation_history"]) == 3
+    assert cache.get_stats()["conflicts"] == 1
+
+    # 캐시된 버전이 오래된 상태에서 저장하면 충돌을 감지하고 캐시를 버린 뒤 덮어쓰지 않고 거부
+    cache.put(SESSION_ID, _state("FACT_COLLECTION", 1), 1)
+    with pytest.raises(SessionStateConflictError):
+        session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 2))
+    assert cache.get_stats()["conflicts"] == 2
+    assert cache.version(SESSION_ID) is None
+    with manager.get_db_session() as session:
+        row = session.get(ChatSession, SESSION_ID)
+        assert (row.current_state, row.state_version) == ("VALIDATION", 2)
+
+
+@pytest.mark.unit
+def test_second_writer_from_same_version_does_not_clobber_first(db):
+    """같은 버전에서 시작한 두 요청 중 나중에 저장하는 쪽은 거부되고 먼저 저장한 상태가 유지됨"""
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 1))
+    first = session_manager.load_session_state(SESSION_ID)
+    second = copy.deepcopy(first)
+    assert first["state_version"] == second["state_version"] == 1
+
+    first["current_state"] = "VALIDATION"
+    first["conversation_history"].append({"field": "amount", "answer": "100만원"})
+    session_manager.save_session_state(SESSION_ID, first)
+    assert first["state_version"] == 2
+
+    second["current_state"] = "RE_QUESTION"
+    second["conversation_history"].append({"field": "incident_date", "answer": "어제"})
+    with pytest.raises(SessionStateConflictError):
+        session_manager.save_session_state(SESSION_ID, second)
+
+    cache.clear()
+    loaded = session_manager.load_session_state(SESSION_ID)
+    assert (loaded["current_state"], loaded["state_version"]) == ("VALIDATION", 2)
+    assert [qa["field"] for qa in loaded["conversation_history"]] == ["f0", "amount"]
+
+
+@pytest.mark.unit
+async def test_invalidate_on_end(db):
+    """상담 종료 시 COMPLETED 상태 저장이 커밋된 뒤에도 캐시에 남지 않음"""
+    from src.api.routers import chat
+
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("SUMMARY", 1))
+    assert cache.version(SESSION_ID) == 1
+
+    def completed(state):
+        return {**state, "current_state": "COMPLETED", "completion_rate": 100}
+
+    with patch.object(chat, "db_manager", manager), \
+            patch("src.langgraph.nodes.summary_node.summary_node", lambda state: state), \
+            patch("src.langgraph.nodes.completed_node.completed_node", completed):
+        await chat.end_chat(chat.ChatEndRequest(session_id=SESSION_ID), "test")
+
+    assert manager.turns == 1
+    assert cache.version(SESSION_ID) is None
+    with manager.get_db_session() as session:
+        assert session.get(ChatSession, SESSION_ID).current_state == "COMPLETED"
+
+
+@pytest.mark.unit
+async def test_stream_loads_session_inside_turn(db):
+    """스트리밍 요청도 세션 로드부터 상태 저장까지 한 턴의 작업 단위 안에서 수행"""
+    from src.api.routers import chat
+
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 1))
+    loaded_in_turn = []
+
+    def load(session_id):
+        loaded_in_turn.append(manager.in_turn)
+        return session_manager.load_session_state(session_id)
+
+    async def run_graph_step_stream(state, on_token):
+        on_token("요약")
+        return {**state, "current_state": "VALIDATION"}
+
+    with patch.object(chat, "db_manager", manager), \
+            patch.object(chat, "load_session_state", load), \
+            patch.object(chat.graph_executor, "run_graph_step_stream", run_graph_step_stream):
+        response = await chat.process_message_stream(
+            chat.ChatMessageRequest(session_id=SESSION_ID, user_message="답변"), "test"
+        )
+        events = [chunk async for chunk in response.body_iterator]
+
+    assert loaded_in_turn == [True]
+    assert manager.turns == 1
+    assert events[0].startswith("event: token") and events[-1].startswith("event: done")
+    assert cache.version(SESSION_ID) == 2
+
+
+@pytest.mark.unit
+def test_snapshot_restores_full_state_with_single_read(db):
+    """캐시가 비어 있어도 스냅샷 기본 키 조회와 chat_turn 조회 한 번씩으로 전체 상태(current_question 등)를 복원"""
+    manager, cache = db
+    state = _state("FACT_COLLECTION", 2)
+    state["current_question"] = {"field": "counterparty", "question": "상대방은 누구인가요?"}
+    state["skipped_fields"] = ["incident_date"]
+    state["initial_analysis"] = {"extracted_facts": {"amount": 1000}}
+    session_manager.save_session_state(SESSION_ID, state)
+    cache.clear()
+
+    manager.statements.clear()
+    loaded = session_manager.load_session_state(SESSION_ID)
+    assert manager.statements == ["SELECT", "SELECT"]
+    assert loaded["current_question"] == state["current_question"]
+    assert loaded["skipped_fields"] == ["incident_date"]
+    assert loaded["initial_analysis"] == state["initial_analysis"]
+    assert loaded["facts"] == {"amount": 1000}
+    assert len(loaded["conversation_history"]) == 2
+
+
+@pytest.mark.unit
+def test_session_without_snapshot_is_restored_from_case_tables(db):
+    """스냅샷이 없는 세션(마이그레이션 이전 저장)은 정규화된 사건 테이블에서 복원"""
+    manager, _ = db
+    with manager.get_db_session() as session:
+        row = session.get(ChatSession, SESSION_ID)
+        row.current_state = "FACT_COLLECTION"
+        row.conversation_history = [{"field": "amount", "answer": "100만원"}]
+
+    loaded = session_manager.load_session_state(SESSION_ID)
+    assert loaded["current_state"] == "FACT_COLLECTION"
+    assert loaded["asked_fields"] == ["amount"]
+    assert loaded["skipped_fields"] == []
+
+
+def _turn_rows(manager) -> list:
+    with manager.get_db_session() as session:
+        return [
+            (turn.seq, turn.field, turn.answer)
+            for turn in session.query(ChatTurn).filter(ChatTurn.session_id == SESSION_ID).order_by(ChatTurn.seq)
+        ]
+
+
+@pytest.mark.unit
+def test_conversation_turns_are_appended_once_per_save(db):
+    """저장마다 새 Q-A 쌍만 chat_turn에 INSERT 한 번으로 추가하고, 스냅샷에는 대화 기록을 넣지 않음"""
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 2))
+    assert _turn_rows(manager) == [(0, "f0", "0"), (1, "f1", "1")]
+
+    for size in (3, 5):
+        manager.statements.clear()
+        session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", size))
+        assert manager.statements == ["UPDATE", "INSERT"]
+    assert [seq for seq, _, _ in _turn_rows(manager)] == [0, 1, 2, 3, 4]
+
+    # 새 Q-A 쌍이 없으면 UPDATE만
+    manager.statements.clear()
+    session_manager.save_session_state(SESSION_ID, _state("VALIDATION", 5))
+    assert manager.statements == ["UPDATE"]
+
+    with manager.get_db_session() as session:
+        snapshot = session_manager.decode_state_snapshot(session.get(ChatSession, SESSION_ID).state_snapshot)
+    assert "conversation_history" not in snapshot
+
+
+@pytest.mark.unit
+def test_rewritten_history_replaces_turns(db):
+    """기록된 앞부분과 다른 대화 기록을 저장하면 세션의 chat_turn을 다시 기록"""
+    manager, cache = db
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 3))
+    state = _state("FACT_COLLECTION", 2)
+    state["conversation_history"][1]["answer"] = "수정"
+    session_manager.save_session_state(SESSION_ID, state)
+    assert _turn_rows(manager) == [(0, "f0", "0"), (1, "f1", "수정")]
+
+    cache.clear()
+    session_manager.save_session_state(SESSION_ID, _state("INIT", 0))
+    assert _turn_rows(manager) == []
+
+
+@pytest.mark.unit
+def test_legacy_json_history_is_backfilled(db):
+    """chat_turn 도입 이전 세션은 첫 로드 시 JSON 컬럼의 대화 기록을 chat_turn으로 옮김"""
+    manager, _ = db
+    history = _state("FACT_COLLECTION", 2)["conversation_history"]
+    with manager.get_db_session() as session:
+        session.get(ChatSession, SESSION_ID).conversation_history = history
+
+    loaded = session_manager.load_session_state(SESSION_ID)
+    assert [qa["answer"] for qa in loaded["conversation_history"]] == ["0", "1"]
+    assert _turn_rows(manager) == [(0, "f0", "0"), (1, "f1", "1")]
+
+
+@pytest.mark.unit
+def test_get_conversation_turns_range(db):
+    """대화 기록 범위 조회"""
+    session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 5))
+    turns = session_manager.get_conversation_turns(SESSION_ID, start=1, limit=2)
+    assert [qa["field"] for qa in turns] == ["f1", "f2"]
+    assert session_manager.get_conversation_turns("sess_missing_0001") == []
+
+
+@pytest.mark.unit
+def test_json_history_write_can_be_disabled(db):
+    """CONVERSATION_HISTORY_JSON_WRITE=false면 JSON 컬럼을 갱신하지 않고 chat_turn에만 기록"""
+    manager, _ = db
+    with patch.object(session_manager.settings, "conversation_history_json_write", False):
+        session_manager.save_session_state(SESSION_ID, _state("FACT_COLLECTION", 2))
+
+    with manager.get_db_session() as session:
+        assert not session.get(ChatSession, SESSION_ID).conversation_history
+    assert len(_turn_rows(manager)) == 2
@@ -0,0 +1,64 @@
+"""
+RAG 희소(BM25) 인덱스 단위 테스트
+"""
+import time
+import pytest
+from pathlib import Path
+from src.rag.numpy_store import NumpyVectorClient
+from src.rag.sparse_index import BM25Index, SparseIndexStore, tokenize
+
+IDS = ["k1-loan", "k1-penalty", "k1-custody"]
+DOCUMENTS = [
+    "대여금 반환 청구: 돈을 빌려주었으나 돌려받지 못한 경우",
+    "과징금 부과 처분 취소: 행정청의 과징금 처분에 불복하는 경우",
+    "양육권 변경: 이혼 후 자녀의 양육권을 변경하려는 경우",
+]
+METADATAS = [
+    {"knowledge_type": "K1", "main_case_type": "CIVIL"},
+    {"knowledge_type": "K1", "main_case_type": "ADMIN"},
+    {"knowledge_type": "K1", "main_case_type": "FAMILY"},
+]
+
+
+@pytest.mark.unit
+def test_tokenize_uses_character_bigrams_within_words():
+    """어절 내부 문자 bigram을 색인어로 사용하여 조사가 붙어도 일치"""
+    assert tokenize("대여금을 반환") == ["대여", "여금", "금을", "반환"]
+    assert tokenize("A 1") == ["a", "1"]
+    assert set(tokenize("대여금")) <= set(tokenize("대여금을"))
+
+
+@pytest.mark.unit
+def test_bm25_ranks_exact_legal_terms_and_applies_filters():
+    """정확한 법률 용어가 포함된 Chunk가 상위에 오고 where 조건을 적용"""
+    index = BM25Index.build(IDS, DOCUMENTS, METADATAS)
+
+    hits = index.search("과징금을 내라고 합니다", top_k=3)
+    assert hits[0][0] == "k1-penalty"
+    assert all(score > 0 for _, score in hits)
+
+    assert index.search("양육권", top_k=3, where={"main_case_type": "CIVIL"}) == []
+    assert len(index.search("경우", top_k=2)) == 2
+    assert index.search("과징금", top_k=3, deadline=time.perf_counter() - 1) is None
+
+
+@pytest.mark.unit
+def test_store_builds_from_collection_and_reloads_on_change(tmp_path: Path):
+    """컬렉션 내용으로 구축하고 파일이 바뀌면 다시 로드, 삭제 후에는 None"""
+    collection = NumpyVectorClient(tmp_path / "vectors").get_or_create_collection("rag_documents")
+    collection.upsert(ids=IDS[:2], embeddings=[[1, 0], [0, 1]], documents=DOCUMENTS[:2], metadatas=METADATAS[:2])
+    store = SparseIndexStore(tmp_path / "sparse")
+
+    assert store.get("rag_documents") is None
+    assert store.build("rag_documents", collection) == 2
+    first = store.get("rag_documents")
+    assert store.get("rag_documents") is first
+
+    collection.upsert(ids=IDS[2:], embeddings=[[1, 1]], documents=DOCUMENTS[2:], metadatas=METADATAS[2:])
+    store.build("rag_documents", collection)
+    reloaded = SparseIndexStore(tmp_path / "sparse").get("rag_documents")
+    assert len(reloaded) == 3
+    assert reloaded.search("양육권", top_k=1)[0][0] == "k1-custody"
+
+    store.delete("rag_documents")
+    assert store.get("rag_documents") is None
@@ -0,0 +1,42 @@
+"""
+세션 상태 스냅샷 직렬화 단위 테스트
+"""
+import zlib
+import pytest
+from datetime import date
+from src.services.state_snapshot import STATE_SNAPSHOT_FORMAT, decode_state_snapshot, encode_state_snapshot
+
+
+@pytest.mark.unit
+def test_snapshot_round_trip_is_compact():
+    """전체 상태를 그대로 복원하고 압축된 크기로 저장"""
+    state = {
+        "session_id": "sess_snapshot_0001",
+        "current_state": "FACT_COLLECTION",
+        "facts": {"amount": 3000000, "counterparty": "친구"},
+        "skipped_fields": ["incident_date"],
+        "current_question": {"field": "evidence", "question": "증거가 있나요?"},
+        "conversation_history": [{"field": "amount", "question": "금액은?", "answer": "300만원"}] * 20
+    }
+    data = encode_state_snapshot(state)
+
+    assert data[0] == STATE_SNAPSHOT_FORMAT
+    assert decode_state_snapshot(data) == state
+    assert len(data) < len(str(state).encode("utf-8")) / 3
+
+
+@pytest.mark.unit
+def test_snapshot_stringifies_non_json_values():
+    """JSON으로 표현할 수 없는 값은 문자열로 저장"""
+    assert decode_state_snapshot(encode_state_snapshot({"facts": {"incident_date": date(2024, 1, 2)}})) == {
+        "facts": {"incident_date": "2024-01-02"}
+    }
+
+
+@pytest.mark.unit
+def test_unknown_format_or_corrupt_snapshot_returns_none():
+    """형식 버전이 다르거나 손상된 스냅샷은 None (정규화 테이블에서 복원)"""
+    assert decode_state_snapshot(None) is None
+    assert decode_state_snapshot(bytes([STATE_SNAPSHOT_FORMAT + 1]) + zlib.compress(b"{}")) is None
+    assert decode_state_snapshot(bytes([STATE_SNAPSHOT_FORMAT]) + b"not zlib") is None
+    assert decode_state_snapshot(bytes([STATE_SNAPSHOT_FORMAT]) + zlib.compress(b"[1, 2]")) is None
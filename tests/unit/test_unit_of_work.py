@@ -0,0 +1,124 @@
+"""
+대화 턴 단위 작업(Unit of Work) 단위 테스트
+"""
+import asyncio
+import pytest
+from unittest.mock import patch
+from src.db.base import Base
+from src.db.connection import DatabaseManager, run_after_commit
+from src.db.models.chat_session import ChatSession
+from src.langgraph.executor import GraphExecutor
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """임시 SQLite 파일 DB를 사용하는 매니저"""
+    db = DatabaseManager(f"sqlite:///{tmp_path / 'uow.db'}")
+    Base.metadata.create_all(db.engine)
+    yield db
+    db.close()
+
+
+def _add_session(db_session, session_id: str):
+    db_session.add(ChatSession(session_id=session_id, channel="web", current_state="INIT", status="ACTIVE"))
+
+
+def _session_ids(manager) -> list:
+    with manager.get_db_session() as db_session:
+        return sorted(row.session_id for row in db_session.query(ChatSession).all())
+
+
+@pytest.mark.unit
+async def test_enlisted_writes_are_committed_once_at_end_of_turn(manager):
+    """턴 안에서 등록한 쓰기는 턴 마지막에 트랜잭션 하나로 기록되고 사용량이 집계됨"""
+    async with manager.unit_of_work() as unit_of_work:
+        await asyncio.to_thread(manager.enlist, _add_session, "sess_uow_0001")
+        manager.enlist(_add_session, "sess_uow_0002")
+        assert unit_of_work.pending == 2
+        assert unit_of_work.statements == 0
+
+    assert _session_ids(manager) == ["sess_uow_0001", "sess_uow_0002"]
+    assert unit_of_work.transactions == 1
+    assert unit_of_work.statements >= 1
+    stats = manager.get_unit_of_work_stats()
+    assert stats["turns"] == 1
+    assert stats["avg_transactions"] == 1.0
+
+
+@pytest.mark.unit
+async def test_disabled_unit_of_work_writes_immediately_and_still_counts(manager):
+    """DB_UNIT_OF_WORK_ENABLED=false면 등록 즉시 기록하고 턴 사용량만 집계"""
+    with patch("src.db.connection.settings.db_unit_of_work_enabled", False):
+        async with manager.unit_of_work() as unit_of_work:
+            manager.enlist(_add_session, "sess_uow_0001")
+            assert _session_ids(manager) == ["sess_uow_0001"]
+            manager.enlist(_add_session, "sess_uow_0002")
+
+    assert unit_of_work.pending == 0
+    assert unit_of_work.transactions == 3
+    assert unit_of_work.connections == 3
+
+
+@pytest.mark.unit
+def test_enlist_outside_turn_runs_immediately(manager):
+    """작업 단위 밖에서는 바로 기록"""
+    manager.enlist(_add_session, "sess_uow_0001")
+    assert _session_ids(manager) == ["sess_uow_0001"]
+    assert manager.get_unit_of_work_stats()["turns"] == 0
+
+
+@pytest.mark.unit
+async def test_failed_batch_is_retried_per_operation(manager):
+    """일괄 기록이 실패하면 작업별로 다시 기록하여 실패 허용 작업만 버림"""
+    def fail(db_session):
+        raise RuntimeError("로그 기록 실패")
+
+    async with manager.unit_of_work():
+        manager.enlist(_add_session, "sess_uow_0001")
+        manager.enlist(fail, best_effort=True)
+        manager.enlist(_add_session, "sess_uow_0002")
+    assert _session_ids(manager) == ["sess_uow_0001", "sess_uow_0002"]
+
+    with pytest.raises(RuntimeError):
+        async with manager.unit_of_work():
+            manager.enlist(fail)
+            manager.enlist(_add_session, "sess_uow_0003")
+    assert "sess_uow_0003" in _session_ids(manager)
+
+
+@pytest.mark.unit
+async def test_after_commit_callbacks_run_only_on_commit(manager):
+    """커밋 후 콜백은 작업 단위가 실제로 커밋된 뒤에만 실행"""
+    called = []
+
+    def save(db_session, session_id):
+        _add_session(db_session, session_id)
+        run_after_commit(db_session, lambda: called.append(session_id))
+
+    async with manager.unit_of_work():
+        manager.enlist(save, "sess_uow_0001")
+        assert called == []
+    assert called == ["sess_uow_0001"]
+
+    with pytest.raises(Exception):
+        manager.enlist(save, "sess_uow_0001")
+    assert called == ["sess_uow_0001"]
+
+
+@pytest.mark.unit
+async def test_mid_turn_flush_and_graph_worker_threads_join_turn(manager):
+    """그래프 워커 스레드에서 등록한 쓰기도 턴에 참여하고, flush_unit_of_work로 턴 중간에 반영 가능"""
+    executor = GraphExecutor(max_workers=1, max_concurrency=1)
+
+    def node():
+        manager.enlist(_add_session, "sess_uow_0001")
+        before = _session_ids(manager)
+        manager.flush_unit_of_work()
+        return before, _session_ids(manager)
+
+    async with manager.unit_of_work() as unit_of_work:
+        before, after = await executor.submit(node)
+    executor.shutdown()
+
+    assert (before, after) == ([], ["sess_uow_0001"])
+    assert unit_of_work.transactions == 3